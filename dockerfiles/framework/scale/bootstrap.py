@@ -23,6 +23,8 @@ FLUENTD_BUFFER_WARN = int(os.getenv('FLUENTD_BUFFER_WARN', 10)) #10 items backed
 FLUENTD_BUFFER_SIZE_WARN = int(os.getenv('FLUENTD_BUFFER_SIZE_WARN', 1000000000)) #1GB
 MESSSAGE_QUEUE_DEPTH_WARN = int(os.getenv('MESSSAGE_QUEUE_DEPTH_WARN', 100)) #100 messages in the message broker queue
 SCHEDULER_QUEUE_LIMIT = int(os.getenv('SCHEDULER_QUEUE_LIMIT', 500)) # Queue limit of 500
+MESSAGE_HANDLER_AUTOSCALE = os.getenv('MESSAGE_HANDLER_AUTOSCALE', 'false') # Scale message handlers with queue depth
+MIN_MESSAGE_HANDLERS = int(os.getenv('MIN_MESSAGE_HANDLERS', 1)) # Fewest message handlers when autoscaling
 
 # used to look for other env vars prefixed with this value
 SCALEUI_ENV_PREFIX = os.getenv('SCALEUI_ENV_PREFIX', 'SCALEUI_')
@@ -57,6 +59,8 @@ def run(client):
     print("FLUENTD_BUFFER_WARN=%d" % FLUENTD_BUFFER_WARN)
     print("FLUENTD_BUFFER_SIZE_WARN=%d" % FLUENTD_BUFFER_SIZE_WARN)
     print("MESSSAGE_QUEUE_DEPTH_WARN=%d" % MESSSAGE_QUEUE_DEPTH_WARN)
+    print("MESSAGE_HANDLER_AUTOSCALE=%s" % MESSAGE_HANDLER_AUTOSCALE)
+    print("MIN_MESSAGE_HANDLERS=%d" % MIN_MESSAGE_HANDLERS)
 
     # Determine if elasticsearch should be deployed. If ELASTICSEARCH_URL is unset we need to deploy it
     es_url = os.getenv('ELASTICSEARCH_URL', '')
@@ -292,7 +296,9 @@ def deploy_webserver(client, app_name, es_url, db_url, broker_url):
         'SCALE_QUEUE_NAME': 'SCALE_QUEUE_NAME',
         'GEOAXIS_HOST': 'GEOAXIS_HOST',
         'GEOAXIS_KEY': 'GEOAXIS_KEY',
-        'GEOAXIS_SECRET': 'GEOAXIS_SECRET'
+        'GEOAXIS_SECRET': 'GEOAXIS_SECRET',
+        'DATABASE_REPLICA_URL': 'DATABASE_REPLICA_URL',
+        'REPLICA_PIN_SECONDS': 'REPLICA_PIN_SECONDS'
     }
     apply_set_envs(marathon, env_map)
 
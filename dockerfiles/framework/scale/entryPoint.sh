@@ -62,6 +62,16 @@ then
         export FLUENTD_BUFFER_SIZE_WARN=`cat bootstrap.log | grep FLUENTD_BUFFER_SIZE_WARN | cut -d '=' -f2`
     fi
 
+    if [[ "${MESSAGE_HANDLER_AUTOSCALE}x" == "x" ]]
+    then
+        export MESSAGE_HANDLER_AUTOSCALE=`cat bootstrap.log | grep MESSAGE_HANDLER_AUTOSCALE | cut -d '=' -f2`
+    fi
+
+    if [[ "${MIN_MESSAGE_HANDLERS}x" == "x" ]]
+    then
+        export MIN_MESSAGE_HANDLERS=`cat bootstrap.log | grep MIN_MESSAGE_HANDLERS | cut -d '=' -f2`
+    fi
+
     if [[ "${LOGGING_ADDRESS}x" == "x" ]]
     then
         export LOGGING_ADDRESS=`cat bootstrap.log | grep LOGGING_ADDRESS | cut -d '=' -f2`
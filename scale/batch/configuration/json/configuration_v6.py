@@ -1,11 +1,11 @@
 """Manages the v6 batch configuration schema"""
 from __future__ import unicode_literals
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from batch.configuration.configuration import BatchConfiguration
 from batch.configuration.exceptions import InvalidConfiguration
+from util.schema import SchemaValidator
 
 
 SCHEMA_VERSION = '7'
@@ -46,6 +46,8 @@ BATCH_CONFIGURATION_SCHEMA = {
     },
 }
 
+BATCH_CONFIGURATION_VALIDATOR = SchemaValidator('batch.configuration.json.configuration_v6', BATCH_CONFIGURATION_SCHEMA)
+
 
 def convert_configuration_to_v6(configuration):
     """Returns the v6 configuration JSON for the given batch configuration
@@ -91,7 +93,7 @@ class BatchConfigurationV6(object):
 
         try:
             if do_validate:
-                validate(self._configuration, BATCH_CONFIGURATION_SCHEMA)
+                BATCH_CONFIGURATION_VALIDATOR.validate(self._configuration)
         except ValidationError as ex:
             raise InvalidConfiguration('INVALID_BATCH_CONFIGURATION', 'Invalid batch configuration: %s' % unicode(ex))
 
@@ -1,12 +1,12 @@
 """Manages the v6 batch definition schema"""
 from __future__ import unicode_literals
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from batch.definition.definition import BatchDefinition
 from batch.definition.exceptions import InvalidDefinition
 from recipe.diff.json.forced_nodes_v6 import convert_forced_nodes_to_v6, ForcedNodesV6
+from util.schema import SchemaValidator
 
 
 SCHEMA_VERSION = '7'
@@ -57,6 +57,8 @@ BATCH_DEFINITION_SCHEMA = {
     },
 }
 
+BATCH_DEFINITION_VALIDATOR = SchemaValidator('batch.definition.json.definition_v6', BATCH_DEFINITION_SCHEMA)
+
 
 def convert_definition_to_v6(definition):
     """Returns the v6 definition JSON for the given batch definition
@@ -110,7 +112,7 @@ class BatchDefinitionV6(object):
 
         try:
             if do_validate:
-                validate(self._definition, BATCH_DEFINITION_SCHEMA)
+                BATCH_DEFINITION_VALIDATOR.validate(self._definition)
                 if 'previous_batch' in self._definition and 'forced_nodes' in self._definition['previous_batch']:
                     ForcedNodesV6(self._definition['previous_batch']['forced_nodes'], do_validate=True)
                 if 'forced_nodes' in self._definition:
@@ -1,7 +1,10 @@
+import fnmatch
+import itertools
+import json
 import logging
 import os
-import fnmatch
 import tempfile
+import time
 
 from datetime import datetime
 from django.core.management.base import BaseCommand
@@ -15,6 +18,9 @@ from source.models import SourceFile
 from storage.media_type import get_media_type
 from storage.models import Workspace
 
+# The default number of files that are written to the database together
+DEFAULT_CHUNK_SIZE = 1000
+
 logger = logging.getLogger(__name__)
 
 class Command(BaseCommand):
@@ -33,6 +39,11 @@ class Command(BaseCommand):
         parser.add_argument("-d", "--data-type", action="append", default=[], help="Data type tag")
         parser.add_argument("-i", "--include", action="append", help="Include glob")
         parser.add_argument("-e", "--exclude", action="append", default=[], help="Exclude glob")
+        parser.add_argument("-c", "--checkpoint", action="store",
+                            help="Checkpoint file recording migration progress. If it exists, the migration resumes "
+                                 "after the last file it recorded.")
+        parser.add_argument("-s", "--chunk-size", action="store", type=int, default=DEFAULT_CHUNK_SIZE,
+                            help="Number of files written to the database together")
 
     # input dir, target workspace
 
@@ -57,6 +68,17 @@ class Command(BaseCommand):
         if options['data_type'] is not None:
             data_types.extend(options['data_type'])
 
+        checkpoint_path = options['checkpoint']
+        checkpoint = {'workspace_id': workspace.id, 'workspace_path': workspace_path, 'last_path': None, 'count': 0}
+        if checkpoint_path and os.path.exists(checkpoint_path):
+            with open(checkpoint_path, 'r') as checkpoint_file:
+                saved_checkpoint = json.load(checkpoint_file)
+            if (saved_checkpoint['workspace_id'], saved_checkpoint['workspace_path']) != (workspace.id, workspace_path):
+                logger.error('Checkpoint %s is for a different workspace and workspace-path.', checkpoint_path)
+                return False
+            checkpoint = saved_checkpoint
+            logger.info("Resuming after %d files, last file %s", checkpoint['count'], checkpoint['last_path'])
+
         mnt_dirs = None
         if options['local_path'] is not None:
             local_path = options['local_path']
@@ -66,62 +88,29 @@ class Command(BaseCommand):
             local_path = os.path.join(mnt_dirs[1], workspace_path)
 
         logger.info("Ingesting files from %s/%s", workspace.name, workspace_path)
-        filenames = self.generate_file_list(local_path, options['include'], options['exclude'])
-        logger.info("Found %d files", len(filenames))
-
-        # prepare for ingest ala strike
-        ingest_records = {}
-        for filename in filenames:
-            logger.info("Generating ingest record for %s" % filename)
-            ingest = Ingest()
-            ingest.file_name = os.path.basename(filename)
-            ingest.file_path = os.path.join(workspace_path, os.path.relpath(filename, local_path))
-            ingest.transfer_started = datetime.utcfromtimestamp(os.path.getatime(filename))
-            ingest.file_size = ingest.bytes_transferred = os.path.getsize(filename)
-            ingest.transfer_ended = timezone.now()
-            ingest.media_type = get_media_type(filename)
-            ingest.workspace = workspace
-            for data_type in data_types:
-                ingest.add_data_type_tag(data_type)
-            ingest.status = 'TRANSFERRED'
+        filenames = self.generate_file_list(local_path, options['include'], options['exclude'],
+                                            checkpoint['last_path'])
+
+        # ingest the files ala strike, a chunk at a time
+        started = time.time()
+        num_files = 0
+        for chunk in self.generate_chunks(filenames, options['chunk_size']):
+            ingests = [self._create_ingest(filename, local_path, workspace, workspace_path, data_types)
+                       for filename in chunk]
             if options['no_commit']:
                 s = IngestDetailsSerializerV6()
-                logger.info(s.to_representation(ingest))
+                for ingest in ingests:
+                    logger.info(s.to_representation(ingest))
             else:
-                ingest.save()
-                ingest_records[filename] = ingest.id
-        logging.info("Ingests records created")
-
-        # start ingest tasks for all the files
-        if not options['no_commit']:
-            logging.info("Starting ingest tasks")
-            for filename in filenames:
-                ingest = Ingest.objects.get(id=ingest_records[filename])
-                logging.info("Processing ingest %s" % ingest.file_name)
-                with transaction.atomic():
-                    ingest.ingest_started = timezone.now()
-                    sf = ingest.source_file = SourceFile.create()
-                    sf.update_uuid(ingest.file_name)
-                    for tag in ingest.get_data_type_tags():
-                        sf.add_data_type_tag(tag)
-                    sf.media_type = ingest.media_type
-                    sf.file_name = ingest.file_name
-                    sf.file_size = ingest.file_size
-                    sf.file_path = ingest.file_path
-                    sf.workspace = workspace
-                    sf.is_deleted = False
-                    sf.deleted = None
-                    sf.save()
-                    sf.set_countries()
-                    sf.save()
-                    ingest.status = 'INGESTED'
-                    ingest.ingest_ended = timezone.now()
-                    ingest.source_file = sf
-                    ingest.save()
-                    if options['recipe']:
-                        IngestRecipeHandler().process_ingested_source_file(ingest.id, ingest.source_file, ingest.ingest_ended)
-
-
+                self._save_ingests(ingests, workspace, options['recipe'])
+            num_files += len(chunk)
+            if checkpoint_path and not options['no_commit']:
+                checkpoint['last_path'] = os.path.relpath(chunk[-1], local_path)
+                checkpoint['count'] += len(chunk)
+                self._write_checkpoint(checkpoint_path, checkpoint)
+            duration = time.time() - started
+            logger.info("Processed %d files (%.1f files/sec)", num_files, num_files / duration if duration else 0.0)
+        logger.info("Processed %d files in total", num_files)
 
         logging.info("Ingests processed, monitor the queue for triggered jobs.")
 
@@ -131,16 +120,165 @@ class Command(BaseCommand):
         logger.info(u'Command completed: migratedata')
 
     @staticmethod
-    def generate_file_list(path, include, exclude):
-        all_files = []
+    def generate_chunks(items, chunk_size):
+        """Returns a generator that groups the given items into lists of up to the given size
+
+        :param items: The items to group
+        :type items: iterable
+        :param chunk_size: The maximum number of items in each chunk
+        :type chunk_size: int
+        :returns: The generator of chunks
+        :rtype: generator
+        """
+
+        items = iter(items)
+        while True:
+            chunk = list(itertools.islice(items, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+    @staticmethod
+    def generate_file_list(path, include, exclude, after=None):
+        """Returns a generator that lazily walks the given path for the files to migrate. Directories and files are
+        visited in sorted order, with the files of each directory before its sub-directories, so that the order is the
+        same on every run and a migration can resume after the last file it processed.
+
+        :param path: The path to walk
+        :type path: string
+        :param include: The globs a file name must match one of, None to include every file
+        :type include: list
+        :param exclude: The globs a file name must not match
+        :type exclude: list
+        :param after: The path of a file relative to the walked path, only files after it are returned
+        :type after: string
+        :returns: The generator of file paths
+        :rtype: generator
+        """
+
+        after_key = Command._get_walk_key(after.split(os.sep)) if after else None
         for root, dirs, files in os.walk(path):
-            tmp = []
-            if include is None:
-                tmp = files
-            else:
-                for inc in include:
-                    tmp.extend(filter(lambda fname, glb=inc: fnmatch.fnmatch(fname, glb), files))
-            for excl in exclude:
-                tmp = filter(lambda fname, glb=excl: not fnmatch.fnmatch(fname, glb), tmp)
-            all_files.extend(map(lambda fname, pth=root: os.path.join(pth, fname), tmp))
-        return all_files
+            rel_root = os.path.relpath(root, path)
+            root_parts = [] if rel_root == os.curdir else rel_root.split(os.sep)
+            dirs.sort()
+            if after_key is not None:
+                # Skip directories that were completely processed before the checkpoint
+                dir_keys = [(d, Command._get_walk_key(root_parts + [d], is_file=False)) for d in dirs]
+                dirs[:] = [d for d, key in dir_keys if key > after_key or after_key[:len(key)] == key]
+            for fname in sorted(files):
+                if include is not None and not any(fnmatch.fnmatch(fname, glb) for glb in include):
+                    continue
+                if any(fnmatch.fnmatch(fname, glb) for glb in exclude):
+                    continue
+                if after_key is not None and Command._get_walk_key(root_parts + [fname]) <= after_key:
+                    continue
+                yield os.path.join(root, fname)
+
+    @staticmethod
+    def _create_ingest(filename, local_path, workspace, workspace_path, data_types):
+        """Creates an unsaved ingest model for the given file
+
+        :param filename: The path of the file
+        :type filename: string
+        :param local_path: The local path being migrated
+        :type local_path: string
+        :param workspace: The workspace being migrated
+        :type workspace: :class:`storage.models.Workspace`
+        :param workspace_path: The path in the workspace being migrated
+        :type workspace_path: string
+        :param data_types: The data type tags to add to the file
+        :type data_types: list
+        :returns: The ingest model
+        :rtype: :class:`ingest.models.Ingest`
+        """
+
+        file_stat = os.stat(filename)
+        ingest = Ingest()
+        ingest.file_name = os.path.basename(filename)
+        ingest.file_path = os.path.join(workspace_path, os.path.relpath(filename, local_path))
+        ingest.transfer_started = datetime.utcfromtimestamp(file_stat.st_atime)
+        ingest.file_size = ingest.bytes_transferred = file_stat.st_size
+        ingest.transfer_ended = timezone.now()
+        ingest.media_type = get_media_type(filename)
+        ingest.workspace = workspace
+        for data_type in data_types:
+            ingest.add_data_type_tag(data_type)
+        ingest.status = 'TRANSFERRED'
+        return ingest
+
+    @staticmethod
+    def _get_walk_key(parts, is_file=True):
+        """Returns a key for the given relative path that sorts in the order the paths are walked, where the files of
+        a directory come before its sub-directories
+
+        :param parts: The components of the relative path
+        :type parts: list
+        :param is_file: Whether the path is a file or a directory
+        :type is_file: bool
+        :returns: The sort key
+        :rtype: tuple
+        """
+
+        if is_file:
+            return tuple((1, part) for part in parts[:-1]) + ((0, parts[-1]),)
+        return tuple((1, part) for part in parts)
+
+    @staticmethod
+    def _save_ingests(ingests, workspace, recipe):
+        """Creates the source files for the given ingests and saves them all in one transaction
+
+        :param ingests: The unsaved ingest models
+        :type ingests: list
+        :param workspace: The workspace being migrated
+        :type workspace: :class:`storage.models.Workspace`
+        :param recipe: The recipe to kick off for each ingested file, if any
+        :type recipe: string
+        """
+
+        with transaction.atomic():
+            source_files = []
+            when = timezone.now()
+            for ingest in ingests:
+                ingest.ingest_started = when
+                sf = SourceFile.create()
+                sf.update_uuid(ingest.file_name)
+                for tag in ingest.get_data_type_tags():
+                    sf.add_data_type_tag(tag)
+                sf.media_type = ingest.media_type
+                sf.file_name = ingest.file_name
+                sf.file_size = ingest.file_size
+                sf.file_path = ingest.file_path
+                sf.workspace = workspace
+                sf.is_deleted = False
+                sf.deleted = None
+                source_files.append(sf)
+            # New source files have no geometry, so they have no countries to set
+            SourceFile.objects.bulk_create(source_files)
+
+            when = timezone.now()
+            for ingest, sf in zip(ingests, source_files):
+                ingest.status = 'INGESTED'
+                ingest.ingest_ended = when
+                ingest.source_file = sf
+            Ingest.objects.bulk_create(ingests)
+
+            if recipe:
+                for ingest in ingests:
+                    IngestRecipeHandler().process_ingested_source_file(ingest.id, ingest.source_file,
+                                                                       ingest.ingest_ended)
+
+    @staticmethod
+    def _write_checkpoint(checkpoint_path, checkpoint):
+        """Writes the given checkpoint, replacing the previous checkpoint file in a single step so an interruption
+        cannot leave it partially written
+
+        :param checkpoint_path: The path of the checkpoint file
+        :type checkpoint_path: string
+        :param checkpoint: The checkpoint
+        :type checkpoint: dict
+        """
+
+        tmp_path = checkpoint_path + '.tmp'
+        with open(tmp_path, 'w') as checkpoint_file:
+            json.dump(checkpoint, checkpoint_file)
+        os.rename(tmp_path, checkpoint_path)
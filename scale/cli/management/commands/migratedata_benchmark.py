@@ -0,0 +1,85 @@
+"""Defines the command line method for benchmarking the migratedata command"""
+from __future__ import unicode_literals
+from __future__ import print_function
+
+import logging
+import os
+import shutil
+import tempfile
+import time
+
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from ingest.models import Ingest
+from storage.models import ScaleFile
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """Command that benchmarks migrating a synthetic local tree of files into scale
+    """
+
+    help = 'Benchmarks migratedata against a synthetic local tree of files and reports files per second'
+
+    def add_arguments(self, parser):
+        parser.add_argument('-w', '--workspace', action='store', required=True,
+                            help='Workspace name or ID to migrate the files into')
+        parser.add_argument('-f', '--num-files', action='store', type=int, default=100000,
+                            help='Number of files in the synthetic tree')
+        parser.add_argument('-d', '--files-per-dir', action='store', type=int, default=1000,
+                            help='Number of files in each directory of the synthetic tree')
+        parser.add_argument('-s', '--chunk-size', action='store', type=int, default=None,
+                            help='Number of files written to the database together')
+        parser.add_argument('-k', '--keep', action='store_true', default=False,
+                            help='Keep the migrated ingest and file records instead of deleting them')
+
+    def handle(self, *args, **options):
+        """See :meth:`django.core.management.base.BaseCommand.handle`.
+
+        This method creates the synthetic tree, migrates it and reports the rate.
+        """
+
+        local_path = tempfile.mkdtemp()
+        workspace_path = 'migratedata-benchmark-%d' % int(time.time())
+        try:
+            logger.info('Creating %d files in %s', options['num_files'], local_path)
+            self._create_tree(local_path, options['num_files'], options['files_per_dir'])
+
+            migrate_options = {'workspace': options['workspace'], 'workspace_path': workspace_path,
+                               'local_path': local_path}
+            if options['chunk_size']:
+                migrate_options['chunk_size'] = options['chunk_size']
+            started = time.time()
+            call_command('migratedata', **migrate_options)
+            duration = time.time() - started
+
+            num_files = Ingest.objects.filter(file_path__startswith=workspace_path + '/').count()
+            print('Migrated %d files in %.2f seconds (%.1f files/sec)' % (num_files, duration, num_files / duration))
+        finally:
+            shutil.rmtree(local_path, ignore_errors=True)
+            if not options['keep']:
+                with transaction.atomic():
+                    Ingest.objects.filter(file_path__startswith=workspace_path + '/').delete()
+                    ScaleFile.objects.filter(file_path__startswith=workspace_path + '/').delete()
+
+    @staticmethod
+    def _create_tree(path, num_files, files_per_dir):
+        """Creates a tree of small files under the given path
+
+        :param path: The root of the tree
+        :type path: string
+        :param num_files: The number of files to create
+        :type num_files: int
+        :param files_per_dir: The number of files in each directory
+        :type files_per_dir: int
+        """
+
+        for i in range(num_files):
+            dir_path = os.path.join(path, 'dir_%05d' % (i // files_per_dir))
+            if i % files_per_dir == 0:
+                os.makedirs(dir_path)
+            with open(os.path.join(dir_path, 'file_%07d.txt' % i), 'w') as data_file:
+                data_file.write('%d\n' % i)
@@ -0,0 +1,98 @@
+from __future__ import unicode_literals
+
+import json
+import os
+import shutil
+import tempfile
+
+import django
+from django.core.management import call_command
+from django.test import TestCase
+
+import storage.test.utils as storage_test_utils
+from cli.management.commands.migratedata import Command
+from ingest.models import Ingest
+from source.models import SourceFile
+
+
+class TestMigrateData(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+        self.workspace = storage_test_utils.create_workspace()
+        self.local_path = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.local_path)
+        for rel_path in ['b.txt', 'a.txt', 'c.log', 'sub2/e.txt', 'sub1/d.txt', 'sub1/deep/f.txt']:
+            file_path = os.path.join(self.local_path, rel_path)
+            if not os.path.exists(os.path.dirname(file_path)):
+                os.makedirs(os.path.dirname(file_path))
+            with open(file_path, 'w') as data_file:
+                data_file.write(rel_path)
+        self.checkpoint_path = os.path.join(self.local_path, 'checkpoint.json')
+
+    def _rel_paths(self, after=None):
+        return [os.path.relpath(file_path, self.local_path)
+                for file_path in Command.generate_file_list(self.local_path, None, ['*.json'], after)]
+
+    def test_generate_file_list(self):
+        """Tests that the file list is walked in sorted order, with the files of a directory before its
+        sub-directories"""
+
+        self.assertListEqual(self._rel_paths(), ['a.txt', 'b.txt', 'c.log', 'sub1/d.txt', 'sub1/deep/f.txt',
+                                                 'sub2/e.txt'])
+        txt_files = Command.generate_file_list(self.local_path, ['*.txt'], ['b*'])
+        self.assertEqual(len(list(txt_files)), 4)
+
+    def test_generate_file_list_after(self):
+        """Tests that the file list resumes after the given file"""
+
+        self.assertListEqual(self._rel_paths('b.txt'), ['c.log', 'sub1/d.txt', 'sub1/deep/f.txt', 'sub2/e.txt'])
+        self.assertListEqual(self._rel_paths('sub1/d.txt'), ['sub1/deep/f.txt', 'sub2/e.txt'])
+        self.assertListEqual(self._rel_paths('sub1/deep/f.txt'), ['sub2/e.txt'])
+        self.assertListEqual(self._rel_paths('sub2/e.txt'), [])
+
+    def test_generate_chunks(self):
+        """Tests grouping items into chunks"""
+
+        self.assertListEqual(list(Command.generate_chunks(range(5), 2)), [[0, 1], [2, 3], [4]])
+        self.assertListEqual(list(Command.generate_chunks([], 2)), [])
+
+    def test_migrate(self):
+        """Tests migrating files in chunks, recording a checkpoint"""
+
+        call_command('migratedata', workspace=self.workspace.name, workspace_path='data', local_path=self.local_path,
+                     data_type=['tag1'], exclude=['*.json'], checkpoint=self.checkpoint_path, chunk_size=4)
+
+        ingests = Ingest.objects.filter(workspace=self.workspace).select_related('source_file')
+        self.assertEqual(ingests.count(), 6)
+        for ingest in ingests:
+            self.assertEqual(ingest.status, 'INGESTED')
+            self.assertEqual(ingest.source_file.file_path, ingest.file_path)
+            self.assertListEqual(ingest.source_file.data_type_tags, ['tag1'])
+        self.assertTrue(SourceFile.objects.filter(file_path='data/sub1/deep/f.txt').exists())
+
+        with open(self.checkpoint_path, 'r') as checkpoint_file:
+            checkpoint = json.load(checkpoint_file)
+        self.assertEqual(checkpoint['last_path'], 'sub2/e.txt')
+        self.assertEqual(checkpoint['count'], 6)
+
+        # Running again with the completed checkpoint migrates nothing
+        call_command('migratedata', workspace=self.workspace.name, workspace_path='data', local_path=self.local_path,
+                     exclude=['*.json'], checkpoint=self.checkpoint_path)
+        self.assertEqual(Ingest.objects.filter(workspace=self.workspace).count(), 6)
+
+    def test_migrate_resume(self):
+        """Tests resuming an interrupted migration from its checkpoint"""
+
+        with open(self.checkpoint_path, 'w') as checkpoint_file:
+            json.dump({'workspace_id': self.workspace.id, 'workspace_path': 'data', 'last_path': 'sub1/d.txt',
+                       'count': 4}, checkpoint_file)
+
+        call_command('migratedata', workspace=self.workspace.name, workspace_path='data', local_path=self.local_path,
+                     exclude=['*.json'], checkpoint=self.checkpoint_path)
+
+        file_paths = Ingest.objects.filter(workspace=self.workspace).values_list('file_path', flat=True)
+        self.assertSetEqual(set(file_paths), {'data/sub1/deep/f.txt', 'data/sub2/e.txt'})
+        with open(self.checkpoint_path, 'r') as checkpoint_file:
+            self.assertEqual(json.load(checkpoint_file)['count'], 6)
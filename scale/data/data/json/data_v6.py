@@ -1,13 +1,13 @@
 """Manages the v6 data schema"""
 from __future__ import unicode_literals
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from data.data.data import Data
 from data.data.exceptions import InvalidData
 from data.data.json.data_v1 import DataV1
 from data.data.value import FileValue, JsonValue
+from util.schema import SchemaValidator
 
 
 SCHEMA_VERSION = '7'
@@ -41,6 +41,8 @@ DATA_SCHEMA = {
     },
 }
 
+DATA_VALIDATOR = SchemaValidator('data.data.json.data_v6', DATA_SCHEMA)
+
 
 def convert_data_to_v6_json(data):
     """Returns the v6 data JSON for the given data
@@ -93,7 +95,7 @@ class DataV6(object):
 
         try:
             if do_validate:
-                validate(self._data, DATA_SCHEMA)
+                DATA_VALIDATOR.validate(self._data)
         except ValidationError as ex:
             raise InvalidData('INVALID_DATA', 'Invalid data: %s' % unicode(ex))
 
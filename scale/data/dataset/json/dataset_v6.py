@@ -1,7 +1,6 @@
 """Manages the DataSet definition schema"""
 from __future__ import unicode_literals
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from data.data.exceptions import InvalidData
@@ -11,6 +10,7 @@ from data.exceptions import InvalidDataSetDefinition
 from data.dataset.dataset import DataSetDefinition
 
 import util.rest as rest_utils
+from util.schema import SchemaValidator
 
 SCHEMA_VERSION = '7'
 SCHEMA_VERSIONS = ['6', '7']
@@ -30,6 +30,9 @@ DATASET_DEFINITION_SCHEMA = {
     },
 }
 
+DATASET_DEFINITION_VALIDATOR = SchemaValidator('data.dataset.json.dataset_v6', DATASET_DEFINITION_SCHEMA)
+
+
 def convert_definition_to_v6_json(definition):
     """Returns the v6 dataset definition JSON for the given definition
 
@@ -83,7 +86,7 @@ class DataSetDefinitionV6(object):
         try:
             self._populate_default_values(do_validate=do_validate)
             if do_validate:
-                validate(self._definition, DATASET_DEFINITION_SCHEMA)
+                DATASET_DEFINITION_VALIDATOR.validate(self._definition)
                 if 'global_data' in definition:
                     dd = self.get_definition()
                     dd.validate()
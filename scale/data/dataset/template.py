@@ -0,0 +1,86 @@
+"""Defines the class that instantiates dataset member data from a data template"""
+from __future__ import unicode_literals
+
+import copy
+
+from data.data.data import Data
+from data.data.exceptions import InvalidData
+from data.data.json.data_v6 import DataV6
+from data.data.value import FileValue, JsonValue
+
+
+FILE_VALUE = 'FILE_VALUE'
+
+# Placeholder file ID used when validating the shape of a template
+PLACEHOLDER_FILE_ID = 0
+
+
+class DataSetMemberTemplate(object):
+    """Represents a data template that is filled with a single file for each dataset member. The template is parsed and
+    validated against the data schema once, after which member data can be instantiated for each file without copying
+    or re-validating the template.
+    """
+
+    def __init__(self, template):
+        """Constructor
+
+        :param template: The data template, where each file parameter to fill has the value 'FILE_VALUE'
+        :type template: dict
+
+        :raises :class:`data.data.exceptions.InvalidData`: If the given template is invalid
+        """
+
+        try:
+            sample = copy.deepcopy(template)
+            self._file_params = [name for name, value in sample['files'].items() if value == FILE_VALUE]
+            for name in self._file_params:
+                sample['files'][name] = [PLACEHOLDER_FILE_ID]
+        except (AttributeError, KeyError, TypeError) as ex:
+            raise InvalidData('INVALID_TEMPLATE', 'Specified template is invalid: %s' % ex)
+
+        sample_dict = DataV6(data=sample, do_validate=True).get_dict()
+        self._static_files = {name: file_ids for name, file_ids in sample_dict['files'].items()
+                              if name not in self._file_params}
+        self._json = sample_dict['json']
+
+    def get_data(self, file_id):
+        """Returns the data for a dataset member filled with the given file
+
+        :param file_id: The ID of the file to place in the template
+        :type file_id: int
+        :returns: The member data
+        :rtype: :class:`data.data.data.Data`
+        """
+
+        data = Data()
+        for name in self._file_params:
+            data.add_value(FileValue(name, [file_id]))
+        for name, file_ids in self._static_files.items():
+            data.add_value(FileValue(name, list(file_ids)))
+        for name, value in self._json.items():
+            data.add_value(JsonValue(name, value))
+        return data
+
+    def validate(self, dataset_def):
+        """Validates the template against the given dataset definition. Since every member instantiated from this
+        template has the same shape, validating a single placeholder member validates all of them. Any values that the
+        dataset definition does not accept are removed from the template.
+
+        :param dataset_def: The dataset definition
+        :type dataset_def: :class:`data.dataset.dataset.DataSetDefinition`
+        :returns: A list of warnings discovered during validation
+        :rtype: :func:`list`
+
+        :raises :class:`data.data.exceptions.InvalidData`: If the template data is invalid for the dataset
+        :raises :class:`data.exceptions.InvalidDataSetMember`: If the template data is invalid for the dataset
+        """
+
+        sample = self.get_data(PLACEHOLDER_FILE_ID)
+        warnings = dataset_def.validate(sample)
+
+        # Data validation removes extra values, so drop them from the template as well
+        self._file_params = [name for name in self._file_params if name in sample.values]
+        self._static_files = {name: ids for name, ids in self._static_files.items() if name in sample.values}
+        self._json = {name: value for name, value in self._json.items() if name in sample.values}
+
+        return warnings
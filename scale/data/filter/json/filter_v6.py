@@ -1,11 +1,11 @@
 """Manages the v6 data filter schema"""
 from __future__ import unicode_literals
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from data.filter.filter import DataFilter
 from data.filter.exceptions import InvalidDataFilter
+from util.schema import SchemaValidator
 
 
 SCHEMA_VERSION = '7'
@@ -77,6 +77,8 @@ DATA_FILTER_SCHEMA = {
     },
 }
 
+DATA_FILTER_VALIDATOR = SchemaValidator('data.filter.json.filter_v6', DATA_FILTER_SCHEMA)
+
 
 def convert_filter_to_v6_json(data_filter):
     """Returns the v6 data filter JSON for the given data filter
@@ -128,7 +130,7 @@ class DataFilterV6(object):
             
         try:
             if do_validate:
-                validate(self._data_filter, DATA_FILTER_SCHEMA)
+                DATA_FILTER_VALIDATOR.validate(self._data_filter)
                 for f in data_filter['filters']:
                     DataFilter.validate_filter(f)
         except ValidationError as ex:
@@ -1,12 +1,12 @@
 """Manages the v6 interface schema"""
 from __future__ import unicode_literals
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from data.interface.exceptions import InvalidInterface
 from data.interface.interface import Interface
 from data.interface.parameter import FileParameter, JsonParameter
+from util.schema import SchemaValidator
 
 
 SCHEMA_VERSION = '7'
@@ -81,6 +81,8 @@ INTERFACE_SCHEMA = {
     },
 }
 
+INTERFACE_VALIDATOR = SchemaValidator('data.interface.json.interface_v6', INTERFACE_SCHEMA)
+
 
 def convert_interface_to_v6_json(interface):
     """Returns the v6 interface JSON for the given interface
@@ -137,7 +139,7 @@ class InterfaceV6(object):
 
         try:
             if do_validate:
-                validate(self._interface, INTERFACE_SCHEMA)
+                INTERFACE_VALIDATOR.validate(self._interface)
         except ValidationError as ex:
             raise InvalidInterface('INVALID_INTERFACE', 'Invalid interface: %s' % unicode(ex))
 
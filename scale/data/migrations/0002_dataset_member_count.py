@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import connection, migrations, models
+
+
+def populate_member_count(apps, schema_editor):
+    # Count the existing members of each dataset
+    update = 'UPDATE data_set ds SET member_count = (SELECT COUNT(*) FROM data_set_member dsm WHERE dsm.dataset_id = ds.id)'
+    with connection.cursor() as cursor:
+        cursor.execute(update)
+        count = cursor.rowcount
+        if count:
+            print('%d datasets updated with member counts' % count)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('data', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='dataset',
+            name='member_count',
+            field=models.IntegerField(default=0),
+        ),
+        migrations.RunPython(populate_member_count),
+    ]
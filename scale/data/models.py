@@ -1,13 +1,12 @@
 """Defines the database models for datasets"""
 from __future__ import absolute_import, unicode_literals
 
-import copy
 import logging
 from collections import namedtuple
 
 import django.contrib.postgres.fields
 from django.db import models, transaction
-from django.db.models import Q, Count
+from django.db.models import F, Q, Count
 
 from data.data import data_util
 from data.data.json.data_v6 import convert_data_to_v6_json, DataV6
@@ -15,14 +14,18 @@ from data.data.exceptions import InvalidData
 from data.data.value import FileValue
 from data.dataset.dataset import DataSetDefinition
 from data.dataset.json.dataset_v6 import convert_definition_to_v6_json, DataSetDefinitionV6
+from data.dataset.template import DataSetMemberTemplate
 from data.exceptions import InvalidDataSetDefinition, InvalidDataSetMember
 from data.serializers import DataSetFileSerializerV6, DataSetMemberSerializerV6
 from storage.models import ScaleFile
 from util import rest as rest_utils
-from util.database import alphabetize
+from util.database import alphabetize, iterate_id_chunks, iterate_ordered_id_chunks
 
 logger = logging.getLogger(__name__)
 
+MEMBER_BATCH_SIZE = 1000  # Maximum batch size for creating DataSetMember models
+MAX_PREVIEW_MEMBERS = 1000  # Maximum number of members returned when previewing the members built from a template
+
 DataSetValidation = namedtuple('DataSetValidation', ['is_valid', 'errors', 'warnings'])
 # DataSetKey = namedtuple('DataSetKey', ['name', 'version'])
 
@@ -191,6 +194,8 @@ class DataSet(models.Model):
     :type created: :class:`django.db.models.DateTimeField`
     :keyword definition: Defines the dataset
     :type definition: class:`django.contrib.postgres.fields.JSONField`
+    :keyword member_count: The number of members created for the dataset so far, updated as members are created
+    :type member_count: :class:`django.db.models.IntegerField`
     """
     ALPHABETIZE_FIELDS = ['title', 'description']
 
@@ -198,6 +203,7 @@ class DataSet(models.Model):
     description = models.TextField(blank=True, null=True)
     created = models.DateTimeField(auto_now_add=True)
     definition = django.contrib.postgres.fields.JSONField(default=dict)
+    member_count = models.IntegerField(default=0)
 
     objects = DataSetManager()
 
@@ -335,19 +341,61 @@ class DataSetMemberManager(models.Manager):
             order=order,file_type=file_type,media_type=media_type)
 
         data_list = []
-        try:
-            for f in files:
-                entry = copy.deepcopy(template)
-                file_params = entry['files']
-                for p in file_params:
-                    if file_params[p] == 'FILE_VALUE':
-                        file_params[p] = [f.id]
-                data_list.append(DataV6(data=entry, do_validate=True).get_data())
-        except (KeyError, TypeError) as ex:
-            raise InvalidData('INVALID_TEMPLATE', "Specified template is invalid: %s" % ex)
+        for chunk in self.iterate_data_chunks(DataSetMemberTemplate(template), files):
+            data_list.extend(chunk)
 
         return data_list
 
+    def iterate_data_chunks(self, template, files, chunk_size=None, ordered=False):
+        """Iterates over the data for the dataset members built from the given template and file query. Only file IDs
+        are queried, in chunks, so arbitrarily large file queries can be processed in bounded memory. The files are in
+        ID order unless the query's own order is requested.
+
+        :param template: The template to fill with the files
+        :type template: :class:`data.dataset.template.DataSetMemberTemplate`
+        :param files: The query of files to place in the template
+        :type files: :class:`django.db.models.QuerySet`
+        :param chunk_size: The maximum number of data objects in each chunk, defaults to MEMBER_BATCH_SIZE
+        :type chunk_size: int
+        :param ordered: Whether to keep the order of the file query instead of ordering the files by ID
+        :type ordered: bool
+        :returns: A generator of data lists
+        :rtype: generator
+        """
+
+        if not chunk_size:
+            chunk_size = MEMBER_BATCH_SIZE
+
+        if ordered:
+            id_chunks = iterate_ordered_id_chunks(files, chunk_size)
+        else:
+            id_chunks = iterate_id_chunks(files, chunk_size)
+        for file_ids in id_chunks:
+            yield [template.get_data(file_id) for file_id in file_ids]
+
+    def preview_dataset_members_from_template(self, dataset_def, template, files, ordered=False):
+        """Returns the data for the first dataset members that would be built from the given template and file query,
+        up to MAX_PREVIEW_MEMBERS. The template is validated against the dataset definition once.
+
+        :param dataset_def: The dataset definition
+        :type dataset_def: :class:`data.dataset.dataset.DataSetDefinition`
+        :param template: The template to fill with the files
+        :type template: dict
+        :param files: The query of files to place in the template
+        :type files: :class:`django.db.models.QuerySet`
+        :param ordered: Whether to keep the order of the file query instead of ordering the files by ID
+        :type ordered: bool
+        :returns: The data for the first dataset members
+        :rtype: [:class:`data.data.data.Data`]
+
+        :raises :class:`data.data.exceptions.InvalidData`: If the template is invalid
+        :raises :class:`data.exceptions.InvalidDataSetMember`: If the template is invalid for the dataset
+        """
+
+        member_template = DataSetMemberTemplate(template)
+        member_template.validate(dataset_def)
+        return next(self.iterate_data_chunks(member_template, files, MAX_PREVIEW_MEMBERS, ordered), [])
+
     def validate_data_list(self, dataset_def, data_list):
         """Validates a list of data objects against a dataset
 
@@ -384,19 +432,78 @@ class DataSetMemberManager(models.Manager):
         """
 
         with transaction.atomic():
+            existing_scale_ids = set(DataSetFile.objects.get_file_ids(dataset_ids=[dataset.id]))
             dataset_members = []
-            datasetfiles = []
-            existing_scale_ids = DataSetFile.objects.get_file_ids(dataset_ids=[dataset.id])
-            for d in data_list:
-                dataset_member = DataSetMember()
-                dataset_member.dataset = dataset
-                dataset_member.data = convert_data_to_v6_json(d).get_dict()
-                dataset_member.file_ids = list(data_util.get_file_ids(d))
-                dataset_members.append(dataset_member)
-                datasetfiles.extend(DataSetFile.objects.create_dataset_files(dataset, d, existing_scale_ids))
-                existing_scale_ids.append(dataset_member.file_ids)
-            DataSetFile.objects.bulk_create(datasetfiles)
-            return DataSetMember.objects.bulk_create(dataset_members)
+            for i in range(0, len(data_list), MEMBER_BATCH_SIZE):
+                chunk = data_list[i:i + MEMBER_BATCH_SIZE]
+                dataset_members.extend(self._create_dataset_member_chunk(dataset, chunk, existing_scale_ids))
+            return dataset_members
+
+    def create_dataset_members_from_template(self, dataset, dataset_def, template, files, ordered=False):
+        """Creates the dataset members built from the given template and file query. The template is validated
+        against the dataset definition once and the members are then created in chunks, each in its own transaction.
+        The dataset's member count is updated after each chunk so that the progress of large datasets can be monitored.
+        If an error occurs partway through, the chunks already committed are kept, and calling this again with the same
+        file query creates their members a second time, so a retry should only query the files that were not yet added.
+
+        :param dataset: The dataset the members are a part of
+        :type dataset: :class:`data.models.DataSet`
+        :param dataset_def: The dataset definition
+        :type dataset_def: :class:`data.dataset.dataset.DataSetDefinition`
+        :param template: The template to fill with the files
+        :type template: dict
+        :param files: The query of files to place in the template
+        :type files: :class:`django.db.models.QuerySet`
+        :param ordered: Whether to create the members in the order of the file query instead of by file ID
+        :type ordered: bool
+        :returns: The number of dataset members created
+        :rtype: int
+
+        :raises :class:`data.data.exceptions.InvalidData`: If the template is invalid
+        :raises :class:`data.exceptions.InvalidDataSetMember`: If the template is invalid for the dataset
+        """
+
+        member_template = DataSetMemberTemplate(template)
+        member_template.validate(dataset_def)
+
+        existing_scale_ids = set(DataSetFile.objects.get_file_ids(dataset_ids=[dataset.id]))
+        num_created = 0
+        for data_list in self.iterate_data_chunks(member_template, files, ordered=ordered):
+            with transaction.atomic():
+                self._create_dataset_member_chunk(dataset, data_list, existing_scale_ids)
+            num_created += len(data_list)
+            logger.info('Created %d members for dataset %d', num_created, dataset.id)
+
+        return num_created
+
+    def _create_dataset_member_chunk(self, dataset, data_list, existing_scale_ids):
+        """Creates a chunk of dataset members and their dataset files and updates the dataset's member count. This
+        method should be called within a transaction.
+
+        :param dataset: The dataset the members are a part of
+        :type dataset: :class:`data.models.DataSet`
+        :param data_list: Data definitions of the dataset members
+        :type data_list: [:class:`data.data.data.Data`]
+        :param existing_scale_ids: The IDs of the files already in the dataset, updated with the new files
+        :type existing_scale_ids: set
+        :returns: The new dataset members
+        :rtype: [:class:`data.models.DataSetMember`]
+        """
+
+        dataset_members = []
+        datasetfiles = []
+        for d in data_list:
+            dataset_member = DataSetMember()
+            dataset_member.dataset = dataset
+            dataset_member.data = convert_data_to_v6_json(d).get_dict()
+            dataset_member.file_ids = list(data_util.get_file_ids(d))
+            dataset_members.append(dataset_member)
+            datasetfiles.extend(DataSetFile.objects.create_dataset_files(dataset, d, existing_scale_ids))
+            existing_scale_ids.update(dataset_member.file_ids)
+        DataSetFile.objects.bulk_create(datasetfiles)
+        dataset_members = DataSetMember.objects.bulk_create(dataset_members)
+        DataSet.objects.filter(id=dataset.id).update(member_count=F('member_count') + len(dataset_members))
+        return dataset_members
 
     def get_dataset_members(self, dataset):
         """Returns dataset members for the given dataset
@@ -484,7 +591,7 @@ class DataSetFileManager(models.Manager):
                         continue
                     file = DataSetFile()
                     file.dataset = dataset
-                    file.scale_file = ScaleFile.objects.get(pk=id)
+                    file.scale_file_id = id
                     file.parameter_name = i
                     datasetfiles.append(file)
         return datasetfiles
@@ -25,6 +25,7 @@ class DataSetBaseSerializerV6(ModelIdSerializer):
     title = serializers.CharField()
     description = serializers.CharField()
     created = serializers.DateTimeField()
+    member_count = serializers.IntegerField()
 
 class DataSetListSerializerV6(DataSetBaseSerializerV6):
     """Converts dataset model fields to REST output"""
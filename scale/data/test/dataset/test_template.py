@@ -0,0 +1,68 @@
+from __future__ import unicode_literals
+
+import copy
+
+import django
+from django.test.testcases import TestCase
+
+from data.data.exceptions import InvalidData
+from data.dataset.dataset import DataSetDefinition
+from data.dataset.template import DataSetMemberTemplate
+import data.test.utils as dataset_test_utils
+
+
+class TestDataSetMemberTemplate(TestCase):
+    """Tests related to the DataSetMemberTemplate class"""
+
+    def setUp(self):
+        django.setup()
+
+        self.template = {'version': '7',
+                         'files': {'input_e': 'FILE_VALUE', 'input_f': [1235, 1236]},
+                         'json': {'input_g': 999, 'input_h': {'greeting': 'hello'}}}
+
+    def test_get_data(self):
+        """Tests calling DataSetMemberTemplate.get_data()"""
+
+        template = DataSetMemberTemplate(self.template)
+        data = template.get_data(42)
+
+        self.assertSetEqual(set(data.values.keys()), {'input_e', 'input_f', 'input_g', 'input_h'})
+        self.assertListEqual(data.values['input_e'].file_ids, [42])
+        self.assertListEqual(data.values['input_f'].file_ids, [1235, 1236])
+        self.assertEqual(data.values['input_g'].value, 999)
+
+        # Template itself should not be modified
+        self.assertEqual(self.template['files']['input_e'], 'FILE_VALUE')
+        data = template.get_data(43)
+        self.assertListEqual(data.values['input_e'].file_ids, [43])
+
+    def test_invalid_template(self):
+        """Tests creating a DataSetMemberTemplate from an invalid template"""
+
+        with self.assertRaises(InvalidData) as context:
+            DataSetMemberTemplate({'json': {}})
+        self.assertEqual(context.exception.error.name, 'INVALID_TEMPLATE')
+
+        template = copy.deepcopy(self.template)
+        template['files']['input_f'] = 'not a list'
+        with self.assertRaises(InvalidData) as context:
+            DataSetMemberTemplate(template)
+        self.assertEqual(context.exception.error.name, 'INVALID_DATA')
+
+    def test_validate(self):
+        """Tests calling DataSetMemberTemplate.validate()"""
+
+        definition = DataSetDefinition(definition=copy.deepcopy(dataset_test_utils.DATASET_DEFINITION))
+
+        template = copy.deepcopy(self.template)
+        template['json']['extra'] = 'value'
+        member_template = DataSetMemberTemplate(template)
+        member_template.validate(definition)
+        self.assertNotIn('extra', member_template.get_data(42).values)
+
+        template = copy.deepcopy(self.template)
+        del template['files']['input_e']
+        with self.assertRaises(InvalidData) as context:
+            DataSetMemberTemplate(template).validate(definition)
+        self.assertEqual(context.exception.error.name, 'PARAM_REQUIRED')
@@ -7,12 +7,14 @@ import datetime
 import django
 from django.utils.timezone import now
 from django.test import TransactionTestCase
+from mock import patch
 
 from data.data.json.data_v6 import DataV6
 from data.models import DataSet, DataSetMember, DataSetFile
 import data.test.utils as dataset_test_utils
 from data.dataset.json.dataset_v6 import DataSetDefinitionV6
 import storage.test.utils as storage_test_utils
+from storage.models import ScaleFile
 
 class TestDataSetManager(TransactionTestCase):
 
@@ -169,6 +171,26 @@ class TestDataSetMemberManager(TransactionTestCase):
         the_dataset_member = DataSetMember.objects.get(pk=dataset_members[0].id)
         self.assertDictEqual(the_dataset_member.data, data_dict)
 
+    def test_create_dataset_members_from_template(self):
+        """Tests calling DataSetManager.create_dataset_members_from_template() """
+
+        template = {'version': '7',
+                    'files': {'input_e': 'FILE_VALUE'},
+                    'json': {'input_g': 999}}
+        files = ScaleFile.objects.filter(id__in=[self.file1.id, self.file2.id, self.file3.id])
+
+        # call test
+        with patch('data.models.MEMBER_BATCH_SIZE', 2):
+            num_created = DataSetMember.objects.create_dataset_members_from_template(
+                dataset=self.dataset, dataset_def=self.dataset.get_definition(), template=template, files=files)
+
+        # Check results
+        self.assertEqual(num_created, 3)
+        members = DataSetMember.objects.filter(dataset=self.dataset).order_by('id')
+        self.assertListEqual([m.file_ids for m in members], [[self.file1.id], [self.file2.id], [self.file3.id]])
+        self.assertEqual(DataSet.objects.get(id=self.dataset.id).member_count, 3)
+        self.assertEqual(DataSetFile.objects.filter(dataset=self.dataset).count(), 3)
+
     def test_validate_dataset_members(self):
         """Tests calling DataSetManager.validate_data_list() """
 
@@ -8,6 +8,7 @@ import json
 
 import django
 from django.utils.timezone import now
+from mock import patch
 from rest_framework import status
 from rest_framework.test import APITestCase
 
@@ -18,7 +19,7 @@ from util import rest
 from data.models import DataSet
 import data.test.utils as dataset_test_utils
 import storage.test.utils as storage_utils
-from storage.models import Workspace
+from storage.models import ScaleFile, Workspace
 
 """Tests the v6/datasets/ endpoint"""
 class TestDatasetViews(APITestCase):
@@ -467,7 +468,9 @@ class TestDatasetDetailsView(APITestCase):
         response = self.client.generic('POST', url, json.dumps(json_data), 'application/json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.content)
         result = json.loads(response.content)
-        self.assertEqual(len(result), 500)
+        self.assertEqual(result['id'], self.dataset.id)
+        self.assertEqual(result['member_count'], 501)
+        self.assertTrue('/%s/datasets/%d/' % (self.api, self.dataset.id) in response['location'])
         
         json_data = {
             'data_template': template,
@@ -477,7 +480,7 @@ class TestDatasetDetailsView(APITestCase):
         response = self.client.generic('POST', url, json.dumps(json_data), 'application/json')
         self.assertEqual(response.status_code, status.HTTP_201_CREATED, response.content)
         result = json.loads(response.content)
-        self.assertEqual(len(result), 1000)
+        self.assertEqual(result['member_count'], 1501)
         
     def test_add_filter_dataset_members_dry_run(self):
         """Tests adding new dataset members based on a filter"""
@@ -500,7 +503,36 @@ class TestDatasetDetailsView(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
         result = json.loads(response.content)
         self.assertEqual(len(result), 500)
-        
+        self.assertEqual(DataSet.objects.get(id=self.dataset.id).member_count, 1)
+
+    @patch('data.models.MAX_PREVIEW_MEMBERS', 10)
+    def test_add_filter_dataset_members_dry_run_ordered(self):
+        """Tests that a dry run returns only the first members, in the requested order"""
+
+        url = '/%s/datasets/%d/' % (self.api, self.dataset.id)
+
+        template = {
+            'version': '6',
+            'files': {'input_a': 'FILE_VALUE'},
+            'json': {}
+        }
+
+        json_data = {
+            'data_template': template,
+            'source_collection': '12345',
+            'order': ['-id'],
+            'dry_run': True
+        }
+
+        response = self.client.generic('POST', url, json.dumps(json_data), 'application/json')
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
+        result = json.loads(response.content)
+        self.assertEqual(len(result), 10)
+        file_ids = [member['files']['input_a'][0] for member in result]
+        expected_ids = list(ScaleFile.objects.filter(source_collection='12345').order_by('-id')
+                            .values_list('id', flat=True)[:10])
+        self.assertListEqual(file_ids, expected_ids)
+
     def test_add_invalid_dataset_member(self):
         """Tests adding an invalid new dataset member"""
 
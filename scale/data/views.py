@@ -13,11 +13,12 @@ from rest_framework.views import APIView
 
 from data.data.exceptions import InvalidData
 from data.data.json.data_v6 import DataV6, convert_data_to_v6_json
-from data.serializers import DataSetListSerializerV6, DataSetDetailsSerializerV6, \
+from data.serializers import DataSetBaseSerializerV6, DataSetListSerializerV6, DataSetDetailsSerializerV6, \
     DataSetMemberSerializerV6, DataSetMemberDetailsSerializerV6
-from data.exceptions import InvalidDataSetDefinition
+from data.exceptions import InvalidDataSetDefinition, InvalidDataSetMember
 from data.models import DataSet, DataSetMember
 from data.dataset.json.dataset_v6 import DataSetDefinitionV6
+from storage.models import ScaleFile
 import util.rest as rest_util
 from util.rest import BadParameter
 
@@ -209,27 +210,35 @@ class DataSetView(ListCreateAPIView):
                 logger.exception(message)
                 raise BadParameter('%s: %s' % (message, unicode(ex)))
         elif template:
+            files = ScaleFile.objects.filter_files(
+                data_started=data_started, data_ended=data_ended,
+                created_started=created_started, created_ended=created_ended,
+                source_started=source_started, source_ended=source_ended,
+                source_sensor_classes=source_sensor_classes, source_sensors=source_sensors,
+                source_collections=source_collections, source_tasks=source_tasks,
+                mod_started=mod_started, mod_ended=mod_ended, job_type_ids=job_type_ids,
+                job_type_names=job_type_names, job_ids=job_ids,
+                file_names=file_names, file_name_search=file_name_search,
+                job_outputs=job_outputs, recipe_ids=recipe_ids,
+                recipe_type_ids=recipe_type_ids, recipe_nodes=recipe_nodes, batch_ids=batch_ids,
+                order=order, file_type=file_types, media_type=media_type)
             try:
-                data_list = DataSetMember.objects.build_data_list(template=template,
-                                                              data_started=data_started, data_ended=data_ended,
-                                                              created_started=created_started, created_ended=created_ended,
-                                                              source_started=source_started, source_ended=source_ended,
-                                                              source_sensor_classes=source_sensor_classes,
-                                                              source_sensors=source_sensors,
-                                                              source_collections=source_collections,
-                                                              source_tasks=source_tasks,
-                                                              mod_started=mod_started, mod_ended=mod_ended,
-                                                              job_type_ids=job_type_ids,
-                                                              job_type_names=job_type_names, job_ids=job_ids,
-                                                              file_names=file_names, file_name_search=file_name_search,
-                                                              job_outputs=job_outputs, recipe_ids=recipe_ids,
-                                                              recipe_type_ids=recipe_type_ids,
-                                                              recipe_nodes=recipe_nodes, batch_ids=batch_ids,
-                                                              order=order,file_type=file_types, media_type=media_type)
+                if not dry_run:
+                    return self._create_members_from_template(request, dataset, dataset_def, template, files,
+                                                              bool(order))
+                data_list = DataSetMember.objects.preview_dataset_members_from_template(dataset_def, template, files,
+                                                                                        bool(order))
             except InvalidData as ex:
                 message = 'Data is invalid'
                 logger.exception(message)
                 raise BadParameter('%s: %s' % (message, unicode(ex)))
+            except InvalidDataSetMember as ex:
+                raise BadParameter('%s: %s' % ('Error(s) validating data against dataset', [ex.error.to_dict()]))
+
+            if not data_list:
+                resp_dict = {'No Results': 'No files found from filters and/or no data provided'}
+                return Response(resp_dict)
+            return Response([convert_data_to_v6_json(d).get_dict() for d in data_list])
 
         if not data_list:
             resp_dict = {'No Results': 'No files found from filters and/or no data provided'}
@@ -254,6 +263,41 @@ class DataSetView(ListCreateAPIView):
             resp_dict.append(convert_data_to_v6_json(dl).get_dict())
         return Response(resp_dict)
 
+    def _create_members_from_template(self, request, dataset, dataset_def, template, files, ordered):
+        """Creates the dataset members for the given template and file query, streaming the files in chunks, and returns
+        the details of the dataset
+
+        :param request: the HTTP POST request
+        :type request: :class:`rest_framework.request.Request`
+        :param dataset: The new dataset
+        :type dataset: :class:`data.models.DataSet`
+        :param dataset_def: The dataset definition
+        :type dataset_def: :class:`data.dataset.dataset.DataSetDefinition`
+        :param template: The data template to fill with the files
+        :type template: dict
+        :param files: The query of files to place in the template
+        :type files: :class:`django.db.models.QuerySet`
+        :param ordered: Whether to create the members in the order of the file query instead of by file ID
+        :type ordered: bool
+        :rtype: :class:`rest_framework.response.Response`
+        :returns: the HTTP response to send back to the user
+        """
+
+        try:
+            num_created = DataSetMember.objects.create_dataset_members_from_template(dataset, dataset_def, template,
+                                                                                     files, ordered)
+        except InvalidDataSetMember as ex:
+            raise BadParameter('%s: %s' % ('Error(s) validating data against dataset', [ex.error.to_dict()]))
+
+        if not num_created:
+            resp_dict = {'No Results': 'No files found from filters and/or no data provided'}
+            return Response(resp_dict)
+
+        dataset = DataSet.objects.get(id=dataset.id)
+        serializer = DataSetDetailsSerializerV6(dataset)
+        url = reverse('dataset_details_view', args=[dataset.id], request=request)
+        return Response(serializer.data, status=status.HTTP_201_CREATED, headers=dict(location=url))
+
 class DataSetDetailsView(GenericAPIView):
     """This view is the endpoint for retrieving details of a specific dataset"""
 
@@ -367,36 +411,33 @@ class DataSetDetailsView(GenericAPIView):
         data_list = []
 
         try:
-            if data:
-                for d in data:
-                    data = DataV6(data=d, do_validate=True).get_data()
-                    data_list.append(data)
-            else:
-                data_list = DataSetMember.objects.build_data_list(template=template,
-                    data_started=data_started, data_ended=data_ended,
-                    created_started=created_started, created_ended=created_ended,
-                    source_started=source_started, source_ended=source_ended,
-                    source_sensor_classes=source_sensor_classes, source_sensors=source_sensors,
-                    source_collections=source_collections, source_tasks=source_tasks,
-                    mod_started=mod_started, mod_ended=mod_ended, job_type_ids=job_type_ids,
-                    job_type_names=job_type_names, job_ids=job_ids,
-                    file_names=file_names, job_outputs=job_outputs, recipe_ids=recipe_ids,
-                    recipe_type_ids=recipe_type_ids, recipe_nodes=recipe_nodes, batch_ids=batch_ids,
-                    order=order,file_type=file_type, media_type=media_type)
+            dataset = DataSet.objects.get(pk=dataset_id)
+        except DataSet.DoesNotExist:
+            raise Http404
+
+        if not data:
+            files = ScaleFile.objects.filter_files(
+                data_started=data_started, data_ended=data_ended,
+                created_started=created_started, created_ended=created_ended,
+                source_started=source_started, source_ended=source_ended,
+                source_sensor_classes=source_sensor_classes, source_sensors=source_sensors,
+                source_collections=source_collections, source_tasks=source_tasks,
+                mod_started=mod_started, mod_ended=mod_ended, job_type_ids=job_type_ids,
+                job_type_names=job_type_names, job_ids=job_ids,
+                file_names=file_names, job_outputs=job_outputs, recipe_ids=recipe_ids,
+                recipe_type_ids=recipe_type_ids, recipe_nodes=recipe_nodes, batch_ids=batch_ids,
+                order=order,file_type=file_type, media_type=media_type)
+            return self._add_members_from_template(request, dataset, template, files, bool(order), dry_run)
+
+        try:
+            for d in data:
+                data = DataV6(data=d, do_validate=True).get_data()
+                data_list.append(data)
         except InvalidData as ex:
             message = 'Data is invalid'
             logger.exception(message)
             raise BadParameter('%s: %s' % (message, unicode(ex)))
 
-        if not data_list:
-            resp_dict = {'No Results': 'No files found from filters and/or no data provided'}
-            return Response(resp_dict)
-
-        try:
-            dataset = DataSet.objects.get(pk=dataset_id)
-        except DataSet.DoesNotExist:
-            raise Http404
-
         validation = DataSetMember.objects.validate_data_list(dataset_def=dataset.get_definition(), data_list=data_list)
         members = []
         if validation.is_valid and not dry_run:
@@ -412,6 +453,55 @@ class DataSetDetailsView(GenericAPIView):
             resp_dict.append(convert_data_to_v6_json(dl).get_dict())
         return Response(resp_dict)
 
+    def _add_members_from_template(self, request, dataset, template, files, ordered, dry_run):
+        """Adds the dataset members for the given template and file query, streaming the files in chunks, and returns
+        the dataset with its new member count. A dry run instead returns the data for the first members that would be
+        added.
+
+        :param request: the HTTP POST request
+        :type request: :class:`rest_framework.request.Request`
+        :param dataset: The dataset
+        :type dataset: :class:`data.models.DataSet`
+        :param template: The data template to fill with the files
+        :type template: dict
+        :param files: The query of files to place in the template
+        :type files: :class:`django.db.models.QuerySet`
+        :param ordered: Whether to add the members in the order of the file query instead of by file ID
+        :type ordered: bool
+        :param dry_run: Whether to only return the data for the members that would be added
+        :type dry_run: bool
+        :rtype: :class:`rest_framework.response.Response`
+        :returns: the HTTP response to send back to the user
+        """
+
+        dataset_def = dataset.get_definition()
+        try:
+            if dry_run:
+                data_list = DataSetMember.objects.preview_dataset_members_from_template(dataset_def, template, files,
+                                                                                        ordered)
+                num_members = len(data_list)
+            else:
+                num_members = DataSetMember.objects.create_dataset_members_from_template(dataset, dataset_def,
+                                                                                         template, files, ordered)
+        except InvalidData as ex:
+            message = 'Data is invalid'
+            logger.exception(message)
+            raise BadParameter('%s: %s' % (message, unicode(ex)))
+        except InvalidDataSetMember as ex:
+            raise BadParameter('%s: %s' % ('Error(s) validating data against dataset', [ex.error.to_dict()]))
+
+        if not num_members:
+            resp_dict = {'No Results': 'No files found from filters and/or no data provided'}
+            return Response(resp_dict)
+
+        if dry_run:
+            return Response([convert_data_to_v6_json(d).get_dict() for d in data_list])
+
+        dataset = DataSet.objects.get(id=dataset.id)
+        serializer = DataSetBaseSerializerV6(dataset)
+        url = reverse('dataset_details_view', args=[dataset.id], request=request)
+        return Response(serializer.data, status=status.HTTP_201_CREATED, headers=dict(location=url))
+
 
 class DataSetMembersView(ListAPIView):
     """This view is the endpoint for retrieving members of a specific dataset"""
@@ -15,7 +15,7 @@ rm -fr environment/scale
 
 # Launch a database for Scale testing
 docker run -d --restart=always -p ${SCALE_DB_PORT}:5432 --name scale-postgis \
-    -e POSTGRES_PASSWORD=${SCALE_DB_PASS} mdillon/postgis:9.4-alpine
+    -e POSTGRES_PASSWORD=${SCALE_DB_PASS} mdillon/postgis:9.5-alpine
 echo Giving Postgres a moment to start up before initializing...
 sleep 10
 
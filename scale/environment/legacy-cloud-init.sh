@@ -1,13 +1,13 @@
 #!/usr/bin/env bash
 
-# Clean up old Postgres and install 9.4 version
+# Clean up old Postgres and install 9.5 version
 service postgresql stop
 apt-get --purge remove -y postgresql\*
 su -c 'echo "deb http://apt.postgresql.org/pub/repos/apt/ trusty-pgdg main" > /etc/apt/sources.list.d/pgdg.list'
 apt-get update
 wget --quiet -O - https://www.postgresql.org/media/keys/ACCC4CF8.asc | apt-key add -
-apt-get install -y --force-yes  postgresql-9.4 postgresql-contrib-9.4 postgresql-9.4-postgis-2.3
-sed 's^local   all             all                                     peer^local   all             all                                     trust^g' -i /etc/postgresql/9.4/main/pg_hba.conf
+apt-get install -y --force-yes  postgresql-9.5 postgresql-contrib-9.5 postgresql-9.5-postgis-2.3
+sed 's^local   all             all                                     peer^local   all             all                                     trust^g' -i /etc/postgresql/9.5/main/pg_hba.conf
 service postgresql start
 update-rc.d postgresql enable
 
@@ -3,7 +3,7 @@ set SCALE_MESSAGE_PORT=55672
 set SCALE_DB_PASS=scale-postgres
 
 REM Launch a database for Scale testing
-docker run -d --restart=always -p %SCALE_DB_PORT%:5432 --name scale-postgis -e POSTGRES_PASSWORD=%SCALE_DB_PASS% mdillon/postgis:9.4-alpine
+docker run -d --restart=always -p %SCALE_DB_PORT%:5432 --name scale-postgis -e POSTGRES_PASSWORD=%SCALE_DB_PASS% mdillon/postgis:9.5-alpine
 
 REM Launch a message broker for Scale testing
 docker run -d --restart=always -p %SCALE_MESSAGE_PORT%:5672 --name scale-rabbitmq rabbitmq:3.6-management
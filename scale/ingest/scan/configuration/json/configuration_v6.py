@@ -5,7 +5,6 @@ import logging
 import os
 import re
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from ingest.handlers.file_handler import FileHandler
@@ -14,6 +13,7 @@ from ingest.scan.configuration.scan_configuration import ScanConfiguration
 from ingest.scan.configuration.exceptions import InvalidScanConfiguration
 from ingest.scan.scanners import factory
 from storage.models import Workspace
+from util.schema import SchemaValidator
 
 logger = logging.getLogger(__name__)
 
@@ -96,6 +96,9 @@ SCAN_CONFIGURATION_SCHEMA = {
     }
 }
 
+SCAN_CONFIGURATION_VALIDATOR = SchemaValidator('ingest.scan.configuration.json.configuration_v6', SCAN_CONFIGURATION_SCHEMA)
+
+
 def convert_config_to_v6_json(config):
     """Returns the v6 scan configuration JSON for the given configuration
 
@@ -136,7 +139,7 @@ class ScanConfigurationV6(object):
 
         try:
             if do_validate:
-                validate(self._configuration, SCAN_CONFIGURATION_SCHEMA)
+                SCAN_CONFIGURATION_VALIDATOR.validate(self._configuration)
         except ValidationError as ex:
             raise InvalidScanConfiguration('Invalid Scan configuration: %s' % unicode(ex))
 
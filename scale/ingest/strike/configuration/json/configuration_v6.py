@@ -5,7 +5,6 @@ import logging
 import os
 import re
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from ingest.handlers.file_handler import FileHandler
@@ -14,6 +13,7 @@ from ingest.strike.configuration.strike_configuration import StrikeConfiguration
 from ingest.strike.configuration.exceptions import InvalidStrikeConfiguration
 from ingest.strike.monitors import factory
 from storage.models import Workspace
+from util.schema import SchemaValidator
 
 logger = logging.getLogger(__name__)
 
@@ -93,6 +93,9 @@ STRIKE_CONFIGURATION_SCHEMA = {
     }
 }
 
+STRIKE_CONFIGURATION_VALIDATOR = SchemaValidator('ingest.strike.configuration.json.configuration_v6', STRIKE_CONFIGURATION_SCHEMA)
+
+
 def convert_strike_config_to_v6_json(config, sanitize=True):
     """Returns the v6 strike configuration JSON for the given configuration
 
@@ -139,7 +142,7 @@ class StrikeConfigurationV6(object):
 
         try:
             if do_validate:
-                validate(configuration, STRIKE_CONFIGURATION_SCHEMA)
+                STRIKE_CONFIGURATION_VALIDATOR.validate(configuration)
         except ValidationError as ex:
             raise InvalidStrikeConfiguration('Invalid Strike configuration: %s' % unicode(ex))
 
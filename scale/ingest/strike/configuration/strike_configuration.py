@@ -5,7 +5,6 @@ import logging
 import os
 import re
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from ingest.handlers.file_handler import FileHandler
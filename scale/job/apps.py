@@ -60,3 +60,9 @@ class JobConfig(AppConfig):
         add_message_type(SpawnDeleteFilesJob)
         add_message_type(UncancelJobs)
         add_message_type(UnpublishJobs)
+
+        # Register the job timeline processor with the clock system
+        import job.clock as clock
+        from job.timeline import JobTimelineProcessor
+
+        clock.register_processor('scale-job-timeline', JobTimelineProcessor)
@@ -6,7 +6,6 @@ import logging
 import os
 import re
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from job.configuration.data.exceptions import InvalidData, InvalidConnection, InvalidConfiguration
@@ -19,6 +18,7 @@ from job.configuration.results.results_manifest.results_manifest import ResultsM
 from job.execution.container import SCALE_JOB_EXE_INPUT_PATH, SCALE_JOB_EXE_OUTPUT_PATH
 from product.types import ProductFileMetadata
 from scheduler.vault.manager import secrets_mgr
+from util.schema import SchemaValidator
 
 logger = logging.getLogger(__name__)
 
@@ -199,6 +199,8 @@ JOB_INTERFACE_SCHEMA = {
     },
 }
 
+JOB_INTERFACE_VALIDATOR = SchemaValidator('job.configuration.interface.job_interface', JOB_INTERFACE_SCHEMA)
+
 
 class JobInterface(object):
     """Represents the interface for executing a job"""
@@ -232,7 +234,7 @@ class JobInterface(object):
 
         try:
             if do_validate:
-                validate(definition, JOB_INTERFACE_SCHEMA)
+                JOB_INTERFACE_VALIDATOR.validate(definition)
         except ValidationError as validation_error:
             raise InvalidInterfaceDefinition(validation_error)
 
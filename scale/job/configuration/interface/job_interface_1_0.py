@@ -6,7 +6,6 @@ import logging
 import os
 import re
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from job.configuration.data.exceptions import InvalidData, InvalidConnection
@@ -15,6 +14,7 @@ from job.configuration.interface.scale_file import ScaleFileDescription
 from job.configuration.results.exceptions import InvalidResultsManifest
 from job.configuration.results.results_manifest.results_manifest import ResultsManifest
 from job.execution.container import SCALE_JOB_EXE_INPUT_PATH, SCALE_JOB_EXE_OUTPUT_PATH
+from util.schema import SchemaValidator
 
 
 logger = logging.getLogger(__name__)
@@ -120,6 +120,8 @@ JOB_INTERFACE_SCHEMA = {
     },
 }
 
+JOB_INTERFACE_VALIDATOR = SchemaValidator('job.configuration.interface.job_interface_1_0', JOB_INTERFACE_SCHEMA)
+
 
 class JobInterface(object):
     """Represents the interface for executing a job"""
@@ -142,7 +144,7 @@ class JobInterface(object):
         self._output_file_manifest_dict = {}  # str->bool
 
         try:
-            validate(definition, JOB_INTERFACE_SCHEMA)
+            JOB_INTERFACE_VALIDATOR.validate(definition)
         except ValidationError as validation_error:
             raise InvalidInterfaceDefinition(validation_error)
 
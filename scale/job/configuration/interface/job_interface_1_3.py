@@ -6,7 +6,6 @@ import logging
 import os
 import re
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from job.configuration.data.exceptions import InvalidData, InvalidConnection
@@ -18,6 +17,7 @@ from job.configuration.results.exceptions import InvalidResultsManifest
 from job.configuration.results.results_manifest.results_manifest import ResultsManifest
 from job.execution.container import SCALE_JOB_EXE_INPUT_PATH, SCALE_JOB_EXE_OUTPUT_PATH
 from scheduler.vault.manager import secrets_mgr
+from util.schema import SchemaValidator
 
 
 logger = logging.getLogger(__name__)
@@ -170,6 +170,8 @@ JOB_INTERFACE_SCHEMA = {
     },
 }
 
+JOB_INTERFACE_VALIDATOR = SchemaValidator('job.configuration.interface.job_interface_1_3', JOB_INTERFACE_SCHEMA)
+
 
 class JobInterface(object):
     """Represents the interface for executing a job"""
@@ -198,7 +200,7 @@ class JobInterface(object):
             self.convert_interface(definition)
 
         try:
-            validate(definition, JOB_INTERFACE_SCHEMA)
+            JOB_INTERFACE_VALIDATOR.validate(definition)
         except ValidationError as validation_error:
             raise InvalidInterfaceDefinition(validation_error)
 
@@ -1,13 +1,13 @@
 """Manages the v6 job configuration schema"""
 from __future__ import unicode_literals
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from job.configuration.configuration import DEFAULT_PRIORITY, JobConfiguration
 from job.configuration.exceptions import InvalidJobConfiguration
 from job.configuration.mount import HostMountConfig, VolumeMountConfig
 from job.execution.configuration.volume import HOST_TYPE, VOLUME_TYPE
+from util.schema import SchemaValidator
 
 
 SCHEMA_VERSION = '7'
@@ -100,6 +100,8 @@ JOB_CONFIG_SCHEMA = {
     },
 }
 
+JOB_CONFIG_VALIDATOR = SchemaValidator('job.configuration.json.job_config_v6', JOB_CONFIG_SCHEMA)
+
 
 def convert_config_to_v6_json(config):
     """Returns the v6 job configuration JSON for the given configuration
@@ -167,7 +169,7 @@ class JobConfigurationV6(object):
 
         try:
             if do_validate:
-                validate(self._config, JOB_CONFIG_SCHEMA)
+                JOB_CONFIG_VALIDATOR.validate(self._config, memoize=True)
         except ValidationError as ex:
             raise InvalidJobConfiguration('INVALID_CONFIGURATION', 'Invalid configuration: %s' % unicode(ex))
 
@@ -7,11 +7,11 @@ from __future__ import unicode_literals
 import copy
 import logging
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 import job.configuration.results.results_manifest.results_manifest_1_0 as previous_manifest
 from job.configuration.results.exceptions import InvalidResultsManifest, MissingRequiredOutput
+from util.schema import SchemaValidator
 
 logger = logging.getLogger(__name__)
 
@@ -143,6 +143,8 @@ RESULTS_MANIFEST_SCHEMA = {
     }
 }
 
+RESULTS_MANIFEST_VALIDATOR = SchemaValidator('job.configuration.results.results_manifest.results_manifest', RESULTS_MANIFEST_SCHEMA)
+
 
 class ResultsManifest(object):
     """Represents the interface for executing a job
@@ -168,7 +170,7 @@ class ResultsManifest(object):
         self._json_manifest = json_manifest
 
         try:
-            validate(json_manifest, RESULTS_MANIFEST_SCHEMA)
+            RESULTS_MANIFEST_VALIDATOR.validate(json_manifest)
         except ValidationError as validation_error:
             raise InvalidResultsManifest(str(validation_error))
 
@@ -23,7 +23,6 @@ from job.execution.container import get_job_exe_input_vol_name, get_job_exe_outp
     get_workspace_volume_name, SCALE_JOB_EXE_INPUT_PATH, SCALE_JOB_EXE_OUTPUT_PATH, SCALE_INPUT_METADATA_PATH
 from job.execution.tasks.post_task import POST_TASK_COMMAND_ARGS
 from job.execution.tasks.pre_task import PRE_TASK_COMMAND_ARGS
-from job.seed.manifest import SeedManifest
 from job.tasks.pull_task import create_pull_command
 from node.resources.node_resources import NodeResources
 from node.resources.resource import Disk
@@ -53,6 +52,7 @@ class QueuedExecutionConfigurator(object):
         """
 
         self._input_files = input_files
+        self._cached_manifests = {}  # {Job type revision ID: (SeedManifest, input interface)}
         self._cached_workspace_names = {}  # {ID: Name}
 
     def configure_queued_job(self, job):
@@ -74,7 +74,7 @@ class QueuedExecutionConfigurator(object):
 
         # Set up env vars for job's input data
         input_values = data.get_injected_input_values(input_files_dict)
-        interface = job.job_type_rev.get_input_interface()
+        manifest, interface = self._get_manifest(job)
 
         env_vars = {}
         if isinstance(data, JobData):
@@ -103,15 +103,14 @@ class QueuedExecutionConfigurator(object):
                 # Set output workspaces from job configuration
                 output_workspaces = {}
                 job_config = job.get_job_configuration()
-                interface = SeedManifest(job.job_type_rev.manifest, do_validate=False)
-                for output_name in interface.get_file_output_names():
+                for output_name in manifest.get_file_output_names():
                     output_workspace = job_config.get_output_workspace(output_name)
                     if output_workspace:
                         output_workspaces[output_name] = output_workspace
                 config.set_output_workspaces(output_workspaces)
 
         # Create main task with fields populated from input data
-        args = job.get_job_interface().get_injected_command_args(input_values, env_vars)
+        args = manifest.get_injected_command_args(input_values, env_vars)
         config.create_tasks(['main'])
         config.add_to_task('main', args=args, env_vars=env_vars, workspaces=task_workspaces)
         return config
@@ -133,6 +132,21 @@ class QueuedExecutionConfigurator(object):
             for workspace in Workspace.objects.filter(id__in=ids).iterator():
                 self._cached_workspace_names[workspace.id] = workspace.name
 
+    def _get_manifest(self, job):
+        """Returns the Seed manifest and input interface of the given job's job type revision, parsing them only once
+        for each revision
+
+        :param job: The queued job model
+        :type job: :class:`job.models.Job`
+        :returns: The Seed manifest and input interface
+        :rtype: tuple
+        """
+
+        if job.job_type_rev_id not in self._cached_manifests:
+            manifest = job.get_job_interface()
+            self._cached_manifests[job.job_type_rev_id] = (manifest, manifest.get_input_interface())
+        return self._cached_manifests[job.job_type_rev_id]
+
     def _create_input_file_dict(self, job_data):
         """Creates the dict storing lists of input files by input name
 
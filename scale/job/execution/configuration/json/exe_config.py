@@ -4,7 +4,6 @@ from __future__ import unicode_literals
 import logging
 from copy import deepcopy
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from job.execution.configuration.docker_param import DockerParameter
@@ -14,6 +13,7 @@ from job.execution.configuration.volume import Volume, MODE_RO, MODE_RW
 from job.execution.configuration.workspace import TaskWorkspace
 from node.resources.node_resources import NodeResources
 from node.resources.resource import ScalarResource
+from util.schema import SchemaValidator
 
 logger = logging.getLogger(__name__)
 
@@ -216,6 +216,8 @@ EXE_CONFIG_SCHEMA = {
     },
 }
 
+EXE_CONFIG_VALIDATOR = SchemaValidator('job.execution.configuration.json.exe_config', EXE_CONFIG_SCHEMA)
+
 
 class ExecutionConfiguration(object):
     """Represents a job execution configuration
@@ -246,7 +248,7 @@ class ExecutionConfiguration(object):
 
         try:
             if do_validate:
-                validate(configuration, EXE_CONFIG_SCHEMA)
+                EXE_CONFIG_VALIDATOR.validate(configuration)
         except ValidationError as validation_error:
             raise InvalidExecutionConfiguration(validation_error)
 
@@ -3,10 +3,10 @@ from __future__ import unicode_literals
 
 import logging
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from job.execution.configuration.exceptions import InvalidExecutionConfiguration
+from util.schema import SchemaValidator
 
 
 logger = logging.getLogger(__name__)
@@ -80,6 +80,8 @@ EXE_CONFIG_SCHEMA = {
     },
 }
 
+EXE_CONFIG_VALIDATOR = SchemaValidator('job.execution.configuration.json.exe_config_1_0', EXE_CONFIG_SCHEMA)
+
 
 class TaskWorkspace(object):
     """Represents a workspace needed by a job task
@@ -117,7 +119,7 @@ class ExecutionConfiguration(object):
         self._post_task_workspace_names = set()
 
         try:
-            validate(configuration, EXE_CONFIG_SCHEMA)
+            EXE_CONFIG_VALIDATOR.validate(configuration)
         except ValidationError as validation_error:
             raise InvalidExecutionConfiguration(validation_error)
 
@@ -3,12 +3,12 @@ from __future__ import unicode_literals
 
 import logging
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from job.execution.configuration.exceptions import InvalidExecutionConfiguration
 from job.execution.configuration.json import exe_config_1_0 as previous_version
 from job.execution.configuration.volume import MODE_RO, MODE_RW
+from util.schema import SchemaValidator
 
 logger = logging.getLogger(__name__)
 
@@ -98,6 +98,8 @@ EXE_CONFIG_SCHEMA = {
     },
 }
 
+EXE_CONFIG_VALIDATOR = SchemaValidator('job.execution.configuration.json.exe_config_1_1', EXE_CONFIG_SCHEMA)
+
 
 class ExecutionConfiguration(previous_version.ExecutionConfiguration):
     """Represents a job configuration
@@ -129,7 +131,7 @@ class ExecutionConfiguration(previous_version.ExecutionConfiguration):
             self.convert_configuration(configuration)
 
         try:
-            validate(configuration, EXE_CONFIG_SCHEMA)
+            EXE_CONFIG_VALIDATOR.validate(configuration)
         except ValidationError as validation_error:
             raise InvalidExecutionConfiguration(validation_error)
 
@@ -219,6 +219,21 @@ class RunningJobExecution(object):
         with self._lock:
             self._set_final_status('FAILED', when, error)
 
+    def get_starvation_deadline(self):
+        """Returns the time after which this job execution will be starved of resources for its next task, possibly None
+        if this job execution is not currently waiting to launch its next task
+
+        :returns: The starvation deadline, possibly None
+        :rtype: :class:`datetime.datetime`
+        """
+
+        with self._lock:
+            if self._has_been_starved or self._current_task or not self._remaining_tasks:
+                return None
+            if not self._last_task_finished:
+                return None
+            return self._last_task_finished + RESOURCE_STARVATION_THRESHOLD
+
     def get_container_names(self):
         """Returns the list of container names for all tasks in this job execution
 
@@ -0,0 +1,167 @@
+"""Defines the methods for retrieving job execution logs from Elasticsearch"""
+from __future__ import unicode_literals
+
+import json
+import logging
+
+import django.utils.html
+from django.conf import settings
+
+
+# The Elasticsearch indices that hold job execution logs
+LOG_INDICES = 'logstash-*,scalelogs-*'
+
+# The number of log hits retrieved from Elasticsearch in each page
+LOG_PAGE_SIZE = 1000
+
+# The default index.max_result_window of Elasticsearch, which limits paging by offset
+MAX_RESULT_WINDOW = 10000
+
+LOG_HTML_HEADER = '<html><head><style>.stdout {} .stderr {color: red;}</style></head><body>'
+LOG_HTML_FOOTER = '</body></html>'
+
+logger = logging.getLogger(__name__)
+
+
+def create_log_query(cluster_id, include_stdout=True, include_stderr=True, since=None):
+    """Creates the Elasticsearch query for the logs of the job execution with the given cluster ID
+
+    :param cluster_id: The cluster ID of the job execution
+    :type cluster_id: string
+    :param include_stdout: If True, include stdout in the result
+    :type include_stdout: bool
+    :param include_stderr: If True include stderr in the result
+    :type include_stderr: bool
+    :param since: If present, only retrieve logs since this timestamp
+    :type since: :class:`datetime.datetime` or None
+    :returns: The query, None if no logs are requested
+    :rtype: dict
+    """
+
+    if not include_stdout and not include_stderr:
+        return None
+
+    if settings.ELASTICSEARCH_VERSION and settings.ELASTICSEARCH_VERSION.startswith('2.'):
+        extension = '.raw'
+    else:
+        extension = '.keyword'
+    # The document ID breaks ties between hits with the same timestamp and order number (such as lines from different
+    # tasks), so that search_after never skips or repeats hits at page boundaries. Before 6.x it is sorted as _uid.
+    if settings.ELASTICSEARCH_VERSION and settings.ELASTICSEARCH_VERSION[:2] in ('2.', '5.'):
+        tiebreaker = '_uid'
+    else:
+        tiebreaker = '_id'
+
+    query = {
+        'size': LOG_PAGE_SIZE,
+        'query': {
+            'bool': {
+                'must': [
+                    {'term': {'scale_job_exe' + extension: cluster_id}}
+                ]
+            }
+        },
+        'sort': [{'@timestamp': 'asc'}, {'scale_order_num': 'asc'}, {tiebreaker: 'asc'}],
+        '_source': ['@timestamp', 'scale_order_num', 'message', 'stream', 'scale_job_exe']
+    }
+    if include_stdout and not include_stderr:
+        query['query']['bool']['must'].append({'term': {'stream' + extension: 'stdout'}})
+    elif include_stderr and not include_stdout:
+        query['query']['bool']['must'].append({'term': {'stream' + extension: 'stderr'}})
+    if since is not None:
+        query['query']['bool']['must'].append({'range': {'@timestamp': {'gte': since.isoformat()}}})
+
+    return query
+
+
+def iter_log_hits(query):
+    """Returns a generator over all of the log hits matching the given query, in log order. The hits are retrieved a
+    page at a time, each page picking up after the sort values of the previous page's last hit, so the number of hits
+    is not limited by the Elasticsearch result window and only one page is held in memory at a time. Elasticsearch 2.x
+    pages by offset instead, so it still stops at the result window.
+
+    :param query: The log query from :meth:`create_log_query`
+    :type query: dict
+    :returns: The generator of log hits
+    :rtype: generator
+    """
+
+    # Elasticsearch 2.x does not support search_after, so fall back to paging by offset
+    use_search_after = not (settings.ELASTICSEARCH_VERSION and settings.ELASTICSEARCH_VERSION.startswith('2.'))
+
+    query = dict(query)
+    page_size = query['size']
+    while True:
+        results = settings.ELASTICSEARCH.search(index=LOG_INDICES, body=query)
+        hits = results['hits']['hits']
+        for hit in hits:
+            yield hit
+        if len(hits) < page_size:
+            return
+        if use_search_after:
+            query['search_after'] = hits[-1]['sort']
+        else:
+            query['from'] = query.get('from', 0) + page_size
+            if query['from'] + page_size > MAX_RESULT_WINDOW:
+                logger.warning('Log is truncated at the Elasticsearch result window of %d hits', MAX_RESULT_WINDOW)
+                return
+
+
+def format_log_line(hit, html=False):
+    """Formats the message of the given log hit, which must have a message
+
+    :param hit: The log hit
+    :type hit: dict
+    :param html: If True, wrap the line in a div element with a stdout/stderr css class
+    :type html: bool
+    :returns: The formatted line
+    :rtype: string
+    """
+
+    if html:
+        return '<div class="%s">%s</div>\n' % (hit['_source']['stream'],
+                                                django.utils.html.escape(hit['_source']['message']))
+    return hit['_source']['message']
+
+
+def iter_log_json(hits):
+    """Returns a generator that encodes the given log hits as JSON in chunks
+
+    :param hits: The log hits
+    :type hits: iterable
+    :returns: The generator of JSON chunks
+    :rtype: generator
+    """
+
+    yield '{"hits": {"hits": ['
+    total = 0
+    for hit in hits:
+        yield (', ' if total else '') + json.dumps(hit)
+        total += 1
+    yield '], "total": %d}}' % total
+
+
+def iter_log_text(hits, html=False):
+    """Returns a generator that formats the given log hits as text in chunks. Hits without a message are skipped.
+
+    :param hits: The log hits
+    :type hits: iterable
+    :param html: If True, produce an HTML document with each line in a div element with a stdout/stderr css class
+    :type html: bool
+    :returns: The generator of text chunks
+    :rtype: generator
+    """
+
+    if html:
+        yield LOG_HTML_HEADER
+    is_first = True
+    for hit in hits:
+        if 'message' not in hit['_source']:
+            continue
+        line = format_log_line(hit, html)
+        if not html and not is_first:
+            line = '\n' + line
+        is_first = False
+        yield line
+    if html:
+        yield LOG_HTML_FOOTER
@@ -12,6 +12,7 @@ from job.messages.completed_jobs import create_completed_jobs_messages, Complete
 from job.messages.failed_jobs import create_failed_jobs_messages, FailedJob
 from job.messages.job_exe_end import create_job_exe_end_messages
 from job.models import Job, JobExecution
+from util.deadline import DeadlineQueue
 
 
 logger = logging.getLogger(__name__)
@@ -31,6 +32,7 @@ class JobExecutionManager(object):
 
         # Current running state
         self._running_job_exes = {}  # {Cluster ID: RunningJobExecution}
+        self._starvation_deadlines = DeadlineQueue()  # Cluster IDs by when they will be starved for their next task
         self._lock = threading.Lock()
         self._metrics = TotalJobExeMetrics(now())
 
@@ -56,11 +58,15 @@ class JobExecutionManager(object):
 
         finished_job_exes = []
         with self._lock:
-            for job_exe in self._running_job_exes.values():
+            # Only the executions whose starvation deadlines have passed need to be checked
+            for cluster_id in self._starvation_deadlines.pop_due(when):
+                job_exe = self._running_job_exes[cluster_id]
                 if job_exe.check_for_starvation(when):
                     if job_exe.is_finished():
                         self._handle_finished_job_exe(job_exe)
                         finished_job_exes.append(job_exe)
+                else:
+                    self._schedule_starvation_check(job_exe)
 
         return finished_job_exes
 
@@ -69,6 +75,7 @@ class JobExecutionManager(object):
         """
 
         self._running_job_exes = {}
+        self._starvation_deadlines.clear()
         self._metrics = TotalJobExeMetrics(now())
 
     def generate_status_json(self, nodes_list, when):
@@ -173,6 +180,7 @@ class JobExecutionManager(object):
                     if job_exe.is_finished():
                         self._handle_finished_job_exe(job_exe)
                         return job_exe
+                    self._schedule_starvation_check(job_exe)
 
         return None
 
@@ -245,33 +253,42 @@ class JobExecutionManager(object):
         with self._lock:
             for job_exe in job_exes:
                 self._running_job_exes[job_exe.cluster_id] = job_exe
+                self._schedule_starvation_check(job_exe)
             self._running_job_messages.extend(messages)
             self._metrics.add_running_job_exes(job_exes)
 
-    def sync_with_database(self):
+    def sync_with_database(self, job_ids=None):
         """Syncs with the database to handle any canceled executions. Any job executions that are now finished are
         returned.
 
+        :param job_ids: If provided, only the running executions of the jobs with these IDs are synced
+        :type job_ids: set
         :returns: A list of the finished job executions
         :rtype: :func:`list`
         """
 
-        job_ids = []
+        running_job_ids = []
         running_job_exes = []
         with self._lock:
             for running_job_exe in self._running_job_exes.values():
-                job_ids.append(running_job_exe.job_id)
+                if job_ids is not None and running_job_exe.job_id not in job_ids:
+                    continue
+                running_job_ids.append(running_job_exe.job_id)
                 running_job_exes.append(running_job_exe)
+        if not running_job_ids:
+            return []
 
         # Query job models from database to check if any running executions have been canceled
         job_models = {}
-        for job in Job.objects.filter(id__in=job_ids):
+        for job in Job.objects.filter(id__in=running_job_ids).only('id', 'status', 'num_exes'):
             job_models[job.id] = job
 
         finished_job_exes = []
         when_canceled = now()
         with self._lock:
             for running_job_exe in running_job_exes:
+                if running_job_exe.cluster_id not in self._running_job_exes:
+                    continue  # Already finished by a concurrent sync
                 job_model = job_models[running_job_exe.job_id]
                 # If the job has been canceled or the job has a newer execution, this execution must be canceled
                 if job_model.status == 'CANCELED' or job_model.num_exes > running_job_exe.exe_num:
@@ -321,7 +338,18 @@ class JobExecutionManager(object):
 
         # Remove the finished job execution and update the metrics
         del self._running_job_exes[running_job_exe.cluster_id]
+        self._starvation_deadlines.remove(running_job_exe.cluster_id)
         self._metrics.job_exe_finished(running_job_exe)
 
+    def _schedule_starvation_check(self, running_job_exe):
+        """Schedules the next starvation check of the given job execution based on its current state. Caller must have
+        obtained the manager lock.
+
+        :param running_job_exe: The running job execution
+        :type running_job_exe: :class:`job.execution.job_exe.RunningJobExecution`
+        """
+
+        self._starvation_deadlines.schedule(running_job_exe.cluster_id, running_job_exe.get_starvation_deadline())
+
 
 job_exe_mgr = JobExecutionManager()
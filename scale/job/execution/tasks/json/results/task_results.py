@@ -2,11 +2,11 @@
 from __future__ import unicode_literals
 
 from django.utils import dateparse
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from job.execution.exceptions import InvalidTaskResults
 from util.parse import datetime_to_string
+from util.schema import SchemaValidator
 
 
 SCHEMA_VERSION = '1.0'
@@ -81,6 +81,8 @@ TASK_RESULTS_SCHEMA = {
     },
 }
 
+TASK_RESULTS_VALIDATOR = SchemaValidator('job.execution.tasks.json.results.task_results', TASK_RESULTS_SCHEMA)
+
 
 class TaskResults(object):
     """Represents the task results for a job execution
@@ -110,7 +112,7 @@ class TaskResults(object):
 
         try:
             if do_validate:
-                validate(task_results, TASK_RESULTS_SCHEMA)
+                TASK_RESULTS_VALIDATOR.validate(task_results)
         except ValidationError as validation_error:
             raise InvalidTaskResults(validation_error)
 
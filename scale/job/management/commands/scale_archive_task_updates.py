@@ -0,0 +1,80 @@
+"""Defines the command line method for archiving old task updates"""
+from __future__ import unicode_literals
+
+import datetime
+import gzip
+import json
+import logging
+import os
+
+from django.core.management.base import BaseCommand
+from django.utils.timezone import now
+
+from job.models import TaskUpdate
+from util.database import iterate_id_chunks
+from util.parse import datetime_to_string
+
+
+logger = logging.getLogger(__name__)
+
+# The task update fields written to the archive files
+ARCHIVE_FIELDS = ['id', 'job_exe_id', 'task_id', 'status', 'timestamp', 'source', 'reason', 'message', 'created']
+
+
+class Command(BaseCommand):
+    """Command that moves task updates older than a retention period out of the database and into compressed archive
+    files, one file of JSON lines for each day
+    """
+
+    help = 'Archives task updates older than the given number of days to compressed files and deletes them'
+
+    def add_arguments(self, parser):
+        parser.add_argument('directory', action='store', help='The directory to write the archive files to')
+        parser.add_argument('-d', '--days', action='store', type=int, default=30,
+                            help='Task updates created more than this many days ago are archived')
+        parser.add_argument('-c', '--chunk-size', action='store', type=int, default=10000,
+                            help='Number of task updates archived and deleted at a time')
+
+    def handle(self, *args, **options):
+        """See :meth:`django.core.management.base.BaseCommand.handle`.
+
+        This method archives and deletes the old task updates.
+        """
+
+        logger.info('Command starting: scale_archive_task_updates')
+        directory = options['directory']
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+        before = now() - datetime.timedelta(days=options['days'])
+        logger.info('Archiving task updates created before %s to %s', datetime_to_string(before), directory)
+        num_archived = 0
+        for ids in iterate_id_chunks(TaskUpdate.objects.filter(created__lt=before), options['chunk_size']):
+            self._archive(directory, ids)
+            num_archived += len(ids)
+            logger.info('Archived %d task updates', num_archived)
+        logger.info('Command completed: scale_archive_task_updates')
+
+    def _archive(self, directory, ids):
+        """Appends the given task updates to the archive files for the days they were created and then deletes them
+
+        :param directory: The directory of the archive files
+        :type directory: string
+        :param ids: The IDs of the task updates
+        :type ids: :func:`list`
+        """
+
+        lines_by_day = {}  # {Day: [JSON line]}
+        for row in TaskUpdate.objects.filter(id__in=ids).order_by('id').values(*ARCHIVE_FIELDS):
+            day = row['created'].date()
+            for field in ['timestamp', 'created']:
+                if row[field]:
+                    row[field] = datetime_to_string(row[field])
+            lines_by_day.setdefault(day, []).append(json.dumps(row) + '\n')
+
+        # Files are written before the rows are deleted so that an interrupted run never loses task updates
+        for day, lines in lines_by_day.items():
+            path = os.path.join(directory, 'task_update_%s.jsonl.gz' % day.isoformat())
+            with gzip.open(path, 'ab') as archive_file:
+                archive_file.write(''.join(lines).encode('utf-8'))
+        TaskUpdate.objects.filter(id__in=ids).delete()
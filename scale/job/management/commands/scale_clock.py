@@ -12,6 +12,7 @@ from django.utils.timezone import now
 
 import job.clock as clock
 from job.models import Job, JobType
+from util.db_pool.pool import release_connections
 
 
 logger = logging.getLogger(__name__)
@@ -63,6 +64,7 @@ class Command(BaseCommand):
             except:
                 logger.exception('Clock encountered error')
             finally:
+                release_connections()
                 if self.running:
                     # If process time takes less than throttle time, throttle
                     if secs_passed < self.throttle:
@@ -5,6 +5,7 @@ import json
 import logging
 import os
 import sys
+import time
 
 from django.core.management.base import BaseCommand
 from django.utils.text import get_valid_filename
@@ -42,8 +43,11 @@ class Command(BaseCommand):
         job_id = int(os.environ.get('SCALE_JOB_ID'))
         exe_num = int(os.environ.get('SCALE_EXE_NUM'))
         logger.info('Command starting: scale_pre_steps - Job ID: %d, Execution Number: %d', job_id, exe_num)
+        phase_durations = []  # [(Phase name, Duration in seconds)]
         try:
+            started = time.time()
             job_exe = self._get_job_exe(job_id, exe_num)
+            started = self._record_phase(phase_durations, 'job_exe', started)
 
             job_interface = job_exe.job_type.get_job_interface()
             exe_config = job_exe.get_execution_configuration()
@@ -53,20 +57,25 @@ class Command(BaseCommand):
             job_interface.validate_populated_settings(exe_config)
             logger.info('Validating outputs and workspaces...')
             job_interface.validate_workspace_for_outputs(exe_config)
+            started = self._record_phase(phase_durations, 'validation', started)
 
             self._generate_input_metadata(job_exe)
+            started = self._record_phase(phase_durations, 'input_metadata', started)
 
             job_data = job_exe.job.get_job_data()
             job_data = JobData(job_data.get_dict())
             logger.info('Setting up input files...')
 
             job_interface.perform_pre_steps(job_data)
+            self._record_phase(phase_durations, 'input_files', started)
 
             logger.info('Ready to execute job: %s', exe_config.get_args('main'))
         except ScaleError as err:
+            self._log_phase_durations(phase_durations)
             err.log()
             sys.exit(err.exit_code)
         except Exception as ex:
+            self._log_phase_durations(phase_durations)
             exit_code = GENERAL_FAIL_EXIT_CODE
             err = get_error_by_exception(ex.__class__.__name__)
             if err:
@@ -77,6 +86,7 @@ class Command(BaseCommand):
 
             sys.exit(exit_code)
 
+        self._log_phase_durations(phase_durations)
         logger.info('Command completed: scale_pre_steps')
 
     @retry_database_query
@@ -94,44 +104,77 @@ class Command(BaseCommand):
         return JobExecution.objects.get_job_exe_with_job_and_job_type(job_id, exe_num)
 
     def _generate_input_metadata(self, job_exe):
-        """Generate the input metadata file for the job execution
+        """Generate the input metadata file for the job execution. The details of every input file of the job and its
+        recipe are retrieved in a single bulk query and each file is only serialized once.
 
         :param job_exe: The job_exe model
         :type job_exe: `job.models.JobExecution`
         """
 
-        # Generate input metadata dict
-        input_metadata = {}
+        job_input_data = None
+        recipe_input_data = None
         config = job_exe.get_execution_configuration()
         if 'input_files' in config.get_dict():
-            input_metadata['JOB'] = {}
-            input_data = job_exe.job.get_input_data()
-            for i in input_data.values.keys():
-                if type(input_data.values[i]) is JsonValue:
-                    input_metadata['JOB'][i] = input_data.values[i].value
-                elif type(input_data.values[i]) is FileValue:
-                    input_metadata['JOB'][i] = [serialize(ScaleFile.objects.get_details(file_id=f)).data for f in
-                                                input_data.values[i].file_ids]
+            job_input_data = job_exe.job.get_input_data()
         if job_exe.recipe_id and job_exe.recipe.has_input():
-            input_metadata['RECIPE'] = {}
-            input_data = job_exe.recipe.get_input_data()
-            for i in input_data.values.keys():
-                if type(input_data.values[i]) is JsonValue:
-                    input_metadata['RECIPE'][i] = input_data.values[i].value
-                elif type(input_data.values[i]) is FileValue:
-                    input_metadata['RECIPE'][i] = [serialize(ScaleFile.objects.get_details(file_id=f)).data for f in
-                                                   input_data.values[i].file_ids]
-
-        logger.debug("Scale Input Metadata Manifest Generated:")
-        log_str = json.dumps(input_metadata, sort_keys=True, indent=4, separators=(',', ': '))
-        logger.debug(log_str)
+            recipe_input_data = job_exe.recipe.get_input_data()
+
+        file_ids = set()
+        for input_data in (job_input_data, recipe_input_data):
+            if input_data:
+                for value in input_data.values.values():
+                    if type(value) is FileValue:
+                        file_ids.update(value.file_ids)
+        scale_files = ScaleFile.objects.get_details_for_ids(list(file_ids))
+        file_details = {}  # {File ID: Serialized file details}
+
+        # Generate input metadata dict
+        input_metadata = {}
+        if job_input_data:
+            input_metadata['JOB'] = self._get_input_values_metadata(job_input_data, scale_files, file_details)
+        if recipe_input_data:
+            input_metadata['RECIPE'] = self._get_input_values_metadata(recipe_input_data, scale_files, file_details)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Scale Input Metadata Manifest Generated:")
+            log_str = json.dumps(input_metadata, sort_keys=True, indent=4, separators=(',', ': '))
+            logger.debug(log_str)
 
         try:
             with open(SCALE_INPUT_METADATA_PATH, 'w+') as metadata_file:
-                json.dump(input_metadata, metadata_file)
+                for chunk in json.JSONEncoder().iterencode(input_metadata):
+                    metadata_file.write(chunk)
         except Exception as ex:
             logger.exception('Error dumping input metadata manifest to file %s: %s' % (SCALE_INPUT_METADATA_PATH, ex))
 
+    def _get_input_values_metadata(self, input_data, scale_files, file_details):
+        """Returns the metadata for the values of the given input data
+
+        :param input_data: The input data
+        :type input_data: :class:`data.data.data.Data`
+        :param scale_files: The file models with all detail fields included, stored by ID
+        :type scale_files: dict
+        :param file_details: The serialized file details stored by ID, which is updated with newly serialized files
+        :type file_details: dict
+        :returns: The metadata for each input value, stored by input name
+        :rtype: dict
+        """
+
+        metadata = {}
+        for name, value in input_data.values.items():
+            if type(value) is JsonValue:
+                metadata[name] = value.value
+            elif type(value) is FileValue:
+                files_metadata = []
+                for file_id in value.file_ids:
+                    if file_id not in file_details:
+                        if file_id not in scale_files:
+                            raise ScaleFile.DoesNotExist('Scale file %d does not exist' % file_id)
+                        file_details[file_id] = serialize(scale_files[file_id]).data
+                    files_metadata.append(file_details[file_id])
+                metadata[name] = files_metadata
+        return metadata
+
     def _calculate_remote_path(self, job_exe):
         """Returns the remote path for storing the manifest
 
@@ -156,3 +199,31 @@ class Command(BaseCommand):
         month_dir = '%02d' % the_date.month
         day_dir = '%02d' % the_date.day
         return os.path.join(remote_path, year_dir, month_dir, day_dir, 'job_exe_%i' % job_exe.id)
+
+    def _log_phase_durations(self, phase_durations):
+        """Logs how long each completed phase of the pre-job steps took
+
+        :param phase_durations: The name and duration in seconds of each completed phase
+        :type phase_durations: :func:`list`
+        """
+
+        if phase_durations:
+            durations = ', '.join('%s=%.3fs' % (name, duration) for name, duration in phase_durations)
+            logger.info('Pre-job step durations: %s', durations)
+
+    def _record_phase(self, phase_durations, name, started):
+        """Records the duration of a completed phase of the pre-job steps
+
+        :param phase_durations: The name and duration in seconds of each completed phase
+        :type phase_durations: :func:`list`
+        :param name: The name of the completed phase
+        :type name: string
+        :param started: When the phase started, from :func:`time.time`
+        :type started: float
+        :returns: When the phase completed, which is when the next phase starts
+        :rtype: float
+        """
+
+        ended = time.time()
+        phase_durations.append((name, ended - started))
+        return ended
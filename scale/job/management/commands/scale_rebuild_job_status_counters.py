@@ -0,0 +1,28 @@
+"""Defines the command line method for rebuilding the job status counters"""
+from __future__ import unicode_literals
+
+import logging
+
+from django.core.management.base import BaseCommand
+
+from job.models import JobStatusCounter
+
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """Command that rebuilds the job status counters from the job table
+    """
+
+    help = 'Rebuilds the job status counters used by the job type status views from the job table'
+
+    def handle(self, *args, **options):
+        """See :meth:`django.core.management.base.BaseCommand.handle`.
+
+        This method rebuilds the job status counters.
+        """
+
+        logger.info('Command starting: scale_rebuild_job_status_counters')
+        JobStatusCounter.objects.rebuild()
+        logger.info('Command completed: scale_rebuild_job_status_counters')
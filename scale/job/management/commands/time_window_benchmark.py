@@ -0,0 +1,119 @@
+"""Defines the command line method for benchmarking time window queries on large time-ordered tables"""
+from __future__ import unicode_literals
+from __future__ import print_function
+
+import datetime
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from django.utils.timezone import now
+
+# The synthetic table, shaped like task_update
+TABLE = 'benchmark_time_window'
+# The rows are inserted in batches of this size
+BATCH_SIZE = 1000000
+# The indexes compared against a sequential scan
+INDEXES = [('btree', 'CREATE INDEX %s_created_btree ON %s (created)' % (TABLE, TABLE)),
+           ('brin', 'CREATE INDEX %s_created_brin ON %s USING brin (created)' % (TABLE, TABLE))]
+
+
+class Command(BaseCommand):
+    """Command that benchmarks counting the rows within time windows of a large synthetic table that is ordered by
+    creation time like the job_exe and task_update tables, without an index and with btree and BRIN indexes
+    """
+
+    help = 'Benchmarks time window queries on a large synthetic time-ordered table with and without indexes'
+
+    def add_arguments(self, parser):
+        parser.add_argument('-r', '--rows', action='store', type=int, default=50000000,
+                            help='Number of synthetic rows, spread evenly over the span')
+        parser.add_argument('-s', '--span', action='store', type=int, default=365,
+                            help='Number of days spanned by the synthetic rows')
+        parser.add_argument('-q', '--queries', action='store', type=int, default=20,
+                            help='Number of random windows queried for each window size')
+
+    def handle(self, *args, **options):
+        """See :meth:`django.core.management.base.BaseCommand.handle`.
+
+        This method creates the synthetic table, times the window queries for each index and drops the table.
+        """
+
+        num_rows = options['rows']
+        span = datetime.timedelta(days=options['span'])
+        first = now() - span
+        windows = []
+        rand = random.Random(0)
+        for window in [datetime.timedelta(hours=1), datetime.timedelta(days=1)]:
+            for _ in range(options['queries']):
+                started = first + datetime.timedelta(seconds=rand.uniform(0, (span - window).total_seconds()))
+                windows.append((window, started, started + window))
+
+        with connection.cursor() as cursor:
+            try:
+                self._create_table(cursor, num_rows, first, span)
+                self._time_queries(cursor, 'none', windows)
+                for name, create_sql in INDEXES:
+                    started = time.time()
+                    cursor.execute(create_sql)
+                    build_time = time.time() - started
+                    cursor.execute('ANALYZE %s' % TABLE)
+                    cursor.execute('SELECT pg_relation_size(%s)', ['%s_created_%s' % (TABLE, name)])
+                    size = cursor.fetchone()[0]
+                    print('%-5s index built in %.1f seconds, %.1f MiB' % (name, build_time, size / 1048576.0))
+                    self._time_queries(cursor, name, windows)
+                    cursor.execute('DROP INDEX %s_created_%s' % (TABLE, name))
+            finally:
+                cursor.execute('DROP TABLE IF EXISTS %s' % TABLE)
+
+    def _create_table(self, cursor, num_rows, first, span):
+        """Creates the synthetic table with its rows inserted in creation time order
+
+        :param cursor: The database cursor
+        :type cursor: :class:`django.db.backends.utils.CursorWrapper`
+        :param num_rows: The number of rows
+        :type num_rows: int
+        :param first: The creation time of the first row
+        :type first: :class:`datetime.datetime`
+        :param span: The time spanned by the rows
+        :type span: :class:`datetime.timedelta`
+        """
+
+        cursor.execute('DROP TABLE IF EXISTS %s' % TABLE)
+        cursor.execute('CREATE UNLOGGED TABLE %s (id bigint PRIMARY KEY, job_exe_id integer NOT NULL, '
+                       'task_id varchar(250) NOT NULL, status varchar(250) NOT NULL, '
+                       'created timestamp with time zone NOT NULL)' % TABLE)
+        started = time.time()
+        step = span.total_seconds() / num_rows
+        for batch_first in range(1, num_rows + 1, BATCH_SIZE):
+            batch_last = min(batch_first + BATCH_SIZE - 1, num_rows)
+            cursor.execute('INSERT INTO %s SELECT g, g / 5, \'task_\' || (g / 5), \'RUNNING\', '
+                           '%%s + g * %%s * interval \'1 second\' FROM generate_series(%%s, %%s) g' % TABLE,
+                           [first, step, batch_first, batch_last])
+        cursor.execute('ANALYZE %s' % TABLE)
+        print('Created %d rows in %.1f seconds' % (num_rows, time.time() - started))
+
+    def _time_queries(self, cursor, name, windows):
+        """Times counting the rows within each of the given windows and prints the results for each window size
+
+        :param cursor: The database cursor
+        :type cursor: :class:`django.db.backends.utils.CursorWrapper`
+        :param name: The name of the index being used
+        :type name: string
+        :param windows: The windows as tuples of window size, start and end
+        :type windows: :func:`list`
+        """
+
+        durations = {}  # {Window size: [duration]}
+        for window, started, ended in windows:
+            query_started = time.time()
+            cursor.execute('SELECT count(*) FROM %s WHERE created >= %%s AND created < %%s' % TABLE, [started, ended])
+            cursor.fetchone()
+            durations.setdefault(window, []).append(time.time() - query_started)
+
+        for window in sorted(durations):
+            window_durations = sorted(durations[window])
+            print('%-5s %-16s window: median %9.2f ms  max %9.2f ms' %
+                  (name, window, window_durations[len(window_durations) // 2] * 1000.0,
+                   window_durations[-1] * 1000.0))
@@ -10,7 +10,7 @@ from data.data.json.data_v6 import convert_data_to_v6_json, DataV6
 from data.data.exceptions import InvalidData
 from job.exceptions import InactiveJobType
 from job.messages.process_job_input import create_process_job_input_messages
-from job.models import Job, JobTypeRevision
+from job.models import Job, JobStatusCounter, JobTypeRevision
 from messaging.messages.message import CommandMessage
 from trigger.models import TriggerEvent
 
@@ -264,6 +264,7 @@ class CreateJobs(CommandMessage):
         try:
             job = Job.objects.create_job_v6(job_type_rev, event_id=self.event_id, input_data=self.input_data)
             job.save()
+            JobStatusCounter.objects.update_for_new_jobs([job])
         except InvalidData:
             msg = 'Job of type (%s, %s, %d) was given invalid input data. Message will not re-run.'
             logger.exception(msg, self.job_type_name, self.job_type_version, self.job_type_rev_num)
@@ -328,6 +329,7 @@ class CreateJobs(CommandMessage):
             recipe_jobs[node_name] = job
 
         Job.objects.bulk_create(recipe_jobs.values())
+        JobStatusCounter.objects.update_for_new_jobs(recipe_jobs.values())
         logger.info('Created %d job(s)', len(recipe_jobs))
 
         # Create recipe nodes
@@ -6,7 +6,8 @@ import logging
 from django.db import transaction
 from django.db.models import F
 
-from job.models import Job, JobExecution, JobExecutionEnd, JobExecutionOutput, JobInputFile, TaskUpdate
+from job.models import (Job, JobExecution, JobExecutionEnd, JobExecutionOutput, JobInputFile, JobStatusCounter,
+                        TaskUpdate)
 from messaging.messages.message import CommandMessage
 from product.models import FileAncestryLink
 from queue.models import Queue
@@ -137,6 +138,7 @@ class PurgeJobs(CommandMessage):
             RecipeNode.objects.filter(job__in=self._purge_job_ids).delete()
             JobInputFile.objects.filter(job__in=self._purge_job_ids).delete()
             Queue.objects.filter(job__in=self._purge_job_ids).delete()
+            JobStatusCounter.objects.update_for_deleted_jobs(self._purge_job_ids)
             Job.objects.filter(id__in=self._purge_job_ids).delete()
 
             # Update results
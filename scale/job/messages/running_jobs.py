@@ -6,7 +6,7 @@ import logging
 from django.db import transaction
 from django.utils.timezone import now
 
-from job.models import Job
+from job.models import Job, JobTimeline
 from messaging.messages.message import CommandMessage
 from util.parse import datetime_to_string, parse_datetime
 
@@ -158,6 +158,7 @@ class RunningJobs(CommandMessage):
 
             # Update jobs that need status set to RUNNING
             if jobs_to_running:
+                JobTimeline.objects.update_job_starts(jobs_to_running, self._started)
                 running_job_ids = Job.objects.update_jobs_to_running(jobs_to_running, self._started)
                 logger.info('Set %d job(s) to RUNNING status', len(running_job_ids))
 
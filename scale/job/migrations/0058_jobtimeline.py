@@ -0,0 +1,38 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job', '0057_auto_20190603_1846'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='job',
+            name='started',
+            field=models.DateTimeField(blank=True, db_index=True, null=True),
+        ),
+        migrations.CreateModel(
+            name='JobTimeline',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(db_index=True)),
+                ('count', models.IntegerField(default=0)),
+                ('job_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='job.JobType')),
+                ('job_type_rev', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE,
+                                                   to='job.JobTypeRevision')),
+            ],
+            options={
+                'db_table': 'job_timeline',
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name='jobtimeline',
+            unique_together=set([('day', 'job_type_rev')]),
+        ),
+    ]
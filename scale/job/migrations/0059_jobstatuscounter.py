@@ -0,0 +1,49 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('error', '0006_update_retried'),
+        ('job', '0058_jobtimeline'),
+    ]
+
+    operations = [
+        migrations.AlterIndexTogether(
+            name='job',
+            index_together=set([('last_modified', 'job_type', 'status'), ('job_type', 'status', 'last_status_change')]),
+        ),
+        migrations.CreateModel(
+            name='JobStatusCounter',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('status', models.CharField(max_length=50)),
+                ('count', models.IntegerField(default=0)),
+                ('oldest', models.DateTimeField(blank=True, null=True)),
+                ('newest', models.DateTimeField(blank=True, null=True)),
+                ('needs_refresh', models.BooleanField(default=False)),
+                ('error', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE,
+                                            to='error.Error')),
+                ('job_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='job.JobType')),
+            ],
+            options={
+                'db_table': 'job_status_counter',
+            },
+        ),
+        # Jobs without an error share a counter, so the unique key treats a null error as its own value
+        migrations.RunSQL(
+            sql='CREATE UNIQUE INDEX job_status_counter_key ON job_status_counter '
+                '(job_type_id, status, COALESCE(error_id, 0))',
+            reverse_sql='DROP INDEX job_status_counter_key',
+        ),
+        migrations.RunSQL(
+            sql='INSERT INTO job_status_counter (job_type_id, status, error_id, count, oldest, newest, needs_refresh) '
+                'SELECT job_type_id, status, error_id, COUNT(*), MIN(last_status_change), MAX(last_status_change), '
+                'false FROM job GROUP BY job_type_id, status, error_id',
+            reverse_sql=migrations.RunSQL.noop,
+        ),
+    ]
@@ -0,0 +1,23 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import django.contrib.postgres.indexes
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job', '0059_jobstatuscounter'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='jobexecution',
+            index=django.contrib.postgres.indexes.BrinIndex(fields=['started'], name='job_exe_started_70a4c7_brin'),
+        ),
+        migrations.AddIndex(
+            model_name='taskupdate',
+            index=django.contrib.postgres.indexes.BrinIndex(fields=['created'], name='task_update_created_1ba991_brin'),
+        ),
+    ]
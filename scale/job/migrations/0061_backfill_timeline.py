@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('job', '0060_time_brin_indexes'),
+        ('recipe', '0038_recipetimeline'),
+    ]
+
+    operations = [
+        # Backfill the daily timeline counts of the jobs that started before the counts were maintained
+        migrations.RunSQL(
+            sql="DELETE FROM job_timeline; "
+                "INSERT INTO job_timeline (day, job_type_id, job_type_rev_id, count) "
+                "SELECT (j.started AT TIME ZONE 'UTC')::date, j.job_type_id, j.job_type_rev_id, COUNT(*) "
+                "FROM job j WHERE j.started IS NOT NULL GROUP BY 1, 2, 3",
+            reverse_sql='DELETE FROM job_timeline',
+        ),
+        migrations.RunSQL(
+            sql="DELETE FROM recipe_timeline; "
+                "INSERT INTO recipe_timeline (day, recipe_type_id, recipe_type_rev_id, count) "
+                "SELECT (j.started AT TIME ZONE 'UTC')::date, r.recipe_type_id, r.recipe_type_rev_id, COUNT(*) "
+                "FROM job j JOIN recipe r ON r.id = j.recipe_id WHERE j.started IS NOT NULL GROUP BY 1, 2, 3",
+            reverse_sql='DELETE FROM recipe_timeline',
+        ),
+    ]
@@ -12,8 +12,7 @@ import semver
 from collections import namedtuple
 
 import django.contrib.postgres.fields
-import django.utils.html
-from django.conf import settings
+from django.contrib.postgres.indexes import BrinIndex
 from django.db import connection, models, transaction
 from django.db.models import F, Q, ExpressionWrapper, fields
 from django.db.models.functions import Lower
@@ -31,6 +30,7 @@ from job.configuration.json.job_config_v6 import convert_config_to_v6_json, JobC
 from job.data.job_data import JobData
 from job.exceptions import InvalidJobField, InactiveJobType
 from job.execution.configuration.json.exe_config import ExecutionConfiguration
+from job.execution.logs import create_log_query, format_log_line, iter_log_hits
 from job.execution.tasks.exe_task import JOB_TASK_ID_PREFIX
 from job.execution.tasks.json.results.task_results import TaskResults
 from job.seed.manifest import SeedManifest
@@ -42,9 +42,10 @@ from node.resources.node_resources import NodeResources
 from node.resources.resource import Cpus, Disk, Mem, ScalarResource
 from storage.models import ScaleFile
 from util import rest as rest_utils
+from util.change_feed import notify_jobs_changed
 from util.validation import ValidationWarning
 from vault.secrets_handler import SecretsHandler
-from util.database import alphabetize
+from util.database import alphabetize, increment_counts
 
 
 logger = logging.getLogger(__name__)
@@ -665,10 +666,13 @@ class JobManager(models.Manager):
         """
 
         job_ids = []
+        updated_jobs = []
         for job in jobs:
             if job.can_be_blocked():
                 job_ids.append(job.id)
+                updated_jobs.append(job)
 
+        JobStatusCounter.objects.update_for_status_change(updated_jobs, 'BLOCKED', when)
         self.filter(id__in=job_ids).update(status='BLOCKED', last_status_change=when, last_modified=timezone.now())
         return job_ids
 
@@ -686,12 +690,16 @@ class JobManager(models.Manager):
         """
 
         job_ids = []
+        updated_jobs = []
         for job in jobs:
             if job.can_be_canceled():
                 job_ids.append(job.id)
+                updated_jobs.append(job)
 
+        JobStatusCounter.objects.update_for_status_change(updated_jobs, 'CANCELED', when, clear_error=True)
         self.filter(id__in=job_ids).update(status='CANCELED', error=None, node=None, last_status_change=when,
                                            last_modified=timezone.now())
+        notify_jobs_changed(job_ids)
         return job_ids
 
     def update_jobs_to_completed(self, jobs, when):
@@ -708,10 +716,13 @@ class JobManager(models.Manager):
         """
 
         job_ids = []
+        updated_jobs = []
         for job in jobs:
             if job.can_be_completed():
                 job_ids.append(job.id)
+                updated_jobs.append(job)
 
+        JobStatusCounter.objects.update_for_status_change(updated_jobs, 'COMPLETED', when)
         self.filter(id__in=job_ids).update(status='COMPLETED', ended=when, last_status_change=when,
                                            last_modified=timezone.now())
         return job_ids
@@ -732,10 +743,13 @@ class JobManager(models.Manager):
         """
 
         job_ids = []
+        updated_jobs = []
         for job in jobs:
             if job.can_be_failed():
                 job_ids.append(job.id)
+                updated_jobs.append(job)
 
+        JobStatusCounter.objects.update_for_status_change(updated_jobs, 'FAILED', when, error_id=error_id)
         self.filter(id__in=job_ids).update(status='FAILED', error_id=error_id, ended=when, last_status_change=when,
                                            last_modified=timezone.now())
         return job_ids
@@ -754,10 +768,13 @@ class JobManager(models.Manager):
         """
 
         job_ids = []
+        updated_jobs = []
         for job in jobs:
             if job.can_be_pending():
                 job_ids.append(job.id)
+                updated_jobs.append(job)
 
+        JobStatusCounter.objects.update_for_status_change(updated_jobs, 'PENDING', when)
         self.filter(id__in=job_ids).update(status='PENDING', last_status_change=when, last_modified=timezone.now())
         return job_ids
 
@@ -777,17 +794,25 @@ class JobManager(models.Manager):
         """
 
         job_ids = []
+        queued_jobs = []
         for job in jobs:
             if requeue:
                 if job.can_be_requeued():
                     job_ids.append(job.id)
+                    queued_jobs.append(job)
             else:
                 if job.can_be_queued():
                     job_ids.append(job.id)
+                    queued_jobs.append(job)
 
+        JobStatusCounter.objects.update_for_status_change(queued_jobs, 'QUEUED', when_queued, clear_error=True)
         self.filter(id__in=job_ids).update(status='QUEUED', node=None, error=None, queued=when_queued, started=None,
                                            ended=None, last_status_change=when_queued,
                                            num_exes=models.F('num_exes') + 1, last_modified=timezone.now())
+        JobTimeline.objects.update_job_starts(queued_jobs, None)
+        if requeue:
+            # Any running executions of re-queued jobs are now out of date
+            notify_jobs_changed(job_ids)
 
         return job_ids
 
@@ -805,10 +830,13 @@ class JobManager(models.Manager):
         """
 
         job_ids = []
+        updated_jobs = []
         for job in jobs:
             if job.can_be_running():
                 job_ids.append(job.id)
+                updated_jobs.append(job)
 
+        JobStatusCounter.objects.update_for_status_change(updated_jobs, 'RUNNING', when)
         self.filter(id__in=job_ids).update(status='RUNNING', last_status_change=when, last_modified=timezone.now())
         return job_ids
 
@@ -946,7 +974,7 @@ class Job(models.Model):
 
     created = models.DateTimeField(auto_now_add=True)
     queued = models.DateTimeField(blank=True, null=True)
-    started = models.DateTimeField(blank=True, null=True)
+    started = models.DateTimeField(blank=True, db_index=True, null=True)
     ended = models.DateTimeField(blank=True, null=True)
     last_status_change = models.DateTimeField(blank=True, db_index=True, null=True)
     superseded = models.DateTimeField(blank=True, null=True)
@@ -1149,25 +1177,35 @@ class Job(models.Model):
 
         return rest_utils.strip_schema_version(convert_data_to_v6_json(self.get_output_data()).get_dict())
 
-    def get_resources(self):
-        """Returns the resources required for this job
+    def get_resources(self, job_type_resources=None, interface_resources=None):
+        """Returns the resources required for this job. Callers computing the resources of many jobs of the same type
+        can provide the job type's resources and interface resources so that the job type's manifest is only parsed once.
 
+        :param job_type_resources: The resources from :meth:`job.models.JobType.get_resources` for this job's type,
+            which are not modified
+        :type job_type_resources: :class:`node.resources.node_resources.NodeResources`
+        :param interface_resources: The scalar resources from this job type's interface
+        :type interface_resources: :func:`list`
         :returns: The required resources
         :rtype: :class:`node.resources.node_resources.NodeResources`
         """
 
-        resources = self.job_type.get_resources()
+        if job_type_resources:
+            resources = job_type_resources.copy()
+        else:
+            resources = self.job_type.get_resources()
 
         # Input File Size in MiB
         input_file_size = self.input_file_size
         if not input_file_size:
             input_file_size = 0.0
 
-        interface = self.job_type.get_job_interface()
+        if interface_resources is None:
+            interface_resources = self.job_type.get_job_interface().get_scalar_resources()
 
         scalar_resources = []
         # Iterate over all scalar resources and
-        for resource in interface.get_scalar_resources():
+        for resource in interface_resources:
             if 'inputMultiplier' in resource:
                 multiplier = resource['inputMultiplier']
                 initial_value = long(math.ceil(multiplier * input_file_size + resource['value']))
@@ -1267,7 +1305,7 @@ class Job(models.Model):
     class Meta(object):
         """meta information for the db"""
         db_table = 'job'
-        index_together = ['last_modified', 'job_type', 'status']
+        index_together = [['last_modified', 'job_type', 'status'], ['job_type', 'status', 'last_status_change']]
 
 
 class JobExecutionManager(models.Manager):
@@ -1539,54 +1577,48 @@ class JobExecution(models.Model):
             self.configuration = {}
         return ExecutionConfiguration(self.configuration, do_validate=False)
 
-    def get_log_json(self, include_stdout=True, include_stderr=True, since=None):
-        """Get log data from elasticsearch as a dict (from the raw JSON).
+    def get_log_hits(self, include_stdout=True, include_stderr=True, since=None):
+        """Returns a generator over this job execution's log hits from elasticsearch, in log order. The hits are
+        retrieved a page at a time, so there is no limit on the number of hits and memory use stays bounded.
 
         :param include_stdout: If True, include stdout in the result
         :type include_stdout: bool
         :param include_stderr: If True include stderr in the result
         :type include_stderr: bool
-        :param since: If present, only retrieve logs since this timestamp (non-inclusive).
+        :param since: If present, only retrieve logs since this timestamp
         :type since: :class:`datetime.datetime` or None
-        :rtype: tuple of (dict, :class:`datetime.datetime`) with the results or None and the last modified timestamp
+        :returns: The generator of log hits (dicts from the raw JSON)
+        :rtype: generator
         """
 
         # If job_exe has not started
         if not self.started:
-            return None, timezone.now()
+            return iter([])
 
-        if settings.ELASTICSEARCH_VERSION and settings.ELASTICSEARCH_VERSION.startswith('2.'):
-            extension = ".raw"
-        else:
-            extension = ".keyword"
-
-        q = {
-                'size': 10000,
-                'query': {
-                    'bool': {
-                        'must': [
-                            {'term': {'scale_job_exe'+extension: self.get_cluster_id()}}
-                        ]
-                    }
-                },
-                'sort': [{'@timestamp': 'asc'}, {'scale_order_num': 'asc'}],
-                '_source': ['@timestamp', 'scale_order_num', 'message', 'stream', 'scale_job_exe']
-            }
-        if not include_stdout and not include_stderr:
-            return None, timezone.now()
-        elif include_stdout and not include_stderr:
-            q['query']['bool']['must'].append({'term': {'stream'+extension: 'stdout'}})
-        elif include_stderr and not include_stdout:
-            q['query']['bool']['must'].append({'term': {'stream'+extension: 'stderr'}})
-        if since is not None:
-            q['query']['bool']['must'].append({'range': {'@timestamp': {'gte': since.isoformat()}}})
+        query = create_log_query(self.get_cluster_id(), include_stdout, include_stderr, since)
+        if query is None:
+            return iter([])
+        return iter_log_hits(query)
 
-        hits = settings.ELASTICSEARCH.search(index='logstash-*,scalelogs-*', body=q)
+    def get_log_json(self, include_stdout=True, include_stderr=True, since=None):
+        """Get log data from elasticsearch as a dict (from the raw JSON).
 
-        if hits['hits']['total'] == 0:
+        :param include_stdout: If True, include stdout in the result
+        :type include_stdout: bool
+        :param include_stderr: If True include stderr in the result
+        :type include_stderr: bool
+        :param since: If present, only retrieve logs since this timestamp (non-inclusive).
+        :type since: :class:`datetime.datetime` or None
+        :rtype: tuple of (dict, :class:`datetime.datetime`) with the results or None and the last modified timestamp
+        """
+
+        hits = list(self.get_log_hits(include_stdout, include_stderr, since))
+        if not hits:
             return None, timezone.now()
-        last_modified = max([util.parse.parse_datetime(h['_source']['@timestamp']) for h in hits['hits']['hits']])
-        return hits, last_modified
+
+        # Hits are sorted by timestamp, so the last hit is the most recent
+        last_modified = util.parse.parse_datetime(hits[-1]['_source']['@timestamp'])
+        return {'hits': {'total': len(hits), 'hits': hits}}, last_modified
 
     def get_log_text(self, include_stdout=True, include_stderr=True, since=None, html=False):
         """Get log data from elasticsearch.
@@ -1602,20 +1634,19 @@ class JobExecution(models.Model):
         :rtype: tuple of (str, :class:`datetime.datetime`) with the log or None and last modified timestamp
         """
 
-        hits, last_modified = self.get_log_json(include_stdout, include_stderr, since)
-        if hits is None:
-            return None, last_modified
-        valid_hits = []  # Make sure hits have the required message field
-        for h in hits['hits']['hits']:
-            if 'message' in h['_source']:
-                valid_hits.append(h)
+        lines = []
+        last_timestamp = None
+        for hit in self.get_log_hits(include_stdout, include_stderr, since):
+            last_timestamp = hit['_source']['@timestamp']
+            if 'message' in hit['_source']:  # Make sure hits have the required message field
+                lines.append(format_log_line(hit, html))
+        if last_timestamp is None:
+            return None, timezone.now()
+
+        last_modified = util.parse.parse_datetime(last_timestamp)
         if html:
-            d = ''
-            for h in valid_hits:
-                cls = h['_source']['stream']
-                d += '<div class="%s">%s</div>\n' % (cls, django.utils.html.escape(h['_source']['message']))
-            return d, last_modified
-        return '\n'.join(h['_source']['message'] for h in valid_hits), last_modified
+            return ''.join(lines), last_modified
+        return '\n'.join(lines), last_modified
 
     def get_resources(self):
         """Returns the resources allocated to this job execution
@@ -1683,6 +1714,8 @@ class JobExecution(models.Model):
     class Meta(object):
         """Meta information for the database"""
         db_table = 'job_exe'
+        # Executions are inserted in the order they are started, so a small BRIN index serves time range queries
+        indexes = [BrinIndex(fields=['started'])]
         unique_together = ['job', 'exe_num']
 
 
@@ -2433,12 +2466,24 @@ class JobTypeManager(models.Manager):
         
         status_dict = {job_type.id: JobTypeStatus(job_type, []) for job_type in job_types}
 
-        # Build up the filters based on inputs and all running jobs
-        count_filters = Q(status='RUNNING')
+        # Running jobs are counted regardless of the time range, so their counts come from the job status counters
+        running_counts = {}  # {(Job type ID, Error category): [Count, Most recent]}
+        error_categories = self._get_error_categories()
+        for counter in JobStatusCounter.objects.get_counters('RUNNING'):
+            key = (counter.job_type_id, error_categories.get(counter.error_id))
+            counts = running_counts.setdefault(key, [0, None])
+            counts[0] += counter.count
+            counts[1] = max(counts[1], counter.newest) if counts[1] else counter.newest
+        for (job_type_id, category), (count, most_recent) in running_counts.items():
+            if job_type_id in status_dict:
+                counts = JobTypeStatusCounts('RUNNING', count, most_recent, category)
+                status_dict[job_type_id].job_counts.append(counts)
+
+        # Build up the filters for the other jobs based on inputs
+        count_filters = Q(last_status_change__gte=started)
         if ended:
-            count_filters = count_filters | Q(last_status_change__gte=started, last_status_change__lte=ended)
-        else:
-            count_filters = count_filters | Q(last_status_change__gte=started)
+            count_filters = count_filters & Q(last_status_change__lte=ended)
+        count_filters = count_filters & ~Q(status='RUNNING')
 
         # Fetch a count of all jobs grouped by status counts
         count_dicts = Job.objects.values('job_type__id', 'status', 'error__category').filter(count_filters)
@@ -2466,22 +2511,9 @@ class JobTypeManager(models.Manager):
         :rtype: [:class:`job.models.JobTypePendingStatus`]
         """
 
-        # Fetch a count of all pending jobs with type information
-        # We have to specify values to workaround the JSON fields throwing an error when used with annotate
-        job_dicts = Job.objects.values(*['job_type__%s' % f for f in JobType.BASE_FIELDS])
-        job_dicts = job_dicts.filter(status='PENDING')
-        job_dicts = job_dicts.annotate(count=models.Count('job_type'),
-                                       longest_pending=models.Min('last_status_change'))
-        job_dicts = job_dicts.order_by('longest_pending')
-
-        # Convert each result to a real job type model with added statistics
         results = []
-        for job_dict in job_dicts:
-            job_type_dict = {f: job_dict['job_type__%s' % f] for f in JobType.BASE_FIELDS}
-            job_type = JobType(**job_type_dict)
-
-            status = JobTypePendingStatus(job_type, job_dict['count'], job_dict['longest_pending'])
-            results.append(status)
+        for job_type, count, longest_pending in self._get_status_counts('PENDING'):
+            results.append(JobTypePendingStatus(job_type, count, longest_pending))
         return results
 
     def get_running_status(self):
@@ -2494,22 +2526,9 @@ class JobTypeManager(models.Manager):
         :rtype: [:class:`job.models.JobTypeRunningStatus`]
         """
 
-        # Fetch a count of all running jobs with type information
-        # We have to specify values to workaround the JSON fields throwing an error when used with annotate
-        job_dicts = Job.objects.values(*['job_type__%s' % f for f in JobType.BASE_FIELDS])
-        job_dicts = job_dicts.filter(status='RUNNING')
-        job_dicts = job_dicts.annotate(count=models.Count('job_type'),
-                                       longest_running=models.Min('last_status_change'))
-        job_dicts = job_dicts.order_by('longest_running')
-
-        # Convert each result to a real job type model with added statistics
         results = []
-        for job_dict in job_dicts:
-            job_type_dict = {f: job_dict['job_type__%s' % f] for f in JobType.BASE_FIELDS}
-            job_type = JobType(**job_type_dict)
-
-            status = JobTypeRunningStatus(job_type, job_dict['count'], job_dict['longest_running'])
-            results.append(status)
+        for job_type, count, longest_running in self._get_status_counts('RUNNING'):
+            results.append(JobTypeRunningStatus(job_type, count, longest_running))
         return results
 
     def get_failed_status(self):
@@ -2525,31 +2544,21 @@ class JobTypeManager(models.Manager):
         # Make a list of all the basic error fields to fetch
         error_fields = ['id', 'name', 'title', 'description', 'category', 'created', 'last_modified']
 
-        # We have to specify values to workaround the JSON fields throwing an error when used with annotate
-        query_fields = []
-        query_fields.extend(['job_type__%s' % f for f in JobType.BASE_FIELDS])
-        query_fields.extend(['error__%s' % f for f in error_fields])
+        counters = JobStatusCounter.objects.get_counters('FAILED', error_category='SYSTEM')
+        job_types = self._get_base_job_types({counter.job_type_id for counter in counters})
+        errors = {}
+        for error_dict in Error.objects.filter(id__in={counter.error_id for counter in counters}).values(*error_fields):
+            errors[error_dict['id']] = Error(**error_dict)
 
-        # Fetch a count of all running jobs with type information
-        job_dicts = Job.objects.values(*query_fields)
-        job_dicts = job_dicts.filter(status='FAILED', error__category='SYSTEM')
-        job_dicts = job_dicts.annotate(count=models.Count('job_type'),
-                                       first_error=models.Min('last_status_change'),
-                                       last_error=models.Max('last_status_change'))
-        job_dicts = job_dicts.order_by('-last_error')
-
-        # Convert each result to a real job type model with added statistics
+        # Convert each counter to a real job type model with added statistics
         results = []
-        for job_dict in job_dicts:
-            job_type_dict = {f: job_dict['job_type__%s' % f] for f in JobType.BASE_FIELDS}
-            job_type = JobType(**job_type_dict)
-
-            error_dict = {f: job_dict['error__%s' % f] for f in error_fields}
-            error = Error(**error_dict)
-
-            status = JobTypeFailedStatus(job_type, error, job_dict['count'], job_dict['first_error'],
-                                         job_dict['last_error'])
+        for counter in counters:
+            if counter.job_type_id not in job_types:
+                continue
+            status = JobTypeFailedStatus(job_types[counter.job_type_id], errors[counter.error_id], counter.count,
+                                         counter.oldest, counter.newest)
             results.append(status)
+        results.sort(key=lambda status: status.last_error, reverse=True)
         return results
 
     def set_job_type_secrets(self, secrets_key, secrets):
@@ -2633,44 +2642,37 @@ class JobTypeManager(models.Manager):
         :rtype: dict
         """
 
-        days_ago_started = (now() - started).days if started else 30
-        days_ago_ended = (now() - ended).days if ended else 1
+        # Timeline days are inclusive, with the most recent day defaulting to today
+        today = now().date()
+        first_day = today - datetime.timedelta(days=((now() - started).days if started else 30) - 1)
+        last_day = today - datetime.timedelta(days=((now() - ended).days if ended else 1) - 1)
 
-        qry = "WITH day_periods AS "
-        qry += "(SELECT (date_trunc('day', Now()) - ((days_ago - 2) * INTERVAL '1 day')) AS end_time, "
-        qry += "(date_trunc('day', Now()) - ((days_ago - 1) * INTERVAL '1 day')) AS start_time "
-        qry += "FROM generate_series(%s, %s, 1) days_ago) "
-        qry += "SELECT to_char(d.start_time, 'YYYY-MM-DD') AS job_type_date, "
+        qry = "SELECT to_char(t.day, 'YYYY-MM-DD') AS job_type_date, "
         qry += "jt.id AS job_type_id, "
         qry += "jt.name AS job_type_name, "
         qry += "jt.manifest#>>'{job, title}' AS job_type_title, "
         qry += "jt.version AS job_type_version, "
         qry += "jtr.revision_num AS job_type_revision, "
-        qry += "COUNT(*) AS new_job_count "
-        qry += "FROM day_periods d "
-        qry += "JOIN job j ON j.started BETWEEN d.start_time AND d.end_time "
-        qry += "JOIN job_type jt ON jt.id = j.job_type_id "
-        qry += "JOIN job_type_revision jtr ON jtr.id = j.job_type_rev_id "
+        qry += "SUM(t.count) AS new_job_count "
+        qry += "FROM job_timeline t "
+        qry += "JOIN job_type jt ON jt.id = t.job_type_id "
+        qry += "JOIN job_type_revision jtr ON jtr.id = t.job_type_rev_id "
+        qry += "WHERE t.day BETWEEN %s AND %s "
 
-        args = [days_ago_ended, days_ago_started]
+        args = [first_day, last_day]
         if type_versions:
-            qry += "WHERE jt.version in %s "
+            qry += "AND jt.version in %s "
             args.append(tuple(type_versions))
-            if type_ids:
-                qry += "AND jt.id in %s "
-                args.append(tuple(type_ids))
-            elif type_names:
-                qry += "AND jt.name in %s "
-                args.append(tuple(type_names))
-
-        elif type_ids:
-            qry += "WHERE jt.id in %s "
+        if type_ids:
+            qry += "AND jt.id in %s "
             args.append(tuple(type_ids))
         elif type_names:
-            qry += "WHERE jt.name in %s "
+            qry += "AND jt.name in %s "
             args.append(tuple(type_names))
 
-        qry += "GROUP BY d.start_time, jt.id, jt.name, jtr.revision_num"
+        qry += "GROUP BY t.day, jt.id, jt.name, jtr.revision_num "
+        qry += "HAVING SUM(t.count) > 0 "
+        qry += "ORDER BY t.day"
 
         results = {}
         with connection.cursor() as cursor:
@@ -2696,6 +2698,55 @@ class JobTypeManager(models.Manager):
 
         return results.values()
 
+    def _get_base_job_types(self, job_type_ids):
+        """Returns the job type models with the given IDs, with only their base fields populated
+
+        :param job_type_ids: The job type IDs
+        :type job_type_ids: set
+        :returns: The job type models stored by ID
+        :rtype: dict
+        """
+
+        # We have to specify values to workaround the JSON fields throwing an error
+        job_types = {}
+        for job_type_dict in JobType.objects.filter(id__in=job_type_ids).values(*JobType.BASE_FIELDS):
+            job_types[job_type_dict['id']] = JobType(**job_type_dict)
+        return job_types
+
+    def _get_error_categories(self):
+        """Returns the categories of all errors
+
+        :returns: The error categories stored by error ID
+        :rtype: dict
+        """
+
+        return dict(Error.objects.values_list('id', 'category'))
+
+    def _get_status_counts(self, status):
+        """Returns the number of jobs of each job type with the given status, along with the oldest status change
+        time, from the job status counters. The results are sorted by the oldest status change time.
+
+        :param status: The job status
+        :type status: string
+        :returns: The list of tuples of job type model (with only base fields), count, and oldest status change time
+        :rtype: :func:`list`
+        """
+
+        counts = {}  # {Job type ID: [Count, Oldest]}
+        for counter in JobStatusCounter.objects.get_counters(status):
+            job_type_counts = counts.setdefault(counter.job_type_id, [0, None])
+            job_type_counts[0] += counter.count
+            if counter.oldest:
+                oldest = job_type_counts[1]
+                job_type_counts[1] = min(oldest, counter.oldest) if oldest else counter.oldest
+
+        job_types = self._get_base_job_types(set(counts.keys()))
+        results = [(job_types[job_type_id], type_count, type_oldest)
+                   for job_type_id, (type_count, type_oldest) in counts.items() if job_type_id in job_types]
+        results.sort(key=lambda result: (result[2] is None, result[2]))
+        return results
+
+
 class JobType(models.Model):
     """Represents a type of job that can be run on the cluster. Any updates to a job type model requires obtaining a
     lock on the model using select_for_update().
@@ -3193,6 +3244,7 @@ class TaskUpdate(models.Model):
     class Meta(object):
         """Meta information for the database"""
         db_table = 'task_update'
+        indexes = [BrinIndex(fields=['created'])]
 
 class JobTypeTagManager(models.Manager):
     """Provides additional methods for handling job type tags
@@ -3266,3 +3318,316 @@ class JobTypeTag(models.Model):
     class Meta(object):
         """meta information for the db"""
         db_table = 'job_type_tag'
+
+
+class JobTimelineManager(models.Manager):
+    """Provides additional methods for handling the daily job timeline counts"""
+
+    def rebuild(self, first_day=None):
+        """Recalculates the job timeline counts (and recipe timeline counts) from the job table for every day starting
+        with the given day. This corrects any counts that have drifted from the job table, for example because jobs
+        were deleted.
+
+        :param first_day: The first day to rebuild, None to rebuild every day
+        :type first_day: :class:`datetime.date`
+        """
+
+        from recipe.models import RecipeTimeline
+
+        where = 'WHERE j.started IS NOT NULL '
+        args = []
+        if first_day:
+            where = 'WHERE j.started >= %s '
+            args.append(datetime.datetime.combine(first_day, datetime.time(tzinfo=timezone.utc)))
+
+        with transaction.atomic():
+            if first_day:
+                self.filter(day__gte=first_day).delete()
+            else:
+                self.all().delete()
+            qry = 'INSERT INTO job_timeline (day, job_type_id, job_type_rev_id, count) '
+            qry += "SELECT (j.started AT TIME ZONE 'UTC')::date, j.job_type_id, j.job_type_rev_id, COUNT(*) "
+            qry += 'FROM job j ' + where
+            qry += 'GROUP BY 1, 2, 3'
+            with connection.cursor() as cursor:
+                cursor.execute(qry, args)
+
+            if first_day:
+                RecipeTimeline.objects.filter(day__gte=first_day).delete()
+            else:
+                RecipeTimeline.objects.all().delete()
+            qry = 'INSERT INTO recipe_timeline (day, recipe_type_id, recipe_type_rev_id, count) '
+            qry += "SELECT (j.started AT TIME ZONE 'UTC')::date, r.recipe_type_id, r.recipe_type_rev_id, COUNT(*) "
+            qry += 'FROM job j JOIN recipe r ON r.id = j.recipe_id ' + where
+            qry += 'GROUP BY 1, 2, 3'
+            with connection.cursor() as cursor:
+                cursor.execute(qry, args)
+
+    def update_job_starts(self, jobs, when):
+        """Updates the job timeline counts (and recipe timeline counts) for the given jobs having their start time
+        changed to the given time. The caller must have obtained model locks on the job models in an atomic transaction
+        and the models must still have their previous start times.
+
+        :param jobs: The job models whose start time is changing
+        :type jobs: :func:`list`
+        :param when: The new start time, possibly None
+        :type when: :class:`datetime.datetime`
+        """
+
+        from recipe.models import Recipe
+
+        new_day = when.astimezone(timezone.utc).date() if when else None
+        job_deltas = {}  # {(Day, Job type ID, Job type revision ID): Delta}
+        recipe_job_deltas = {}  # {(Day, Recipe ID): Delta}
+        for job in jobs:
+            if job.started == when:
+                continue  # Start time is unchanged
+            old_day = job.started.astimezone(timezone.utc).date() if job.started else None
+            for day, delta in ((old_day, -1), (new_day, 1)):
+                if day is None:
+                    continue
+                key = (day, job.job_type_id, job.job_type_rev_id)
+                job_deltas[key] = job_deltas.get(key, 0) + delta
+                if job.recipe_id:
+                    key = (day, job.recipe_id)
+                    recipe_job_deltas[key] = recipe_job_deltas.get(key, 0) + delta
+
+        increment_counts('job_timeline', ['day', 'job_type_id', 'job_type_rev_id'], ['day', 'job_type_rev_id'],
+                         job_deltas)
+
+        if recipe_job_deltas:
+            recipe_ids = {recipe_id for _day, recipe_id in recipe_job_deltas.keys()}
+            recipe_revs = {recipe_id: (recipe_type_id, recipe_type_rev_id) for recipe_id, recipe_type_id,
+                           recipe_type_rev_id in Recipe.objects.filter(id__in=recipe_ids).values_list(
+                               'id', 'recipe_type_id', 'recipe_type_rev_id')}
+            recipe_deltas = {}  # {(Day, Recipe type ID, Recipe type revision ID): Delta}
+            for (day, recipe_id), delta in recipe_job_deltas.items():
+                key = (day,) + recipe_revs[recipe_id]
+                recipe_deltas[key] = recipe_deltas.get(key, 0) + delta
+            increment_counts('recipe_timeline', ['day', 'recipe_type_id', 'recipe_type_rev_id'],
+                             ['day', 'recipe_type_rev_id'], recipe_deltas)
+
+
+class JobTimeline(models.Model):
+    """Stores the number of jobs of a job type revision that started on a given day (UTC). These counts are maintained
+    as jobs start and are re-queued so that the job timeline does not need to scan the job table.
+
+    :keyword day: The day the jobs started
+    :type day: :class:`django.db.models.DateField`
+    :keyword job_type: The job type of the jobs
+    :type job_type: :class:`django.db.models.ForeignKey`
+    :keyword job_type_rev: The job type revision of the jobs
+    :type job_type_rev: :class:`django.db.models.ForeignKey`
+    :keyword count: The number of jobs that started on the day
+    :type count: :class:`django.db.models.IntegerField`
+    """
+
+    day = models.DateField(db_index=True)
+    job_type = models.ForeignKey('job.JobType', on_delete=models.CASCADE)
+    job_type_rev = models.ForeignKey('job.JobTypeRevision', on_delete=models.CASCADE)
+    count = models.IntegerField(default=0)
+
+    objects = JobTimelineManager()
+
+    class Meta(object):
+        """meta information for the db"""
+        db_table = 'job_timeline'
+        unique_together = ('day', 'job_type_rev')
+
+
+class JobStatusCounterManager(models.Manager):
+    """Provides additional methods for handling the job status counters"""
+
+    def get_counters(self, status, error_category=None):
+        """Returns the counters with a positive count for the given job status, refreshing any stale timestamps
+
+        :param status: The job status
+        :type status: string
+        :param error_category: The error category to limit the counters, possibly None
+        :type error_category: string
+        :returns: The list of counters
+        :rtype: [:class:`job.models.JobStatusCounter`]
+        """
+
+        counters = self.filter(status=status, count__gt=0)
+        if error_category:
+            counters = counters.filter(error__category=error_category)
+        return [self._refresh_counter(c) if c.needs_refresh else c for c in counters.iterator()]
+
+    def rebuild(self):
+        """Recalculates all of the job status counters from the job table. Status changes that are committed while the
+        counters are being rebuilt wait for the rebuild to complete, so no change is lost or counted twice.
+        """
+
+        with transaction.atomic():
+            with connection.cursor() as cursor:
+                cursor.execute('LOCK TABLE job_status_counter IN EXCLUSIVE MODE')
+                cursor.execute('DELETE FROM job_status_counter')
+                qry = 'INSERT INTO job_status_counter (job_type_id, status, error_id, count, oldest, newest, '
+                qry += 'needs_refresh) '
+                qry += 'SELECT job_type_id, status, error_id, COUNT(*), MIN(last_status_change), '
+                qry += 'MAX(last_status_change), false FROM job GROUP BY job_type_id, status, error_id'
+                cursor.execute(qry)
+
+    def update_for_deleted_jobs(self, job_ids):
+        """Updates the counters for the jobs with the given IDs being deleted. The caller must delete the jobs in the
+        same atomic transaction.
+
+        :param job_ids: The IDs of the jobs being deleted
+        :type job_ids: :func:`list`
+        """
+
+        changes = []
+        qry = Job.objects.filter(id__in=job_ids)
+        for job_type_id, status, error_id, when in qry.values_list('job_type_id', 'status', 'error_id',
+                                                                   'last_status_change').iterator():
+            changes.append(((job_type_id, status, error_id), when, None, None))
+        self._apply_changes(changes)
+
+    def update_for_new_jobs(self, jobs):
+        """Updates the counters for the given newly created job models
+
+        :param jobs: The new job models
+        :type jobs: :func:`list`
+        """
+
+        changes = [(None, None, (job.job_type_id, job.status, job.error_id), job.last_status_change) for job in jobs]
+        self._apply_changes(changes)
+
+    def update_for_status_change(self, jobs, status, when, error_id=None, clear_error=False):
+        """Updates the counters for the given job models changing to the given status. The caller must have obtained
+        model locks on the job models in an atomic transaction and the models must still have their previous status.
+
+        :param jobs: The job models changing status
+        :type jobs: :func:`list`
+        :param status: The new status
+        :type status: string
+        :param when: The time of the status change
+        :type when: :class:`datetime.datetime`
+        :param error_id: The ID of the jobs' new error, if the status change sets the error
+        :type error_id: int
+        :param clear_error: Whether the status change clears the jobs' error
+        :type clear_error: bool
+        """
+
+        changes = []
+        for job in jobs:
+            new_error_id = error_id if error_id else (None if clear_error else job.error_id)
+            changes.append(((job.job_type_id, job.status, job.error_id), job.last_status_change,
+                            (job.job_type_id, status, new_error_id), when))
+        self._apply_changes(changes)
+
+    def _apply_changes(self, changes):
+        """Applies the given job changes to the counters. Each change is a tuple of the job's old counter key and
+        status change time and the job's new counter key and status change time, where a key of None indicates that the
+        job is being created or deleted. A counter key is a tuple of job type ID, status, and error ID.
+
+        :param changes: The list of job changes
+        :type changes: :func:`list`
+        """
+
+        # {Counter key: [Delta, Min entering time, Max entering time, Min leaving time, Max leaving time]}
+        updates = {}
+        for old_key, old_when, new_key, new_when in changes:
+            if old_key:
+                update = updates.setdefault(old_key, [0, None, None, None, None])
+                update[0] -= 1
+                if old_when:
+                    update[3] = min(update[3], old_when) if update[3] else old_when
+                    update[4] = max(update[4], old_when) if update[4] else old_when
+            if new_key:
+                update = updates.setdefault(new_key, [0, None, None, None, None])
+                update[0] += 1
+                if new_when:
+                    update[1] = min(update[1], new_when) if update[1] else new_when
+                    update[2] = max(update[2], new_when) if update[2] else new_when
+        if not updates:
+            return
+
+        keys = sorted(updates.keys(), key=lambda k: (k[0], k[1], k[2] or 0))
+        with connection.cursor() as cursor:
+            # Create any missing counters
+            qry = 'INSERT INTO job_status_counter (job_type_id, status, error_id, count, needs_refresh) VALUES '
+            qry += ', '.join(['(%s, %s, %s, 0, false)'] * len(keys))
+            qry += ' ON CONFLICT (job_type_id, status, COALESCE(error_id, 0)) DO NOTHING'
+            cursor.execute(qry, [value for key in keys for value in key])
+
+            # Lock the counters in a consistent order to prevent deadlocks
+            values = ', '.join(['(%s::integer, %s::varchar, %s::integer)'] * len(keys))
+            qry = 'SELECT id FROM job_status_counter WHERE (job_type_id, status, COALESCE(error_id, 0)) IN '
+            qry += '(VALUES %s) ORDER BY id FOR UPDATE' % values
+            cursor.execute(qry, [value for key in keys for value in (key[0], key[1], key[2] or 0)])
+
+            # A counter's timestamps become stale when its oldest or newest job leaves
+            values = ', '.join(['(%s::integer, %s::varchar, %s::integer, %s::integer, %s::timestamptz, '
+                                '%s::timestamptz, %s::timestamptz, %s::timestamptz)'] * len(keys))
+            qry = 'UPDATE job_status_counter c SET count = c.count + v.delta, oldest = LEAST(c.oldest, v.min_in), '
+            qry += 'newest = GREATEST(c.newest, v.max_in), needs_refresh = c.needs_refresh OR '
+            qry += 'COALESCE(v.min_out <= c.oldest OR v.max_out >= c.newest, false) '
+            qry += 'FROM (VALUES %s) ' % values
+            qry += 'AS v (job_type_id, status, error_id, delta, min_in, max_in, min_out, max_out) '
+            qry += 'WHERE c.job_type_id = v.job_type_id AND c.status = v.status '
+            qry += 'AND COALESCE(c.error_id, 0) = v.error_id'
+            args = []
+            for key in keys:
+                args.extend([key[0], key[1], key[2] or 0])
+                args.extend(updates[key])
+            cursor.execute(qry, args)
+
+    def _refresh_counter(self, counter):
+        """Recalculates the oldest and newest timestamps of the given stale counter from the job table
+
+        :param counter: The stale counter
+        :type counter: :class:`job.models.JobStatusCounter`
+        :returns: The refreshed counter
+        :rtype: :class:`job.models.JobStatusCounter`
+        """
+
+        with transaction.atomic():
+            # Locking the counter holds off status changes until the timestamps are recalculated
+            counter = self.select_for_update().get(id=counter.id)
+            if counter.needs_refresh:
+                times = Job.objects.filter(job_type_id=counter.job_type_id, status=counter.status,
+                                           error_id=counter.error_id).aggregate(oldest=models.Min('last_status_change'),
+                                                                                newest=models.Max('last_status_change'))
+                counter.oldest = times['oldest']
+                counter.newest = times['newest']
+                counter.needs_refresh = False
+                counter.save(update_fields=['oldest', 'newest', 'needs_refresh'])
+        return counter
+
+
+class JobStatusCounter(models.Model):
+    """Stores the number of jobs of a job type that have a given status and error. These counters are maintained by the
+    job status transition methods so that the job type status views do not need to aggregate the job table.
+
+    :keyword job_type: The job type of the jobs
+    :type job_type: :class:`django.db.models.ForeignKey`
+    :keyword status: The status of the jobs
+    :type status: :class:`django.db.models.CharField`
+    :keyword error: The error of the jobs, possibly None
+    :type error: :class:`django.db.models.ForeignKey`
+    :keyword count: The number of jobs
+    :type count: :class:`django.db.models.IntegerField`
+    :keyword oldest: The earliest last status change of the jobs
+    :type oldest: :class:`django.db.models.DateTimeField`
+    :keyword newest: The latest last status change of the jobs
+    :type newest: :class:`django.db.models.DateTimeField`
+    :keyword needs_refresh: Whether the oldest and newest timestamps are stale because the job that set them changed
+        status
+    :type needs_refresh: :class:`django.db.models.BooleanField`
+    """
+
+    job_type = models.ForeignKey('job.JobType', on_delete=models.CASCADE)
+    status = models.CharField(max_length=50)
+    error = models.ForeignKey('error.Error', blank=True, null=True, on_delete=models.CASCADE)
+    count = models.IntegerField(default=0)
+    oldest = models.DateTimeField(blank=True, null=True)
+    newest = models.DateTimeField(blank=True, null=True)
+    needs_refresh = models.BooleanField(default=False)
+
+    objects = JobStatusCounterManager()
+
+    class Meta(object):
+        """meta information for the db"""
+        db_table = 'job_status_counter'
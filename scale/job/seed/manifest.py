@@ -7,7 +7,6 @@ import json
 import logging
 import os
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from data.interface.json.interface_v6 import InterfaceV6
@@ -21,6 +20,7 @@ from job.seed.types import SeedInputFiles, SeedInputJson, SeedOutputJson, SeedOu
 from scheduler.vault.manager import secrets_mgr
 from storage.media_type import UNKNOWN_MEDIA_TYPE
 from util.environment import normalize_env_var_name
+from util.schema import SchemaValidator
 
 logger = logging.getLogger(__name__)
 
@@ -31,6 +31,8 @@ SCHEMA_FILENAME = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'sch
 with open(SCHEMA_FILENAME) as schema_file:
     SEED_MANIFEST_SCHEMA = json.load(schema_file)
 
+SEED_MANIFEST_VALIDATOR = SchemaValidator('job.seed.manifest', SEED_MANIFEST_SCHEMA)
+
 
 class SeedManifest(object):
     """Represents the interface defined by an algorithm developer to a Seed job"""
@@ -49,7 +51,7 @@ class SeedManifest(object):
 
         try:
             if do_validate:
-                validate(definition, SEED_MANIFEST_SCHEMA)
+                SEED_MANIFEST_VALIDATOR.validate(definition, memoize=True)
                 self.validate_resources()
         except ValidationError as validation_error:
             raise InvalidSeedManifestDefinition('JSON_VALIDATION_ERROR', 'Error validating against schema: %s' % validation_error)
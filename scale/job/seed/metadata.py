@@ -7,10 +7,10 @@ from copy import deepcopy
 
 import os
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from job.seed.exceptions import InvalidSeedMetadataDefinition
+from util.schema import SchemaValidator
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +21,8 @@ METADATA_SUFFIX = '.metadata.json'
 
 UNSUPPORTED_TYPES = ('FeatureCollection', 'GeometryCollection')
 
+METADATA_VALIDATOR = SchemaValidator('job.seed.metadata', METADATA_SCHEMA)
+
 
 class SeedMetadata(object):
     """Represents the extended metadata for a single file in Seed job.
@@ -53,7 +55,7 @@ class SeedMetadata(object):
 
         try:
             if do_validate:
-                validate(metadata, METADATA_SCHEMA)
+                METADATA_VALIDATOR.validate(metadata)
         except ValidationError as validation_error:
             raise InvalidSeedMetadataDefinition('JSON_VALIDATION_ERROR', 'Error validating against schema: %s' %
                                                 validation_error)
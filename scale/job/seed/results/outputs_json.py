@@ -1,18 +1,42 @@
+import hashlib
 import json
 import os
-from jsonschema import validate
+import threading
 
 from job.execution.container import SCALE_JOB_EXE_OUTPUT_PATH
+from util.schema import SchemaValidator
 
 SEED_OUTPUTS_JSON_FILENAME = 'seed.outputs.json'
 
+# The schemas are built from job type interfaces, so one validator is cached for each distinct schema
+_VALIDATORS = {}  # {Schema hash: SchemaValidator}
+_VALIDATORS_LOCK = threading.Lock()
+
+
+def _get_validator(schema):
+    """Returns the cached validator for the given seed.outputs.json schema, creating it on first use
+
+    :param schema: The schema built by :meth:`SeedOutputsJson.construct_schema`
+    :type schema: dict
+    :returns: The validator for the schema
+    :rtype: :class:`util.schema.SchemaValidator`
+    """
+
+    schema_hash = hashlib.sha1(json.dumps(schema, sort_keys=True).encode('utf-8')).hexdigest()
+    with _VALIDATORS_LOCK:
+        validator = _VALIDATORS.get(schema_hash)
+        if not validator:
+            validator = SchemaValidator('job.seed.results.outputs_json.%s' % schema_hash[:12], schema)
+            _VALIDATORS[schema_hash] = validator
+    return validator
+
 
 class SeedOutputsJson(object):
     def __init__(self, data, schema=None):
         self._dict = data
 
         if schema:
-            validate(self._dict, schema)
+            _get_validator(schema).validate(self._dict)
 
     @staticmethod
     def read_outputs(schema):
@@ -71,6 +71,7 @@ class Task(object):
         self._has_been_launched = False
         self._launched = None
         self._force_recon = False
+        self._force_listener = None
         self._needs_killed = False
         self._last_status_update = None
         self._has_started = False
@@ -298,12 +299,48 @@ class Task(object):
         """
 
         self._needs_killed = True
+        self._notify_force_listener()
 
     def force_reconciliation(self):
         """Sets a task setting to force immediate reconciliation for this task
         """
 
         self._force_recon = True
+        self._notify_force_listener()
+
+    def get_reconciliation_deadline(self):
+        """Returns the time after which this task's latest status update is stale and the task needs to be reconciled,
+        possibly None if this task has not been launched
+
+        :returns: The reconciliation deadline, possibly None
+        :rtype: :class:`datetime.datetime`
+        """
+
+        with self._lock:
+            if not self._last_status_update:
+                return None
+            if self._has_started:
+                return self._last_status_update + RUNNING_RECON_THRESHOLD
+            return self._last_status_update + STAGING_RECON_THRESHOLD
+
+    def get_timeout_deadline(self):
+        """Returns the time after which this task will exceed its current timeout threshold, possibly None if this task
+        is not currently subject to a timeout
+
+        :returns: The timeout deadline, possibly None
+        :rtype: :class:`datetime.datetime`
+        """
+
+        with self._lock:
+            if not self._has_been_launched or self._has_timed_out or self._has_ended:
+                return None
+
+            if self._has_started:
+                if self._running_timeout_threshold:
+                    return self._started + self._running_timeout_threshold
+            elif self._staging_timeout_threshold:
+                return self._launched + self._staging_timeout_threshold
+            return None
 
     @abstractmethod
     def get_resources(self):
@@ -362,6 +399,15 @@ class Task(object):
             self._launched = when
             self._last_status_update = when
 
+    def set_force_listener(self, listener):
+        """Sets the function that is called with this task whenever it is forced to be killed or reconciled
+
+        :param listener: The listener function, possibly None
+        :type listener: function
+        """
+
+        self._force_listener = listener
+
     def update(self, task_update):
         """Handles the given task update
 
@@ -408,6 +454,15 @@ class Task(object):
 
         return '%s:%s' % (settings.SCALE_DOCKER_IMAGE, settings.DOCKER_VERSION)
 
+    def _notify_force_listener(self):
+        """Notifies the force listener, if any, that this task has been forced to be killed or reconciled. Caller must
+        not hold the task lock.
+        """
+
+        listener = self._force_listener
+        if listener:
+            listener(self)
+
     def _parse_container_name(self, task_update):
         """Tries to parse the container name out of the task update. Assumes caller already has the task lock.
 
@@ -7,19 +7,26 @@ import threading
 from job.tasks.node_task import NodeTask
 from job.tasks.update import TaskStatusUpdate
 from scheduler.tasks.system_task import SystemTask
+from util.deadline import DeadlineQueue
 
 
 logger = logging.getLogger(__name__)
 
 
 class TaskManager(object):
-    """This class manages all currently running tasks. This class is thread-safe."""
+    """This class manages all currently running tasks. Rather than scanning every task on each check, the manager
+    tracks the timeout and reconciliation deadline of each task and the set of tasks that have been flagged for killing
+    or reconciliation, so each check only touches the tasks that are due. This class is thread-safe."""
 
     def __init__(self):
         """Constructor
         """
 
         self._tasks = {}  # {Task ID: Task}
+        self._flagged_task_ids = set()  # Tasks that have been forced to be killed or reconciled or have timed out
+        self._recon_deadlines = DeadlineQueue()  # Task IDs by when their latest status update becomes stale
+        self._timeout_deadlines = DeadlineQueue()  # Task IDs by when they exceed their timeout threshold
+        self._timed_out_task_ids = set()  # Tasks that have timed out but not yet ended
         self._lock = threading.Lock()
 
     def generate_status_json(self, nodes_list):
@@ -97,7 +104,8 @@ class TaskManager(object):
 
         tasks = []
         with self._lock:
-            for task in self._tasks.values():
+            for task_id in self._flagged_task_ids:
+                task = self._tasks[task_id]
                 if task.needs_killed():
                     tasks.append(task)
         return tasks
@@ -111,12 +119,20 @@ class TaskManager(object):
         :rtype: :func:`list`
         """
 
-        tasks = []
+        tasks = {}  # {Task ID: Task}
         with self._lock:
-            for task in self._tasks.values():
+            for task_id in self._flagged_task_ids:
+                task = self._tasks[task_id]
                 if task.needs_reconciliation(when):
-                    tasks.append(task)
-        return tasks
+                    tasks[task_id] = task
+
+            for task_id in self._recon_deadlines.pop_due(when):
+                task = self._tasks[task_id]
+                if task.needs_reconciliation(when):
+                    tasks[task_id] = task
+                # Stale tasks remain due until they receive a new status update
+                self._recon_deadlines.schedule(task_id, task.get_reconciliation_deadline())
+        return list(tasks.values())
 
     def get_timeout_tasks(self, when):
         """Returns all of the tasks that have timed out
@@ -127,12 +143,17 @@ class TaskManager(object):
         :rtype: :func:`list`
         """
 
-        tasks = []
         with self._lock:
-            for task in self._tasks.values():
+            for task_id in self._timeout_deadlines.pop_due(when):
+                task = self._tasks[task_id]
                 if task.check_timeout(when):
-                    tasks.append(task)
-        return tasks
+                    self._timed_out_task_ids.add(task_id)
+                    self._flagged_task_ids.add(task_id)
+                else:
+                    self._timeout_deadlines.schedule(task_id, task.get_timeout_deadline())
+
+            # Timed out tasks are reported until they end
+            return [self._tasks[task_id] for task_id in self._timed_out_task_ids]
 
     def handle_task_update(self, task_update):
         """Handles the given task update
@@ -148,7 +169,9 @@ class TaskManager(object):
             task.update(task_update)
             if task.has_ended or task_update.status == TaskStatusUpdate.LOST:
                 # Task is no longer launched/running so remove it from manager
-                del self._tasks[task.id]
+                self._remove_task(task)
+            else:
+                self._schedule_deadlines(task)
 
     def launch_tasks(self, tasks, when):
         """Adds the new tasks to the manager and marks them as launched
@@ -164,8 +187,48 @@ class TaskManager(object):
                 if task.id not in self._tasks:
                     task.launch(when)
                     self._tasks[task.id] = task
+                    task.set_force_listener(self._handle_forced_task)
+                    if task.needs_killed():
+                        self._flagged_task_ids.add(task.id)
+                    self._schedule_deadlines(task)
                 else:
                     logger.error('Attempted to launch a task that has already been launched')
 
+    def _handle_forced_task(self, task):
+        """Handles a task that has been forced to be killed or reconciled so that it is included in the next check
+
+        :param task: The task
+        :type task: :class:`job.tasks.base_task.Task`
+        """
+
+        with self._lock:
+            if self._tasks.get(task.id) is task:
+                self._flagged_task_ids.add(task.id)
+
+    def _remove_task(self, task):
+        """Removes the given task and its deadlines from the manager. Caller must have obtained the manager lock.
+
+        :param task: The task
+        :type task: :class:`job.tasks.base_task.Task`
+        """
+
+        task.set_force_listener(None)
+        del self._tasks[task.id]
+        self._flagged_task_ids.discard(task.id)
+        self._timed_out_task_ids.discard(task.id)
+        self._recon_deadlines.remove(task.id)
+        self._timeout_deadlines.remove(task.id)
+
+    def _schedule_deadlines(self, task):
+        """Schedules the reconciliation and timeout deadlines of the given task based on its current state. Caller must
+        have obtained the manager lock.
+
+        :param task: The task
+        :type task: :class:`job.tasks.base_task.Task`
+        """
+
+        self._recon_deadlines.schedule(task.id, task.get_reconciliation_deadline())
+        self._timeout_deadlines.schedule(task.id, task.get_timeout_deadline())
+
 
 task_mgr = TaskManager()
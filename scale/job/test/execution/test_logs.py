@@ -0,0 +1,202 @@
+from __future__ import unicode_literals
+
+import datetime
+import json
+import threading
+from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+
+import django
+import elasticsearch
+from django.test import SimpleTestCase
+from django.utils.timezone import utc
+from mock import patch
+
+from job.execution.logs import create_log_query, iter_log_hits, iter_log_json, iter_log_text
+from util.parse import parse_datetime
+
+
+class StubElasticsearchServer(object):
+    """A minimal HTTP server that answers Elasticsearch _search requests over a fixed list of log documents. It
+    supports term and range filters, sorting by timestamp, order number and document ID, and paging with from, size and
+    search_after.
+    """
+
+    def __init__(self, documents):
+        """Constructor
+
+        :param documents: The log documents (the _source of each hit)
+        :type documents: list
+        """
+
+        self.documents = documents
+        self.requests = []  # The body of each search request
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                length = int(self.headers.get('Content-Length', 0))
+                body = json.loads(self.rfile.read(length)) if length else {}
+                stub.requests.append(body)
+                content = json.dumps(stub.search(body))
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_POST = do_GET
+
+            def log_message(self, *args):
+                pass
+
+        self._server = HTTPServer(('127.0.0.1', 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:%d' % self._server.server_address[1]
+
+    def search(self, body):
+        """Performs the given search over the documents
+
+        :param body: The search request body
+        :type body: dict
+        :returns: The search response
+        :rtype: dict
+        """
+
+        matches = [('doc_%03d' % i, doc) for i, doc in enumerate(self.documents)
+                   if self._matches(doc, body.get('query', {}))]
+        matches = sorted((doc['@timestamp'], doc['scale_order_num'], doc_id, doc) for doc_id, doc in matches)
+        if 'search_after' in body:
+            search_after = tuple(body['search_after'])
+            matches = [match for match in matches if match[:3] > search_after]
+        start = body.get('from', 0)
+        page = matches[start:start + body.get('size', 10)]
+        hits = [{'_id': doc_id, '_source': doc, 'sort': [timestamp, order_num, doc_id]}
+                for timestamp, order_num, doc_id, doc in page]
+        return {'hits': {'total': len(matches), 'hits': hits}}
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    @staticmethod
+    def _matches(doc, query):
+        for clause in query.get('bool', {}).get('must', []):
+            if 'term' in clause:
+                field, value = list(clause['term'].items())[0]
+                if doc.get(field.split('.')[0]) != value:
+                    return False
+            elif 'range' in clause:
+                field, bounds = list(clause['range'].items())[0]
+                if parse_datetime(doc[field]) < parse_datetime(bounds['gte']):
+                    return False
+        return True
+
+
+class TestLogs(SimpleTestCase):
+
+    def setUp(self):
+        django.setup()
+
+        when = datetime.datetime(2016, 1, 1, tzinfo=utc)
+        self.documents = []
+        for i in range(25):
+            timestamp = (when + datetime.timedelta(seconds=i // 2)).strftime('%Y-%m-%dT%H:%M:%S.000Z')
+            self.documents.append({'@timestamp': timestamp, 'scale_order_num': i, 'message': 'line %d' % i,
+                                   'stream': 'stdout' if i % 5 else 'stderr', 'scale_job_exe': 'exe_1'})
+        self.documents.append({'@timestamp': '2016-01-01T00:00:00.000Z', 'scale_order_num': 0, 'message': 'other',
+                               'stream': 'stdout', 'scale_job_exe': 'exe_2'})
+
+        self.server = StubElasticsearchServer(self.documents)
+        self.server.start()
+        self.addCleanup(self.server.stop)
+
+    def _settings(self, version='6.3.0'):
+        return self.settings(ELASTICSEARCH=elasticsearch.Elasticsearch([self.server.url]),
+                             ELASTICSEARCH_VERSION=version)
+
+    @patch('job.execution.logs.LOG_PAGE_SIZE', 10)
+    def test_iter_log_hits_pages(self):
+        """Tests that iter_log_hits() retrieves every hit in order, a page at a time using search_after"""
+
+        with self._settings():
+            hits = list(iter_log_hits(create_log_query('exe_1')))
+
+        self.assertListEqual([hit['_source']['scale_order_num'] for hit in hits], list(range(25)))
+        self.assertEqual(len(self.server.requests), 3)
+        self.assertNotIn('search_after', self.server.requests[0])
+        self.assertListEqual(self.server.requests[1]['search_after'], ['2016-01-01T00:00:04.000Z', 9, 'doc_009'])
+        self.assertDictEqual(self.server.requests[0]['sort'][-1], {'_id': 'asc'})
+
+    @patch('job.execution.logs.LOG_PAGE_SIZE', 10)
+    def test_iter_log_hits_ties(self):
+        """Tests that hits sharing a timestamp and order number are neither skipped nor repeated across pages"""
+
+        # A second task of the execution logs lines with the same timestamps and order numbers
+        for doc in list(self.documents[:25]):
+            self.documents.append(dict(doc, message='task 2 %s' % doc['message']))
+
+        with self._settings():
+            hits = list(iter_log_hits(create_log_query('exe_1')))
+
+        self.assertEqual(len(hits), 50)
+        self.assertEqual(len({hit['_id'] for hit in hits}), 50)
+        self.assertListEqual([hit['_source']['scale_order_num'] for hit in hits],
+                             [i // 2 for i in range(50)])
+
+    @patch('job.execution.logs.LOG_PAGE_SIZE', 10)
+    def test_iter_log_hits_pages_by_offset(self):
+        """Tests that iter_log_hits() pages by offset for Elasticsearch 2.x"""
+
+        with self._settings(version='2.4.0'):
+            hits = list(iter_log_hits(create_log_query('exe_1')))
+
+        self.assertListEqual([hit['_source']['scale_order_num'] for hit in hits], list(range(25)))
+        self.assertEqual(self.server.requests[2]['from'], 20)
+        self.assertDictEqual(self.server.requests[0]['sort'][-1], {'_uid': 'asc'})
+
+    @patch('job.execution.logs.LOG_PAGE_SIZE', 10)
+    @patch('job.execution.logs.MAX_RESULT_WINDOW', 20)
+    def test_iter_log_hits_offset_window(self):
+        """Tests that paging by offset stops at the Elasticsearch result window"""
+
+        with self._settings(version='2.4.0'):
+            hits = list(iter_log_hits(create_log_query('exe_1')))
+
+        self.assertListEqual([hit['_source']['scale_order_num'] for hit in hits], list(range(20)))
+        self.assertEqual(len(self.server.requests), 2)
+
+    def test_iter_log_hits_filters(self):
+        """Tests that iter_log_hits() applies the stream and since filters"""
+
+        since = datetime.datetime(2016, 1, 1, 0, 0, 10, tzinfo=utc)
+        with self._settings():
+            stderr_hits = list(iter_log_hits(create_log_query('exe_1', include_stdout=False)))
+            since_hits = list(iter_log_hits(create_log_query('exe_1', since=since)))
+
+        self.assertListEqual([hit['_source']['scale_order_num'] for hit in stderr_hits], [0, 5, 10, 15, 20])
+        self.assertListEqual([hit['_source']['scale_order_num'] for hit in since_hits], [20, 21, 22, 23, 24])
+        self.assertIsNone(create_log_query('exe_1', include_stdout=False, include_stderr=False))
+
+    @patch('job.execution.logs.LOG_PAGE_SIZE', 10)
+    def test_iter_log_json_and_text(self):
+        """Tests that the streamed JSON and text contain every hit"""
+
+        with self._settings():
+            content = ''.join(iter_log_json(iter_log_hits(create_log_query('exe_1'))))
+            text = ''.join(iter_log_text(iter_log_hits(create_log_query('exe_1'))))
+            html = ''.join(iter_log_text(iter_log_hits(create_log_query('exe_1')), html=True))
+
+        result = json.loads(content)
+        self.assertEqual(result['hits']['total'], 25)
+        self.assertEqual(len(result['hits']['hits']), 25)
+        self.assertEqual(text, '\n'.join('line %d' % i for i in range(25)))
+        self.assertEqual(html.count('<div class="stderr">'), 5)
+        self.assertTrue(html.endswith('</body></html>'))
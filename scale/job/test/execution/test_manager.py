@@ -237,3 +237,16 @@ class TestJobExecutionManager(TransactionTestCase):
         message = self.job_exe_mgr.get_messages()[0]
         self.assertEqual(message.type, 'create_job_exe_ends')
         self.assertEqual(message._job_exe_ends[0].job_exe_id, self.job_exe_1.id)
+
+    def test_sync_with_database_job_ids(self):
+        """Tests calling sync_with_database() for only some of the running jobs"""
+
+        self.job_exe_mgr.schedule_job_exes([self.job_exe_1, self.job_exe_2], [])
+
+        Job.objects.update_jobs_to_canceled([self.job_exe_1._job_exe.job, self.job_exe_2._job_exe.job], now())
+        finished_job_exes = self.job_exe_mgr.sync_with_database({self.job_exe_2.job_id})
+
+        self.assertNotEqual(self.job_exe_1.status, 'CANCELED')
+        self.assertEqual(self.job_exe_2.status, 'CANCELED')
+        self.assertListEqual([job_exe.id for job_exe in finished_job_exes], [self.job_exe_2.id])
+        self.assertListEqual(self.job_exe_mgr.sync_with_database(set()), [])
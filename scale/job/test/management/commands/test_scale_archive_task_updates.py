@@ -0,0 +1,54 @@
+from __future__ import unicode_literals
+
+import datetime
+import gzip
+import json
+import os
+import shutil
+import tempfile
+
+import django
+from django.core.management import call_command
+from django.test import TestCase
+from django.utils.timezone import now
+
+from job.models import TaskUpdate
+from job.test import utils as job_utils
+
+
+class TestArchiveTaskUpdates(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+        self.directory = tempfile.mkdtemp()
+        self.job_exe = job_utils.create_job_exe()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    def test_archive(self):
+        """Tests that only the task updates older than the retention period are archived and deleted"""
+
+        when = now()
+        old_created = when - datetime.timedelta(days=40)
+        task_updates = []
+        for i in range(5):
+            task_updates.append(TaskUpdate.objects.create(job_exe=self.job_exe, task_id='task_%d' % i,
+                                                          status='RUNNING', timestamp=when))
+        old_ids = [task_update.id for task_update in task_updates[:3]]
+        TaskUpdate.objects.filter(id__in=old_ids[:2]).update(created=old_created)
+        TaskUpdate.objects.filter(id=old_ids[2]).update(created=old_created + datetime.timedelta(days=1))
+
+        call_command('scale_archive_task_updates', self.directory, days=30, chunk_size=2)
+
+        remaining_ids = set(TaskUpdate.objects.values_list('id', flat=True))
+        self.assertSetEqual(remaining_ids, {task_update.id for task_update in task_updates[3:]})
+        self.assertEqual(len(os.listdir(self.directory)), 2)
+
+        path = os.path.join(self.directory, 'task_update_%s.jsonl.gz' % old_created.date().isoformat())
+        with gzip.open(path, 'rb') as archive_file:
+            rows = [json.loads(line) for line in archive_file.read().decode('utf-8').splitlines()]
+        self.assertListEqual([row['id'] for row in rows], old_ids[:2])
+        self.assertEqual(rows[0]['task_id'], 'task_0')
+        self.assertEqual(rows[0]['job_exe_id'], self.job_exe.id)
@@ -2,6 +2,9 @@ from __future__ import unicode_literals
 
 import copy
 import json
+import os
+import shutil
+import tempfile
 
 import django
 from django.db.utils import DatabaseError, OperationalError
@@ -73,23 +76,29 @@ class TestPreJobSteps(TransactionTestCase):
         self.seed_exe_meta = job_utils.create_job_exe(job=self.seed_job_meta, status='RUNNING', timeout=timeout, queued=now(),
                                                  configuration=exe_config.get_dict())
 
-    @patch('os.mkdir')
-    @patch('__builtin__.open')
-    @patch('job.management.commands.scale_pre_steps.json.dump')
-    def test_generate_input_metadata(self, mock_dump, mock_open, mock_mkdir):
+    def test_generate_input_metadata(self):
+        """Tests generating the input metadata file with the file details retrieved in bulk"""
 
         cmd = PreCommand()
+        metadata_path = os.path.join(tempfile.mkdtemp(), 'metadata.json')
+        self.addCleanup(shutil.rmtree, os.path.dirname(metadata_path))
 
-        cmd._generate_input_metadata(self.seed_exe_meta)
-        mock_dump.assert_called_once()
-        args, kwargs = mock_dump.call_args
+        get_details_for_ids = ScaleFile.objects.get_details_for_ids
+        with patch('job.management.commands.scale_pre_steps.SCALE_INPUT_METADATA_PATH', metadata_path):
+            with patch.object(ScaleFile.objects, 'get_details_for_ids', wraps=get_details_for_ids) as mock_details:
+                cmd._generate_input_metadata(self.seed_exe_meta)
+
+        mock_details.assert_called_once()
+        with open(metadata_path) as metadata_file:
+            metadata = json.load(metadata_file)
         metadata_dict = {'JOB': {}}
         metadata_dict['JOB']['input_1'] = 'my_val'
         metadata_dict['JOB']['input_2'] = [serialize(ScaleFile.objects.get_details(file_id=self.file_1.id)).data]
         metadata_dict['JOB']['input_3'] = [serialize(ScaleFile.objects.get_details(file_id=self.file_2.id)).data, serialize(ScaleFile.objects.get_details(file_id=self.file_3.id)).data]
+        metadata_dict = json.loads(json.dumps(metadata_dict))
         self.maxDiff = None
-        self.assertDictEqual(args[0]['JOB']['input_2'][0], metadata_dict['JOB']['input_2'][0])
-        self.assertDictEqual(args[0], metadata_dict)
+        self.assertDictEqual(metadata['JOB']['input_2'][0], metadata_dict['JOB']['input_2'][0])
+        self.assertDictEqual(metadata, metadata_dict)
 
     @patch('job.management.commands.scale_pre_steps.sys.exit')
     @patch('job.management.commands.scale_pre_steps.os.environ.get')
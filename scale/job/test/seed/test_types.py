@@ -4,7 +4,8 @@ import json
 
 import django
 from django.test import TestCase
-from job.seed.results.outputs_json import SeedOutputsJson
+from jsonschema.exceptions import ValidationError
+from job.seed.results.outputs_json import SeedOutputsJson, _get_validator
 from job.configuration.results.exceptions import MissingRequiredOutput, UnexpectedMultipleOutputs
 from mock import patch, mock_open
 
@@ -122,6 +123,19 @@ class TestSeedOutputsJson(TestCase):
 
         self.assertDictEqual(self.outputs_json_dict, result._dict)
 
+    def test_validator_cached(self):
+        """Tests that documents with the same outputs schema share one validator"""
+
+        validator = _get_validator(self.schema)
+        num_validations = validator.get_stats()['validations']
+        SeedOutputsJson(self.outputs_json_dict, self.schema)
+        SeedOutputsJson(self.outputs_json_dict, SeedOutputsJson.construct_schema(self.seed_outputs_json))
+
+        self.assertIs(_get_validator(SeedOutputsJson.construct_schema(self.seed_outputs_json)), validator)
+        self.assertEqual(validator.get_stats()['validations'], num_validations + 2)
+        with self.assertRaises(ValidationError):
+            SeedOutputsJson({'INPUT_FILE_NAME': '/my/file'}, self.schema)
+
     def test_get_values(self):
         outputs_obj = SeedOutputsJson(self.outputs_json_dict, self.schema)
 
@@ -7,7 +7,8 @@ from django.test import TestCase
 from django.utils.timezone import now
 
 import job.test.utils as job_test_utils
-from job.tasks.base_task import Task
+from job.tasks.base_task import (BASE_RUNNING_TIMEOUT_THRESHOLD, BASE_STAGING_TIMEOUT_THRESHOLD,
+                                 RUNNING_RECON_THRESHOLD, STAGING_RECON_THRESHOLD, Task)
 from job.tasks.manager import TaskManager
 from job.tasks.node_task import NodeTask
 from job.tasks.update import TaskStatusUpdate
@@ -168,3 +169,88 @@ class TestTaskManager(TestCase):
         self.assertEqual(task_2._launched, when)
         self.assertTrue(task_3.has_been_launched)
         self.assertEqual(task_3._launched, when)
+
+    def test_get_tasks_to_kill(self):
+        """Tests calling TaskManager.get_tasks_to_kill()"""
+
+        task_1 = ImplementedTask('task_1', 'My Task', 'agent_1')
+        task_2 = ImplementedTask('task_2', 'My Task', 'agent_1')
+
+        when = now()
+        manager = TaskManager()
+        manager.launch_tasks([task_1, task_2], when)
+        self.assertListEqual(manager.get_tasks_to_kill(), [])
+
+        # Forcing a kill after launch should be picked up by the manager
+        task_2.force_kill()
+        self.assertListEqual(manager.get_tasks_to_kill(), [task_2])
+        self.assertListEqual(manager.get_tasks_to_kill(), [task_2])
+
+        # Once the task ends it should no longer be killed
+        update = job_test_utils.create_task_status_update(task_2.id, task_2.agent_id, TaskStatusUpdate.KILLED,
+                                                          when=when + datetime.timedelta(seconds=1))
+        manager.handle_task_update(update)
+        self.assertListEqual(manager.get_tasks_to_kill(), [])
+
+    def test_get_tasks_to_reconcile(self):
+        """Tests calling TaskManager.get_tasks_to_reconcile()"""
+
+        task_1 = ImplementedTask('task_1', 'My Task', 'agent_1')
+        task_2 = ImplementedTask('task_2', 'My Task', 'agent_1')
+
+        when = now()
+        manager = TaskManager()
+        manager.launch_tasks([task_1, task_2], when)
+        update = job_test_utils.create_task_status_update(task_1.id, task_1.agent_id, TaskStatusUpdate.RUNNING,
+                                                          when=when + datetime.timedelta(seconds=1))
+        manager.handle_task_update(update)
+
+        # Only the staging task is stale
+        check_time = when + STAGING_RECON_THRESHOLD + datetime.timedelta(seconds=2)
+        self.assertListEqual(manager.get_tasks_to_reconcile(check_time), [task_2])
+        self.assertListEqual(manager.get_tasks_to_reconcile(check_time), [task_2])
+
+        # Forcing reconciliation should be picked up immediately
+        task_1.force_reconciliation()
+        tasks = manager.get_tasks_to_reconcile(check_time)
+        self.assertSetEqual({task.id for task in tasks}, {task_1.id, task_2.id})
+
+        # Both tasks are stale after the running threshold
+        update = job_test_utils.create_task_status_update(task_1.id, task_1.agent_id, TaskStatusUpdate.RUNNING,
+                                                          when=check_time)
+        manager.handle_task_update(update)
+        self.assertListEqual(manager.get_tasks_to_reconcile(check_time), [task_2])
+        check_time = check_time + RUNNING_RECON_THRESHOLD + datetime.timedelta(seconds=1)
+        tasks = manager.get_tasks_to_reconcile(check_time)
+        self.assertSetEqual({task.id for task in tasks}, {task_1.id, task_2.id})
+
+    def test_get_timeout_tasks(self):
+        """Tests calling TaskManager.get_timeout_tasks()"""
+
+        task_1 = ImplementedTask('task_1', 'My Task', 'agent_1')
+        task_2 = ImplementedTask('task_2', 'My Task', 'agent_1')
+
+        when = now()
+        manager = TaskManager()
+        manager.launch_tasks([task_1, task_2], when)
+        update = job_test_utils.create_task_status_update(task_1.id, task_1.agent_id, TaskStatusUpdate.RUNNING,
+                                                          when=when + datetime.timedelta(seconds=1))
+        manager.handle_task_update(update)
+        self.assertListEqual(manager.get_timeout_tasks(when), [])
+
+        # Only the staging task has timed out, and it should be killed
+        check_time = when + BASE_STAGING_TIMEOUT_THRESHOLD + datetime.timedelta(seconds=1)
+        self.assertListEqual(manager.get_timeout_tasks(check_time), [task_2])
+        self.assertTrue(task_2.has_timed_out)
+        self.assertListEqual(manager.get_tasks_to_kill(), [task_2])
+
+        # Timed out tasks are reported until they end
+        self.assertListEqual(manager.get_timeout_tasks(check_time), [task_2])
+        update = job_test_utils.create_task_status_update(task_2.id, task_2.agent_id, TaskStatusUpdate.KILLED,
+                                                          when=check_time)
+        manager.handle_task_update(update)
+        self.assertListEqual(manager.get_timeout_tasks(check_time), [])
+
+        # The running task times out after the running threshold
+        check_time = when + BASE_RUNNING_TIMEOUT_THRESHOLD + datetime.timedelta(seconds=2)
+        self.assertListEqual(manager.get_timeout_tasks(check_time), [task_1])
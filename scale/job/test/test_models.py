@@ -9,9 +9,11 @@ import time
 import django
 import django.utils.timezone as timezone
 from django.test import TestCase, TransactionTestCase
+from mock import MagicMock
 
 import error.test.utils as error_test_utils
 import job.test.utils as job_test_utils
+import recipe.test.utils as recipe_test_utils
 import storage.test.utils as storage_test_utils
 import trigger.test.utils as trigger_test_utils
 from data.data.data import Data
@@ -22,8 +24,11 @@ from job.configuration.data.job_data import JobData
 from job.configuration.interface.job_interface import JobInterface
 from job.configuration.results.job_results import JobResults
 from job.seed.results.job_results import JobResults as SeedJobResults
-from job.models import Job, JobExecution, JobExecutionOutput, JobInputFile, JobType, JobTypeRevision, JobTypeTag
+from job.models import (Job, JobExecution, JobExecutionOutput, JobInputFile, JobStatusCounter, JobTimeline, JobType,
+                        JobTypeRevision, JobTypeTag)
+from job.timeline import JobTimelineProcessor
 from node.resources.json.resources import Resources
+from recipe.models import RecipeTimeline
 
 
 class TestJobManager(TransactionTestCase):
@@ -644,3 +649,129 @@ class TestJobTypeTagManager(TransactionTestCase):
         tags = [jt_tag.tag for jt_tag in JobTypeTag.objects.filter(job_type_id=self.job_type3.id)]
 
         self.assertEqual(len(tags), 0)
+
+
+class TestJobTimelineManager(TransactionTestCase):
+
+    def setUp(self):
+        django.setup()
+
+        self.day_1 = datetime.date(2020, 1, 1)
+        self.day_2 = datetime.date(2020, 1, 2)
+        self.when_1 = datetime.datetime(2020, 1, 1, 10, tzinfo=timezone.utc)
+        self.when_2 = datetime.datetime(2020, 1, 2, 10, tzinfo=timezone.utc)
+
+        self.job_type = job_test_utils.create_seed_job_type()
+        self.recipe = recipe_test_utils.create_recipe()
+        self.job_1 = job_test_utils.create_job(job_type=self.job_type, status='RUNNING', started=self.when_1)
+        self.job_2 = job_test_utils.create_job(job_type=self.job_type, status='RUNNING', started=self.when_1,
+                                               recipe=self.recipe)
+        self.job_3 = job_test_utils.create_job(job_type=self.job_type, status='QUEUED')
+
+    def _get_job_counts(self):
+        return {row.day: row.count for row in JobTimeline.objects.filter(job_type_id=self.job_type.id)}
+
+    def _get_recipe_counts(self):
+        return {row.day: row.count for row in RecipeTimeline.objects.filter(recipe_type_id=self.recipe.recipe_type_id)}
+
+    def test_rebuild(self):
+        """Tests calling JobTimelineManager.rebuild()"""
+
+        JobTimeline.objects.rebuild()
+        self.assertDictEqual(self._get_job_counts(), {self.day_1: 2})
+        self.assertDictEqual(self._get_recipe_counts(), {self.day_1: 1})
+
+        # Rebuilding later days should leave earlier days alone
+        Job.objects.filter(id=self.job_3.id).update(started=self.when_2)
+        JobTimeline.objects.filter(day=self.day_1).update(count=5)
+        JobTimeline.objects.rebuild(self.day_2)
+        self.assertDictEqual(self._get_job_counts(), {self.day_1: 5, self.day_2: 1})
+
+    def test_processor(self):
+        """Tests that the timeline clock processor corrects the counts of days before its last event"""
+
+        JobTimeline.objects.rebuild()
+        # Job 1 is purged long after it started
+        self.job_1.delete()
+
+        last_event = MagicMock(occurred=self.when_2 + datetime.timedelta(days=30))
+        JobTimelineProcessor().process_event(MagicMock(), last_event)
+        self.assertDictEqual(self._get_job_counts(), {self.day_1: 1})
+        self.assertDictEqual(self._get_recipe_counts(), {self.day_1: 1})
+
+    def test_update_job_starts(self):
+        """Tests calling JobTimelineManager.update_job_starts() as jobs start and are re-queued"""
+
+        JobTimeline.objects.rebuild()
+
+        # Job 2 starts again the next day and job 3 starts for the first time
+        JobTimeline.objects.update_job_starts([self.job_2, self.job_3], self.when_2)
+        self.assertDictEqual(self._get_job_counts(), {self.day_1: 1, self.day_2: 2})
+        self.assertDictEqual(self._get_recipe_counts(), {self.day_1: 0, self.day_2: 1})
+
+        # Job 1 is re-queued, clearing its start time
+        JobTimeline.objects.update_job_starts([self.job_1], None)
+        self.assertDictEqual(self._get_job_counts(), {self.day_1: 0, self.day_2: 2})
+
+        # Unchanged start times are ignored
+        job_2 = Job.objects.get(id=self.job_2.id)
+        job_2.started = self.when_2
+        JobTimeline.objects.update_job_starts([job_2], self.when_2)
+        self.assertDictEqual(self._get_job_counts(), {self.day_1: 0, self.day_2: 2})
+
+
+class TestJobStatusCounterManager(TransactionTestCase):
+
+    def setUp(self):
+        django.setup()
+
+        self.job_type = job_test_utils.create_seed_job_type()
+        self.error = error_test_utils.create_error(category='SYSTEM')
+        self.when_1 = datetime.datetime(2020, 1, 1, tzinfo=timezone.utc)
+        self.when_2 = datetime.datetime(2020, 1, 2, tzinfo=timezone.utc)
+        self.when_3 = datetime.datetime(2020, 1, 3, tzinfo=timezone.utc)
+        self.job_1 = job_test_utils.create_job(job_type=self.job_type, status='QUEUED', last_status_change=self.when_1)
+        self.job_2 = job_test_utils.create_job(job_type=self.job_type, status='QUEUED', last_status_change=self.when_2)
+
+    def _get_counts(self, status):
+        return [(c.count, c.oldest, c.newest) for c in JobStatusCounter.objects.get_counters(status)
+                if c.job_type_id == self.job_type.id]
+
+    def test_status_change(self):
+        """Tests that the counters follow jobs through their status changes"""
+
+        self.assertListEqual(self._get_counts('QUEUED'), [(2, self.when_1, self.when_2)])
+
+        # The oldest queued job starts running, so the queued timestamps must be refreshed
+        Job.objects.update_jobs_to_running(Job.objects.get_locked_jobs([self.job_1.id]), self.when_3)
+        self.assertTrue(JobStatusCounter.objects.get(job_type_id=self.job_type.id, status='QUEUED').needs_refresh)
+        self.assertListEqual(self._get_counts('QUEUED'), [(1, self.when_2, self.when_2)])
+        self.assertListEqual(self._get_counts('RUNNING'), [(1, self.when_3, self.when_3)])
+
+        Job.objects.update_jobs_to_failed(Job.objects.get_locked_jobs([self.job_1.id]), self.error.id, self.when_3)
+        self.assertListEqual(self._get_counts('RUNNING'), [])
+        counters = JobStatusCounter.objects.get_counters('FAILED', error_category='SYSTEM')
+        self.assertListEqual([(c.job_type_id, c.error_id, c.count) for c in counters],
+                             [(self.job_type.id, self.error.id, 1)])
+
+        # Re-queueing clears the error
+        Job.objects.update_jobs_to_queued(Job.objects.get_locked_jobs([self.job_1.id]), self.when_3, requeue=True)
+        self.assertListEqual(JobStatusCounter.objects.get_counters('FAILED'), [])
+        self.assertListEqual(self._get_counts('QUEUED'), [(2, self.when_2, self.when_3)])
+
+    def test_deleted_jobs(self):
+        """Tests calling JobStatusCounterManager.update_for_deleted_jobs()"""
+
+        JobStatusCounter.objects.update_for_deleted_jobs([self.job_2.id])
+        Job.objects.filter(id=self.job_2.id).delete()
+
+        self.assertListEqual(self._get_counts('QUEUED'), [(1, self.when_1, self.when_1)])
+
+    def test_rebuild(self):
+        """Tests calling JobStatusCounterManager.rebuild()"""
+
+        Job.objects.filter(id=self.job_2.id).update(status='RUNNING', last_status_change=self.when_3)
+        JobStatusCounter.objects.rebuild()
+
+        self.assertListEqual(self._get_counts('QUEUED'), [(1, self.when_1, self.when_1)])
+        self.assertListEqual(self._get_counts('RUNNING'), [(1, self.when_3, self.when_3)])
@@ -2349,6 +2349,12 @@ class TestJobExecutionDetailsViewV6(APITransactionTestCase):
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND, response.content)
 
 
+LOG_HIT_STDOUT = {'_source': {'@timestamp': '2016-01-01T00:00:00.000Z', 'scale_order_num': 1, 'message': 'hello',
+                              'stream': 'stdout'}}
+LOG_HIT_STDERR = {'_source': {'@timestamp': '2016-01-01T00:00:01.000Z', 'scale_order_num': 2, 'message': 'uh oh',
+                              'stream': 'stderr'}}
+
+
 class TestJobExecutionSpecificLogViewV6(APITestCase):
     api = 'v6'
 
@@ -2363,63 +2369,69 @@ class TestJobExecutionSpecificLogViewV6(APITestCase):
 
     @patch('job.views.JobExecution.objects.get_logs')
     def test_combined_log_json_no_time(self, mock_get_logs):
-        def new_get_log_json(include_stdout, include_stderr, since):
+        def new_get_log_hits(include_stdout, include_stderr, since):
             self.assertTrue(include_stdout)
             self.assertTrue(include_stderr)
             self.assertIsNone(since)
-            return {}, now()
+            return iter([LOG_HIT_STDOUT, LOG_HIT_STDERR])
 
-        mock_get_logs.return_value.get_log_json.side_effect = new_get_log_json
+        mock_get_logs.return_value.get_log_hits.side_effect = new_get_log_hits
 
         url = '/%s/job-executions/999999/logs/combined/?format=json' % self.api
         response = self.client.generic('GET', url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
-        self.assertEqual(response.accepted_media_type, 'application/json')
+        self.assertEqual(response['Content-Type'], 'application/json')
+        result = json.loads(b''.join(response.streaming_content))
+        self.assertEqual(result['hits']['total'], 2)
+        self.assertListEqual(result['hits']['hits'], [LOG_HIT_STDOUT, LOG_HIT_STDERR])
 
     @patch('job.views.JobExecution.objects.get_logs')
     def test_combined_log_text_no_time(self, mock_get_logs):
-        def new_get_log_text(include_stdout, include_stderr, since, html):
+        def new_get_log_hits(include_stdout, include_stderr, since):
             self.assertTrue(include_stdout)
             self.assertTrue(include_stderr)
             self.assertIsNone(since)
-            self.assertFalse(html)
-            return 'hello', now()
+            return iter([LOG_HIT_STDOUT, LOG_HIT_STDERR])
 
-        mock_get_logs.return_value.get_log_text.side_effect = new_get_log_text
+        mock_get_logs.return_value.get_log_hits.side_effect = new_get_log_hits
 
         url = '/%s/job-executions/999999/logs/combined/?format=txt' % self.api
         response = self.client.get(url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
-        self.assertEqual(response.accepted_media_type, 'text/plain')
+        self.assertTrue(response['Content-Type'].startswith('text/plain'))
+        self.assertEqual(b''.join(response.streaming_content), b'hello\nuh oh')
 
     @patch('job.views.JobExecution.objects.get_logs')
     def test_combined_log_html_no_time(self, mock_get_logs):
-        def new_get_log_text(include_stdout, include_stderr, since, html):
+        def new_get_log_hits(include_stdout, include_stderr, since):
             self.assertTrue(include_stdout)
             self.assertTrue(include_stderr)
             self.assertIsNone(since)
-            self.assertTrue(html)
-            return '<html>hello</html>', now()
+            return iter([LOG_HIT_STDOUT, LOG_HIT_STDERR])
 
-        mock_get_logs.return_value.get_log_text.side_effect = new_get_log_text
+        mock_get_logs.return_value.get_log_hits.side_effect = new_get_log_hits
 
         url = '/%s/job-executions/999999/logs/combined/?format=html' % self.api
         response = self.client.generic('GET', url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
-        self.assertEqual(response.accepted_media_type, 'text/html')
+        self.assertTrue(response['Content-Type'].startswith('text/html'))
+        content = b''.join(response.streaming_content)
+        self.assertTrue(content.startswith(b'<html>'))
+        self.assertIn(b'<div class="stdout">hello</div>', content)
+        self.assertIn(b'<div class="stderr">uh oh</div>', content)
 
     @patch('job.views.JobExecution.objects.get_logs')
     def test_combined_log_json_no_content(self, mock_get_logs):
-        def new_get_log_json(include_stdout, include_stderr, since):
+        def new_get_log_hits(include_stdout, include_stderr, since):
             self.assertTrue(include_stdout)
             self.assertTrue(include_stderr)
             self.assertIsNone(since)
-            return None, now()
+            return iter([])
 
-        mock_get_logs.return_value.get_log_json.side_effect = new_get_log_json
+        mock_get_logs.return_value.get_log_hits.side_effect = new_get_log_hits
 
         url = '/%s/job-executions/999999/logs/combined/?format=json' % self.api
         response = self.client.generic('GET', url)
@@ -2428,55 +2440,53 @@ class TestJobExecutionSpecificLogViewV6(APITestCase):
 
     @patch('job.views.JobExecution.objects.get_logs')
     def test_stdout_log_html_no_time(self, mock_get_logs):
-        def new_get_log_text(include_stdout, include_stderr, since, html):
+        def new_get_log_hits(include_stdout, include_stderr, since):
             self.assertTrue(include_stdout)
             self.assertFalse(include_stderr)
             self.assertIsNone(since)
-            self.assertTrue(html)
-            return '<html>hello</html>', now()
+            return iter([LOG_HIT_STDOUT])
 
-        mock_get_logs.return_value.get_log_text.side_effect = new_get_log_text
+        mock_get_logs.return_value.get_log_hits.side_effect = new_get_log_hits
 
         url = '/%s/job-executions/999999/logs/stdout/?format=html' % self.api
         response = self.client.generic('GET', url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
-        self.assertEqual(response.accepted_media_type, 'text/html')
+        self.assertTrue(response['Content-Type'].startswith('text/html'))
 
     @patch('job.views.JobExecution.objects.get_logs')
     def test_stderr_log_html_no_time(self, mock_get_logs):
-        def new_get_log_text(include_stdout, include_stderr, since, html):
+        def new_get_log_hits(include_stdout, include_stderr, since):
             self.assertFalse(include_stdout)
             self.assertTrue(include_stderr)
             self.assertIsNone(since)
-            self.assertTrue(html)
-            return '<html>hello</html>', now()
+            return iter([LOG_HIT_STDERR])
 
-        mock_get_logs.return_value.get_log_text.side_effect = new_get_log_text
+        mock_get_logs.return_value.get_log_hits.side_effect = new_get_log_hits
 
         url = '/%s/job-executions/999999/logs/stderr/?format=html' % self.api
         response = self.client.generic('GET', url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
-        self.assertEqual(response.accepted_media_type, 'text/html')
+        self.assertTrue(response['Content-Type'].startswith('text/html'))
 
     @patch('job.views.JobExecution.objects.get_logs')
     def test_combined_log_json_with_time(self, mock_get_logs):
         started = datetime.datetime(2016, 1, 1, tzinfo=utc)
 
-        def new_get_log_json(include_stdout, include_stderr, since):
+        def new_get_log_hits(include_stdout, include_stderr, since):
             self.assertTrue(include_stdout)
             self.assertTrue(include_stderr)
             self.assertEqual(since, started)
-            return {}, now()
+            return iter([LOG_HIT_STDOUT])
 
-        mock_get_logs.return_value.get_log_json.side_effect = new_get_log_json
+        mock_get_logs.return_value.get_log_hits.side_effect = new_get_log_hits
 
         url = '/%s/job-executions/999999/logs/combined/?started=2016-01-01T00:00:00Z&format=json' % self.api
         response = self.client.generic('GET', url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
-        self.assertEqual(response.accepted_media_type, 'application/json')
+        self.assertEqual(response['Content-Type'], 'application/json')
 
 
 class TestJobInputFilesViewV6(APITestCase):
@@ -16,7 +16,8 @@ from job.execution.configuration.json.exe_config import ExecutionConfiguration
 from job.configuration.results.job_results import JobResults
 from job.execution.job_exe import RunningJobExecution
 from job.execution.tasks.json.results.task_results import TaskResults
-from job.models import Job, JobExecution, JobExecutionEnd, JobExecutionOutput, JobInputFile, JobType, JobTypeRevision, TaskUpdate
+from job.models import (Job, JobExecution, JobExecutionEnd, JobExecutionOutput, JobInputFile, JobStatusCounter, JobType,
+                        JobTypeRevision, TaskUpdate)
 from job.seed.manifest import SeedManifest
 from job.tasks.update import TaskStatusUpdate
 from node.test import utils as node_utils
@@ -261,6 +262,7 @@ def create_job(job_type=None, event=None, status='PENDING', error=None, input=No
 
     if save:
         job.save()
+        JobStatusCounter.objects.update_for_new_jobs([job])
     return job
 
 def create_job_exe(job_type=None, job=None, exe_num=None, node=None, timeout=None, input_file_size=10.0, queued=None,
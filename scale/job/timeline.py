@@ -0,0 +1,23 @@
+"""Defines the clock event processor for maintaining the daily job and recipe timeline counts"""
+from __future__ import unicode_literals
+
+import logging
+
+from job.clock import ClockEventProcessor
+from job.models import JobTimeline
+
+logger = logging.getLogger(__name__)
+
+
+class JobTimelineProcessor(ClockEventProcessor):
+    """This class backfills the daily job and recipe timeline counts from the job table"""
+
+    def process_event(self, event, last_event=None):
+        """See :meth:`job.clock.ClockEventProcessor.process_event`.
+
+        Rebuilds the timeline counts for every day. Jobs can be purged no matter when they started, so the counts of any
+        day may have drifted since the last event.
+        """
+
+        logger.info('Rebuilding job timeline counts')
+        JobTimeline.objects.rebuild()
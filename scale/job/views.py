@@ -1,11 +1,12 @@
 from __future__ import absolute_import
 from __future__ import unicode_literals
 
+import itertools
 import logging
 
 import rest_framework.status as status
 from django.db import transaction
-from django.http.response import Http404, HttpResponse
+from django.http.response import Http404, HttpResponse, StreamingHttpResponse
 from job.seed.exceptions import InvalidSeedManifestDefinition
 from job.seed.manifest import SeedManifest
 from rest_framework.generics import GenericAPIView, ListAPIView, ListCreateAPIView, RetrieveAPIView
@@ -22,6 +23,7 @@ from job.configuration.exceptions import InvalidJobConfiguration
 from job.configuration.interface.exceptions import InvalidInterfaceDefinition
 from job.configuration.json.job_config_v6 import convert_config_to_v6_json, JobConfigurationV6
 from job.exceptions import InvalidJobField, NonSeedJobType
+from job.execution.logs import iter_log_json, iter_log_text
 from job.job_type_serializers import (JobTypeSerializerV6, JobTypeListSerializerV6, JobTypeRevisionSerializerV6,
                                       JobTypeRevisionDetailsSerializerV6, JobTypeDetailsSerializerV6,
                                       JobTypePendingStatusSerializerV6, JobTypeRunningStatusSerializerV6,
@@ -1082,20 +1084,23 @@ class JobExecutionSpecificLogView(RetrieveAPIView):
 
         started = rest_util.parse_timestamp(request, 'started', required=False)
 
-        if request.accepted_renderer.format == 'json':
-            logs, last_modified = job_exe.get_log_json(include_stdout, include_stderr, started)
-        elif request.accepted_renderer.format == 'txt':
-            logs, last_modified = job_exe.get_log_text(include_stdout, include_stderr, started, False)
-        elif request.accepted_renderer.format == 'html':
-            logs, last_modified = job_exe.get_log_text(include_stdout, include_stderr, started, True)
-            if logs is not None:
-                logs = '<html><head><style>.stdout {} .stderr {color: red;}</style></head><body>' + logs + '</body></html>'
-        else:
+        renderer_format = request.accepted_renderer.format
+        if renderer_format not in ('json', 'txt', 'html'):
             return HttpResponse('%s is not a valid content type request.' % request.accepted_renderer.content_type,
                                 content_type='text/plain', status=406)
 
-        if logs is None:
-            rsp = HttpResponse(status=204)
+        # Stream the log a page at a time so that large logs are neither truncated nor held in memory
+        hits = job_exe.get_log_hits(include_stdout, include_stderr, started)
+        first_hit = next(hits, None)
+        if first_hit is None:
+            return HttpResponse(status=204)
+        hits = itertools.chain([first_hit], hits)
+
+        if renderer_format == 'json':
+            content = iter_log_json(hits)
         else:
-            rsp = Response(data=logs)
-        return rsp
+            content = iter_log_text(hits, renderer_format == 'html')
+        content_type = request.accepted_renderer.media_type
+        if request.accepted_renderer.charset:
+            content_type = '%s; charset=%s' % (content_type, request.accepted_renderer.charset)
+        return StreamingHttpResponse(content, content_type=content_type)
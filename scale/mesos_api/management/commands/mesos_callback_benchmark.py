@@ -0,0 +1,74 @@
+"""Defines the command line method for benchmarking the conversion of Mesos offers and task status updates"""
+from __future__ import unicode_literals
+from __future__ import print_function
+
+import json
+import timeit
+from base64 import b64decode
+
+from django.core.management.base import BaseCommand
+
+from mesos_api import utils
+from mesos_api.utils import obj_from_json, sample_offer, sample_update
+
+
+# The rate of offers the benchmark reports its per-callback budget for
+OFFERS_PER_SECOND = 10000
+
+
+def _json_round_trip(input_json):
+    """The previous conversion that serialized the dict and parsed it back again, kept as the benchmark baseline"""
+
+    return json.loads(json.dumps(input_json), object_hook=lambda d: utils.Namespace(**d))
+
+
+def _convert_offer_baseline():
+    scale_offer = _json_round_trip(sample_offer)
+    return [(resource.name, resource.type) for resource in scale_offer.resources]
+
+
+def _convert_offer():
+    scale_offer = obj_from_json(sample_offer)
+    return [(resource.name, resource.type) for resource in scale_offer.resources]
+
+
+def _convert_update_baseline():
+    # The previous task status helpers converted the status once for each of the eight fields they read
+    for _ in range(8):
+        status = _json_round_trip(sample_update).status
+    return status.task_id.value, status.agent_id.value, json.loads(b64decode(status.data))
+
+
+def _convert_update():
+    utils.create_task_update_model(sample_update)
+    return utils.get_status_agent_id(sample_update), utils.get_status_data(sample_update)
+
+
+class Command(BaseCommand):
+    """Command that benchmarks converting recorded Mesos offers and task status updates
+    """
+
+    help = 'Benchmarks the per-callback cost of converting recorded Mesos offers and task status updates'
+
+    def add_arguments(self, parser):
+        parser.add_argument('-n', '--number', action='store', type=int, default=OFFERS_PER_SECOND,
+                            help='Number of conversions timed in each run')
+        parser.add_argument('-r', '--repeat', action='store', type=int, default=5,
+                            help='Number of runs, the fastest run is reported')
+
+    def handle(self, *args, **options):
+        """See :meth:`django.core.management.base.BaseCommand.handle`.
+
+        This method times each conversion and prints the per-callback latency.
+        """
+
+        number, repeat = options['number'], options['repeat']
+        budget = 1000000.0 / OFFERS_PER_SECOND
+        print('Per-callback latency in microseconds (budget at %d offers/sec is %.1f)' % (OFFERS_PER_SECOND, budget))
+        for name, baseline, converter in [('offer', _convert_offer_baseline, _convert_offer),
+                                          ('task update', _convert_update_baseline, _convert_update)]:
+            baseline_usec = min(timeit.repeat(baseline, number=number, repeat=repeat)) * 1000000.0 / number
+            converter_usec = min(timeit.repeat(converter, number=number, repeat=repeat)) * 1000000.0 / number
+            print('%-12s JSON round trip: %8.1f  direct: %8.1f  speedup: %5.1fx  budget used: %5.1f%%' %
+                  (name, baseline_usec, converter_usec, baseline_usec / converter_usec,
+                   converter_usec * 100.0 / budget))
@@ -0,0 +1,49 @@
+from __future__ import unicode_literals
+
+import datetime
+
+import django
+from django.test import TestCase
+from django.utils.timezone import utc
+
+from mesos_api import utils
+
+
+class TestUtils(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+    def test_obj_from_json(self):
+        """Tests converting a nested dict into a dot accessible object"""
+
+        offer = utils.obj_from_json(utils.sample_offer)
+
+        self.assertEqual(offer.id.value, '73e84cd0-c07b-44bc-a76b-475f608aa132-O1862')
+        self.assertEqual(offer.url.address.port, 5051)
+        self.assertEqual(offer.resources[1].scalar.value, 13838.0)
+        self.assertEqual(offer.resources[3].ranges.range[0].end, 2180)
+        self.assertListEqual(offer.url.query, [])
+        self.assertIsNot(offer.resources, utils.sample_offer['resources'])
+
+    def test_create_task_update_model(self):
+        """Tests creating a task update model from a task status"""
+
+        model = utils.create_task_update_model(utils.sample['update'])
+
+        self.assertEqual(model.task_id, 'scale_health_73e84cd0-c07b-44bc-a76b-475f608aa132-0005_10')
+        self.assertEqual(model.status, 'TASK_LOST')
+        self.assertEqual(model.source, 'SOURCE_MASTER')
+        self.assertEqual(model.reason, 'REASON_RECONCILIATION')
+        self.assertEqual(model.message, 'Reconciliation: Task is unknown to the agent')
+        self.assertEqual(model.timestamp, datetime.datetime(2018, 11, 1, 15, 11, 0, 901000, tzinfo=utc))
+
+    def test_get_status_data(self):
+        """Tests getting the data dict of a task status, which may be missing"""
+
+        data = utils.get_status_data(utils.sample_update)
+
+        self.assertEqual(data[0]['Path'], './entryPoint.sh')
+        self.assertDictEqual(utils.get_status_data(utils.sample['update']), {})
+        self.assertIsNone(utils.get_status_reason(utils.sample_update))
+        self.assertEqual(utils.get_status_agent_id(utils.sample_update), 'ef554235-4600-4202-aac9-53d79dc8e923-S6')
@@ -7,10 +7,14 @@ from __future__ import unicode_literals
 import logging
 import signal
 
+from django.conf import settings
 from django.core.management.base import BaseCommand
+from django.utils.timezone import now
 
 from error.models import Error
 from messaging.manager import CommandMessageManager
+from messaging.profiling import message_profiler
+from util.db_pool.pool import release_connections
 
 logger = logging.getLogger(__name__)
 
@@ -44,6 +48,12 @@ class Command(BaseCommand):
 
         while self.running:
             manager.receive_messages()
+            if settings.MESSAGE_PROFILING:
+                self._save_profiles(is_final=False)
+            release_connections()
+
+        if settings.MESSAGE_PROFILING:
+            self._save_profiles(is_final=True)
 
         logger.info('Command completed: scale_message_handler')
 
@@ -51,3 +61,19 @@ class Command(BaseCommand):
 
         logger.info('Halting queue processing as a result of signal: {}'.format(signum))
         self.running = False
+
+    def _save_profiles(self, is_final):
+        """Logs and saves the message execution profiles if they are due, or unconditionally if the handler is
+        stopping
+
+        :param is_final: Whether the handler is stopping
+        :type is_final: bool
+        """
+
+        try:
+            if is_final:
+                message_profiler.save_profiles(now())
+            else:
+                message_profiler.save_profiles_if_due(now())
+        except Exception:
+            logger.exception('Failed to save message execution profiles')
@@ -10,6 +10,7 @@ from django.utils.timezone import now
 from six import raise_from
 
 from messaging.messages.factory import get_message_type
+from messaging.profiling import message_profiler
 from util.broker import BrokerDetails
 from .backends.factory import get_message_backend
 from .exceptions import CommandMessageExecuteFailure, InvalidCommandMessage
@@ -129,7 +130,10 @@ class CommandMessageManager(object):
         start_time = now()
         logger.info('Processing message of type %s', command.type)
         try:
-            success = command.execute()
+            if settings.MESSAGE_PROFILING:
+                success = message_profiler.execute(command)
+            else:
+                success = command.execute()
         except Exception:
             logger.exception('Message threw exception')
             success = False
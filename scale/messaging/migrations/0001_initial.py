@@ -0,0 +1,30 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+import django.contrib.postgres.fields.jsonb
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='MessageProfile',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('handler', models.CharField(max_length=250)),
+                ('message_type', models.CharField(max_length=100)),
+                ('started', models.DateTimeField()),
+                ('ended', models.DateTimeField(db_index=True)),
+                ('profile', django.contrib.postgres.fields.jsonb.JSONField(default=dict)),
+            ],
+            options={
+                'db_table': 'message_profile',
+            },
+        ),
+    ]
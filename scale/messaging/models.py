@@ -0,0 +1,100 @@
+"""Defines the database models for message execution profiles"""
+from __future__ import unicode_literals
+
+import django.contrib.postgres.fields
+from django.db import models
+
+from messaging.profiling import MessageTypeProfile
+
+
+class MessageProfileManager(models.Manager):
+    """Provides additional methods for handling message execution profiles
+    """
+
+    def delete_old_profiles(self, before):
+        """Deletes the profiles that ended before the given time
+
+        :param before: The time
+        :type before: :class:`datetime.datetime`
+        """
+
+        self.filter(ended__lt=before).delete()
+
+    def get_profiles(self, started=None, ended=None, message_types=None):
+        """Returns the profiles of each message type saved by all message handlers within the given time range, merged
+        together
+
+        :param started: Query profiles that ended after this time
+        :type started: :class:`datetime.datetime`
+        :param ended: Query profiles that started before this time
+        :type ended: :class:`datetime.datetime`
+        :param message_types: Query profiles of these message types
+        :type message_types: :func:`list`
+        :returns: The merged profiles sorted by message type
+        :rtype: [:class:`messaging.profiling.MessageTypeProfile`]
+        """
+
+        query = self.all()
+        if started:
+            query = query.filter(ended__gt=started)
+        if ended:
+            query = query.filter(started__lt=ended)
+        if message_types:
+            query = query.filter(message_type__in=message_types)
+
+        profiles = {}  # {Message type: MessageTypeProfile}
+        for message_type, profile_dict in query.values_list('message_type', 'profile').iterator():
+            profile = MessageTypeProfile.from_dict(profile_dict)
+            if message_type in profiles:
+                profiles[message_type].merge(profile)
+            else:
+                profiles[message_type] = profile
+        return [profiles[message_type] for message_type in sorted(profiles)]
+
+    def save_profiles(self, handler, started, ended, profiles):
+        """Saves the given profiles recorded by a message handler
+
+        :param handler: The name of the message handler
+        :type handler: string
+        :param started: When the profiles were started
+        :type started: :class:`datetime.datetime`
+        :param ended: When the profiles were ended
+        :type ended: :class:`datetime.datetime`
+        :param profiles: The profiles
+        :type profiles: [:class:`messaging.profiling.MessageTypeProfile`]
+        """
+
+        message_profiles = []
+        for profile in profiles:
+            message_profiles.append(MessageProfile(handler=handler, message_type=profile.message_type,
+                                                   started=started, ended=ended, profile=profile.get_dict()))
+        if message_profiles:
+            self.bulk_create(message_profiles)
+
+
+class MessageProfile(models.Model):
+    """Represents the profile of the executions of a message type by one message handler over a period of time
+
+    :keyword handler: The name of the message handler that executed the messages
+    :type handler: :class:`django.db.models.CharField`
+    :keyword message_type: The message type
+    :type message_type: :class:`django.db.models.CharField`
+    :keyword started: When the profile was started
+    :type started: :class:`django.db.models.DateTimeField`
+    :keyword ended: When the profile was ended
+    :type ended: :class:`django.db.models.DateTimeField`
+    :keyword profile: JSON description of the profile
+    :type profile: :class:`django.contrib.postgres.fields.JSONField`
+    """
+
+    handler = models.CharField(max_length=250)
+    message_type = models.CharField(max_length=100)
+    started = models.DateTimeField()
+    ended = models.DateTimeField(db_index=True)
+    profile = django.contrib.postgres.fields.JSONField(default=dict)
+
+    objects = MessageProfileManager()
+
+    class Meta(object):
+        """meta information for the db"""
+        db_table = 'message_profile'
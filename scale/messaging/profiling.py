@@ -0,0 +1,463 @@
+"""Defines the classes that profile the execution of command messages by message type"""
+from __future__ import absolute_import
+from __future__ import division
+from __future__ import print_function
+from __future__ import unicode_literals
+
+import bisect
+import datetime
+import logging
+import os
+import socket
+import threading
+import time
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.backends.utils import CursorWrapper
+from django.utils.timezone import now
+
+from util.parse import datetime_to_string
+
+# The upper bounds of the histogram buckets for durations in seconds
+DURATION_BOUNDS = [0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0]
+# The upper bounds of the histogram buckets for numbers of queries and new messages
+COUNT_BOUNDS = [0, 1, 2, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000]
+# How often a message handler logs a summary of its profiles and saves them to the database
+SUMMARY_INTERVAL = datetime.timedelta(minutes=5)
+# How long saved profiles are kept in the database
+PROFILE_RETENTION = datetime.timedelta(days=1)
+
+logger = logging.getLogger(__name__)
+
+
+class Histogram(object):
+    """This class represents a histogram of values with fixed bucket bounds, so that histograms recorded by different
+    message handlers can be merged
+    """
+
+    def __init__(self, bounds):
+        """Constructor
+
+        :param bounds: The ascending upper bounds of the buckets, values above the last bound go in an overflow bucket
+        :type bounds: :func:`list`
+        """
+
+        self.bounds = bounds
+        self.counts = [0] * (len(bounds) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    @property
+    def mean(self):
+        """The mean of the values, zero if there are no values
+
+        :returns: The mean
+        :rtype: float
+        """
+
+        return self.total / self.count if self.count else 0.0
+
+    def add(self, value):
+        """Adds the given value to the histogram
+
+        :param value: The value
+        :type value: float
+        """
+
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.total += value
+        self.max = max(self.max, value)
+
+    def get_dict(self):
+        """Returns the JSON dict for this histogram
+
+        :returns: The JSON dict
+        :rtype: dict
+        """
+
+        return {'bounds': list(self.bounds), 'counts': list(self.counts), 'count': self.count, 'total': self.total,
+                'max': self.max}
+
+    def get_percentile(self, percentile):
+        """Returns an upper estimate of the given percentile, which is the upper bound of the bucket that contains it or
+        the maximum value if it is in the overflow bucket
+
+        :param percentile: The percentile between 0 and 100
+        :type percentile: float
+        :returns: The estimated percentile value, zero if there are no values
+        :rtype: float
+        """
+
+        if not self.count:
+            return 0.0
+        rank = percentile / 100.0 * self.count
+        cumulative = 0
+        for bound, count in zip(self.bounds, self.counts):
+            cumulative += count
+            if cumulative >= rank:
+                return min(bound, self.max)
+        return self.max
+
+    def merge(self, histogram):
+        """Merges the values of the given histogram, which must have the same bounds, into this one
+
+        :param histogram: The histogram to merge
+        :type histogram: :class:`messaging.profiling.Histogram`
+        """
+
+        self.counts = [count + other for count, other in zip(self.counts, histogram.counts)]
+        self.count += histogram.count
+        self.total += histogram.total
+        self.max = max(self.max, histogram.max)
+
+    @staticmethod
+    def from_dict(histogram_dict):
+        """Returns the histogram for the given JSON dict
+
+        :param histogram_dict: The JSON dict
+        :type histogram_dict: dict
+        :returns: The histogram
+        :rtype: :class:`messaging.profiling.Histogram`
+        """
+
+        histogram = Histogram(histogram_dict['bounds'])
+        histogram.counts = histogram_dict['counts']
+        histogram.count = histogram_dict['count']
+        histogram.total = histogram_dict['total']
+        histogram.max = histogram_dict['max']
+        return histogram
+
+
+class MessageTypeProfile(object):
+    """This class represents the profile of the executions of a single message type: histograms of the wall time,
+    database time, number of queries and number of new messages of each execution, and the query traces of the slowest
+    executions if tracing is enabled
+    """
+
+    def __init__(self, message_type):
+        """Constructor
+
+        :param message_type: The message type
+        :type message_type: string
+        """
+
+        self.message_type = message_type
+        self.num_failed = 0
+        self.wall_time = Histogram(DURATION_BOUNDS)
+        self.db_time = Histogram(DURATION_BOUNDS)
+        self.num_queries = Histogram(COUNT_BOUNDS)
+        self.num_new_messages = Histogram(COUNT_BOUNDS)
+        self.traces = []  # The slowest executions with their queries, slowest first
+
+    @property
+    def count(self):
+        """The number of executions
+
+        :returns: The number of executions
+        :rtype: int
+        """
+
+        return self.wall_time.count
+
+    def add_execution(self, wall_time, num_queries, db_time, num_new_messages, success, when, queries=None,
+                      max_traces=0):
+        """Adds an execution of this message type to the profile
+
+        :param wall_time: The wall time of the execution in seconds
+        :type wall_time: float
+        :param num_queries: The number of queries made by the execution
+        :type num_queries: int
+        :param db_time: The time spent executing the queries in seconds
+        :type db_time: float
+        :param num_new_messages: The number of new messages created by the execution
+        :type num_new_messages: int
+        :param success: Whether the execution succeeded
+        :type success: bool
+        :param when: When the execution finished
+        :type when: :class:`datetime.datetime`
+        :param queries: The queries made by the execution, each a dict with the SQL and its time in seconds, only
+            recorded when query traces are kept
+        :type queries: :func:`list`
+        :param max_traces: The number of the slowest executions to keep query traces for
+        :type max_traces: int
+        """
+
+        self.wall_time.add(wall_time)
+        self.db_time.add(db_time)
+        self.num_queries.add(num_queries)
+        self.num_new_messages.add(num_new_messages)
+        if not success:
+            self.num_failed += 1
+
+        if max_traces and (len(self.traces) < max_traces or wall_time > self.traces[-1]['wall_time']):
+            trace = {'wall_time': wall_time, 'db_time': db_time, 'num_queries': num_queries,
+                     'num_new_messages': num_new_messages, 'success': success, 'when': datetime_to_string(when),
+                     'queries': list(queries) if queries else []}
+            self._add_traces([trace], max_traces)
+
+    def get_dict(self):
+        """Returns the JSON dict for this profile
+
+        :returns: The JSON dict
+        :rtype: dict
+        """
+
+        return {'message_type': self.message_type, 'count': self.count, 'num_failed': self.num_failed,
+                'wall_time': self.wall_time.get_dict(), 'db_time': self.db_time.get_dict(),
+                'num_queries': self.num_queries.get_dict(), 'num_new_messages': self.num_new_messages.get_dict(),
+                'traces': list(self.traces)}
+
+    def get_summary(self):
+        """Returns a one line summary of this profile for logging
+
+        :returns: The summary
+        :rtype: string
+        """
+
+        return ('%s: %d executed, %d failed, wall time %.3fs mean/%.3fs p95/%.3fs max, DB time %.3fs mean, '
+                '%.1f queries mean/%d max, %.1f new messages mean' %
+                (self.message_type, self.count, self.num_failed, self.wall_time.mean,
+                 self.wall_time.get_percentile(95), self.wall_time.max, self.db_time.mean, self.num_queries.mean,
+                 self.num_queries.max, self.num_new_messages.mean))
+
+    def merge(self, profile, max_traces=None):
+        """Merges the given profile of the same message type into this one
+
+        :param profile: The profile to merge
+        :type profile: :class:`messaging.profiling.MessageTypeProfile`
+        :param max_traces: The number of the slowest executions to keep query traces for, defaults to the larger number
+            of traces in either profile
+        :type max_traces: int
+        """
+
+        if max_traces is None:
+            max_traces = max(len(self.traces), len(profile.traces))
+        self.num_failed += profile.num_failed
+        self.wall_time.merge(profile.wall_time)
+        self.db_time.merge(profile.db_time)
+        self.num_queries.merge(profile.num_queries)
+        self.num_new_messages.merge(profile.num_new_messages)
+        self._add_traces(profile.traces, max_traces)
+
+    @staticmethod
+    def from_dict(profile_dict):
+        """Returns the profile for the given JSON dict
+
+        :param profile_dict: The JSON dict
+        :type profile_dict: dict
+        :returns: The profile
+        :rtype: :class:`messaging.profiling.MessageTypeProfile`
+        """
+
+        profile = MessageTypeProfile(profile_dict['message_type'])
+        profile.num_failed = profile_dict['num_failed']
+        profile.wall_time = Histogram.from_dict(profile_dict['wall_time'])
+        profile.db_time = Histogram.from_dict(profile_dict['db_time'])
+        profile.num_queries = Histogram.from_dict(profile_dict['num_queries'])
+        profile.num_new_messages = Histogram.from_dict(profile_dict['num_new_messages'])
+        profile.traces = profile_dict['traces']
+        return profile
+
+    def _add_traces(self, traces, max_traces):
+        """Adds the given traces, keeping only the given number of the slowest traces
+
+        :param traces: The traces to add
+        :type traces: :func:`list`
+        :param max_traces: The number of the slowest traces to keep
+        :type max_traces: int
+        """
+
+        all_traces = self.traces + traces
+        all_traces.sort(key=lambda trace: trace['wall_time'], reverse=True)
+        self.traces = all_traces[:max_traces]
+
+
+class QueryRecorder(object):
+    """This class records the number and time of the queries made on the default database connection of the current
+    thread while it is entered as a context manager. Unlike the debug cursor, it does not keep the SQL of each query
+    unless asked to.
+    """
+
+    def __init__(self, keep_sql=False):
+        """Constructor
+
+        :param keep_sql: Whether to keep the SQL and time of each query
+        :type keep_sql: bool
+        """
+
+        self.keep_sql = keep_sql
+        self.num_queries = 0
+        self.db_time = 0.0  # In seconds
+        self.queries = [] if keep_sql else None  # Each a dict with the SQL and its time in seconds
+
+        self._connection = None
+
+    def __enter__(self):
+        self._connection = connections[DEFAULT_DB_ALIAS]
+        make_debug_cursor = self._connection.make_debug_cursor
+        # Cursors are wrapped on the connection instance, so only this thread's queries are recorded
+        self._connection.make_cursor = lambda cursor: _RecordingCursorWrapper(cursor, self)
+        self._connection.make_debug_cursor = lambda cursor: _RecordingCursorWrapper(make_debug_cursor(cursor), self)
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        del self._connection.make_cursor
+        del self._connection.make_debug_cursor
+        self._connection = None
+
+    def record(self, sql, duration):
+        """Records a query
+
+        :param sql: The SQL of the query
+        :type sql: string
+        :param duration: The time the query took in seconds
+        :type duration: float
+        """
+
+        self.num_queries += 1
+        self.db_time += duration
+        if self.keep_sql:
+            self.queries.append({'sql': sql, 'time': duration})
+
+
+class _RecordingCursorWrapper(CursorWrapper):
+    """A cursor wrapper that times each query and passes it to a query recorder"""
+
+    def __init__(self, cursor, recorder):
+        super(_RecordingCursorWrapper, self).__init__(cursor, recorder._connection)
+        self._recorder = recorder
+
+    def execute(self, sql, params=None):
+        started = time.time()
+        try:
+            return super(_RecordingCursorWrapper, self).execute(sql, params)
+        finally:
+            self._recorder.record(sql, time.time() - started)
+
+    def executemany(self, sql, param_list):
+        started = time.time()
+        try:
+            return super(_RecordingCursorWrapper, self).executemany(sql, param_list)
+        finally:
+            self._recorder.record(sql, time.time() - started)
+
+
+class MessageProfiler(object):
+    """This class executes command messages and profiles the executions of each message type. The profiles cover the
+    executions since they were last saved, which a message handler does periodically along with logging a summary of
+    them. This class is thread-safe.
+    """
+
+    def __init__(self):
+        """Constructor
+        """
+
+        self._handler = '%s:%d' % (socket.gethostname(), os.getpid())
+        self._lock = threading.Lock()
+        self._next_summary = None
+        self._profiles = {}  # {Message type: MessageTypeProfile}
+        self._started = now()
+
+    def execute(self, command):
+        """Executes the given command message and adds the execution to its message type's profile. Any exception raised
+        by the command is re-raised after the execution is recorded as failed.
+
+        :param command: The command message to execute
+        :type command: :class:`messaging.messages.message.CommandMessage`
+        :returns: Whether the execution succeeded
+        :rtype: bool
+        """
+
+        max_traces = settings.MESSAGE_PROFILE_TRACES
+        recorder = QueryRecorder(keep_sql=max_traces > 0)
+        success = False
+        started = time.time()
+        try:
+            with recorder:
+                success = command.execute()
+        finally:
+            wall_time = time.time() - started
+            self._add_execution(command.type, wall_time, recorder, len(command.new_messages), success, max_traces)
+        return success
+
+    def get_profiles(self):
+        """Returns copies of the current profiles
+
+        :returns: The profiles stored by message type
+        :rtype: dict
+        """
+
+        with self._lock:
+            return {message_type: MessageTypeProfile.from_dict(profile.get_dict())
+                    for message_type, profile in self._profiles.items()}
+
+    def save_profiles(self, when):
+        """Logs a summary of the current profiles, saves them to the database and starts new profiles. Saved profiles
+        older than the retention period are deleted.
+
+        :param when: The current time
+        :type when: :class:`datetime.datetime`
+        """
+
+        from messaging.models import MessageProfile
+
+        with self._lock:
+            profiles = self._profiles
+            started = self._started
+            self._profiles = {}
+            self._started = when
+            self._next_summary = when + SUMMARY_INTERVAL
+
+        if profiles:
+            logger.info('Message execution profiles since %s:', datetime_to_string(started))
+            for profile in sorted(profiles.values(), key=lambda p: p.wall_time.total, reverse=True):
+                logger.info(profile.get_summary())
+        MessageProfile.objects.save_profiles(self._handler, started, when, profiles.values())
+        MessageProfile.objects.delete_old_profiles(when - PROFILE_RETENTION)
+
+    def save_profiles_if_due(self, when):
+        """Saves the current profiles if the summary interval has passed since they were started
+
+        :param when: The current time
+        :type when: :class:`datetime.datetime`
+        :returns: Whether the profiles were saved
+        :rtype: bool
+        """
+
+        with self._lock:
+            if self._next_summary is None:
+                self._next_summary = self._started + SUMMARY_INTERVAL
+            is_due = when >= self._next_summary
+
+        if is_due:
+            self.save_profiles(when)
+        return is_due
+
+    def _add_execution(self, message_type, wall_time, recorder, num_new_messages, success, max_traces):
+        """Adds an execution to the profile of its message type
+
+        :param message_type: The message type
+        :type message_type: string
+        :param wall_time: The wall time of the execution in seconds
+        :type wall_time: float
+        :param recorder: The recorder of the queries made by the execution
+        :type recorder: :class:`messaging.profiling.QueryRecorder`
+        :param num_new_messages: The number of new messages created by the execution
+        :type num_new_messages: int
+        :param success: Whether the execution succeeded
+        :type success: bool
+        :param max_traces: The number of the slowest executions to keep query traces for
+        :type max_traces: int
+        """
+
+        with self._lock:
+            if message_type not in self._profiles:
+                self._profiles[message_type] = MessageTypeProfile(message_type)
+            self._profiles[message_type].add_execution(wall_time, recorder.num_queries, recorder.db_time,
+                                                       num_new_messages, success, now(), recorder.queries, max_traces)
+
+
+message_profiler = MessageProfiler()
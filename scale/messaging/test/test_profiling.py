@@ -0,0 +1,258 @@
+from __future__ import unicode_literals
+
+import datetime
+
+import django
+from django.db import connection
+from django.test import TestCase
+from django.utils.timezone import now
+from mock import MagicMock, patch
+
+from messaging.models import MessageProfile
+from messaging.profiling import COUNT_BOUNDS, DURATION_BOUNDS, Histogram, MessageProfiler, MessageTypeProfile, \
+    PROFILE_RETENTION, SUMMARY_INTERVAL
+
+
+class TestHistogram(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+    def test_add(self):
+        """Tests adding values to a histogram"""
+
+        histogram = Histogram([1.0, 2.0, 5.0])
+        for value in [0.5, 1.0, 1.5, 4.0, 10.0]:
+            histogram.add(value)
+
+        self.assertListEqual(histogram.counts, [2, 1, 1, 1])
+        self.assertEqual(histogram.count, 5)
+        self.assertEqual(histogram.total, 17.0)
+        self.assertEqual(histogram.max, 10.0)
+        self.assertEqual(histogram.mean, 3.4)
+
+    def test_get_percentile(self):
+        """Tests estimating percentiles from a histogram"""
+
+        histogram = Histogram([1.0, 2.0, 5.0])
+        self.assertEqual(histogram.get_percentile(50), 0.0)
+
+        for value in [0.5, 0.5, 0.5, 1.5, 3.0, 8.0]:
+            histogram.add(value)
+
+        self.assertEqual(histogram.get_percentile(50), 1.0)
+        self.assertEqual(histogram.get_percentile(65), 2.0)
+        self.assertEqual(histogram.get_percentile(80), 5.0)
+        self.assertEqual(histogram.get_percentile(100), 8.0)
+
+    def test_merge_and_from_dict(self):
+        """Tests merging a histogram restored from its JSON dict"""
+
+        histogram_1 = Histogram(COUNT_BOUNDS)
+        histogram_1.add(3)
+        histogram_2 = Histogram(COUNT_BOUNDS)
+        histogram_2.add(20)
+        histogram_2.add(0)
+
+        histogram_1.merge(Histogram.from_dict(histogram_2.get_dict()))
+
+        self.assertEqual(histogram_1.count, 3)
+        self.assertEqual(histogram_1.total, 23)
+        self.assertEqual(histogram_1.max, 20)
+        self.assertEqual(sum(histogram_1.counts), 3)
+        # The original histogram is not changed by the merge
+        self.assertEqual(histogram_2.count, 2)
+
+
+class TestMessageTypeProfile(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+    def test_add_execution(self):
+        """Tests adding executions to a message type profile"""
+
+        when = now()
+        profile = MessageTypeProfile('test_type')
+        profile.add_execution(0.1, 2, 0.04, 2, True, when)
+        profile.add_execution(0.3, 0, 0.0, 0, False, when)
+
+        self.assertEqual(profile.count, 2)
+        self.assertEqual(profile.num_failed, 1)
+        self.assertAlmostEqual(profile.db_time.total, 0.04)
+        self.assertEqual(profile.num_queries.total, 2)
+        self.assertEqual(profile.num_new_messages.total, 2)
+        self.assertListEqual(profile.traces, [])
+
+    def test_traces(self):
+        """Tests that only the traces of the slowest executions are kept"""
+
+        when = now()
+        profile = MessageTypeProfile('test_type')
+        for wall_time in [0.2, 0.5, 0.1, 0.4]:
+            profile.add_execution(wall_time, 1, 0.001, 0, True, when, queries=[{'sql': 'SELECT 1', 'time': 0.001}],
+                                  max_traces=2)
+
+        self.assertListEqual([trace['wall_time'] for trace in profile.traces], [0.5, 0.4])
+        self.assertEqual(profile.traces[0]['queries'][0]['sql'], 'SELECT 1')
+
+    def test_merge(self):
+        """Tests merging message type profiles"""
+
+        when = now()
+        profile_1 = MessageTypeProfile('test_type')
+        profile_1.add_execution(0.2, 0, 0.0, 1, True, when, max_traces=1)
+        profile_2 = MessageTypeProfile('test_type')
+        profile_2.add_execution(0.6, 0, 0.0, 0, False, when, max_traces=1)
+        profile_2.add_execution(0.1, 0, 0.0, 0, True, when, max_traces=1)
+
+        profile_1.merge(MessageTypeProfile.from_dict(profile_2.get_dict()))
+
+        self.assertEqual(profile_1.count, 3)
+        self.assertEqual(profile_1.num_failed, 1)
+        self.assertEqual(profile_1.wall_time.max, 0.6)
+        self.assertEqual(len(profile_1.traces), 1)
+        self.assertEqual(profile_1.traces[0]['wall_time'], 0.6)
+        self.assertIn('test_type: 3 executed, 1 failed', profile_1.get_summary())
+
+
+class TestMessageProfiler(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+    def _create_command(self, message_type, success=True, num_new_messages=0):
+        command = MagicMock(execute=MagicMock(return_value=success))
+        command.type = message_type
+        command.new_messages = [MagicMock()] * num_new_messages
+        return command
+
+    @patch('messaging.profiling.settings')
+    def test_execute(self, mock_settings):
+        """Tests executing command messages through the profiler"""
+
+        mock_settings.MESSAGE_PROFILE_TRACES = 0
+        profiler = MessageProfiler()
+
+        self.assertTrue(profiler.execute(self._create_command('type_a', num_new_messages=3)))
+        self.assertFalse(profiler.execute(self._create_command('type_a', success=False)))
+        self.assertTrue(profiler.execute(self._create_command('type_b')))
+
+        profiles = profiler.get_profiles()
+        self.assertSetEqual(set(profiles.keys()), {'type_a', 'type_b'})
+        self.assertEqual(profiles['type_a'].count, 2)
+        self.assertEqual(profiles['type_a'].num_failed, 1)
+        self.assertEqual(profiles['type_a'].num_new_messages.total, 3)
+        self.assertEqual(profiles['type_b'].count, 1)
+
+    @patch('messaging.profiling.settings')
+    def test_execute_exception(self, mock_settings):
+        """Tests that an exception raised by a command message is re-raised and recorded as a failure"""
+
+        mock_settings.MESSAGE_PROFILE_TRACES = 0
+        profiler = MessageProfiler()
+        command = self._create_command('type_a')
+        command.execute.side_effect = Exception
+
+        with self.assertRaises(Exception):
+            profiler.execute(command)
+
+        profiles = profiler.get_profiles()
+        self.assertEqual(profiles['type_a'].count, 1)
+        self.assertEqual(profiles['type_a'].num_failed, 1)
+
+    @patch('messaging.profiling.settings')
+    def test_execute_traces(self, mock_settings):
+        """Tests that the queries of a command message are traced when enabled"""
+
+        mock_settings.MESSAGE_PROFILE_TRACES = 1
+        profiler = MessageProfiler()
+
+        def execute():
+            MessageProfile.objects.count()
+            return True
+        command = self._create_command('type_a')
+        command.execute.side_effect = execute
+        profiler.execute(command)
+
+        profile = profiler.get_profiles()['type_a']
+        self.assertEqual(profile.num_queries.total, 1)
+        self.assertEqual(len(profile.traces), 1)
+        self.assertIn('message_profile', profile.traces[0]['queries'][0]['sql'])
+
+    @patch('messaging.profiling.settings')
+    def test_execute_without_traces(self, mock_settings):
+        """Tests that queries are counted and timed without keeping their SQL when tracing is disabled"""
+
+        mock_settings.MESSAGE_PROFILE_TRACES = 0
+        profiler = MessageProfiler()
+
+        def execute():
+            MessageProfile.objects.count()
+            MessageProfile.objects.count()
+            return True
+        command = self._create_command('type_a')
+        command.execute.side_effect = execute
+        profiler.execute(command)
+
+        profile = profiler.get_profiles()['type_a']
+        self.assertEqual(profile.num_queries.total, 2)
+        self.assertGreater(profile.db_time.total, 0.0)
+        self.assertListEqual(profile.traces, [])
+        self.assertEqual(len(connection.queries_log), 0)
+
+    @patch('messaging.profiling.settings')
+    def test_save_profiles_if_due(self, mock_settings):
+        """Tests that profiles are saved to the database once the summary interval has passed"""
+
+        mock_settings.MESSAGE_PROFILE_TRACES = 0
+        profiler = MessageProfiler()
+        profiler.execute(self._create_command('type_a'))
+        profiler.execute(self._create_command('type_b'))
+        started = profiler._started
+
+        self.assertFalse(profiler.save_profiles_if_due(started + datetime.timedelta(seconds=1)))
+        self.assertEqual(MessageProfile.objects.count(), 0)
+
+        when = started + SUMMARY_INTERVAL
+        self.assertTrue(profiler.save_profiles_if_due(when))
+        self.assertEqual(MessageProfile.objects.count(), 2)
+        self.assertDictEqual(profiler.get_profiles(), {})
+        self.assertFalse(profiler.save_profiles_if_due(when + datetime.timedelta(seconds=1)))
+
+        # Profiles older than the retention period are deleted
+        profiler.save_profiles(when + PROFILE_RETENTION + datetime.timedelta(seconds=1))
+        self.assertEqual(MessageProfile.objects.count(), 0)
+
+
+class TestMessageProfileManager(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+    def test_get_profiles(self):
+        """Tests merging the profiles saved by different message handlers"""
+
+        when = now()
+        profile_1 = MessageTypeProfile('type_a')
+        profile_1.add_execution(0.1, 0, 0.0, 0, True, when)
+        profile_2 = MessageTypeProfile('type_a')
+        profile_2.add_execution(0.3, 0, 0.0, 0, False, when)
+        profile_3 = MessageTypeProfile('type_b')
+        profile_3.add_execution(0.2, 0, 0.0, 0, True, when)
+        started = when - datetime.timedelta(minutes=5)
+        MessageProfile.objects.save_profiles('handler_1', started, when, [profile_1, profile_3])
+        MessageProfile.objects.save_profiles('handler_2', started, when, [profile_2])
+        old_started = when - datetime.timedelta(hours=2)
+        MessageProfile.objects.save_profiles('handler_1', old_started, old_started + SUMMARY_INTERVAL, [profile_1])
+
+        profiles = MessageProfile.objects.get_profiles(started=when - datetime.timedelta(hours=1))
+        self.assertListEqual([profile.message_type for profile in profiles], ['type_a', 'type_b'])
+        self.assertEqual(profiles[0].count, 2)
+        self.assertEqual(profiles[0].num_failed, 1)
+        self.assertEqual(profiles[0].wall_time.bounds, DURATION_BOUNDS)
+        self.assertEqual(profiles[1].count, 1)
+
+        profiles = MessageProfile.objects.get_profiles(message_types=['type_a'])
+        self.assertEqual(len(profiles), 1)
+        self.assertEqual(profiles[0].count, 3)
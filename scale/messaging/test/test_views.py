@@ -0,0 +1,81 @@
+from __future__ import unicode_literals
+
+import datetime
+import json
+
+import django
+from django.utils.timezone import now
+from rest_framework import status
+from rest_framework.test import APITestCase
+
+from messaging.models import MessageProfile
+from messaging.profiling import MessageTypeProfile
+from util import rest
+
+
+class TestMessageMetricsViewV6(APITestCase):
+    api = 'v6'
+
+    def setUp(self):
+        django.setup()
+
+        rest.login_client(self.client)
+
+        when = now()
+        started = when - datetime.timedelta(minutes=5)
+        profile_1 = MessageTypeProfile('type_a')
+        profile_1.add_execution(0.1, 1, 0.01, 1, True, when, queries=[{'sql': 'SELECT 1', 'time': 0.01}], max_traces=1)
+        profile_2 = MessageTypeProfile('type_b')
+        profile_2.add_execution(0.2, 0, 0.0, 0, False, when, max_traces=1)
+        MessageProfile.objects.save_profiles('handler_1', started, when, [profile_1, profile_2])
+        MessageProfile.objects.save_profiles('handler_2', started, when, [profile_1])
+
+    def test_invalid_version(self):
+        """Tests calling the message metrics view with an invalid REST API version"""
+
+        url = '/v1/messages/metrics/'
+        response = self.client.generic('GET', url)
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND, response.content)
+
+    def test_successful(self):
+        """Tests successfully calling the message metrics view"""
+
+        url = '/%s/messages/metrics/' % self.api
+        response = self.client.generic('GET', url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
+
+        result = json.loads(response.content)
+        self.assertIsNone(result['ended'])
+        self.assertEqual(len(result['results']), 2)
+        self.assertEqual(result['results'][0]['message_type'], 'type_a')
+        self.assertEqual(result['results'][0]['count'], 2)
+        self.assertEqual(result['results'][0]['num_queries']['total'], 2)
+        self.assertEqual(result['results'][1]['message_type'], 'type_b')
+        self.assertEqual(result['results'][1]['num_failed'], 1)
+        self.assertNotIn('traces', result['results'][0])
+
+    def test_message_type(self):
+        """Tests calling the message metrics view filtered by message type"""
+
+        url = '/%s/messages/metrics/?message_type=type_b' % self.api
+        response = self.client.generic('GET', url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
+
+        result = json.loads(response.content)
+        self.assertEqual(len(result['results']), 1)
+        self.assertEqual(result['results'][0]['message_type'], 'type_b')
+
+    def test_include_traces(self):
+        """Tests calling the message metrics view with the query traces included"""
+
+        url = '/%s/messages/metrics/?include_traces=true' % self.api
+        response = self.client.generic('GET', url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
+
+        result = json.loads(response.content)
+        self.assertEqual(len(result['results'][0]['traces']), 1)
+        self.assertEqual(result['results'][0]['traces'][0]['queries'][0]['sql'], 'SELECT 1')
+
+
+class TestMessageMetricsViewV7(TestMessageMetricsViewV6):
+    api = 'v7'
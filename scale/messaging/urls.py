@@ -0,0 +1,8 @@
+"""Defines the URLs for the RESTful messaging services"""
+from django.conf.urls import url
+
+import messaging.views
+
+urlpatterns = [
+    url(r'^messages/metrics/$', messaging.views.MessageMetricsView.as_view(), name='message_metrics_view'),
+]
@@ -0,0 +1,61 @@
+"""Defines the views for the RESTful messaging services"""
+from __future__ import unicode_literals
+
+import logging
+
+from django.http.response import Http404
+from rest_framework.generics import GenericAPIView
+from rest_framework.response import Response
+
+import util.rest as rest_util
+from messaging.models import MessageProfile
+from util.parse import datetime_to_string
+
+logger = logging.getLogger(__name__)
+
+
+class MessageMetricsView(GenericAPIView):
+    """This view is the endpoint for retrieving the execution metrics of each message type"""
+    queryset = MessageProfile.objects.all()
+
+    def get(self, request):
+        """Retrieves the execution metrics of each message type and returns them in JSON form
+
+        :param request: the HTTP GET request
+        :type request: :class:`rest_framework.request.Request`
+        :rtype: :class:`rest_framework.response.Response`
+        :returns: the HTTP response to send back to the user
+        """
+
+        if request.version == 'v6':
+            return self.get_v6(request)
+        elif request.version == 'v7':
+            return self.get_v6(request)
+
+        raise Http404()
+
+    def get_v6(self, request):
+        """The v6 version to retrieve the execution metrics of each message type
+
+        :param request: the HTTP GET request
+        :type request: :class:`rest_framework.request.Request`
+        :rtype: :class:`rest_framework.response.Response`
+        :returns: the HTTP response to send back to the user
+        """
+
+        started = rest_util.parse_timestamp(request, 'started', 'PT1H0M0S')
+        ended = rest_util.parse_timestamp(request, 'ended', required=False)
+        rest_util.check_time_range(started, ended)
+        message_types = rest_util.parse_string_list(request, 'message_type', required=False)
+        include_traces = rest_util.parse_bool(request, 'include_traces', default_value=False)
+
+        results = []
+        for profile in MessageProfile.objects.get_profiles(started, ended, message_types):
+            profile_dict = profile.get_dict()
+            if not include_traces:
+                del profile_dict['traces']
+            results.append(profile_dict)
+
+        return Response({'started': datetime_to_string(started),
+                         'ended': datetime_to_string(ended) if ended else None,
+                         'results': results})
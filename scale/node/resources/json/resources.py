@@ -3,12 +3,12 @@ from __future__ import unicode_literals
 
 import logging
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from node.resources.exceptions import InvalidResources
 from node.resources.node_resources import NodeResources
 from node.resources.resource import ScalarResource
+from util.schema import SchemaValidator
 
 logger = logging.getLogger(__name__)
 
@@ -34,6 +34,8 @@ RESOURCES_SCHEMA = {
     },
 }
 
+RESOURCES_VALIDATOR = SchemaValidator('node.resources.json.resources', RESOURCES_SCHEMA)
+
 
 class Resources(object):
     """Represents the schema for a set of resources"""
@@ -61,7 +63,7 @@ class Resources(object):
 
         try:
             if do_validate:
-                validate(resources, RESOURCES_SCHEMA)
+                RESOURCES_VALIDATOR.validate(resources)
         except ValidationError as validation_error:
             raise InvalidResources(validation_error)
 
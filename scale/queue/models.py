@@ -11,7 +11,7 @@ from job.execution.configuration.configurators import QueuedExecutionConfigurato
 from job.configuration.data.exceptions import InvalidData
 from job.execution.configuration.json.exe_config import ExecutionConfiguration
 from job.seed.manifest import SeedManifest
-from job.models import Job, JobType
+from job.models import Job, JobStatusCounter, JobType
 from job.models import JobExecution, JobTypeRevision
 from node.resources.json.resources import Resources
 from product.models import ProductFile
@@ -23,11 +23,15 @@ from data.data.data_util import get_file_ids
 from messaging.manager import CommandMessageManager
 from job.messages.process_job_input import create_process_job_input_messages
 from recipe.messages.process_recipe_input import create_process_recipe_input_messages
+from util.change_feed import notify_queue_changed
 from util.rest import BadParameter
 
 
 logger = logging.getLogger(__name__)
 
+# The maximum number of queue models inserted by a single query
+QUEUE_BULK_CREATE_SIZE = 1000
+
 QUEUE_ORDER_FIFO = 'FIFO'
 QUEUE_ORDER_LIFO = 'LIFO'
 DEFAULT_QUEUE_ORDER = QUEUE_ORDER_FIFO
@@ -218,6 +222,7 @@ class QueueManager(models.Manager):
         """
 
         self.filter(job_id__in=job_ids).update(is_canceled=True)
+        notify_queue_changed()
 
     def get_queue(self, order_mode, ignore_job_type_ids=None):
         """Returns the list of queue models sorted according to their priority first, and then according to the provided
@@ -299,22 +304,42 @@ class QueueManager(models.Manager):
             for input_file in ScaleFile.objects.get_files_for_queued_jobs(input_file_ids):
                 input_files[input_file.id] = input_file
 
-        # Bulk create queue models
+        # Bulk create queue models, deriving the values shared by jobs of the same job type, job type revision or
+        # batch only once
         queues = []
         job_ids = []
+        job_type_values = {}  # {Job type ID: (SeedManifest, job type resources, interface resources, priority)}
+        interfaces = {}  # {Job type revision ID: Interface dict}
+        batch_priorities = {}  # {Batch ID: Priority}
         configurator = QueuedExecutionConfigurator(input_files)
         for job in queued_jobs:
             job_ids.append(job.id)
             config = configurator.configure_queued_job(job)
 
-            manifest = SeedManifest(job.job_type.manifest)
+            if job.job_type_id not in job_type_values:
+                manifest = SeedManifest(job.job_type.manifest)
+                job_type_values[job.job_type_id] = (manifest, job.job_type.get_resources(),
+                                                    manifest.get_scalar_resources(),
+                                                    job.job_type.get_job_configuration().priority)
+            manifest, job_type_resources, interface_resources, job_type_priority = job_type_values[job.job_type_id]
+
+            if job.job_type_rev_id not in interfaces:
+                interfaces[job.job_type_rev_id] = job.get_job_interface().get_dict()
+
+            batch_priority = None
+            if job.batch:
+                if job.batch_id not in batch_priorities:
+                    batch_priorities[job.batch_id] = job.batch.get_configuration().priority
+                batch_priority = batch_priorities[job.batch_id]
 
             if priority:
                 queued_priority = priority
-            elif job.batch and job.batch.get_configuration().priority:
-                queued_priority = job.batch.get_configuration().priority
-            else:
+            elif batch_priority:
+                queued_priority = batch_priority
+            elif job.configuration:
                 queued_priority = job.get_job_configuration().priority
+            else:
+                queued_priority = job_type_priority
 
             queue = Queue()
             # select_related from get_jobs_with_related above will only make a single query
@@ -328,17 +353,19 @@ class QueueManager(models.Manager):
             queue.is_canceled = False
             queue.priority = queued_priority
             queue.timeout = manifest.get_timeout() if manifest else job.timeout
-            queue.interface = job.get_job_interface().get_dict()
+            queue.interface = interfaces[job.job_type_rev_id]
             queue.configuration = config.get_dict()
-            if job.get_resources():
-                queue.resources = job.get_resources().get_json().get_dict()
+            resources = job.get_resources(job_type_resources, interface_resources)
+            if resources:
+                queue.resources = resources.get_json().get_dict()
             queue.queued = when_queued
             queues.append(queue)
 
         self.cancel_queued_jobs(job_ids)
 
         if queues:
-            self.bulk_create(queues)
+            self.bulk_create(queues, batch_size=QUEUE_BULK_CREATE_SIZE)
+            notify_queue_changed()
 
         return queued_job_ids
 
@@ -365,6 +392,7 @@ class QueueManager(models.Manager):
                 job = Job.objects.create_job_v6(job_type_rev, event_id=event.id, input_data=data,
                                                 job_config=job_configuration)
                 job.save()
+                JobStatusCounter.objects.update_for_new_jobs([job])
         except InvalidData as ex:
             raise BadParameter(unicode(ex))
         
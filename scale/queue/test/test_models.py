@@ -22,7 +22,7 @@ from data.data.value import FileValue
 from data.data.json.data_v6 import DataV6
 from job.configuration.data.job_data import JobData
 from job.data.job_data import JobData as JobDataV6
-from job.models import Job
+from job.models import Job, JobType
 from queue.models import JobLoad, Queue, QUEUE_ORDER_FIFO, QUEUE_ORDER_LIFO
 from recipe.definition.definition import RecipeDefinition
 from recipe.models import Recipe
@@ -148,6 +148,31 @@ class TestQueueManager(TransactionTestCase):
             else:
                 self.assertEqual(queue.id, queue_1.id)
 
+    def test_queue_jobs_shared_values(self):
+        """Tests that QueueManager.queue_jobs() derives the job type values only once for jobs of the same type"""
+
+        job_type = job_test_utils.create_seed_job_type()
+        input_dict = convert_data_to_v6_json(Data()).get_dict()
+        job_1 = job_test_utils.create_job(job_type=job_type, num_exes=0, input=input_dict)
+        job_2 = job_test_utils.create_job(job_type=job_type, num_exes=0, input=input_dict)
+        job_3 = job_test_utils.create_job(job_type=job_type, num_exes=0, input=input_dict, job_config={'priority': 5})
+
+        get_resources = JobType.get_resources
+        with patch('job.models.JobType.get_resources', autospec=True, side_effect=get_resources) as mock_resources:
+            queued_job_ids = Queue.objects.queue_jobs([job_1, job_2, job_3])
+
+        self.assertSetEqual(set(queued_job_ids), {job_1.id, job_2.id, job_3.id})
+        self.assertEqual(mock_resources.call_count, 1)
+        queues = {queue.job_id: queue for queue in Queue.objects.all()}
+        expected_resources = Job.objects.get(id=job_1.id).get_resources().get_json().get_dict()
+        expected_priority = job_type.get_job_configuration().priority
+        for job_id in queued_job_ids:
+            self.assertDictEqual(queues[job_id].resources, expected_resources)
+            self.assertDictEqual(queues[job_id].interface, queues[job_1.id].interface)
+        self.assertEqual(queues[job_1.id].priority, expected_priority)
+        self.assertEqual(queues[job_2.id].priority, expected_priority)
+        self.assertEqual(queues[job_3.id].priority, 5)
+
 
 class TestQueueManagerQueueNewJob(TransactionTestCase):
 
@@ -12,11 +12,11 @@ from job.handlers.inputs.files import FilesInput
 from job.handlers.inputs.property import PropertyInput
 from job.models import JobType
 from job.seed.manifest import SeedManifest
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 from recipe.configuration.data.exceptions import InvalidRecipeConnection
 from recipe.configuration.definition.exceptions import InvalidDefinition
 from recipe.handlers.graph import RecipeGraph
+from util.schema import SchemaValidator
 
 
 DEFAULT_VERSION = '1.0'
@@ -169,6 +169,8 @@ RECIPE_DEFINITION_SCHEMA = {
     },
 }
 
+RECIPE_DEFINITION_VALIDATOR = SchemaValidator('recipe.configuration.definition.recipe_definition', RECIPE_DEFINITION_SCHEMA)
+
 
 class LegacyRecipeDefinition(object):
     """Represents the definition for a recipe. The definition includes the recipe inputs, the jobs that make up the
@@ -192,7 +194,7 @@ class LegacyRecipeDefinition(object):
         self._input_file_validation_dict = {}  # File Input name -> (required, multiple, file description)
 
         try:
-            validate(definition, RECIPE_DEFINITION_SCHEMA)
+            RECIPE_DEFINITION_VALIDATOR.validate(definition)
         except ValidationError as ex:
             raise InvalidDefinition('Invalid recipe definition: %s' % unicode(ex))
 
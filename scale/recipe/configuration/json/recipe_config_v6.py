@@ -1,13 +1,13 @@
 """Manages the v6 recipe configuration schema"""
 from __future__ import unicode_literals
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from job.configuration.mount import HostMountConfig, VolumeMountConfig
 from job.execution.configuration.volume import HOST_TYPE, VOLUME_TYPE
 from recipe.configuration.configuration import DEFAULT_PRIORITY, RecipeConfiguration
 from recipe.configuration.exceptions import InvalidRecipeConfiguration
+from util.schema import SchemaValidator
 
 SCHEMA_VERSION = '7'
 SCHEMA_VERSIONS = ['6', '7']
@@ -99,6 +99,8 @@ RECIPE_CONFIG_SCHEMA = {
     },
 }
 
+RECIPE_CONFIG_VALIDATOR = SchemaValidator('recipe.configuration.json.recipe_config_v6', RECIPE_CONFIG_SCHEMA)
+
 
 def convert_config_to_v6_json(config):
     """Returns the v6 recipe configuration JSON for the given configuration
@@ -163,7 +165,7 @@ class RecipeConfigurationV6(object):
 
         try:
             if do_validate:
-                validate(self._config, RECIPE_CONFIG_SCHEMA)
+                RECIPE_CONFIG_VALIDATOR.validate(self._config)
         except ValidationError as ex:
             raise InvalidRecipeConfiguration('INVALID_CONFIGURATION', 'Invalid configuration: %s' % unicode(ex))
 
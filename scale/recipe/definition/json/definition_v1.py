@@ -1,13 +1,13 @@
 """Defines the class for managing a recipe definition"""
 from __future__ import unicode_literals
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from data.interface.parameter import FileParameter, JsonParameter
 from recipe.definition.connection import DependencyInputConnection, RecipeInputConnection
 from recipe.definition.exceptions import InvalidDefinition
 from recipe.definition.node import JobNodeDefinition
+from util.schema import SchemaValidator
 
 
 DEFAULT_VERSION = '1.0'
@@ -160,6 +160,8 @@ RECIPE_DEFINITION_SCHEMA = {
     },
 }
 
+RECIPE_DEFINITION_VALIDATOR = SchemaValidator('recipe.definition.json.definition_v1', RECIPE_DEFINITION_SCHEMA)
+
 
 def convert_recipe_definition_to_v1_json(definition):
     """Returns the v1 recipe definition JSON for the given recipe definition
@@ -256,7 +258,7 @@ class RecipeDefinitionV1(object):
 
         try:
             if do_validate:
-                validate(definition, RECIPE_DEFINITION_SCHEMA)
+                RECIPE_DEFINITION_VALIDATOR.validate(definition)
         except ValidationError as ex:
             raise InvalidDefinition('INVALID_DEFINITION', 'Invalid recipe definition: %s' % unicode(ex))
 
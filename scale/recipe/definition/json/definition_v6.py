@@ -5,7 +5,6 @@ import copy
 import json
 import re
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from data.filter.filter import DataFilter
@@ -18,6 +17,7 @@ from recipe.definition.exceptions import InvalidDefinition
 from recipe.definition.json.definition_v1 import RecipeDefinitionV1
 from recipe.definition.node import ConditionNodeDefinition, JobNodeDefinition, RecipeNodeDefinition
 from util.rest import strip_schema_version
+from util.schema import SchemaValidator
 
 
 SCHEMA_VERSION = '7'
@@ -190,6 +190,9 @@ RECIPE_DEFINITION_SCHEMA = {
 
 FIND_ALL_U = re.compile(r"(u\"([^\\\"]|\\\"|\\)*\")|(u'([^\\']|\\'|\\)*')")
 
+RECIPE_DEFINITION_VALIDATOR = SchemaValidator('recipe.definition.json.definition_v6', RECIPE_DEFINITION_SCHEMA)
+
+
 def filter_out_us(string):
     """Returns a string where all of the unicode 'u's have been removed. 
     Used to remove the Us from strings that were converted from unicode
@@ -293,7 +296,7 @@ class RecipeDefinitionV6(object):
 
         try:
             if do_validate:
-                validate(self._definition, RECIPE_DEFINITION_SCHEMA)
+                RECIPE_DEFINITION_VALIDATOR.validate(self._definition, memoize=True)
         except ValidationError as ex:
             if type(ex.instance) == dict:
                 node_name = ex.absolute_path[-2]
@@ -1,10 +1,10 @@
 """Manages the v6 recipe diff schema"""
 from __future__ import unicode_literals
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from recipe.diff.exceptions import InvalidDiff
+from util.schema import SchemaValidator
 
 
 SCHEMA_VERSION = '7'
@@ -210,6 +210,10 @@ RECIPE_DIFF_SCHEMA = {
 
 
 # TODO: remove this once old recipe definitions are removed
+
+RECIPE_DIFF_VALIDATOR = SchemaValidator('recipe.diff.json.diff_v6', RECIPE_DIFF_SCHEMA)
+
+
 def convert_diff_to_v6(graph_diff):
     """Returns the v6 recipe graph diff JSON for the given graph diff
 
@@ -344,7 +348,7 @@ class RecipeDiffV6(object):
 
         try:
             if do_validate:
-                validate(self._diff, RECIPE_DIFF_SCHEMA)
+                RECIPE_DIFF_VALIDATOR.validate(self._diff)
         except ValidationError as ex:
             raise InvalidDiff('Invalid recipe graph diff: %s' % unicode(ex))
 
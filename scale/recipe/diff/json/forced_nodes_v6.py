@@ -1,11 +1,11 @@
 """Manages the v6 forced nodes schema"""
 from __future__ import unicode_literals
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from recipe.diff.exceptions import InvalidDiff
 from recipe.diff.forced_nodes import ForcedNodes
+from util.schema import SchemaValidator
 
 
 SCHEMA_VERSION = '7'
@@ -48,6 +48,8 @@ FORCED_NODES_SCHEMA = {
     },
 }
 
+FORCED_NODES_VALIDATOR = SchemaValidator('recipe.diff.json.forced_nodes_v6', FORCED_NODES_SCHEMA)
+
 
 def convert_forced_nodes_to_v6(forced_nodes):
     """Returns the v6 forced nodes JSON for the given forced nodes object
@@ -117,7 +119,7 @@ class ForcedNodesV6(object):
 
         try:
             if do_validate:
-                validate(self._forced_nodes, FORCED_NODES_SCHEMA)
+                FORCED_NODES_VALIDATOR.validate(self._forced_nodes)
         except ValidationError as ex:
             raise InvalidDiff('Invalid forced nodes: %s' % unicode(ex))
 
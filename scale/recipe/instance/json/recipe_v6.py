@@ -1,11 +1,11 @@
 """Manages the v6 recipe instance schema"""
 from __future__ import unicode_literals
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from recipe.definition.node import ConditionNodeDefinition, JobNodeDefinition, RecipeNodeDefinition
 from recipe.instance.exceptions import InvalidRecipe
+from util.schema import SchemaValidator
 
 
 SCHEMA_VERSION = '7'
@@ -193,6 +193,8 @@ RECIPE_INSTANCE_SCHEMA = {
     },
 }
 
+RECIPE_INSTANCE_VALIDATOR = SchemaValidator('recipe.instance.json.recipe_v6', RECIPE_INSTANCE_SCHEMA)
+
 
 def convert_recipe_to_v6_json(recipe):
     """Returns the v6 recipe JSON for the given recipe instance
@@ -268,7 +270,7 @@ class RecipeInstanceV6(object):
 
         try:
             if do_validate:
-                validate(self._json, RECIPE_INSTANCE_SCHEMA)
+                RECIPE_INSTANCE_VALIDATOR.validate(self._json)
         except ValidationError as ex:
             raise InvalidRecipe('Invalid recipe instance: %s' % unicode(ex))
 
@@ -0,0 +1,34 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('recipe', '0037_remove_recipetype_trigger_rule'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RecipeTimeline',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField(db_index=True)),
+                ('count', models.IntegerField(default=0)),
+                ('recipe_type', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE,
+                                                  to='recipe.RecipeType')),
+                ('recipe_type_rev', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE,
+                                                      to='recipe.RecipeTypeRevision')),
+            ],
+            options={
+                'db_table': 'recipe_timeline',
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name='recipetimeline',
+            unique_together=set([('day', 'recipe_type_rev')]),
+        ),
+    ]
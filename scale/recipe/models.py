@@ -2,6 +2,7 @@
 from __future__ import unicode_literals
 
 import copy
+import datetime
 import logging
 from collections import namedtuple
 
@@ -1565,47 +1566,36 @@ class RecipeTypeManager(models.Manager):
         :rtype: dict
         """
 
-        days_ago_started = (now() - started).days if started else 30
-        days_ago_ended = (now() - ended).days if ended else 1
+        # Timeline days are inclusive, with the most recent day defaulting to today
+        today = now().date()
+        first_day = today - datetime.timedelta(days=((now() - started).days if started else 30) - 1)
+        last_day = today - datetime.timedelta(days=((now() - ended).days if ended else 1) - 1)
 
-        args = [days_ago_ended, days_ago_started]
-        qry = "WITH day_periods AS "
-        qry += "(SELECT (date_trunc('day', Now()) - ((days_ago - 2) * INTERVAL '1 day')) AS end_time, "
-        qry += "(date_trunc('day', Now()) - ((days_ago - 1) * INTERVAL '1 day')) AS start_time "
-        qry += "FROM generate_series(%s, %s, 1) days_ago) "
-        qry += "SELECT to_char(d.start_time, 'YYYY-MM-DD') AS recipe_date, "
+        args = [first_day, last_day]
+        qry = "SELECT to_char(t.day, 'YYYY-MM-DD') AS recipe_date, "
         qry += "rt.id AS recipe_type_id, "
         qry += "rt.name AS recipe_type_name, "
         qry += "rt.title AS recipe_type_title, "
         qry += "rtr.revision_num AS recipe_type_revision, "
-        qry += "COUNT(*) AS new_recipe_count "
-        qry += "FROM day_periods d "
-        qry += "JOIN job j ON j.started BETWEEN d.start_time AND d.end_time "
-        qry += "JOIN recipe r ON r.id = j.recipe_id "
-        qry += "JOIN recipe_type rt ON rt.ID = r.recipe_type_id "
-        qry += "JOIN recipe_type_revision rtr ON rtr.id = r.recipe_type_rev_id "
+        qry += "SUM(t.count) AS new_recipe_count "
+        qry += "FROM recipe_timeline t "
+        qry += "JOIN recipe_type rt ON rt.id = t.recipe_type_id "
+        qry += "JOIN recipe_type_revision rtr ON rtr.id = t.recipe_type_rev_id "
+        qry += "WHERE t.day BETWEEN %s AND %s "
 
         if type_ids:
-            qry += "WHERE rt.id in %s "
+            qry += "AND rt.id in %s "
             args.append(tuple(type_ids))
-
-            if revisions:
-                qry += "AND rtr.revision_num in %s "
-                args.append(tuple(revisions))
-
         elif type_names:
-            qry += "WHERE rt.name in %s "
+            qry += "AND rt.name in %s "
             args.append(tuple(type_names))
-
-            if revisions:
-                qry += "AND rtr.revision_num in %s "
-                args.append(tuple(revisions))
-
-        elif revisions:
-            qry += "WHERE rtr.revision_num in %s "
+        if revisions:
+            qry += "AND rtr.revision_num in %s "
             args.append(tuple(revisions))
 
-        qry += "GROUP BY d.start_time, rt.id, rt.name, rt.title, rtr.revision_num"
+        qry += "GROUP BY t.day, rt.id, rt.name, rt.title, rtr.revision_num "
+        qry += "HAVING SUM(t.count) > 0 "
+        qry += "ORDER BY t.day"
 
         results = {}
         with connection.cursor() as cursor:
@@ -2149,4 +2139,30 @@ class RecipeTypeJobLink(models.Model):
     class Meta(object):
         """meta information for the db"""
         db_table = 'recipe_type_job_link'
-        unique_together = ('recipe_type', 'job_type')
\ No newline at end of file
+        unique_together = ('recipe_type', 'job_type')
+
+
+class RecipeTimeline(models.Model):
+    """Stores the number of jobs in recipes of a recipe type revision that started on a given day (UTC). These counts
+    are maintained by :meth:`job.models.JobTimelineManager.update_job_starts` so that the recipe timeline does not need
+    to scan the job table.
+
+    :keyword day: The day the jobs started
+    :type day: :class:`django.db.models.DateField`
+    :keyword recipe_type: The recipe type of the jobs' recipes
+    :type recipe_type: :class:`django.db.models.ForeignKey`
+    :keyword recipe_type_rev: The recipe type revision of the jobs' recipes
+    :type recipe_type_rev: :class:`django.db.models.ForeignKey`
+    :keyword count: The number of jobs that started on the day
+    :type count: :class:`django.db.models.IntegerField`
+    """
+
+    day = models.DateField(db_index=True)
+    recipe_type = models.ForeignKey('recipe.RecipeType', on_delete=models.CASCADE)
+    recipe_type_rev = models.ForeignKey('recipe.RecipeTypeRevision', on_delete=models.CASCADE)
+    count = models.IntegerField(default=0)
+
+    class Meta(object):
+        """meta information for the db"""
+        db_table = 'recipe_timeline'
+        unique_together = ('day', 'recipe_type_rev')
@@ -13,11 +13,11 @@ from job.handlers.inputs.files import FilesInput
 from job.handlers.inputs.property import PropertyInput
 from job.models import JobType
 from job.seed.types import SeedInputFiles, SeedInputJson
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 from recipe.configuration.data.exceptions import InvalidRecipeConnection
 from recipe.configuration.definition.exceptions import InvalidDefinition
 from recipe.handlers.graph import RecipeGraph
+from util.schema import SchemaValidator
 
 
 DEFAULT_VERSION = '2.0'
@@ -26,6 +26,8 @@ SCHEMA_FILENAME = os.path.join(os.path.dirname(os.path.realpath(__file__)), 'sch
 with open(SCHEMA_FILENAME) as schema_file:
     RECIPE_DEFINITION_SCHEMA = json.load(schema_file)
 
+RECIPE_DEFINITION_VALIDATOR = SchemaValidator('recipe.seed.recipe_definition', RECIPE_DEFINITION_SCHEMA)
+
 
 class RecipeDefinition(object):
     """Represents the definition for a recipe. The definition includes the recipe inputs, the jobs that make up the
@@ -50,7 +52,7 @@ class RecipeDefinition(object):
         self._input_file_validation_dict = {}  # File Input name -> (required, multiple, file description)
 
         try:
-            validate(definition, RECIPE_DEFINITION_SCHEMA)
+            RECIPE_DEFINITION_VALIDATOR.validate(definition)
         except ValidationError as ex:
             raise InvalidDefinition('Invalid recipe definition: %s' % unicode(ex))
 
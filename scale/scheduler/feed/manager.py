@@ -0,0 +1,60 @@
+"""Defines the class that manages the state of the scheduler's change feed"""
+from __future__ import unicode_literals
+
+import threading
+
+
+class ChangeFeedManager(object):
+    """This class manages the state of the change feed that notifies the scheduler of queue and job changes. This class
+    is thread-safe."""
+
+    def __init__(self):
+        """Constructor
+        """
+
+        self._lock = threading.Lock()
+        self._is_connected = False
+        self._queue_version = 0  # Incremented each time the queue may have changed
+
+    def get_queue_version(self):
+        """Returns the current queue version. If the version is unchanged since it was last retrieved and the change
+        feed is connected, the queue has not changed since then.
+
+        :returns: The queue version
+        :rtype: int
+        """
+
+        with self._lock:
+            return self._queue_version
+
+    def is_connected(self):
+        """Indicates whether the change feed is connected, so that changes are being reported as they happen
+
+        :returns: True if the change feed is connected, False otherwise
+        :rtype: bool
+        """
+
+        with self._lock:
+            return self._is_connected
+
+    def queue_changed(self):
+        """Records that the queue has changed
+        """
+
+        with self._lock:
+            self._queue_version += 1
+
+    def set_connected(self, is_connected):
+        """Sets whether the change feed is connected. Changes may have been missed while the feed was disconnected, so
+        the queue is considered changed.
+
+        :param is_connected: True if the change feed is connected, False otherwise
+        :type is_connected: bool
+        """
+
+        with self._lock:
+            self._is_connected = is_connected
+            self._queue_version += 1
+
+
+change_feed_mgr = ChangeFeedManager()
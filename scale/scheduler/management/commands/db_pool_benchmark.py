@@ -0,0 +1,101 @@
+"""Defines the command line method for benchmarking scheduler loops with and without pooled database connections"""
+from __future__ import unicode_literals
+from __future__ import print_function
+
+import threading
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connections
+
+from job.models import JobType
+from node.models import Node
+from queue.models import Queue
+from scheduler.models import Scheduler
+from util.db_pool.pool import get_pool_metrics
+
+
+def _run_loop(alias):
+    """Runs the queries of a typical scheduler thread loop on the given database alias and then closes the connection,
+    as a scheduler thread does after each loop when pooling is enabled
+
+    :param alias: The database alias
+    :type alias: string
+    """
+
+    Scheduler.objects.using(alias).filter(id=1).first()
+    list(Node.objects.using(alias).filter(is_active=True).values_list('id', flat=True))
+    list(JobType.objects.using(alias).filter(is_active=True, is_paused=False).values_list('id', flat=True))
+    list(Queue.objects.using(alias).order_by('priority', 'queued').values_list('id', flat=True)[:100])
+    connections[alias].close()
+
+
+def _run_thread(alias, num_loops, interval, durations):
+    """Runs the given number of loops on the given database alias, appending the duration of each loop
+
+    :param alias: The database alias
+    :type alias: string
+    :param num_loops: The number of loops
+    :type num_loops: int
+    :param interval: The number of seconds to sleep between loops
+    :type interval: float
+    :param durations: The list to append the loop durations to
+    :type durations: :func:`list`
+    """
+
+    for _ in range(num_loops):
+        started = time.time()
+        _run_loop(alias)
+        durations.append(time.time() - started)
+        time.sleep(interval)
+
+
+class Command(BaseCommand):
+    """Command that benchmarks the latency of scheduler thread loops against the configured PostGIS database, opening a
+    new connection for each loop versus checking one out of a connection pool
+    """
+
+    help = 'Benchmarks scheduler thread loop latency with and without pooled database connections'
+
+    def add_arguments(self, parser):
+        parser.add_argument('-t', '--threads', action='store', type=int, default=12,
+                            help='Number of concurrent scheduler threads')
+        parser.add_argument('-l', '--loops', action='store', type=int, default=200,
+                            help='Number of loops run by each thread')
+        parser.add_argument('-i', '--interval', action='store', type=float, default=0.01,
+                            help='Seconds each thread sleeps between loops')
+
+    def handle(self, *args, **options):
+        """See :meth:`django.core.management.base.BaseCommand.handle`.
+
+        This method runs the loops without and with pooling and prints the loop latencies and pool metrics.
+        """
+
+        settings_dict = connections['default'].settings_dict
+        engines = [('direct', 'django.contrib.gis.db.backends.postgis'), ('pooled', 'util.db_pool')]
+        for name, engine in engines:
+            alias = 'benchmark_%s' % name
+            connections.databases[alias] = dict(settings_dict, ENGINE=engine)
+            connections.ensure_defaults(alias)
+
+            durations = []
+            threads = [threading.Thread(target=_run_thread,
+                                        args=(alias, options['loops'], options['interval'], durations))
+                       for _ in range(options['threads'])]
+            started = time.time()
+            for thread in threads:
+                thread.start()
+            for thread in threads:
+                thread.join()
+            total = time.time() - started
+
+            durations.sort()
+            print('%-6s %5d loops in %6.2f seconds, latency in ms: mean %7.2f  p50 %7.2f  p95 %7.2f  max %7.2f' %
+                  (name, len(durations), total, sum(durations) * 1000.0 / len(durations),
+                   durations[len(durations) // 2] * 1000.0, durations[int(len(durations) * 0.95)] * 1000.0,
+                   durations[-1] * 1000.0))
+
+        for metrics in get_pool_metrics():
+            print('pool %s: %d connections opened for %d checkouts, %d waits, mean wait %.2f ms, max wait %.2f ms' %
+                  (metrics['name'], metrics['num_connects'], metrics['num_checkouts'], metrics['num_waits'],
+                   metrics['mean_wait'] * 1000.0, metrics['max_wait'] * 1000.0))
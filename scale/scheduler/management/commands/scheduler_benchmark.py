@@ -0,0 +1,83 @@
+"""Defines the command line method for benchmarking the scheduler against simulated clusters"""
+from __future__ import unicode_literals
+from __future__ import print_function
+
+import datetime
+import json
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from scheduler.simulation.scenario import get_reference_scenario, REFERENCE_SCENARIOS
+from scheduler.simulation.simulator import SchedulerSimulator, summarize_cycles
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """Command that runs the scheduler against simulated clusters and reports scheduling cycle measurements
+    """
+
+    help = 'Runs the scheduler against simulated clusters and reports cycle latency, tasks launched and DB queries'
+
+    def add_arguments(self, parser):
+        parser.add_argument('scenarios', nargs='*', metavar='scenario',
+                            help='Reference scenarios to run (%s), defaults to all of them' %
+                                 ', '.join(sorted(REFERENCE_SCENARIOS)))
+        parser.add_argument('-c', '--cycles', action='store', type=int, default=None,
+                            help='Number of scheduling cycles to run, overriding the scenario')
+        parser.add_argument('-i', '--interval', action='store', type=float, default=None,
+                            help='Simulated seconds between scheduling cycles, overriding the scenario')
+        parser.add_argument('-o', '--output', action='store', default=None,
+                            help='File to write the measurements of every cycle to as JSON')
+        parser.add_argument('--show-cycles', action='store_true', default=False,
+                            help='Print the measurements of every cycle')
+
+    def handle(self, *args, **options):
+        """See :meth:`django.core.management.base.BaseCommand.handle`.
+
+        This method runs each scenario in a transaction that is rolled back and prints its measurements.
+        """
+
+        names = options['scenarios'] if options['scenarios'] else sorted(REFERENCE_SCENARIOS)
+        for name in names:
+            if name not in REFERENCE_SCENARIOS:
+                raise CommandError('Unknown scenario %s, choose from %s' %
+                                   (name, ', '.join(sorted(REFERENCE_SCENARIOS))))
+
+        results = {}
+        for name in names:
+            scenario = get_reference_scenario(name)
+            if options['cycles']:
+                scenario.num_cycles = options['cycles']
+            if options['interval']:
+                scenario.cycle_interval = datetime.timedelta(seconds=options['interval'])
+
+            print('Scenario %s: %s, %d cycles every %.1f simulated seconds' %
+                  (scenario.name, scenario.description, scenario.num_cycles, scenario.cycle_interval.total_seconds()))
+            with transaction.atomic():
+                simulator = SchedulerSimulator(scenario)
+                simulator.setup()
+                cycles = simulator.run()
+                transaction.set_rollback(True)
+
+            if options['show_cycles']:
+                for cycle in cycles:
+                    print('  cycle %4d  %8.1f ms  %5d tasks  %5d queries  %6d running  %5d messages' %
+                          (cycle.number, cycle.duration * 1000.0, cycle.num_tasks, cycle.num_queries,
+                           cycle.num_running_tasks, cycle.num_messages))
+            summary = summarize_cycles(cycles)
+            print('  tasks launched:  %d total, %.1f mean, %d max per cycle' %
+                  (summary['total_tasks'], summary['mean_tasks'], summary['max_tasks']))
+            print('  DB queries:      %d total, %.1f mean, %d max per cycle' %
+                  (summary['total_queries'], summary['mean_queries'], summary['max_queries']))
+            print('  cycle latency:   %.1f ms mean, %.1f ms p50, %.1f ms p95, %.1f ms max' %
+                  (summary['mean_duration'] * 1000.0, summary['p50_duration'] * 1000.0,
+                   summary['p95_duration'] * 1000.0, summary['max_duration'] * 1000.0))
+            results[name] = {'summary': summary, 'cycles': [cycle.get_dict() for cycle in cycles]}
+
+        if options['output']:
+            with open(options['output'], 'w') as output_file:
+                json.dump(results, output_file, indent=2, sort_keys=True)
+            logger.info('Wrote cycle measurements to %s', options['output'])
@@ -0,0 +1,19 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('scheduler', '0015_auto_20200812_1929'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='scheduler',
+            name='status_timestamp',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+    ]
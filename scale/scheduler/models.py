@@ -8,6 +8,7 @@ from django.db import models, transaction
 from mesos_api.api import MesosError
 
 from queue.models import Queue, QUEUE_ORDER_FIFO, QUEUE_ORDER_LIFO
+from util.parse import datetime_to_string
 
 logger = logging.getLogger(__name__)
 
@@ -28,6 +29,19 @@ class SchedulerManager(models.Manager):
             logger.exception('Initial database import missing master scheduler: 1')
             raise
 
+    def get_status(self):
+        """Returns the most recent scheduler status JSON with its timestamp set to when the scheduler last reported its
+        status, which may be more recent than when the status content last changed
+
+        :returns: The scheduler status JSON, an empty dict if the scheduler has not yet reported its status
+        :rtype: dict
+        """
+
+        status_dict, status_timestamp = self.filter(pk=1).values_list('status', 'status_timestamp').get()
+        if status_dict and status_timestamp:
+            status_dict['timestamp'] = datetime_to_string(status_timestamp)
+        return status_dict
+
     def initialize_scheduler(self):
         """Initializes the scheduler table by creating a model if one does not already exist
         """
@@ -61,6 +75,23 @@ class SchedulerManager(models.Manager):
 
         self.all().update(**new_data)
 
+    def update_status(self, status_dict, when, is_changed=True):
+        """Records the given scheduler status JSON. If the status content has not changed since it was last recorded,
+        only the status timestamp is updated so that the status JSON is not written again.
+
+        :param status_dict: The scheduler status JSON
+        :type status_dict: dict
+        :param when: When the status was generated
+        :type when: :class:`datetime.datetime`
+        :param is_changed: Whether the status content has changed since it was last recorded
+        :type is_changed: bool
+        """
+
+        if is_changed:
+            self.all().update(status=status_dict, status_timestamp=when)
+        else:
+            self.all().update(status_timestamp=when)
+
 
 class Scheduler(models.Model):
     """Represents a scheduler instance. There should only be a single instance of this and it's used for storing
@@ -70,6 +101,10 @@ class Scheduler(models.Model):
     :type is_paused: :class:`django.db.models.BooleanField()`
     :keyword num_message_handlers: The number of message handlers to have scheduled 
     :type num_message_handlers: :class:`django.db.models.IntegerField`
+    :keyword status: The most recent scheduler status JSON
+    :type status: :class:`django.contrib.postgres.fields.JSONField`
+    :keyword status_timestamp: When the scheduler last reported its status, even if the status content was unchanged
+    :type status_timestamp: :class:`django.db.models.DateTimeField`
     :keyword system_logging_level: The logging level for all scale system components
     :type system_logging_level: :class:`django.db.models.CharField`
     """
@@ -83,6 +118,7 @@ class Scheduler(models.Model):
     num_message_handlers = models.IntegerField(default=1)
     queue_mode = models.CharField(choices=QUEUE_MODES, default=QUEUE_ORDER_FIFO, max_length=50)
     status = django.contrib.postgres.fields.JSONField(default=dict)
+    status_timestamp = models.DateTimeField(blank=True, null=True)
     system_logging_level = models.CharField(max_length=10, default='INFO')
 
     objects = SchedulerManager()
@@ -5,6 +5,8 @@ import datetime
 import logging
 import threading
 
+from django.db.models import Count
+
 from mesos_api.unversioned.agent import get_agent_resources
 from node.resources.node_resources import NodeResources
 from scheduler.resources.agent import AgentResources
@@ -30,6 +32,8 @@ class ResourceManager(object):
 
         self._agent_resources = {}  # {Agent ID: AgentResources}
         self._agent_resources_lock = threading.Lock()  # Protects self._agent_resources
+        self._job_type_resources = {}  # {Job Type ID: (Revision number, NodeResources)}
+        self._job_type_resources_lock = threading.Lock()  # Protects self._job_type_resources
         self._last_watermark_reset = None
         self._new_offers = {}  # {Offer ID: ResourceOffer}
         self._new_offers_lock = threading.Lock()  # Protects self._new_offers
@@ -95,6 +99,7 @@ class ResourceManager(object):
         self._agent_resources = {}
         self._last_watermark_reset = None
         self._new_offers = {}
+        self._job_type_resources = {}
 
     def generate_status_json(self, status_dict):
         """Generates the portion of the status JSON that describes the resources
@@ -241,25 +246,22 @@ class ResourceManager(object):
             for r_name in NodeResources()._resources.keys():
                 cluster_resources[r_name] = getattr(resource_db, r_name)
 
-        # Get all of the jobs that have a status in statuses.
-        jobs = Job.objects.filter(status__in=statuses)
-        jobs = jobs.values('status', 'job_type')
-        job_types = JobType.objects.all()
-
-        for job in jobs.iterator():
-            job_status = job["status"]
-
-            queue_lengths[job_status] += 1
+        # Count the jobs with each status and job type and multiply by the resources required by each job type
+        job_counts = Job.objects.filter(status__in=statuses).order_by().values('status', 'job_type_id')
+        job_counts = list(job_counts.annotate(count=Count('id')))
+        job_type_resources = self._get_job_type_resources({row['job_type_id'] for row in job_counts})
 
-            # Find the job_type information for our current job.
-            job_type = filter(lambda jt: jt.id == job["job_type"], job_types.iterator())
+        for row in job_counts:
+            job_status = row['status']
+            count = row['count']
 
-            if len(job_type) > 0:
-                job_type = job_type[0]
+            queue_lengths[job_status] += count
 
-                for r_name, r_value in job_type.get_resources()._resources.items():
+            if row['job_type_id'] in job_type_resources:
+                for r_name, r_value in job_type_resources[row['job_type_id']]._resources.items():
                     if r_value.value > 0:
-                        total_resources[job_status][r_name] = total_resources[job_status].get(r_name, 0) + r_value.value
+                        total_resources[job_status][r_name] = (total_resources[job_status].get(r_name, 0) +
+                                                               r_value.value * count)
 
         return {
             "cluster_resources": cluster_resources,
@@ -409,4 +411,36 @@ class ResourceManager(object):
             for agent_id in resources:
                 self._agent_resources[agent_id].set_total(resources[agent_id])
 
+    def _get_job_type_resources(self, job_type_ids):
+        """Returns the resources required by each of the given job types. The resources are cached by job type revision
+        so that Seed manifests are only parsed when a job type changes.
+
+        :param job_type_ids: The IDs of the job types
+        :type job_type_ids: set
+        :returns: The resources required by each job type, stored by job type ID
+        :rtype: dict
+        """
+
+        job_type_resources = {}
+        stale_job_type_ids = []
+        revisions = JobType.objects.filter(id__in=job_type_ids).values_list('id', 'revision_num')
+        with self._job_type_resources_lock:
+            for job_type_id, revision_num in revisions:
+                cached = self._job_type_resources.get(job_type_id)
+                if cached and cached[0] == revision_num:
+                    job_type_resources[job_type_id] = cached[1]
+                else:
+                    stale_job_type_ids.append(job_type_id)
+
+        if stale_job_type_ids:
+            new_resources = {}
+            for job_type in JobType.objects.filter(id__in=stale_job_type_ids).iterator():
+                new_resources[job_type.id] = (job_type.revision_num, job_type.get_resources())
+                job_type_resources[job_type.id] = new_resources[job_type.id][1]
+            with self._job_type_resources_lock:
+                self._job_type_resources.update(new_resources)
+
+        return job_type_resources
+
+
 resource_mgr = ResourceManager()
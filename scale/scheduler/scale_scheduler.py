@@ -36,6 +36,7 @@ from scheduler.sync.job_type_manager import job_type_mgr
 from scheduler.sync.workspace_manager import workspace_mgr
 from scheduler.task.manager import task_update_mgr
 from scheduler.tasks.manager import system_task_mgr
+from scheduler.threads.change_feed import ChangeFeedThread
 from scheduler.threads.messaging import MessagingThread
 from scheduler.threads.recon import ReconciliationThread
 from scheduler.threads.schedule import SchedulingThread
@@ -63,6 +64,7 @@ class ScaleScheduler(object):
         self._framework_id = None
         self._master_host_address = None
 
+        self._change_feed_thread = None
         self._messaging_thread = None
         self._recon_thread = None
         self._scheduler_status_thread = None
@@ -139,6 +141,12 @@ class ScaleScheduler(object):
         task_update_thread.start()
         self._threads.append(task_update_thread)
 
+        self._change_feed_thread = ChangeFeedThread(self._scheduling_thread, self._messaging_thread)
+        change_feed_thread = threading.Thread(target=self._change_feed_thread.run)
+        change_feed_thread.daemon = True
+        change_feed_thread.start()
+        self._threads.append(change_feed_thread)
+
     def run(self, client):
         """Launch scheduler with callbacks for Mesos events.
 
@@ -280,6 +288,9 @@ class ScaleScheduler(object):
         logger.debug("Agents registered.")
         resource_mgr.add_new_offers(resource_offers)
         logger.debug("Resource offers added.")
+        if resource_offers and self._scheduling_thread:
+            # Schedule the new offers right away instead of waiting for the next scheduling loop
+            self._scheduling_thread.wake_up()
         Node.objects.update_node_offers(offered_nodes, now())
         logger.debug("Node offer times updated.")
 
@@ -355,6 +366,8 @@ class ScaleScheduler(object):
             if job_exe:
                 model.job_exe_id = job_exe.id
         task_update_mgr.add_task_update(model)
+        if self._task_update_thread:
+            self._task_update_thread.wake_up()
 
         # Update task with latest status
         # This should happen before the job execution or node manager are updated, since they will assume that the task
@@ -378,6 +391,9 @@ class ScaleScheduler(object):
                 task = task_mgr.get_task(task_id)
                 if task:
                     recon_mgr.add_tasks([task])
+            if self._messaging_thread:
+                # Send any messages for the job execution's change right away
+                self._messaging_thread.wake_up()
         else:
             # Not a job task, so must be either a node or system task
             node_mgr.handle_task_update(task_update)
@@ -408,6 +424,7 @@ class ScaleScheduler(object):
         """
 
         logger.info('Scheduler shutdown invoked, stopping background threads')
+        self._change_feed_thread.shutdown()
         self._messaging_thread.shutdown()
         self._recon_thread.shutdown()
         self._scheduler_status_thread.shutdown()
@@ -22,6 +22,7 @@ from queue.job_exe import QueuedJobExecution
 from queue.models import Queue
 from scale import settings as scale_settings
 from scheduler.cleanup.manager import cleanup_mgr
+from scheduler.feed.manager import change_feed_mgr
 from scheduler.manager import scheduler_mgr, SchedulerWarning
 from scheduler.node.manager import node_mgr
 from scheduler.resources.agent import ResourceSet
@@ -44,6 +45,9 @@ LAUNCH_TASK_WARN_THRESHOLD = datetime.timedelta(milliseconds=300)
 # It is considered a resource shortage if a task waits this many generations without being scheduled
 TASK_SHORTAGE_WAIT_COUNT = 10
 
+# While the change feed is connected, an empty queue is only queried again after it changes or after this duration
+EMPTY_QUEUE_RECHECK_INTERVAL = datetime.timedelta(minutes=1)
+
 logger = logging.getLogger(__name__)
 
 
@@ -67,6 +71,8 @@ class SchedulingManager(object):
         """
 
         self._waiting_tasks = {}  # {Task ID: int}
+        self._empty_queue_version = None  # The change feed queue version when the queue was last found to be empty
+        self._empty_queue_checked = None  # When the queue was last found to be empty
 
     def perform_scheduling(self, client, when):
         """Organizes and analyzes the cluster resources, schedules new job executions, and launches tasks
@@ -347,8 +353,18 @@ class SchedulingManager(object):
             return scheduled_job_executions
         
         ignore_job_type_ids = self._calculate_job_types_to_ignore(job_types, job_type_limits)
+
+        # Skip querying the queue if it was empty and the change feed has not reported any changes to it since
+        queue_version = change_feed_mgr.get_queue_version()
+        if self._empty_queue_version == queue_version and change_feed_mgr.is_connected():
+            if started - self._empty_queue_checked < EMPTY_QUEUE_RECHECK_INTERVAL:
+                return scheduled_job_executions
+        self._empty_queue_version = None
+
         max_cluster_resources = resource_mgr.get_max_available_resources()
+        num_queued = 0
         for queue in Queue.objects.get_queue(scheduler_mgr.config.queue_mode, ignore_job_type_ids)[:QUEUE_LIMIT]:
+            num_queued += 1
             job_exe = QueuedJobExecution(queue)
 
             # Canceled job executions get processed as scheduled executions
@@ -446,6 +462,10 @@ class SchedulingManager(object):
                 if job_type_id in job_type_limits:
                     job_type_limits[job_type_id] -= 1
 
+        if not num_queued and not ignore_job_type_ids:
+            self._empty_queue_version = queue_version
+            self._empty_queue_checked = started
+
         duration = now() - started
         if type_warnings:
             for warn in type_warnings:
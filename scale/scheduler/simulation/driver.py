@@ -0,0 +1,77 @@
+"""Defines the fake Mesos client and offers that the scheduler simulation schedules against"""
+from __future__ import unicode_literals
+
+from mesos_api.tasks import RESOURCE_TYPE_SCALAR
+from node.resources.node_resources import NodeResources
+from node.resources.resource import ScalarResource
+
+
+class FakeMesosOffer(object):
+    """This class stands in for a :class:`mesoshttp.offers.Offer` and records whether it was declined"""
+
+    def __init__(self, offer_id, agent_id):
+        """Constructor
+
+        :param offer_id: The ID of the offer
+        :type offer_id: string
+        :param agent_id: The agent ID of the node
+        :type agent_id: string
+        """
+
+        self.offer_id = offer_id
+        self.agent_id = agent_id
+        self.is_declined = False
+
+    def decline(self):
+        """Declines the offer
+        """
+
+        self.is_declined = True
+
+
+class FakeMesosClient(object):
+    """This class stands in for a :class:`mesoshttp.client.MesosClient`, recording the tasks launched by the scheduler
+    instead of sending them to Mesos
+    """
+
+    def __init__(self):
+        """Constructor
+        """
+
+        self.num_accepted_offers = 0
+        self._launched_tasks = []  # [(Task ID, agent ID, NodeResources)]
+
+    def combine_offers(self, offers, tasks):
+        """Accepts the given offers and launches the given Mesos tasks on them
+
+        :param offers: The offers to accept
+        :type offers: :func:`list`
+        :param tasks: The tasks to launch in Mesos TaskInfo JSON format
+        :type tasks: :func:`list`
+        """
+
+        self.num_accepted_offers += len(offers)
+        for task in tasks:
+            resources = NodeResources([ScalarResource(resource['name'], resource['scalar']['value'])
+                                       for resource in task['resources'] if resource['type'] == RESOURCE_TYPE_SCALAR])
+            self._launched_tasks.append((task['task_id']['value'], task['agent_id']['value'], resources))
+
+    def get_driver(self):
+        """Returns the driver, which is this client since the simulation is always connected
+
+        :returns: The driver
+        :rtype: :class:`scheduler.simulation.driver.FakeMesosClient`
+        """
+
+        return self
+
+    def pop_launched_tasks(self):
+        """Returns the tasks launched since this method was last called
+
+        :returns: The list of launched tasks as tuples of task ID, agent ID, and task resources
+        :rtype: :func:`list`
+        """
+
+        launched_tasks = self._launched_tasks
+        self._launched_tasks = []
+        return launched_tasks
@@ -0,0 +1,172 @@
+"""Defines the scenarios that the scheduler simulation runs and the reference scenarios for benchmarking"""
+from __future__ import unicode_literals
+
+import datetime
+
+
+class SimulatedNodeGroup(object):
+    """This class represents a group of identical agents in a simulated cluster"""
+
+    def __init__(self, count, cpus, mem, disk, gpus=0.0):
+        """Constructor
+
+        :param count: The number of agents in the group
+        :type count: int
+        :param cpus: The number of CPUs of each agent
+        :type cpus: float
+        :param mem: The memory of each agent in MiB
+        :type mem: float
+        :param disk: The disk space of each agent in MiB
+        :type disk: float
+        :param gpus: The number of GPUs of each agent
+        :type gpus: float
+        """
+
+        self.count = count
+        self.cpus = cpus
+        self.mem = mem
+        self.disk = disk
+        self.gpus = gpus
+
+
+class SimulatedJobType(object):
+    """This class represents a job type and its queued jobs in a simulated cluster"""
+
+    def __init__(self, name, num_queued, cpus, mem, disk=0.0, gpus=0.0, duration=60, max_scheduled=None):
+        """Constructor
+
+        :param name: The name of the job type
+        :type name: string
+        :param num_queued: The number of jobs of this type on the queue when the simulation starts
+        :type num_queued: int
+        :param cpus: The number of CPUs each job requires
+        :type cpus: float
+        :param mem: The memory each job requires in MiB
+        :type mem: float
+        :param disk: The disk space each job requires in MiB
+        :type disk: float
+        :param gpus: The number of GPUs each job requires
+        :type gpus: float
+        :param duration: The number of simulated seconds that the main task of each job runs
+        :type duration: int
+        :param max_scheduled: The maximum number of jobs of this type that may be scheduled at the same time
+        :type max_scheduled: int
+        """
+
+        self.name = name
+        self.num_queued = num_queued
+        self.cpus = cpus
+        self.mem = mem
+        self.disk = disk
+        self.gpus = gpus
+        self.duration = duration
+        self.max_scheduled = max_scheduled
+
+
+class Scenario(object):
+    """This class represents a simulated cluster and queue that the scheduler is run against"""
+
+    def __init__(self, name, description, node_groups, job_types, num_cycles=120,
+                 cycle_interval=datetime.timedelta(seconds=1)):
+        """Constructor
+
+        :param name: The name of the scenario
+        :type name: string
+        :param description: The description of the scenario
+        :type description: string
+        :param node_groups: The groups of agents in the cluster
+        :type node_groups: :func:`list`
+        :param job_types: The job types with queued jobs
+        :type job_types: :func:`list`
+        :param num_cycles: The number of scheduling cycles to run
+        :type num_cycles: int
+        :param cycle_interval: The simulated time between scheduling cycles
+        :type cycle_interval: :class:`datetime.timedelta`
+        """
+
+        self.name = name
+        self.description = description
+        self.node_groups = node_groups
+        self.job_types = job_types
+        self.num_cycles = num_cycles
+        self.cycle_interval = cycle_interval
+
+    @property
+    def num_nodes(self):
+        """The total number of agents in the cluster
+
+        :returns: The number of agents
+        :rtype: int
+        """
+
+        return sum(group.count for group in self.node_groups)
+
+    @property
+    def num_queued(self):
+        """The total number of jobs on the queue when the simulation starts
+
+        :returns: The number of queued jobs
+        :rtype: int
+        """
+
+        return sum(job_type.num_queued for job_type in self.job_types)
+
+
+def _create_large_cluster():
+    job_types = []
+    for i in range(10):
+        job_types.append(SimulatedJobType('sim-large-%d' % i, 5000, cpus=1.0 + i % 4, mem=1024.0 * (1 + i % 8),
+                                          disk=1024.0, duration=20 + 10 * i))
+    return Scenario('large-cluster', '1,000 nodes with 50,000 queued jobs of 10 job types',
+                    [SimulatedNodeGroup(1000, cpus=16.0, mem=65536.0, disk=512000.0)], job_types)
+
+
+def _create_gpu_heavy():
+    job_types = []
+    for i in range(6):
+        job_types.append(SimulatedJobType('sim-gpu-%d' % i, 2500, cpus=4.0, mem=16384.0, disk=10240.0,
+                                          gpus=1.0 + i % 2, duration=30 + 15 * i))
+    for i in range(4):
+        job_types.append(SimulatedJobType('sim-cpu-%d' % i, 1250, cpus=2.0, mem=4096.0, disk=1024.0,
+                                          duration=20 + 10 * i))
+    return Scenario('gpu-heavy', '200 nodes (150 with 4 GPUs) with 20,000 queued jobs, 75% requiring GPUs',
+                    [SimulatedNodeGroup(150, cpus=32.0, mem=131072.0, disk=512000.0, gpus=4.0),
+                     SimulatedNodeGroup(50, cpus=16.0, mem=65536.0, disk=512000.0)], job_types)
+
+
+def _create_many_job_types():
+    job_types = []
+    for i in range(1000):
+        job_types.append(SimulatedJobType('sim-many-%d' % i, 20, cpus=1.0 + i % 2, mem=512.0 * (1 + i % 4),
+                                          disk=1024.0, duration=10 + i % 10 * 10,
+                                          max_scheduled=5 if i % 5 == 0 else None))
+    return Scenario('many-job-types', '500 nodes with 20,000 queued jobs of 1,000 job types, 200 of them limited',
+                    [SimulatedNodeGroup(500, cpus=16.0, mem=65536.0, disk=512000.0)], job_types)
+
+
+def _create_small():
+    job_types = [SimulatedJobType('sim-small-cpu', 100, cpus=1.0, mem=1024.0, duration=5),
+                 SimulatedJobType('sim-small-gpu', 20, cpus=2.0, mem=2048.0, gpus=1.0, duration=10),
+                 SimulatedJobType('sim-small-limited', 80, cpus=1.0, mem=512.0, duration=5, max_scheduled=2)]
+    return Scenario('small', '10 nodes (2 with GPUs) with 200 queued jobs of 3 job types',
+                    [SimulatedNodeGroup(8, cpus=4.0, mem=16384.0, disk=102400.0),
+                     SimulatedNodeGroup(2, cpus=8.0, mem=32768.0, disk=102400.0, gpus=2.0)], job_types, num_cycles=30)
+
+
+# Factories for the reference scenarios stored by name
+REFERENCE_SCENARIOS = {'large-cluster': _create_large_cluster, 'gpu-heavy': _create_gpu_heavy,
+                       'many-job-types': _create_many_job_types, 'small': _create_small}
+
+
+def get_reference_scenario(name):
+    """Returns a new copy of the reference scenario with the given name
+
+    :param name: The name of the reference scenario
+    :type name: string
+    :returns: The scenario
+    :rtype: :class:`scheduler.simulation.scenario.Scenario`
+
+    :raises KeyError: If there is no reference scenario with the given name
+    """
+
+    return REFERENCE_SCENARIOS[name]()
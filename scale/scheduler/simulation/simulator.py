@@ -0,0 +1,339 @@
+"""Defines the class that runs the scheduler against a simulated cluster"""
+from __future__ import division
+from __future__ import unicode_literals
+
+import datetime
+import heapq
+import logging
+import time
+
+from django.db import connection, reset_queries
+from django.test.utils import CaptureQueriesContext
+from django.utils.timezone import now
+
+from data.data.data import Data
+from job.execution.manager import job_exe_mgr
+from job.execution.tasks.exe_task import JOB_TASK_ID_PREFIX
+from job.models import Job, JobExecution, JobStatusCounter, JobType, JobTypeRevision, TaskUpdate
+from job.seed.manifest import SeedManifest
+from job.tasks.manager import task_mgr
+from job.tasks.update import TaskStatusUpdate
+from node.resources.gpu_manager import GPUManager
+from node.resources.node_resources import NodeResources
+from node.resources.resource import Cpus, Disk, Gpus, Mem
+from queue.models import Queue
+from scheduler.cleanup.manager import cleanup_mgr
+from scheduler.manager import scheduler_mgr
+from scheduler.models import Scheduler
+from scheduler.node.agent import Agent
+from scheduler.node.manager import node_mgr
+from scheduler.resources.manager import resource_mgr
+from scheduler.resources.offer import ResourceOffer
+from scheduler.scheduling.manager import SchedulingManager
+from scheduler.simulation.driver import FakeMesosClient, FakeMesosOffer
+from scheduler.sync.job_type_manager import job_type_mgr
+from scheduler.sync.workspace_manager import workspace_mgr
+from scheduler.tasks.manager import system_task_mgr
+
+
+# The simulated duration of every task other than the main task of a job, such as system, pull, pre and post tasks
+DEFAULT_TASK_DURATION = datetime.timedelta(seconds=1)
+# The framework ID that the simulated scheduler is registered with
+FRAMEWORK_ID = 'scale-simulation'
+# The number of jobs that are created and queued together when populating the queue
+QUEUE_CHUNK_SIZE = 1000
+
+logger = logging.getLogger(__name__)
+
+
+class SchedulingCycle(object):
+    """This class represents the measurements of one simulated scheduling cycle"""
+
+    def __init__(self, number, when, duration, num_tasks, num_queries, num_running_tasks, num_messages):
+        """Constructor
+
+        :param number: The number of the cycle, starting at 1
+        :type number: int
+        :param when: The simulated time of the cycle
+        :type when: :class:`datetime.datetime`
+        :param duration: The wall clock duration of the cycle in seconds
+        :type duration: float
+        :param num_tasks: The number of tasks launched in the cycle
+        :type num_tasks: int
+        :param num_queries: The number of database queries made in the cycle
+        :type num_queries: int
+        :param num_running_tasks: The number of launched tasks that had not finished at the end of the cycle
+        :type num_running_tasks: int
+        :param num_messages: The number of messages created in the cycle for the messaging backend
+        :type num_messages: int
+        """
+
+        self.number = number
+        self.when = when
+        self.duration = duration
+        self.num_tasks = num_tasks
+        self.num_queries = num_queries
+        self.num_running_tasks = num_running_tasks
+        self.num_messages = num_messages
+
+    def get_dict(self):
+        """Returns the measurements of this cycle as a JSON-serializable dict
+
+        :returns: The measurements
+        :rtype: dict
+        """
+
+        return {'cycle': self.number, 'when': self.when.isoformat(), 'duration': self.duration,
+                'num_tasks': self.num_tasks, 'num_queries': self.num_queries,
+                'num_running_tasks': self.num_running_tasks, 'num_messages': self.num_messages}
+
+
+class SchedulerSimulator(object):
+    """This class drives :meth:`scheduler.scheduling.manager.SchedulingManager.perform_scheduling` and the node, job
+    execution and resource managers against a simulated cluster. Each cycle, every agent offers the resources not used
+    by its launched tasks, the scheduler runs once against a fake Mesos client, and the launched tasks report that they
+    are running and, after their simulated duration, that they finished. Time advances on a virtual clock by the
+    scenario's cycle interval, so the tasks launched in each cycle are the same on every run.
+
+    The simulation writes to the database, so the caller should run it in an atomic transaction that is rolled back.
+    Offers are marked with the wall clock time they were received, as a few scheduler internals compare them with
+    :func:`django.utils.timezone.now` rather than the virtual clock. Messages that would be sent to the messaging
+    backend are counted and discarded. This class is NOT thread-safe.
+    """
+
+    def __init__(self, scenario):
+        """Constructor
+
+        :param scenario: The scenario to simulate
+        :type scenario: :class:`scheduler.simulation.scenario.Scenario`
+        """
+
+        self.scenario = scenario
+        self.cycles = []
+
+        self._client = FakeMesosClient()
+        self._scheduling_mgr = SchedulingManager()
+        self._agent_resources = {}  # {Agent ID: NodeResources}
+        self._used_resources = {}  # {Agent ID: NodeResources}
+        self._task_resources = {}  # {Task ID: (Agent ID, NodeResources)}
+        self._job_type_durations = {}  # {Job type ID: datetime.timedelta}
+        self._task_updates = []  # Heap of (when, sequence, task ID, agent ID, Mesos task status)
+        self._sequence = 0
+        self._when = None
+
+    def run(self):
+        """Runs the scheduling cycles of the scenario
+
+        :returns: The list of measured cycles
+        :rtype: [:class:`scheduler.simulation.simulator.SchedulingCycle`]
+        """
+
+        for _ in range(self.scenario.num_cycles):
+            self.run_cycle()
+        return self.cycles
+
+    def run_cycle(self):
+        """Runs a single scheduling cycle and advances the virtual clock
+
+        :returns: The measured cycle
+        :rtype: :class:`scheduler.simulation.simulator.SchedulingCycle`
+        """
+
+        when = self._when
+        self._deliver_task_updates(when)
+        self._add_offers()
+
+        # The query log holds a limited number of queries, so it is cleared for each cycle to keep the count accurate
+        reset_queries()
+        with CaptureQueriesContext(connection) as queries:
+            started = time.time()
+            num_tasks = self._scheduling_mgr.perform_scheduling(self._client, when)
+            duration = time.time() - started
+
+        for task_id, agent_id, resources in self._client.pop_launched_tasks():
+            self._launch_task(task_id, agent_id, resources, when)
+        num_messages = len(job_exe_mgr.get_messages())
+
+        cycle = SchedulingCycle(len(self.cycles) + 1, when, duration, num_tasks, len(queries),
+                                len(self._task_resources), num_messages)
+        self.cycles.append(cycle)
+        self._when = when + self.scenario.cycle_interval
+        return cycle
+
+    def setup(self, when=None):
+        """Creates the scenario's job types, queued jobs and nodes and resets the scheduler managers
+
+        :param when: The virtual time that the simulation starts, defaults to the current time
+        :type when: :class:`datetime.datetime`
+        """
+
+        self._when = when if when else now()
+        logger.info('Setting up scenario %s with %d nodes and %d queued jobs', self.scenario.name,
+                    self.scenario.num_nodes, self.scenario.num_queued)
+
+        Scheduler.objects.initialize_scheduler()
+        Scheduler.objects.update(num_message_handlers=0)  # Message handlers are not part of the simulated cluster
+        scheduler_mgr.sync_with_database()
+        scheduler_mgr.update_from_mesos(framework_id=FRAMEWORK_ID)
+        resource_mgr.clear()
+        job_exe_mgr.clear()
+        node_mgr.clear()
+        GPUManager.reset_gpu_dict()
+
+        for simulated_job_type in self.scenario.job_types:
+            self._create_queued_jobs(simulated_job_type)
+        job_type_mgr.sync_with_database()
+        workspace_mgr.sync_with_database()
+
+        agents = []
+        for group_num, group in enumerate(self.scenario.node_groups):
+            for i in range(group.count):
+                agent = Agent('sim-agent-%d-%d' % (group_num, i), 'sim-host-%d-%d' % (group_num, i))
+                agents.append(agent)
+                self._agent_resources[agent.agent_id] = NodeResources([Cpus(group.cpus), Mem(group.mem),
+                                                                       Disk(group.disk), Gpus(group.gpus)])
+                self._used_resources[agent.agent_id] = NodeResources()
+        node_mgr.register_agents(agents)
+        node_mgr.sync_with_database(scheduler_mgr.config)
+        cleanup_mgr.update_nodes(node_mgr.get_nodes())
+
+    def _add_offers(self):
+        """Offers the resources of each agent that are not used by its launched tasks
+        """
+
+        offers = []
+        for agent_id in sorted(self._agent_resources):
+            resources = self._agent_resources[agent_id].copy()
+            resources.subtract(self._used_resources[agent_id])
+            if resources.cpus <= 0.0 or resources.mem <= 0.0:
+                continue
+            self._sequence += 1
+            offer_id = 'sim-offer-%d' % self._sequence
+            offers.append(ResourceOffer(offer_id, agent_id, FRAMEWORK_ID, resources, now(),
+                                        FakeMesosOffer(offer_id, agent_id)))
+        resource_mgr.add_new_offers(offers)
+
+    def _create_queued_jobs(self, simulated_job_type):
+        """Creates the given job type and puts its jobs on the queue
+
+        :param simulated_job_type: The simulated job type
+        :type simulated_job_type: :class:`scheduler.simulation.scenario.SimulatedJobType`
+        """
+
+        scalar = [{'name': 'cpus', 'value': simulated_job_type.cpus}, {'name': 'mem', 'value': simulated_job_type.mem}]
+        if simulated_job_type.disk:
+            scalar.append({'name': 'disk', 'value': simulated_job_type.disk})
+        if simulated_job_type.gpus:
+            scalar.append({'name': 'gpus', 'value': simulated_job_type.gpus})
+        manifest = {'seedVersion': '1.0.0',
+                    'job': {'name': simulated_job_type.name, 'jobVersion': '1.0.0', 'packageVersion': '1.0.0',
+                            'title': 'Simulated Job', 'description': 'A job type for scheduler simulation',
+                            'maintainer': {'name': 'Scale', 'email': 'scale@example.com'},
+                            'timeout': 3600, 'interface': {'command': 'true'}, 'resources': {'scalar': scalar}}}
+        docker_image = '%s-1.0.0-seed:1.0.0' % simulated_job_type.name
+        job_type = JobType.objects.create_job_type_v6(docker_image, SeedManifest(manifest),
+                                                      max_scheduled=simulated_job_type.max_scheduled)
+        self._job_type_durations[job_type.id] = datetime.timedelta(seconds=simulated_job_type.duration)
+        job_type_rev = JobTypeRevision.objects.get_revision(job_type.name, job_type.version, job_type.revision_num)
+
+        num_created = 0
+        while num_created < simulated_job_type.num_queued:
+            count = min(QUEUE_CHUNK_SIZE, simulated_job_type.num_queued - num_created)
+            jobs = []
+            for _ in range(count):
+                job = Job.objects.create_job_v6(job_type_rev, input_data=Data())
+                job.last_status_change = self._when
+                jobs.append(job)
+            Job.objects.bulk_create(jobs)
+            JobStatusCounter.objects.update_for_new_jobs(jobs)
+            Queue.objects.queue_jobs(jobs)
+            num_created += count
+
+    def _deliver_task_updates(self, when):
+        """Delivers the task status updates that are due at the given time, the same way the scheduler handles Mesos
+        status updates
+
+        :param when: The current virtual time
+        :type when: :class:`datetime.datetime`
+        """
+
+        while self._task_updates and self._task_updates[0][0] <= when:
+            update_time, _, task_id, agent_id, status = heapq.heappop(self._task_updates)
+            model = TaskUpdate()
+            model.task_id = task_id
+            model.status = status
+            model.timestamp = update_time
+            task_update = TaskStatusUpdate(model, agent_id, {})
+
+            task_mgr.handle_task_update(task_update)
+            if task_id.startswith(JOB_TASK_ID_PREFIX):
+                job_exe = job_exe_mgr.handle_task_update(task_update)
+                if job_exe and job_exe.is_finished():
+                    cleanup_mgr.add_job_execution(job_exe)
+                    GPUManager.release_gpus(job_exe.node_id, job_exe.job_id)
+            else:
+                node_mgr.handle_task_update(task_update)
+                system_task_mgr.handle_task_update(task_update)
+
+            if task_update.status in TaskStatusUpdate.TERMINAL_STATUSES and task_id in self._task_resources:
+                task_agent_id, resources = self._task_resources.pop(task_id)
+                self._used_resources[task_agent_id].subtract(resources)
+
+    def _get_task_duration(self, task_id):
+        """Returns the simulated duration of the given launched task
+
+        :param task_id: The task ID
+        :type task_id: string
+        :returns: The duration of the task
+        :rtype: :class:`datetime.timedelta`
+        """
+
+        task = task_mgr.get_task(task_id)
+        if task_id.startswith(JOB_TASK_ID_PREFIX) and task and task.task_type == 'main':
+            job_exe = job_exe_mgr.get_running_job_exe(JobExecution.parse_cluster_id(task_id))
+            if job_exe and job_exe.job_type_id in self._job_type_durations:
+                return self._job_type_durations[job_exe.job_type_id]
+        return DEFAULT_TASK_DURATION
+
+    def _launch_task(self, task_id, agent_id, resources, when):
+        """Tracks the resources of a task launched on the fake Mesos client and schedules its status updates
+
+        :param task_id: The task ID
+        :type task_id: string
+        :param agent_id: The agent ID that the task was launched on
+        :type agent_id: string
+        :param resources: The resources of the task
+        :type resources: :class:`node.resources.node_resources.NodeResources`
+        :param when: The virtual time that the task was launched
+        :type when: :class:`datetime.datetime`
+        """
+
+        self._task_resources[task_id] = (agent_id, resources)
+        self._used_resources[agent_id].add(resources)
+        finished = when + self._get_task_duration(task_id)
+        for update_time, status in [(when, 'TASK_RUNNING'), (finished, 'TASK_FINISHED')]:
+            self._sequence += 1
+            heapq.heappush(self._task_updates, (update_time, self._sequence, task_id, agent_id, status))
+
+
+def summarize_cycles(cycles):
+    """Returns the summary statistics of the given measured cycles
+
+    :param cycles: The measured cycles
+    :type cycles: [:class:`scheduler.simulation.simulator.SchedulingCycle`]
+    :returns: The summary statistics
+    :rtype: dict
+    """
+
+    durations = sorted(cycle.duration for cycle in cycles)
+    num_tasks = [cycle.num_tasks for cycle in cycles]
+    num_queries = [cycle.num_queries for cycle in cycles]
+    count = len(cycles)
+    return {'num_cycles': count, 'total_tasks': sum(num_tasks), 'max_tasks': max(num_tasks) if count else 0,
+            'mean_tasks': sum(num_tasks) / count if count else 0.0,
+            'total_queries': sum(num_queries), 'max_queries': max(num_queries) if count else 0,
+            'mean_queries': sum(num_queries) / count if count else 0.0,
+            'mean_duration': sum(durations) / count if count else 0.0,
+            'p50_duration': durations[int(0.50 * (count - 1))] if count else 0.0,
+            'p95_duration': durations[int(0.95 * (count - 1))] if count else 0.0,
+            'max_duration': durations[-1] if count else 0.0}
@@ -1,12 +1,21 @@
 """Defines the class that manages the syncing of the scheduler with the job type models"""
 from __future__ import unicode_literals
 
+import datetime
 import logging
 import threading
+from collections import namedtuple
 
 from job.models import JobType
 from job.seed.exceptions import InvalidSeedMetadataDefinition
 
+# Each sync re-reads job types modified this long before the previous high-water mark, to catch job types saved by
+# transactions that committed after the previous sync
+SYNC_OVERLAP = datetime.timedelta(minutes=1)
+
+# The data derived from a job type's Seed manifest, which is expensive to parse
+JobTypeData = namedtuple('JobTypeData', ['revision_num', 'manifest', 'title', 'description', 'resources'])
+
 # TODO: when we calculate duration averages for job types, create a new job type class that contains model, resources,
 # stats, etc
 logger = logging.getLogger(__name__)
@@ -18,8 +27,10 @@ class JobTypeManager(object):
         """Constructor
         """
 
+        self._job_type_data = {}  # {Job Type ID: JobTypeData}, only accessed by the syncing thread
         self._job_type_resources = []
         self._job_types = {}  # {Job Type ID: Job Type}
+        self._last_modified = None  # The high-water mark of job type modification times that have been synced
         self._lock = threading.Lock()
 
     def generate_status_json(self, status_dict):
@@ -73,24 +84,78 @@ class JobTypeManager(object):
             return dict(self._job_types)
 
     def sync_with_database(self):
-        """Syncs with the database to retrieve updated job type models
+        """Syncs with the database to retrieve updated job type models. Only the job types modified since the previous
+        sync are retrieved, and the data derived from each job type's Seed manifest is cached by revision so that it is
+        only parsed when the manifest changes.
         """
 
-        update_job_type_resources = []
-        updated_job_types = {}
-        for job_type in JobType.objects.all().iterator():
-            try:
-                job_type.title = job_type.get_title()
-                job_type.description = job_type.get_description()
-                updated_job_types[job_type.id] = job_type
-                update_job_type_resources.append(job_type.get_resources())
-            except InvalidSeedMetadataDefinition as ex:
-                logger.exception('Invalid Seed manifest for job type %s-%s, id=%d' % (job_type.name, job_type.version, job_type.id))
-                pass
+        modified_qry = JobType.objects.all()
+        if self._last_modified:
+            modified_qry = modified_qry.filter(last_modified__gte=self._last_modified - SYNC_OVERLAP)
+        modified_job_types = list(modified_qry.iterator())
 
+        # Retrieve the current IDs after the modified job types so that deleted job types are always detected
+        job_type_ids = set(JobType.objects.values_list('id', flat=True))
+
+        with self._lock:
+            job_types = dict(self._job_types)
+        is_changed = False
+
+        for job_type in modified_job_types:
+            if self._last_modified is None or job_type.last_modified > self._last_modified:
+                self._last_modified = job_type.last_modified
+            if job_type.id not in job_type_ids:
+                continue
+            job_type_data = self._get_job_type_data(job_type)
+            if job_type_data:
+                job_type.title = job_type_data.title
+                job_type.description = job_type_data.description
+                job_types[job_type.id] = job_type
+            else:
+                job_types.pop(job_type.id, None)
+            is_changed = True
+
+        for job_type_id in list(job_types.keys()):
+            if job_type_id not in job_type_ids:
+                del job_types[job_type_id]
+                is_changed = True
+        for job_type_id in list(self._job_type_data.keys()):
+            if job_type_id not in job_type_ids:
+                del self._job_type_data[job_type_id]
+
+        if not is_changed:
+            return
+
+        job_type_resources = [self._job_type_data[job_type_id].resources for job_type_id in job_types]
         with self._lock:
-            self._job_type_resources = update_job_type_resources
-            self._job_types = updated_job_types
+            self._job_type_resources = job_type_resources
+            self._job_types = job_types
+
+    def _get_job_type_data(self, job_type):
+        """Returns the data derived from the given job type's Seed manifest, parsing the manifest only if it has changed
+        since the cached data was derived
+
+        :param job_type: The job type model
+        :type job_type: :class:`job.models.JobType`
+        :returns: The derived data, None if the manifest is invalid
+        :rtype: :class:`scheduler.sync.job_type_manager.JobTypeData`
+        """
+
+        job_type_data = self._job_type_data.get(job_type.id)
+        if job_type_data and job_type_data.revision_num == job_type.revision_num:
+            if job_type_data.manifest == job_type.manifest:
+                return job_type_data if job_type_data.resources is not None else None
+
+        try:
+            job_type_data = JobTypeData(job_type.revision_num, job_type.manifest, job_type.get_title(),
+                                        job_type.get_description(), job_type.get_resources())
+        except InvalidSeedMetadataDefinition:
+            logger.exception('Invalid Seed manifest for job type %s-%s, id=%d' % (job_type.name, job_type.version, job_type.id))
+            # Cache the invalid revision so that it is not parsed and logged again
+            job_type_data = JobTypeData(job_type.revision_num, job_type.manifest, None, None, None)
+        self._job_type_data[job_type.id] = job_type_data
+
+        return job_type_data if job_type_data.resources is not None else None
 
 
 job_type_mgr = JobTypeManager()
@@ -125,5 +125,13 @@ class SystemTaskManager(object):
                 for service in self._services:
                     service.handle_task_update(task_update)
 
+    def sync_with_backend(self):
+        """Syncs the system services with their backends. The services do not change, so this happens outside of the
+        lock to keep any network I/O from blocking scheduling.
+        """
+
+        for service in self._services:
+            service.sync_with_backend()
+
 
 system_task_mgr = SystemTaskManager()
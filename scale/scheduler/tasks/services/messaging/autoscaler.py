@@ -0,0 +1,197 @@
+"""Defines the class that scales the number of message handlers with the depth of the message queue"""
+from __future__ import division
+from __future__ import unicode_literals
+
+import datetime
+import logging
+import math
+import threading
+
+from messaging.manager import CommandMessageManager
+
+
+# How often the depth of the message queue is sampled
+SAMPLE_INTERVAL = datetime.timedelta(seconds=30)
+# The desired amount of time to clear the message backlog
+TARGET_DRAIN_TIME = datetime.timedelta(minutes=5)
+# How long the backlog must need fewer handlers before the number of handlers is lowered
+SCALE_DOWN_DELAY = datetime.timedelta(minutes=5)
+# The weight of the newest drain rate sample in the smoothed drain rate
+SMOOTHING_FACTOR = 0.3
+
+logger = logging.getLogger(__name__)
+
+
+class MessageHandlerAutoscaler(object):
+    """This class determines the desired number of message handlers from the depth of the message queue. The queue depth
+    is sampled periodically to track a smoothed rate at which each handler drains the queue, and the desired number of
+    handlers is the number needed to clear the backlog within the target drain time. The number of handlers is raised
+    as soon as more are needed, but only lowered once fewer have been needed for the scale down delay. The queue depth
+    is sampled by one thread (so that its network I/O stays out of the scheduling locks) and the desired number of
+    handlers is read by another. Each of the two methods should only be called by a single thread at a time.
+    """
+
+    def __init__(self, backend=None):
+        """Constructor
+
+        :param backend: The object providing get_queue_size() for the message queue, defaults to the command message
+            manager
+        :type backend: :class:`messaging.manager.CommandMessageManager`
+        """
+
+        self._backend = backend
+        self._desired_count = None
+        self._drain_rate = None  # Smoothed number of messages drained per second per handler
+        self._last_depth = None
+        self._last_num_handlers = 0
+        self._last_sample = None
+        self._lock = threading.Lock()
+        self._next_sample = None
+        self._sample = None  # The newest queue depth sample not yet used, as a tuple of depth and sample time
+        self._scale_down_count = None  # The most handlers needed since scale down was first needed
+        self._scale_down_started = None
+
+    @property
+    def drain_rate(self):
+        """The smoothed number of messages drained per second by each handler, None if not known yet
+
+        :returns: The drain rate
+        :rtype: float
+        """
+
+        return self._drain_rate
+
+    def get_desired_count(self, num_handlers, min_count, max_count):
+        """Returns the desired number of message handlers, updated with the newest queue depth sample. This method does
+        not do any I/O.
+
+        :param num_handlers: The current number of message handlers
+        :type num_handlers: int
+        :param min_count: The minimum number of message handlers
+        :type min_count: int
+        :param max_count: The maximum number of message handlers
+        :type max_count: int
+        :returns: The desired number of message handlers
+        :rtype: int
+        """
+
+        min_count = min(min_count, max_count)
+        with self._lock:
+            sample = self._sample
+            self._sample = None
+        if sample:
+            depth, when = sample
+            self._update(depth, num_handlers, min_count, max_count, when)
+
+        if self._desired_count is None:
+            return max_count
+        return min(max(self._desired_count, min_count), max_count)
+
+    def sample_queue_depth(self, when):
+        """Retrieves the depth of the message queue from the backend if the sample interval has passed and stores it for
+        the next call to :meth:`get_desired_count`
+
+        :param when: The current time
+        :type when: :class:`datetime.datetime`
+        :returns: Whether the queue depth was sampled
+        :rtype: bool
+        """
+
+        if self._next_sample is not None and when < self._next_sample:
+            return False
+        self._next_sample = when + SAMPLE_INTERVAL
+
+        try:
+            depth = self._get_backend().get_queue_size()
+        except Exception:
+            logger.exception('Unable to retrieve the message queue depth')
+            return False
+
+        with self._lock:
+            self._sample = (depth, when)
+        return True
+
+    def _get_backend(self):
+        """Returns the backend providing the queue depth, creating the command message manager if needed
+
+        :returns: The backend
+        :rtype: :class:`messaging.manager.CommandMessageManager`
+        """
+
+        if self._backend is None:
+            self._backend = CommandMessageManager()
+        return self._backend
+
+    def _get_needed_count(self, depth, num_handlers, min_count, max_count):
+        """Returns the number of message handlers needed to clear the given backlog within the target drain time
+
+        :param depth: The depth of the message queue
+        :type depth: int
+        :param num_handlers: The current number of message handlers
+        :type num_handlers: int
+        :param min_count: The minimum number of message handlers
+        :type min_count: int
+        :param max_count: The maximum number of message handlers
+        :type max_count: int
+        :returns: The needed number of message handlers
+        :rtype: int
+        """
+
+        if depth == 0:
+            needed = min_count
+        elif self._drain_rate is None:
+            # Drain rate is not known yet, so keep the current handlers until it can be measured
+            needed = max(num_handlers, 1)
+        elif self._drain_rate == 0.0:
+            # The backlog is not draining
+            needed = max_count
+        else:
+            needed = int(math.ceil(depth / (self._drain_rate * TARGET_DRAIN_TIME.total_seconds())))
+        return min(max(needed, min_count), max_count)
+
+    def _update(self, depth, num_handlers, min_count, max_count, when):
+        """Updates the drain rate and desired number of message handlers with a new queue depth sample
+
+        :param depth: The depth of the message queue
+        :type depth: int
+        :param num_handlers: The current number of message handlers
+        :type num_handlers: int
+        :param min_count: The minimum number of message handlers
+        :type min_count: int
+        :param max_count: The maximum number of message handlers
+        :type max_count: int
+        :param when: The current time
+        :type when: :class:`datetime.datetime`
+        """
+
+        if self._last_depth and self._last_num_handlers:
+            elapsed = (when - self._last_sample).total_seconds()
+            if elapsed > 0:
+                # New messages also arrive while the handlers drain the queue, so the measured rate is a lower bound
+                rate = max(self._last_depth - depth, 0) / elapsed / self._last_num_handlers
+                if self._drain_rate is None:
+                    self._drain_rate = rate
+                else:
+                    self._drain_rate = SMOOTHING_FACTOR * rate + (1.0 - SMOOTHING_FACTOR) * self._drain_rate
+        self._last_depth = depth
+        self._last_num_handlers = num_handlers
+        self._last_sample = when
+
+        needed = self._get_needed_count(depth, num_handlers, min_count, max_count)
+        if self._desired_count is None or needed >= self._desired_count:
+            if self._desired_count is not None and needed > self._desired_count:
+                logger.info('Message queue depth is %d, scaling message handlers up to %d', depth, needed)
+            self._desired_count = needed
+            self._scale_down_count = None
+            self._scale_down_started = None
+        elif self._scale_down_started is None:
+            self._scale_down_count = needed
+            self._scale_down_started = when
+        else:
+            self._scale_down_count = max(self._scale_down_count, needed)
+            if when - self._scale_down_started >= SCALE_DOWN_DELAY:
+                logger.info('Message queue depth is %d, scaling message handlers down to %d', depth,
+                            self._scale_down_count)
+                self._desired_count = self._scale_down_count
+                self._scale_down_count = None
+                self._scale_down_started = None
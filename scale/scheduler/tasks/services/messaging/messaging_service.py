@@ -3,7 +3,11 @@ from __future__ import unicode_literals
 
 import logging
 
+from django.conf import settings
+from django.utils.timezone import now
+
 from scheduler.manager import scheduler_mgr
+from scheduler.tasks.services.messaging.autoscaler import MessageHandlerAutoscaler
 from scheduler.tasks.services.messaging.message_handler_task import MessageHandlerTask
 from scheduler.tasks.services.service import Service
 
@@ -22,11 +26,29 @@ class MessagingService(Service):
         self._name = 'messaging'
         self._title = 'Messaging'
         self._description = 'Processes the backend messaging system'
+        self._autoscaler = MessageHandlerAutoscaler()
 
     def get_desired_task_count(self):
-        """See :meth:`scheduler.tasks.services.service.Service.get_desired_task_count`"""
+        """See :meth:`scheduler.tasks.services.service.Service.get_desired_task_count`
+
+        When autoscaling is enabled, the configured number of message handlers is the maximum and the desired number
+        is scaled with the most recently sampled depth of the message queue.
+        """
+
+        if not settings.MESSAGE_HANDLER_AUTOSCALE:
+            return scheduler_mgr.config.num_message_handlers
+
+        return self._autoscaler.get_desired_count(self.get_actual_task_count(), settings.MIN_MESSAGE_HANDLERS,
+                                                  scheduler_mgr.config.num_message_handlers)
+
+    def sync_with_backend(self):
+        """See :meth:`scheduler.tasks.services.service.Service.sync_with_backend`
+
+        When autoscaling is enabled, this samples the depth of the message queue for the autoscaler.
+        """
 
-        return scheduler_mgr.config.num_message_handlers
+        if settings.MESSAGE_HANDLER_AUTOSCALE:
+            self._autoscaler.sample_queue_depth(now())
 
     def _create_service_task(self):
         """See :meth:`scheduler.tasks.services.service.Service._create_service_task`"""
@@ -117,6 +117,13 @@ class Service(object):
         if task.has_ended:
             del self._tasks[task.id]
 
+    def sync_with_backend(self):
+        """Syncs this service with any backend that it depends on. This is called by the synchronization thread, outside
+        of the system task lock, so that any network I/O does not block scheduling. By default there is nothing to sync.
+        """
+
+        pass
+
     @abstractmethod
     def _create_service_task(self):
         """Creates a new service task
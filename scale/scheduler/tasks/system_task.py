@@ -43,12 +43,17 @@ class SystemTask(Task):
         """Adds the necessary Docker parameters to this task to provide the Scale database connection settings
         """
 
-        db_params = [DockerParameter('env', 'DATABASE_URL=%s' % settings.DATABASE_URL)]
+        db_params = [DockerParameter('env', 'DATABASE_URL=%s' % settings.DATABASE_URL),
+                     DockerParameter('env', 'DATABASE_POOL=%s' % settings.DATABASE_POOL),
+                     DockerParameter('env', 'DATABASE_POOL_MAX_SIZE=%d' % settings.DATABASE_POOL_MAX_SIZE),
+                     DockerParameter('env', 'DATABASE_POOL_TIMEOUT=%d' % settings.DATABASE_POOL_TIMEOUT),
+                     DockerParameter('env', 'DATABASE_POOL_HEALTH_CHECK=%d' % settings.DATABASE_POOL_HEALTH_CHECK)]
 
         self._docker_params.extend(db_params)
 
     def _add_messaging_docker_params(self):
-        """Adds the necessary Docker parameters to this task to provide the backend messaging connection settings
+        """Adds the necessary Docker parameters to this task to provide the backend messaging connection settings and
+        the settings for processing messages
         """
 
         broker_url = settings.BROKER_URL
@@ -59,5 +64,10 @@ class SystemTask(Task):
             messaging_params.append(DockerParameter('env', 'SCALE_BROKER_URL=%s' % broker_url))
         if queue_name:
             messaging_params.append(DockerParameter('env', 'SCALE_QUEUE_NAME=%s' % queue_name))
+        messaging_params.append(DockerParameter('env', 'MESSAGE_PROFILING=%s' % settings.MESSAGE_PROFILING))
+        messaging_params.append(DockerParameter('env', 'MESSAGE_PROFILE_TRACES=%d' % settings.MESSAGE_PROFILE_TRACES))
+        messaging_params.append(DockerParameter('env', 'PURGE_CHUNK_SIZE=%d' % settings.PURGE_CHUNK_SIZE))
+        messaging_params.append(DockerParameter('env', 'PURGE_MAX_CHUNKS_PER_MESSAGE=%d' %
+                                                settings.PURGE_MAX_CHUNKS_PER_MESSAGE))
 
         self._docker_params.extend(messaging_params)
@@ -5,6 +5,7 @@ from django.test import TestCase
 from django.utils.timezone import now
 from mock import patch, Mock
 
+import job.test.utils as job_test_utils
 from node.resources.node_resources import NodeResources
 from node.resources.resource import Cpus, Mem, Disk
 from scheduler.resources.manager import resource_mgr
@@ -50,3 +51,25 @@ class TestResourceManager(TestCase):
         host = host_address_from_mesos_url('http://leader.mesos:80/mesos')
         resource_mgr.sync_with_mesos(host)
         self.assertEqual(resource_mgr._mesos_error, 'Missing key u\'id\' in mesos response')
+
+    def test_get_queued_resources(self):
+        """Tests getting queued resource information, where job type resources are only parsed once"""
+
+        job_type = job_test_utils.create_seed_job_type()
+        job_test_utils.create_job(job_type=job_type, status='QUEUED')
+        job_test_utils.create_job(job_type=job_type, status='QUEUED')
+        job_test_utils.create_job(job_type=job_type, status='RUNNING')
+        resources = job_type.get_resources()
+        cpus = resources.cpus
+        mem = resources.mem
+
+        queued_resources = resource_mgr.get_queued_resources()
+        self.assertDictEqual(queued_resources['queue_lengths'], {'PENDING': 0, 'QUEUED': 2, 'RUNNING': 1})
+        self.assertEqual(queued_resources['total_resources']['QUEUED']['cpus'], cpus * 2)
+        self.assertEqual(queued_resources['total_resources']['QUEUED']['mem'], mem * 2)
+        self.assertEqual(queued_resources['total_resources']['RUNNING']['cpus'], cpus)
+
+        with patch('job.models.JobType.get_resources') as mock_get_resources:
+            queued_resources = resource_mgr.get_queued_resources()
+            self.assertFalse(mock_get_resources.called)
+        self.assertEqual(queued_resources['total_resources']['QUEUED']['cpus'], cpus * 2)
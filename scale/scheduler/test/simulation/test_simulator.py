@@ -0,0 +1,80 @@
+from __future__ import unicode_literals
+
+import django
+from django.test import TestCase
+
+from error.models import reset_error_cache
+from job.models import JobExecution
+from queue.models import Queue
+from scheduler.simulation.driver import FakeMesosClient
+from scheduler.simulation.scenario import get_reference_scenario, REFERENCE_SCENARIOS, Scenario, SimulatedJobType, \
+    SimulatedNodeGroup
+from scheduler.simulation.simulator import SchedulerSimulator, summarize_cycles
+
+
+class TestFakeMesosClient(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+    def test_combine_offers(self):
+        """Tests that launched tasks are recorded with their scalar resources"""
+
+        client = FakeMesosClient()
+        task = {'task_id': {'value': 'task_1'}, 'agent_id': {'value': 'agent_1'},
+                'resources': [{'name': 'cpus', 'type': 'SCALAR', 'scalar': {'value': 2.0}},
+                              {'name': 'mem', 'type': 'SCALAR', 'scalar': {'value': 512.0}}]}
+        client.combine_offers(['offer_1', 'offer_2'], [task])
+
+        self.assertEqual(client.num_accepted_offers, 2)
+        launched_tasks = client.pop_launched_tasks()
+        self.assertEqual(len(launched_tasks), 1)
+        task_id, agent_id, resources = launched_tasks[0]
+        self.assertEqual(task_id, 'task_1')
+        self.assertEqual(agent_id, 'agent_1')
+        self.assertEqual(resources.cpus, 2.0)
+        self.assertEqual(resources.mem, 512.0)
+        self.assertListEqual(client.pop_launched_tasks(), [])
+
+
+class TestSchedulerSimulator(TestCase):
+
+    fixtures = ['basic_job_errors.json']
+
+    def setUp(self):
+        django.setup()
+
+        reset_error_cache()
+
+    def test_run(self):
+        """Tests running a small scenario until every queued job is scheduled"""
+
+        scenario = Scenario('test', 'Test scenario', [SimulatedNodeGroup(2, cpus=4.0, mem=4096.0, disk=10240.0)],
+                            [SimulatedJobType('sim-test', 3, cpus=1.0, mem=512.0, duration=2)], num_cycles=30)
+        simulator = SchedulerSimulator(scenario)
+        simulator.setup()
+        self.assertEqual(Queue.objects.count(), 3)
+
+        cycles = simulator.run()
+
+        self.assertEqual(len(cycles), 30)
+        self.assertListEqual([cycle.number for cycle in cycles], range(1, 31))
+        self.assertEqual(cycles[1].when - cycles[0].when, scenario.cycle_interval)
+        self.assertEqual(Queue.objects.count(), 0)
+        self.assertEqual(JobExecution.objects.filter(job__job_type__name='sim-test').count(), 3)
+        summary = summarize_cycles(cycles)
+        self.assertEqual(summary['num_cycles'], 30)
+        # The system tasks and at least one task for each job execution were launched
+        self.assertGreater(summary['total_tasks'], 3)
+        self.assertGreater(summary['total_queries'], 0)
+
+    def test_reference_scenarios(self):
+        """Tests that each reference scenario can be created"""
+
+        for name in REFERENCE_SCENARIOS:
+            scenario = get_reference_scenario(name)
+            self.assertEqual(scenario.name, name)
+            self.assertGreater(scenario.num_nodes, 0)
+            self.assertGreater(scenario.num_queued, 0)
+        self.assertEqual(get_reference_scenario('large-cluster').num_nodes, 1000)
+        self.assertEqual(get_reference_scenario('large-cluster').num_queued, 50000)
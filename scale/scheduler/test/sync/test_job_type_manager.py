@@ -2,7 +2,11 @@ from __future__ import unicode_literals
 
 import django
 from django.test import TestCase
+from django.utils.timezone import now
+from mock import patch
 
+import job.test.utils as job_test_utils
+from job.models import JobType, JobTypeRevision, JobTypeTag
 from scheduler.sync.job_type_manager import JobTypeManager
 
 
@@ -22,3 +26,36 @@ class TestJobTypeManager(TestCase):
         manager.generate_status_json(status_dict)
 
         self.assertEqual(len(status_dict['job_types']), 1)
+
+    def test_sync_only_modified_job_types(self):
+        """Tests that syncing only retrieves modified job types and only parses changed manifests"""
+
+        job_type = job_test_utils.create_seed_job_type()
+        manager = JobTypeManager()
+        manager.sync_with_database()
+        self.assertEqual(len(manager.get_job_types()), 2)
+        self.assertEqual(len(manager.get_job_type_resources()), 2)
+
+        # Modifying a job type without changing its manifest should not re-parse the manifest
+        JobType.objects.filter(id=job_type.id).update(is_paused=True, last_modified=now())
+        with patch('job.models.JobType.get_resources') as mock_get_resources:
+            manager.sync_with_database()
+            self.assertFalse(mock_get_resources.called)
+        self.assertTrue(manager.get_job_type(job_type.id).is_paused)
+        self.assertEqual(len(manager.get_job_type_resources()), 2)
+
+    def test_sync_deleted_job_type(self):
+        """Tests that syncing removes deleted job types"""
+
+        job_type = job_test_utils.create_seed_job_type()
+        manager = JobTypeManager()
+        manager.sync_with_database()
+        self.assertIsNotNone(manager.get_job_type(job_type.id))
+
+        JobTypeRevision.objects.filter(job_type_id=job_type.id).delete()
+        JobTypeTag.objects.filter(job_type_id=job_type.id).delete()
+        JobType.objects.filter(id=job_type.id).delete()
+        manager.sync_with_database()
+        self.assertIsNone(manager.get_job_type(job_type.id))
+        self.assertEqual(len(manager.get_job_types()), 1)
+        self.assertEqual(len(manager.get_job_type_resources()), 1)
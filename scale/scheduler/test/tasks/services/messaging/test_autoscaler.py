@@ -0,0 +1,120 @@
+from __future__ import unicode_literals
+
+import datetime
+
+import django
+from django.test import TestCase
+from django.utils.timezone import utc
+
+from scheduler.tasks.services.messaging.autoscaler import MessageHandlerAutoscaler
+
+
+class FakeBackend(object):
+    """A message backend that returns a scripted sequence of queue depths"""
+
+    def __init__(self, depths):
+        self.depths = list(depths)
+        self.num_calls = 0
+
+    def get_queue_size(self):
+        self.num_calls += 1
+        depth = self.depths.pop(0)
+        if isinstance(depth, Exception):
+            raise depth
+        return depth
+
+
+class TestMessageHandlerAutoscaler(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+        self.when = datetime.datetime(2019, 1, 1, tzinfo=utc)
+
+    def _at(self, seconds):
+        return self.when + datetime.timedelta(seconds=seconds)
+
+    def _scale(self, autoscaler, num_handlers, min_count, max_count, seconds):
+        autoscaler.sample_queue_depth(self._at(seconds))
+        return autoscaler.get_desired_count(num_handlers, min_count, max_count)
+
+    def test_scale_up(self):
+        """Tests that the number of handlers is raised as soon as the backlog needs more handlers"""
+
+        backend = FakeBackend([1000, 940, 10000])
+        autoscaler = MessageHandlerAutoscaler(backend)
+
+        # Drain rate is not known yet
+        self.assertEqual(self._scale(autoscaler, 1, 1, 10, 0), 1)
+        self.assertIsNone(autoscaler.drain_rate)
+
+        # One handler drained 60 messages in 30 seconds, so 2 handlers clear the backlog in the target time
+        self.assertEqual(self._scale(autoscaler, 1, 1, 10, 30), 2)
+        self.assertAlmostEqual(autoscaler.drain_rate, 2.0)
+
+        # Backlog surges, limited by the maximum
+        self.assertEqual(self._scale(autoscaler, 2, 1, 10, 60), 10)
+        self.assertAlmostEqual(autoscaler.drain_rate, 1.4)
+
+    def test_scale_down_hysteresis(self):
+        """Tests that the number of handlers is only lowered after fewer have been needed for the scale down delay"""
+
+        backend = FakeBackend([1000, 940, 10000, 0, 40000, 0])
+        autoscaler = MessageHandlerAutoscaler(backend)
+        self._scale(autoscaler, 1, 1, 10, 0)
+        self._scale(autoscaler, 1, 1, 10, 30)
+        self.assertEqual(self._scale(autoscaler, 2, 1, 10, 60), 10)
+
+        # Queue is empty, but the handlers are kept until the scale down delay passes
+        self.assertEqual(self._scale(autoscaler, 10, 1, 10, 90), 10)
+        self.assertEqual(self._scale(autoscaler, 10, 1, 10, 150), 10)
+
+        # Scales down to the most handlers needed during the delay
+        self.assertEqual(self._scale(autoscaler, 10, 1, 10, 390), 3)
+
+    def test_sample_interval(self):
+        """Tests that the queue depth is only sampled once per sample interval"""
+
+        backend = FakeBackend([0, 0])
+        autoscaler = MessageHandlerAutoscaler(backend)
+
+        self.assertEqual(self._scale(autoscaler, 0, 2, 10, 0), 2)
+        self.assertEqual(self._scale(autoscaler, 0, 2, 10, 10), 2)
+        self.assertEqual(backend.num_calls, 1)
+        self._scale(autoscaler, 0, 2, 10, 30)
+        self.assertEqual(backend.num_calls, 2)
+
+    def test_backlog_not_draining(self):
+        """Tests that a backlog that is not draining scales up to the maximum"""
+
+        backend = FakeBackend([500, 600])
+        autoscaler = MessageHandlerAutoscaler(backend)
+
+        self.assertEqual(self._scale(autoscaler, 2, 1, 8, 0), 2)
+        self.assertEqual(self._scale(autoscaler, 2, 1, 8, 30), 8)
+
+    def test_backend_error(self):
+        """Tests that the maximum is used until the queue depth can be retrieved"""
+
+        backend = FakeBackend([Exception('Error connecting to rabbit'), 0])
+        autoscaler = MessageHandlerAutoscaler(backend)
+
+        self.assertEqual(self._scale(autoscaler, 0, 1, 5, 0), 5)
+        self.assertEqual(self._scale(autoscaler, 0, 1, 5, 10), 5)
+        self.assertEqual(self._scale(autoscaler, 0, 1, 5, 30), 1)
+        self.assertEqual(backend.num_calls, 2)
+
+    def test_get_desired_count_without_sample(self):
+        """Tests that the desired count is only updated from stored samples, without retrieving the queue depth"""
+
+        backend = FakeBackend([0])
+        autoscaler = MessageHandlerAutoscaler(backend)
+
+        self.assertEqual(autoscaler.get_desired_count(0, 1, 5), 5)
+        self.assertEqual(backend.num_calls, 0)
+
+        self.assertTrue(autoscaler.sample_queue_depth(self._at(0)))
+        self.assertFalse(autoscaler.sample_queue_depth(self._at(10)))
+        self.assertEqual(backend.num_calls, 1)
+        self.assertEqual(autoscaler.get_desired_count(0, 1, 5), 1)
+        self.assertEqual(autoscaler.get_desired_count(0, 1, 5), 1)
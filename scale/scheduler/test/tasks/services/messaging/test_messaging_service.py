@@ -3,6 +3,7 @@ from __future__ import unicode_literals
 import django
 from django.test import TestCase
 from django.utils.timezone import now
+from mock import patch
 
 from job.tasks.manager import task_mgr
 from job.tasks.update import TaskStatusUpdate
@@ -27,6 +28,26 @@ class TestMessagingService(TestCase):
         self.assertEqual(status_json['actual_count'], 0)
         self.assertEqual(status_json['desired_count'], 2)
 
+    @patch('scheduler.tasks.services.messaging.messaging_service.settings')
+    @patch('scheduler.tasks.services.messaging.autoscaler.CommandMessageManager')
+    def test_get_desired_task_count_autoscale(self, mock_manager, mock_settings):
+        """Tests that the desired number of message handlers scales with an empty queue when autoscaling"""
+
+        mock_settings.MESSAGE_HANDLER_AUTOSCALE = True
+        mock_settings.MIN_MESSAGE_HANDLERS = 1
+        mock_manager.return_value.get_queue_size.return_value = 0
+        scheduler_mgr.config.num_message_handlers = 5
+
+        service = MessagingService()
+        # The maximum is used until the queue depth is sampled
+        self.assertEqual(service.get_desired_task_count(), 5)
+        service.sync_with_backend()
+        self.assertEqual(service.get_desired_task_count(), 1)
+
+        # The configured number of message handlers is the maximum
+        scheduler_mgr.config.num_message_handlers = 0
+        self.assertEqual(service.get_desired_task_count(), 0)
+
     def test_get_tasks_to_kill(self):
         """Tests calling get_tasks_to_kill() successfully"""
 
@@ -176,6 +176,28 @@ class TestStatusView(APITestCase):
         self.assertEqual(result['timestamp'], datetime_to_string(when))
         self.assertDictEqual(result['vault'], {u'status': u'Secrets Not Configured', u'message': u'', u'sealed': False})
 
+    @patch('messaging.manager.CommandMessageManager.get_queue_size')
+    def test_status_unchanged(self, mock_get_queue_size):
+        """Test that unchanged status content is not written again while the status timestamp stays current"""
+
+        mock_get_queue_size.return_value = 0
+
+        first = now() - datetime.timedelta(seconds=5)
+        second = now()
+        status_thread = SchedulerStatusThread()
+        status_thread._generate_status_json(first)
+        status_thread._generate_status_json(second)
+
+        scheduler = Scheduler.objects.get(pk=1)
+        self.assertEqual(scheduler.status['timestamp'], datetime_to_string(first))
+        self.assertEqual(scheduler.status_timestamp, second)
+
+        url = '/%s/status/' % self.api
+        response = self.client.generic('GET', url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
+        result = json.loads(response.content)
+        self.assertEqual(result['timestamp'], datetime_to_string(second))
+
 
 class TestVersionView(APITestCase):
     api = 'v6'
@@ -0,0 +1,65 @@
+from __future__ import unicode_literals
+
+import datetime
+import threading
+import time
+
+import django
+from django.test import SimpleTestCase
+
+from scheduler.threads.base_thread import BaseSchedulerThread
+
+
+class CountingThread(BaseSchedulerThread):
+    """A scheduler thread that counts its loops"""
+
+    def __init__(self, throttle, min_interval=None):
+        super(CountingThread, self).__init__('Counting', throttle, datetime.timedelta(seconds=1), min_interval)
+        self.loops = 0
+        self.looped = threading.Event()
+
+    def _execute(self):
+        self.loops += 1
+        self.looped.set()
+
+
+class TestBaseSchedulerThread(SimpleTestCase):
+
+    def setUp(self):
+        django.setup()
+
+    def _start(self, scheduler_thread):
+        thread = threading.Thread(target=scheduler_thread.run)
+        thread.daemon = True
+        thread.start()
+        self.assertTrue(scheduler_thread.looped.wait(5))
+        scheduler_thread.looped.clear()
+        return thread
+
+    def test_wake_up(self):
+        """Tests that waking up a thread runs its next loop before the throttle duration has passed"""
+
+        scheduler_thread = CountingThread(datetime.timedelta(seconds=60), datetime.timedelta(milliseconds=10))
+        thread = self._start(scheduler_thread)
+
+        scheduler_thread.wake_up()
+        self.assertTrue(scheduler_thread.looped.wait(5))
+        self.assertEqual(scheduler_thread.loops, 2)
+
+        scheduler_thread.shutdown()
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
+
+    def test_wake_up_ignored(self):
+        """Tests that a thread without a minimum interval ignores wake ups"""
+
+        scheduler_thread = CountingThread(datetime.timedelta(seconds=1))
+        thread = self._start(scheduler_thread)
+
+        scheduler_thread.wake_up()
+        time.sleep(0.2)
+        self.assertEqual(scheduler_thread.loops, 1)
+
+        scheduler_thread.shutdown()
+        thread.join(5)
+        self.assertFalse(thread.is_alive())
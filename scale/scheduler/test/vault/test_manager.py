@@ -0,0 +1,70 @@
+from __future__ import unicode_literals
+
+import datetime
+
+import django
+from django.test import TestCase
+from mock import patch
+
+from scheduler.vault.manager import SecretsManager
+from vault.benchmark import StubVaultServer
+
+
+class TestSecretsManager(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+        secrets = {'job-type-%d' % i: {'password': 'secret-%d' % i} for i in range(20)}
+        self.server = StubVaultServer(secrets)
+        self.server.start()
+        self.addCleanup(self.server.stop)
+
+    def _settings(self):
+        return self.settings(SECRETS_URL=self.server.url, SECRETS_TOKEN='some_master_token', DCOS_SERVICE_ACCOUNT=None,
+                             SECRETS_SSL_WARNINGS=True, SECRETS_SYNC_WORKERS=4)
+
+    def _num_requests(self, path):
+        return len([request for request in self.server.requests if request[1] == path])
+
+    def test_sync_with_backend(self):
+        """Tests that syncing retrieves every job type's secrets and then only updates the changed job types"""
+
+        secrets_mgr = SecretsManager()
+        with self._settings():
+            changed_jobs = secrets_mgr.sync_with_backend()
+            self.assertSetEqual(changed_jobs, set(self.server.secrets.keys()))
+            self.assertDictEqual(secrets_mgr.retrieve_job_type_secrets('job-type-7'), {'password': 'secret-7'})
+            unchanged_secrets = secrets_mgr.retrieve_job_type_secrets('job-type-1')
+
+            self.server.secrets['job-type-3'] = {'password': 'new-secret'}
+            del self.server.secrets['job-type-5']
+            changed_jobs = secrets_mgr.sync_with_backend()
+
+        self.assertSetEqual(changed_jobs, {'job-type-3', 'job-type-5'})
+        self.assertDictEqual(secrets_mgr.retrieve_job_type_secrets('job-type-3'), {'password': 'new-secret'})
+        self.assertDictEqual(secrets_mgr.retrieve_job_type_secrets('job-type-5'), {})
+        self.assertIs(secrets_mgr.retrieve_job_type_secrets('job-type-1'), unchanged_secrets)
+
+        # Authenticated once and reused the kept connections
+        self.assertEqual(self._num_requests('/v1/sys/health'), 1)
+        self.assertLessEqual(self.server.num_connections, 4)
+
+    def test_sync_with_backend_unchanged(self):
+        """Tests that syncing with no changes reports no changed job types"""
+
+        secrets_mgr = SecretsManager()
+        with self._settings():
+            secrets_mgr.sync_with_backend()
+            self.assertSetEqual(secrets_mgr.sync_with_backend(), set())
+
+    @patch('vault.secrets_handler.DEFAULT_AUTH_TTL', datetime.timedelta(0))
+    def test_sync_with_backend_auth_expired(self):
+        """Tests that syncing authenticates again once the authentication has expired"""
+
+        secrets_mgr = SecretsManager()
+        with self._settings():
+            secrets_mgr.sync_with_backend()
+            secrets_mgr.sync_with_backend()
+
+        self.assertEqual(self._num_requests('/v1/sys/health'), 2)
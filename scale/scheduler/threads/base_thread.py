@@ -2,13 +2,14 @@
 from __future__ import unicode_literals
 
 import logging
-import math
+import threading
 import time
 from abc import ABCMeta
 
 from django.db.utils import InterfaceError
 from django.utils.timezone import now
 
+from util.db_pool.pool import release_connections
 
 logger = logging.getLogger(__name__)
 
@@ -18,21 +19,27 @@ class BaseSchedulerThread(object):
 
     __metaclass__ = ABCMeta
 
-    def __init__(self, name, throttle, warning_threshold):
+    def __init__(self, name, throttle, warning_threshold, min_interval=None):
         """Constructor
 
         :param name: The name of this thread
         :type name: string
-        :param throttle: A loop of this thread should occur no more than once per this duration
+        :param throttle: A loop of this thread should occur no more than once per this duration, unless the thread is
+            woken up
         :type throttle: :class:`datetime.timedelta`
         :param warning_threshold: A warning is logged if loop execution exceeds this duration
         :type warning_threshold: :class:`datetime.timedelta`
+        :param min_interval: When the thread is woken up, loops still occur no more than once per this duration. If
+            None, the thread ignores wake ups and only loops once per throttle duration.
+        :type min_interval: :class:`datetime.timedelta`
         """
 
         self._name = name
         self._running = True
         self._throttle = throttle
         self._warning_threshold = warning_threshold
+        self._min_interval = min_interval if min_interval is not None else throttle
+        self._wake_up = threading.Event()
 
     def run(self):
         """The main run loop of the thread
@@ -43,6 +50,8 @@ class BaseSchedulerThread(object):
         while self._running:
 
             started = now()
+            # Clear before executing so that a wake up during this loop triggers the next loop
+            self._wake_up.clear()
 
             try:
                 self._execute()
@@ -56,6 +65,8 @@ class BaseSchedulerThread(object):
                     GLOBAL_SHUTDOWN()
             except Exception:
                 logger.exception('%s thread had a critical error', self._name)
+            finally:
+                release_connections()
 
             duration = now() - started
 
@@ -65,11 +76,7 @@ class BaseSchedulerThread(object):
             else:
                 logger.debug(msg, self._name, duration.total_seconds())
 
-            # If time takes less than threshold, throttle
-            if duration < self._throttle:
-                # Delay until full throttle time reached
-                delay = math.ceil(self._throttle.total_seconds() - duration.total_seconds())
-                time.sleep(delay)
+            self._wait(started)
 
         logger.info('%s thread stopped', self._name)
 
@@ -79,9 +86,35 @@ class BaseSchedulerThread(object):
 
         logger.info('%s thread is shutting down', self._name)
         self._running = False
+        self._wake_up.set()
+
+    def wake_up(self):
+        """Wakes up the thread so that its next loop runs as soon as its minimum interval allows, instead of waiting
+        for the full throttle duration. This method is thread-safe.
+        """
+
+        self._wake_up.set()
 
     def _execute(self):
         """Executes a single loop of this thread
         """
 
         raise NotImplementedError
+
+    def _wait(self, started):
+        """Waits until the next loop of this thread should start. The next loop starts once the throttle duration since
+        the given start time has passed, or sooner if the thread is woken up, but never before the minimum interval has
+        passed.
+
+        :param started: When the previous loop started
+        :type started: :class:`datetime.datetime`
+        """
+
+        min_remaining = (self._min_interval - (now() - started)).total_seconds()
+        if min_remaining > 0:
+            time.sleep(min_remaining)
+
+        if self._running:
+            remaining = (self._throttle - (now() - started)).total_seconds()
+            if remaining > 0:
+                self._wake_up.wait(remaining)
@@ -0,0 +1,114 @@
+"""Defines the class that manages the change feed background thread"""
+from __future__ import unicode_literals
+
+import datetime
+import logging
+import time
+
+from job.execution.manager import job_exe_mgr
+from scheduler.cleanup.manager import cleanup_mgr
+from scheduler.feed.manager import change_feed_mgr
+from scheduler.threads.base_thread import BaseSchedulerThread
+from util.change_feed import ChangeFeedListener, JOBS_CHANNEL, parse_job_ids, QUEUE_CHANNEL
+
+
+# The listener blocks while it waits for notifications, so the loop itself is not throttled
+THROTTLE = datetime.timedelta(seconds=0)
+# The maximum number of seconds the listener blocks waiting for notifications in a single loop
+POLL_TIMEOUT = 1.0
+WARN_THRESHOLD = datetime.timedelta(seconds=POLL_TIMEOUT + 1)
+# How long to wait before reconnecting after the listener fails to connect
+RECONNECT_DELAY = 5.0
+
+logger = logging.getLogger(__name__)
+
+
+class ChangeFeedThread(BaseSchedulerThread):
+    """This class manages the change feed background thread for the scheduler. It listens for queue and job change
+    notifications and updates the scheduler's in-memory state as they arrive.
+    """
+
+    def __init__(self, scheduling_thread, messaging_thread):
+        """Constructor
+
+        :param scheduling_thread: The scheduling thread to wake up when the queue changes
+        :type scheduling_thread: :class:`scheduler.threads.schedule.SchedulingThread`
+        :param messaging_thread: The messaging thread to wake up when job executions are canceled
+        :type messaging_thread: :class:`scheduler.threads.messaging.MessagingThread`
+        """
+
+        super(ChangeFeedThread, self).__init__('Change feed', THROTTLE, WARN_THRESHOLD)
+        self._listener = ChangeFeedListener([QUEUE_CHANNEL, JOBS_CHANNEL])
+        self._messaging_thread = messaging_thread
+        self._scheduling_thread = scheduling_thread
+
+    def _execute(self):
+        """See :meth:`scheduler.threads.base_thread.BaseSchedulerThread._execute`
+        """
+
+        if not self._listener.is_connected():
+            if not self._connect():
+                return
+
+        try:
+            notifications = self._listener.poll(POLL_TIMEOUT)
+        except Exception:
+            logger.exception('Change feed lost its database connection')
+            self._disconnect()
+            return
+
+        is_queue_changed = False
+        job_ids = set()
+        for channel, payload in notifications:
+            if channel == QUEUE_CHANNEL:
+                is_queue_changed = True
+            elif channel == JOBS_CHANNEL:
+                job_ids.update(parse_job_ids(payload))
+
+        if is_queue_changed:
+            change_feed_mgr.queue_changed()
+            self._scheduling_thread.wake_up()
+        if job_ids:
+            logger.debug('Change feed received %d changed job(s)', len(job_ids))
+            self._handle_changed_jobs(job_ids)
+
+    def _connect(self):
+        """Connects the listener, handling any canceled executions that may have been missed while disconnected
+
+        :returns: True if the listener connected, False otherwise
+        :rtype: bool
+        """
+
+        try:
+            self._listener.connect()
+        except Exception:
+            logger.exception('Change feed failed to connect, retrying in %.1f seconds', RECONNECT_DELAY)
+            self._disconnect()
+            time.sleep(RECONNECT_DELAY)
+            return False
+
+        logger.info('Change feed connected')
+        change_feed_mgr.set_connected(True)
+        self._scheduling_thread.wake_up()
+        self._handle_changed_jobs(None)
+        return True
+
+    def _disconnect(self):
+        """Closes the listener and records that changes are no longer being reported
+        """
+
+        self._listener.close()
+        change_feed_mgr.set_connected(False)
+
+    def _handle_changed_jobs(self, job_ids):
+        """Handles any running executions of the given jobs that have been canceled
+
+        :param job_ids: The IDs of the changed jobs, None to check every running execution
+        :type job_ids: set
+        """
+
+        finished_job_exes = job_exe_mgr.sync_with_database(job_ids)
+        for finished_job_exe in finished_job_exes:
+            cleanup_mgr.add_job_execution(finished_job_exe)
+        if finished_job_exes:
+            self._messaging_thread.wake_up()
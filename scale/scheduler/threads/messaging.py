@@ -11,6 +11,8 @@ from scheduler.threads.base_thread import BaseSchedulerThread
 
 THROTTLE = datetime.timedelta(seconds=1)
 WARN_THRESHOLD = datetime.timedelta(milliseconds=500)
+# When woken up, the thread still loops no more than once per this duration
+MIN_INTERVAL = datetime.timedelta(milliseconds=100)
 
 logger = logging.getLogger(__name__)
 
@@ -22,7 +24,7 @@ class MessagingThread(BaseSchedulerThread):
         """Constructor
         """
 
-        super(MessagingThread, self).__init__('Messaging', THROTTLE, WARN_THRESHOLD)
+        super(MessagingThread, self).__init__('Messaging', THROTTLE, WARN_THRESHOLD, MIN_INTERVAL)
 
         self._manager = CommandMessageManager()
         self._messages = []
@@ -12,6 +12,8 @@ from scheduler.threads.base_thread import BaseSchedulerThread
 
 THROTTLE = datetime.timedelta(seconds=1)
 WARN_THRESHOLD = datetime.timedelta(seconds=1)
+# When woken up, the thread still loops no more than once per this duration
+MIN_INTERVAL = datetime.timedelta(milliseconds=100)
 
 logger = logging.getLogger(__name__)
 
@@ -26,7 +28,7 @@ class SchedulingThread(BaseSchedulerThread):
         :type driver: :class:`mesoshttp.client.MesosClient`
         """
 
-        super(SchedulingThread, self).__init__('Scheduling', THROTTLE, WARN_THRESHOLD)
+        super(SchedulingThread, self).__init__('Scheduling', THROTTLE, WARN_THRESHOLD, MIN_INTERVAL)
         self._client = client
         self._manager = SchedulingManager()
 
@@ -2,6 +2,8 @@
 from __future__ import unicode_literals
 
 import datetime
+import hashlib
+import json
 import logging
 
 from django.utils.timezone import now
@@ -35,6 +37,8 @@ class SchedulerStatusThread(BaseSchedulerThread):
 
         super(SchedulerStatusThread, self).__init__('Scheduler status', THROTTLE, WARN_THRESHOLD)
 
+        self._status_hash = None  # Hash of the content of the most recently recorded status JSON
+
     def _execute(self):
         """See :meth:`scheduler.threads.base_thread.BaseSchedulerThread._execute`
         """
@@ -50,7 +54,7 @@ class SchedulerStatusThread(BaseSchedulerThread):
         :type when: :class:`datetime.datetime`
         """
 
-        status_dict = {'timestamp': datetime_to_string(when)}
+        status_dict = {}
         scheduler_mgr.generate_status_json(status_dict)
         system_task_mgr.generate_status_json(status_dict)
         node_mgr.generate_status_json(status_dict)
@@ -60,4 +64,10 @@ class SchedulerStatusThread(BaseSchedulerThread):
         job_type_mgr.generate_status_json(status_dict)
         secrets_mgr.generate_status_json(status_dict)
         dependency_mgr.generate_status_json(status_dict)
-        Scheduler.objects.all().update(status=status_dict)
+
+        # Only write the status JSON when its content changes, otherwise just record that the status is current
+        status_hash = hashlib.sha1(json.dumps(status_dict, sort_keys=True).encode('utf-8')).hexdigest()
+        is_changed = status_hash != self._status_hash
+        status_dict['timestamp'] = datetime_to_string(when)
+        Scheduler.objects.update_status(status_dict, when, is_changed)
+        self._status_hash = status_hash
@@ -5,20 +5,26 @@ import datetime
 import logging
 
 from django.conf import settings
+from django.utils.timezone import now
 
 from job.execution.manager import job_exe_mgr
 from scheduler.cleanup.manager import cleanup_mgr
+from scheduler.feed.manager import change_feed_mgr
 from scheduler.manager import scheduler_mgr
 from scheduler.node.manager import node_mgr
 from scheduler.resources.manager import resource_mgr
 from scheduler.sync.job_type_manager import job_type_mgr
 from scheduler.sync.workspace_manager import workspace_mgr
+from scheduler.tasks.manager import system_task_mgr
 from scheduler.threads.base_thread import BaseSchedulerThread
 from scheduler.vault.manager import secrets_mgr
 
 
 THROTTLE = datetime.timedelta(seconds=10)
 WARN_THRESHOLD = datetime.timedelta(seconds=5)
+# While the change feed is connected, it reports canceled job executions, so all running job executions are only synced
+# with the database this often as a safety net
+JOB_EXE_SYNC_INTERVAL = datetime.timedelta(minutes=2)
 
 
 logger = logging.getLogger(__name__)
@@ -36,6 +42,7 @@ class SyncThread(BaseSchedulerThread):
 
         super(SyncThread, self).__init__('Synchronization', THROTTLE, WARN_THRESHOLD)
         self._driver = driver
+        self._last_job_exe_sync = None
 
     @property
     def driver(self):
@@ -65,7 +72,6 @@ class SyncThread(BaseSchedulerThread):
 
         scheduler_mgr.sync_with_database()
         job_type_mgr.sync_with_database()
-        job_exe_mgr.sync_with_database()
         workspace_mgr.sync_with_database()
 
         node_mgr.sync_with_database(scheduler_mgr.config)
@@ -75,8 +81,14 @@ class SyncThread(BaseSchedulerThread):
             resource_mgr.sync_with_mesos(mesos_master)
 
         # Handle canceled job executions
-        for finished_job_exe in job_exe_mgr.sync_with_database():
-            cleanup_mgr.add_job_execution(finished_job_exe)
+        when = now()
+        if not change_feed_mgr.is_connected() or self._last_job_exe_sync is None or \
+                when - self._last_job_exe_sync >= JOB_EXE_SYNC_INTERVAL:
+            for finished_job_exe in job_exe_mgr.sync_with_database():
+                cleanup_mgr.add_job_execution(finished_job_exe)
+            self._last_job_exe_sync = when
+
+        system_task_mgr.sync_with_backend()
 
         if settings.SECRETS_URL:
             secrets_mgr.sync_with_backend()
@@ -10,6 +10,8 @@ from scheduler.threads.base_thread import BaseSchedulerThread
 
 THROTTLE = datetime.timedelta(seconds=1)
 WARN_THRESHOLD = datetime.timedelta(milliseconds=500)
+# When woken up, the thread still loops no more than once per this duration
+MIN_INTERVAL = datetime.timedelta(milliseconds=100)
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +23,7 @@ class TaskUpdateThread(BaseSchedulerThread):
         """Constructor
         """
 
-        super(TaskUpdateThread, self).__init__('Task update', THROTTLE, WARN_THRESHOLD)
+        super(TaskUpdateThread, self).__init__('Task update', THROTTLE, WARN_THRESHOLD, MIN_INTERVAL)
 
     def _execute(self):
         """See :meth:`scheduler.threads.base_thread.BaseSchedulerThread._execute`
@@ -2,8 +2,11 @@
 from __future__ import unicode_literals
 
 import logging
+from functools import partial
+from multiprocessing.pool import ThreadPool
 
 from django.conf import settings
+from django.utils.timezone import now
 from vault.exceptions import InvalidSecretsAuthorization, InvalidSecretsRequest, InvalidSecretsToken, InvalidSecretsValue
 from vault.secrets_handler import SecretsHandler
 
@@ -19,6 +22,7 @@ class SecretsManager(object):
         """
 
         self._all_secrets = {}
+        self._handler = None  # Kept between syncs to reuse its HTTP session and authentication
 
     def retrieve_job_type_secrets(self, job_name):
         """Get the secret values from the cache pertaining to the provided job
@@ -37,28 +41,48 @@ class SecretsManager(object):
         return secret_values
 
     def sync_with_backend(self):
-        """Gather all job type secrets that are stored in the secrets backend.
+        """Gather all job type secrets that are stored in the secrets backend. The secrets are retrieved concurrently
+        and compared with the previous sync, so only the job types whose secrets changed are updated.
+
+        :returns: The names of the job types whose secrets were added, changed or removed
+        :rtype: set
         """
 
-        updated_secrets = {}
         try:
-            sh = SecretsHandler()
+            sh = self._get_handler()
             jobs_with_secrets = sh.list_job_types()
         except (InvalidSecretsAuthorization, InvalidSecretsRequest, InvalidSecretsToken) as e:
             # do not spam logs with exception, this will be captured once in status json
             # logger.exception('Secrets Error: %s', e.message)
-            return
+            self._close_handler()
+            return set()
 
-        for job in jobs_with_secrets:
+        results = []
+        if jobs_with_secrets:
+            pool = ThreadPool(min(settings.SECRETS_SYNC_WORKERS, len(jobs_with_secrets)))
             try:
-                job_secrets = sh.get_job_type_secrets(job)
-                updated_secrets[job] = job_secrets
-            except (InvalidSecretsAuthorization, InvalidSecretsRequest, InvalidSecretsValue) as e:
-                # do not spam logs with exception, this will be captured once in status json
-                # logger.exception('Secrets Error: %s', e.message)
+                results = pool.map(partial(self._get_job_type_secrets, sh), jobs_with_secrets)
+            finally:
+                pool.close()
+                pool.join()
+
+        previous_secrets = self._all_secrets
+        updated_secrets = {}
+        changed_jobs = set()
+        for job, job_secrets in zip(jobs_with_secrets, results):
+            if job_secrets is None:
                 continue
-                
-        self._all_secrets = updated_secrets
+            if job in previous_secrets and previous_secrets[job] == job_secrets:
+                updated_secrets[job] = previous_secrets[job]
+            else:
+                updated_secrets[job] = job_secrets
+                changed_jobs.add(job)
+        changed_jobs.update(job for job in previous_secrets if job not in updated_secrets)
+
+        if changed_jobs:
+            logger.info('Secrets changed for %d job type(s)', len(changed_jobs))
+            self._all_secrets = updated_secrets
+        return changed_jobs
 
     def generate_status_json(self, status_dict):
         """Generates the portion of the status JSON that describes the secrets settings and metrics
@@ -124,5 +148,44 @@ class SecretsManager(object):
                 status_dict['vault']['message'] = e.message
                 return
 
+    def _close_handler(self):
+        """Closes the kept secrets handler so the next sync authenticates again
+        """
+
+        if self._handler:
+            self._handler.close()
+            self._handler = None
+
+    def _get_handler(self):
+        """Returns the kept secrets handler, creating a new one if there is none or its authentication has expired
+
+        :returns: The secrets handler
+        :rtype: :class:`vault.secrets_handler.SecretsHandler`
+        """
+
+        if self._handler and self._handler.is_auth_expired(now()):
+            self._close_handler()
+        if not self._handler:
+            self._handler = SecretsHandler(pool_size=settings.SECRETS_SYNC_WORKERS)
+        return self._handler
+
+    @staticmethod
+    def _get_job_type_secrets(sh, job):
+        """Retrieves the secrets for the given job type
+
+        :param sh: The secrets handler
+        :type sh: :class:`vault.secrets_handler.SecretsHandler`
+        :param job: The name of the job type
+        :type job: string
+        :returns: The job type secrets, None if they could not be retrieved
+        :rtype: dict
+        """
+
+        try:
+            return sh.get_job_type_secrets(job)
+        except (InvalidSecretsAuthorization, InvalidSecretsRequest, InvalidSecretsValue):
+            # do not spam logs with exception, this will be captured once in status json
+            return None
+
 
 secrets_mgr = SecretsManager()
@@ -145,7 +145,7 @@ class StatusView(GenericAPIView):
         :returns: the HTTP response to send back to the user
         """
 
-        status_dict = Scheduler.objects.get_master().status
+        status_dict = Scheduler.objects.get_status()
 
         if not status_dict:  # Empty dict from model initialization
             raise ServiceUnavailable(unicode('Status is missing. Scheduler may be down.'))
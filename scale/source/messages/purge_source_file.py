@@ -3,6 +3,7 @@ from __future__ import unicode_literals
 
 import logging
 
+from django.conf import settings
 from django.utils import timezone
 
 from ingest.models import Ingest
@@ -10,18 +11,21 @@ from job.models import JobInputFile
 from messaging.messages.message import CommandMessage
 from recipe.models import RecipeInputFile
 from storage.models import PurgeResults, ScaleFile
+from storage.purge import is_legacy_purge, PurgeEngine
 
 
 logger = logging.getLogger(__name__)
 
 
-def create_purge_source_file_message(source_file_id, trigger_id):
+def create_purge_source_file_message(source_file_id, trigger_id, chain_token=None):
     """Creates messages to removes a source file form Scale
 
     :param source_file_id: The source file ID
     :type source_file_id: int
     :param trigger_id: The trigger event ID for the purge operation
     :type trigger_id: int
+    :param chain_token: The chain token that lets the message continue a running purge, None to start the purge
+    :type chain_token: string
     :return: The purge source file message
     :rtype: :class:`storage.messages.purge_source_file.PurgeSourceFile`
     """
@@ -29,12 +33,13 @@ def create_purge_source_file_message(source_file_id, trigger_id):
     message = PurgeSourceFile()
     message.source_file_id = source_file_id
     message.trigger_id = trigger_id
+    message.chain_token = chain_token
 
     return message
 
 
 class PurgeSourceFile(CommandMessage):
-    """Command message that removes source file models
+    """Command message that purges a source file and its lineage, see :class:`storage.purge.PurgeEngine`
     """
 
     def __init__(self):
@@ -45,13 +50,14 @@ class PurgeSourceFile(CommandMessage):
 
         self.source_file_id = None
         self.trigger_id = None
+        self.chain_token = None
 
 
     def to_json(self):
         """See :meth:`messaging.messages.message.CommandMessage.to_json`
         """
 
-        return {'source_file_id': self.source_file_id, 'trigger_id': self.trigger_id}
+        return {'source_file_id': self.source_file_id, 'trigger_id': self.trigger_id, 'chain_token': self.chain_token}
 
     @staticmethod
     def from_json(json_dict):
@@ -61,6 +67,7 @@ class PurgeSourceFile(CommandMessage):
         message = PurgeSourceFile()
         message.source_file_id = json_dict['source_file_id']
         message.trigger_id = json_dict['trigger_id']
+        message.chain_token = json_dict.get('chain_token')
 
         return message
 
@@ -73,6 +80,32 @@ class PurgeSourceFile(CommandMessage):
         if results.force_stop_purge:
             return True
 
+        if is_legacy_purge(self.trigger_id):
+            self._execute_legacy(results)
+            return True
+
+        # Purge the next chunks of the source file's lineage. If there is more to do, it is continued by a new message
+        # holding the purge's new chain token so that a large purge does not monopolize the message handler.
+        engine = PurgeEngine(self.trigger_id, self.source_file_id, self.chain_token)
+        if engine.run(settings.PURGE_MAX_CHUNKS_PER_MESSAGE):
+            self.new_messages.append(create_purge_source_file_message(source_file_id=self.source_file_id,
+                                                                      trigger_id=self.trigger_id,
+                                                                      chain_token=engine.chain_token))
+        self.new_messages.extend(engine.new_messages)
+
+        return True
+
+    def _execute_legacy(self, results):
+        """Continues a purge that was started before the purge engine existed, using the purge_recipe and
+        spawn_delete_files_job messages it started with
+
+        :param results: The results of the purge operation
+        :type results: :class:`storage.models.PurgeResults`
+        """
+
+        from job.messages.spawn_delete_files_job import create_spawn_delete_files_job
+        from recipe.messages.purge_recipe import create_purge_recipe_message
+
         job_inputs = JobInputFile.objects.filter(input_file=self.source_file_id,
                                                  job__recipe__isnull=True).select_related('job')
         recipe_inputs = RecipeInputFile.objects.filter(input_file=self.source_file_id,
@@ -80,7 +113,6 @@ class PurgeSourceFile(CommandMessage):
 
         # Kick off spawn_delete_job_files for jobs that are not in a recipe and have the given source_file as input
         for job_input in job_inputs:
-            from job.messages.spawn_delete_files_job import create_spawn_delete_files_job
             self.new_messages.append(create_spawn_delete_files_job(job_id=job_input.job.id,
                                                                    trigger_id=self.trigger_id,
                                                                    source_file_id=self.source_file_id,
@@ -88,7 +120,6 @@ class PurgeSourceFile(CommandMessage):
 
         # Kick off purge_recipe for recipes that are not superseded and have the given source_file as input
         for recipe_input in recipe_inputs:
-            from recipe.messages.purge_recipe import create_purge_recipe_message
             self.new_messages.append(create_purge_recipe_message(recipe_id=recipe_input.recipe.id,
                                                                  trigger_id=self.trigger_id,
                                                                  source_file_id=self.source_file_id))
@@ -101,5 +132,3 @@ class PurgeSourceFile(CommandMessage):
             # Update results
             results.purge_completed = timezone.now()
             results.save()
-
-        return True
@@ -2,14 +2,18 @@ from __future__ import unicode_literals
 
 import django
 from django.test import TransactionTestCase
+from django.utils.timezone import now
 
 from ingest.models import Ingest
+from job.models import Job
 from job.test import utils as job_test_utils
 from recipe.models import Recipe, RecipeInputFile, RecipeNode
 from recipe.test import utils as recipe_test_utils
 from source.messages.purge_source_file import create_purge_source_file_message, PurgeSourceFile
 from source.models import ScaleFile
-from storage.models import PurgeResults
+from storage.messages.delete_files import create_delete_files_messages
+from storage.models import PurgeCheckpoint, PurgeResults
+from storage.purge import LEGACY_STEP, LINEAGE_STEP
 from storage.test import utils as storage_test_utils
 from trigger.test import utils as trigger_test_utils
 
@@ -105,7 +109,34 @@ class TestPurgeSourceFile(TransactionTestCase):
             trigger_event=trigger))
 
     def test_execute_with_job(self):
-        """Tests calling PurgeSourceFile.execute() successfully"""
+        """Tests calling PurgeSourceFile.execute() successfully with a job that has no products"""
+
+        # Create a file
+        source_file = storage_test_utils.create_file(file_type='SOURCE')
+        trigger = trigger_test_utils.create_trigger_event()
+        PurgeResults.objects.create(source_file_id=source_file.id, trigger_event=trigger)
+
+        # Create a job and other models
+        job = job_test_utils.create_job()
+        job_test_utils.create_input_file(job=job, input_file=source_file)
+
+        # Create message
+        message = create_purge_source_file_message(source_file_id=source_file.id,
+                                                   trigger_id=trigger.id)
+        # Execute message
+        result = message.execute()
+        self.assertTrue(result)
+
+        # Test to see that the job and source file were purged directly
+        self.assertEqual(len(message.new_messages), 0)
+        self.assertEqual(Job.objects.filter(id=job.id).count(), 0)
+        self.assertEqual(ScaleFile.objects.filter(id=source_file.id).count(), 0)
+        results = PurgeResults.objects.get(trigger_event=trigger)
+        self.assertEqual(results.num_jobs_deleted, 1)
+        self.assertIsNotNone(results.purge_completed)
+
+    def test_execute_with_job_products(self):
+        """Tests calling PurgeSourceFile.execute() successfully with a job that has products"""
 
         # Create a file
         source_file = storage_test_utils.create_file(file_type='SOURCE')
@@ -115,6 +146,8 @@ class TestPurgeSourceFile(TransactionTestCase):
         # Create a job and other models
         job = job_test_utils.create_job()
         job_test_utils.create_input_file(job=job, input_file=source_file)
+        job_exe = job_test_utils.create_job_exe(job=job)
+        storage_test_utils.create_file(job_exe=job_exe, file_type='PRODUCT')
 
         # Create message
         message = create_purge_source_file_message(source_file_id=source_file.id,
@@ -123,11 +156,128 @@ class TestPurgeSourceFile(TransactionTestCase):
         result = message.execute()
         self.assertTrue(result)
 
-        # Test to see that a message to purge the job was created
-        self.assertEqual(len(message.new_messages), 1)
+        # Test to see that a message to delete the job's products was created along with a continuation message
+        msg_types = sorted(msg.type for msg in message.new_messages)
+        self.assertListEqual(msg_types, ['purge_source_file', 'spawn_delete_files_job'])
         for msg in message.new_messages:
-            self.assertEqual(msg.job_id, job.id)
-            self.assertEqual(msg.type, 'spawn_delete_files_job')
+            if msg.type == 'spawn_delete_files_job':
+                self.assertEqual(msg.job_id, job.id)
+            else:
+                continuation = msg
+
+        # Continuing the purge should wait for the products to be deleted
+        result = continuation.execute()
+        self.assertTrue(result)
+        self.assertEqual(len(continuation.new_messages), 0)
+        self.assertEqual(Job.objects.filter(id=job.id).count(), 1)
+        self.assertIsNone(PurgeResults.objects.get(trigger_event=trigger).purge_completed)
+
+        # Deleting the products should continue the purge from exactly one delete files message
+        product_ids = list(ScaleFile.objects.filter(job_id=job.id).values_list('id', flat=True))
+        delete_messages = create_delete_files_messages(files=ScaleFile.objects.filter(id__in=product_ids),
+                                                       job_id=job.id, trigger_id=trigger.id,
+                                                       source_file_id=source_file.id, purge=True)
+        delete_messages.extend(create_delete_files_messages(files=ScaleFile.objects.filter(id__in=product_ids),
+                                                            job_id=job.id, trigger_id=trigger.id,
+                                                            source_file_id=source_file.id, purge=True))
+        continuations = []
+        for delete_message in delete_messages:
+            self.assertTrue(delete_message.execute())
+            continuations.extend(delete_message.new_messages)
+        self.assertEqual(len(continuations), 1)
+        self.assertEqual(continuations[0].type, 'purge_source_file')
+
+        result = continuations[0].execute()
+        self.assertTrue(result)
+        self.assertEqual(Job.objects.filter(id=job.id).count(), 0)
+        self.assertIsNotNone(PurgeResults.objects.get(trigger_event=trigger).purge_completed)
+
+    def test_execute_stale_message(self):
+        """Tests that only the message holding the purge's chain token continues the purge"""
+
+        # Create a file
+        source_file = storage_test_utils.create_file(file_type='SOURCE')
+        trigger = trigger_test_utils.create_trigger_event()
+        PurgeResults.objects.create(source_file_id=source_file.id, trigger_event=trigger)
+
+        # Create jobs and other models
+        for _ in range(5):
+            job = job_test_utils.create_job()
+            job_test_utils.create_input_file(job=job, input_file=source_file)
+
+        with self.settings(PURGE_CHUNK_SIZE=2, PURGE_MAX_CHUNKS_PER_MESSAGE=1):
+            message = create_purge_source_file_message(source_file_id=source_file.id,
+                                                       trigger_id=trigger.id)
+            self.assertTrue(message.execute())
+            self.assertEqual(len(message.new_messages), 1)
+            continuation = message.new_messages[0]
+            self.assertIsNotNone(continuation.chain_token)
+
+            # A redelivered start message and a redelivered continuation should do nothing
+            message = create_purge_source_file_message(source_file_id=source_file.id,
+                                                       trigger_id=trigger.id)
+            self.assertTrue(message.execute())
+            self.assertEqual(len(message.new_messages), 0)
+            stale_continuation = PurgeSourceFile.from_json(continuation.to_json())
+            self.assertTrue(continuation.execute())
+            self.assertEqual(len(continuation.new_messages), 1)
+            self.assertTrue(stale_continuation.execute())
+            self.assertEqual(len(stale_continuation.new_messages), 0)
+
+        self.assertEqual(PurgeResults.objects.get(trigger_event=trigger).num_jobs_deleted, 0)
+
+    def test_execute_legacy(self):
+        """Tests that a purge started before the purge engine existed continues with the legacy messages"""
+
+        # Create a file
+        source_file = storage_test_utils.create_file(file_type='SOURCE')
+        trigger = trigger_test_utils.create_trigger_event()
+        results = PurgeResults.objects.create(source_file_id=source_file.id, trigger_event=trigger)
+        PurgeCheckpoint.objects.create(purge=results, step=LEGACY_STEP, completed=now())
+
+        # Create a job and other models
+        job = job_test_utils.create_job()
+        job_test_utils.create_input_file(job=job, input_file=source_file)
+
+        # Create message
+        message = create_purge_source_file_message(source_file_id=source_file.id,
+                                                   trigger_id=trigger.id)
+        # Execute message
+        result = message.execute()
+        self.assertTrue(result)
+
+        # Test to see that the job's files are deleted by the legacy messages instead of the purge engine
+        self.assertListEqual([msg.type for msg in message.new_messages], ['spawn_delete_files_job'])
+        self.assertEqual(Job.objects.filter(id=job.id).count(), 1)
+        self.assertFalse(PurgeCheckpoint.objects.filter(purge=results, step=LINEAGE_STEP).exists())
+
+    def test_execute_chunked(self):
+        """Tests calling PurgeSourceFile.execute() where the purge takes multiple messages"""
+
+        # Create a file
+        source_file = storage_test_utils.create_file(file_type='SOURCE')
+        trigger = trigger_test_utils.create_trigger_event()
+        PurgeResults.objects.create(source_file_id=source_file.id, trigger_event=trigger)
+
+        # Create jobs and other models
+        for _ in range(5):
+            job = job_test_utils.create_job()
+            job_test_utils.create_input_file(job=job, input_file=source_file)
+
+        num_messages = 0
+        with self.settings(PURGE_CHUNK_SIZE=2, PURGE_MAX_CHUNKS_PER_MESSAGE=2):
+            message = create_purge_source_file_message(source_file_id=source_file.id,
+                                                       trigger_id=trigger.id)
+            while message:
+                num_messages += 1
+                self.assertTrue(message.execute())
+                message = message.new_messages[0] if message.new_messages else None
+
+        self.assertGreater(num_messages, 1)
+        results = PurgeResults.objects.get(trigger_event=trigger)
+        self.assertEqual(results.num_jobs_deleted, 5)
+        self.assertIsNotNone(results.purge_completed)
+        self.assertEqual(ScaleFile.objects.filter(id=source_file.id).count(), 0)
 
     def test_execute_with_recipe(self):
         """Tests calling PurgeSourceFile.execute() successfully"""
@@ -149,8 +299,9 @@ class TestPurgeSourceFile(TransactionTestCase):
         result = message.execute()
         self.assertTrue(result)
 
-        # Test to see that a message to purge the recipe was created
-        self.assertEqual(len(message.new_messages), 1)
-        for msg in message.new_messages:
-            self.assertEqual(msg.recipe_id, recipe.id)
-            self.assertEqual(msg.type, 'purge_recipe')
+        # Test to see that the recipe was purged
+        self.assertEqual(len(message.new_messages), 0)
+        self.assertEqual(Recipe.objects.filter(id=recipe.id).count(), 0)
+        results = PurgeResults.objects.get(trigger_event=trigger)
+        self.assertEqual(results.num_recipes_deleted, 1)
+        self.assertIsNotNone(results.purge_completed)
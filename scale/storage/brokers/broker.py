@@ -1,4 +1,8 @@
 """Defines the base broker class"""
+import errno
+import logging
+import os
+import time
 from abc import ABCMeta
 from collections import namedtuple
 
@@ -13,6 +17,45 @@ FileMove = namedtuple('FileMove', ['file', 'new_path'])
 FileUpload = namedtuple('FileUpload', ['file', 'local_path'])
 FileDetails = namedtuple('FileDetails', ['file', 'size'])
 
+logger = logging.getLogger(__name__)
+
+
+def link_files(volume_path, file_downloads):
+    """Downloads the given files by creating a symbolic link at each local path to the file's location in the mounted
+    volume. The existence of every file is checked before any link is created, and the links are created in-process
+    instead of spawning a command for each file.
+
+    :param volume_path: Absolute path to the local container location onto which the volume file system was mounted
+    :type volume_path: string
+    :param file_downloads: List of files to download
+    :type file_downloads: [:class:`storage.brokers.broker.FileDownload`]
+
+    :raises :class:`storage.exceptions.MissingFile`: If a file to download does not exist at the expected path
+    """
+
+    # Imported here since storage.exceptions loads the error models, and this module is imported while apps load
+    from storage.exceptions import MissingFile
+
+    started = time.time()
+    links = []  # [(Path to file in volume, local path, file name)]
+    for file_download in file_downloads:
+        path_to_download = os.path.join(volume_path, file_download.file.file_path)
+        try:
+            os.stat(path_to_download)
+        except OSError as ex:
+            if ex.errno in (errno.ENOENT, errno.ENOTDIR):
+                raise MissingFile(file_download.file.file_name)
+            raise
+        links.append((path_to_download, file_download.local_path, file_download.file.file_name))
+
+    for path_to_download, local_path, file_name in links:
+        link_started = time.time()
+        os.symlink(path_to_download, local_path)
+        logger.debug('Created link %s -> %s in %.3fs', local_path, path_to_download, time.time() - link_started)
+
+    if links:
+        logger.info('Linked %d file(s) from %s in %.3fs', len(links), volume_path, time.time() - started)
+
 
 class Broker(object):
     """Abstract class for a broker that can download and upload files for a given storage backend
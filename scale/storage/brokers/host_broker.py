@@ -5,10 +5,9 @@ import logging
 import os
 import shutil
 
-from storage.brokers.broker import Broker, BrokerVolume, FileDetails
+from storage.brokers.broker import Broker, BrokerVolume, FileDetails, link_files
 from storage.brokers.exceptions import InvalidBrokerConfiguration
 from storage.exceptions import MissingFile
-from util.command import execute_command_line
 from util.os_helper import makedirs
 
 logger = logging.getLogger(__name__)
@@ -43,16 +42,8 @@ class HostBroker(Broker):
         """See :meth:`storage.brokers.broker.Broker.download_files`
         """
 
-        for file_download in file_downloads:
-            path_to_download = os.path.join(volume_path, file_download.file.file_path)
-
-            logger.info('Checking path %s', path_to_download)
-            if not os.path.exists(path_to_download):
-                raise MissingFile(file_download.file.file_name)
-
-            # Create symlink to the file in the host mount
-            logger.info('Creating link %s -> %s', file_download.local_path, path_to_download)
-            execute_command_line(['ln', '-s', path_to_download, file_download.local_path])
+        # Create symlinks to the files in the host mount
+        link_files(volume_path, file_downloads)
 
     def get_file_system_paths(self, volume_path, files):
         """See :meth:`storage.brokers.broker.Broker.get_file_system_paths`
@@ -5,7 +5,7 @@ import logging
 import os
 import shutil
 
-from storage.brokers.broker import Broker, BrokerVolume
+from storage.brokers.broker import Broker, BrokerVolume, link_files
 from storage.brokers.exceptions import InvalidBrokerConfiguration
 from storage.exceptions import MissingFile
 from util.command import execute_command_line
@@ -44,16 +44,8 @@ class NfsBroker(Broker):
         """See :meth:`storage.brokers.broker.Broker.download_files`
         """
 
-        for file_download in file_downloads:
-            path_to_download = os.path.join(volume_path, file_download.file.file_path)
-
-            logger.info('Checking path %s', path_to_download)
-            if not os.path.exists(path_to_download):
-                raise MissingFile(file_download.file.file_name)
-
-            # Create symlink to the file in the host mount
-            logger.info('Creating link %s -> %s', file_download.local_path, path_to_download)
-            execute_command_line(['ln', '-s', path_to_download, file_download.local_path])
+        # Create symlinks to the files in the host mount
+        link_files(volume_path, file_downloads)
 
     def get_file_system_paths(self, volume_path, files):
         """See :meth:`storage.brokers.broker.Broker.get_file_system_paths`
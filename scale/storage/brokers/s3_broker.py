@@ -2,18 +2,16 @@
 from __future__ import unicode_literals
 
 import logging
-import os
 import ssl
 import time
 
 from botocore.exceptions import ClientError, NoCredentialsError
 
 import storage.settings as settings
-from storage.brokers.broker import Broker, BrokerVolume
+from storage.brokers.broker import Broker, BrokerVolume, link_files
 from storage.brokers.exceptions import InvalidBrokerConfiguration
 from storage.exceptions import MissingFile
 from util.aws import S3Client, AWSClient
-from util.command import execute_command_line
 from util.exceptions import FileDoesNotExist
 from util.validation import ValidationWarning
 
@@ -49,22 +47,23 @@ class S3Broker(Broker):
     def download_files(self, volume_path, file_downloads):
         """See :meth:`storage.brokers.broker.Broker.download_files`"""
 
-        with S3Client(self._credentials, self._region_name) as client:
-            for file_download in file_downloads:
-                # If file supports partial mount and volume is configured attempt sym-link
-                if file_download.partial and self._volume:
-                    logger.debug('Partial S3 file accessed by mounted bucket.')
-                    path_to_download = os.path.join(volume_path, file_download.file.file_path)
-
-                    logger.info('Checking path %s', path_to_download)
-                    if not os.path.exists(path_to_download):
-                        raise MissingFile(file_download.file.file_name)
-
-                    # Create symlink to the file in the host mount
-                    logger.info('Creating link %s -> %s', file_download.local_path, path_to_download)
-                    execute_command_line(['ln', '-s', path_to_download, file_download.local_path])
-                # Fall-back to default S3 file download
-                else:
+        # If a file supports partial mount and the volume is configured, sym-link to the mounted bucket
+        partial_downloads = []
+        full_downloads = []
+        for file_download in file_downloads:
+            if file_download.partial and self._volume:
+                partial_downloads.append(file_download)
+            else:
+                full_downloads.append(file_download)
+
+        if partial_downloads:
+            logger.debug('Partial S3 files accessed by mounted bucket.')
+            link_files(volume_path, partial_downloads)
+
+        # Fall-back to default S3 file download
+        if full_downloads:
+            with S3Client(self._credentials, self._region_name) as client:
+                for file_download in full_downloads:
                     try:
                         s3_object = client.get_object(self._bucket_name, file_download.file.file_path)
                     except FileDoesNotExist:
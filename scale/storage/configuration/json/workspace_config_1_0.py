@@ -3,11 +3,11 @@ from __future__ import unicode_literals
 
 import logging
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from storage.configuration.workspace_configuration import WorkspaceConfiguration
 from storage.configuration.exceptions import InvalidWorkspaceConfiguration
+from util.schema import SchemaValidator
 
 logger = logging.getLogger(__name__)
 
@@ -37,6 +37,8 @@ WORKSPACE_CONFIGURATION_SCHEMA = {
     },
 }
 
+WORKSPACE_CONFIGURATION_VALIDATOR = SchemaValidator('storage.configuration.json.workspace_config_1_0', WORKSPACE_CONFIGURATION_SCHEMA)
+
 
 class WorkspaceConfigurationV1(object):
     """Represents the schema for a workspace configuration"""
@@ -58,7 +60,7 @@ class WorkspaceConfigurationV1(object):
 
         try:
             if do_validate:
-                validate(configuration, WORKSPACE_CONFIGURATION_SCHEMA)
+                WORKSPACE_CONFIGURATION_VALIDATOR.validate(configuration)
                 config.validate_broker()
         except ValidationError as validation_error:
             raise InvalidWorkspaceConfiguration('INVALID_CONFIGURATION', validation_error)
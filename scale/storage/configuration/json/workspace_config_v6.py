@@ -1,12 +1,12 @@
 """Manages the v6 job configuration schema"""
 from __future__ import unicode_literals
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 from storage.configuration.workspace_configuration import WorkspaceConfiguration
 from storage.configuration.exceptions import InvalidWorkspaceConfiguration
 from storage.configuration.json.workspace_config_1_0 import WorkspaceConfigurationV1
+from util.schema import SchemaValidator
 
 
 SCHEMA_VERSION = '7'
@@ -36,6 +36,9 @@ WORKSPACE_CONFIGURATION_SCHEMA = {
     },
 }
 
+WORKSPACE_CONFIGURATION_VALIDATOR = SchemaValidator('storage.configuration.json.workspace_config_v6', WORKSPACE_CONFIGURATION_SCHEMA)
+
+
 def convert_config_to_v6_json(config, sanitize=True):
     """Returns the v6 workspace configuration JSON for the given configuration
 
@@ -83,7 +86,7 @@ class WorkspaceConfigurationV6(object):
 
         try:
             if do_validate:
-                validate(self._config, WORKSPACE_CONFIGURATION_SCHEMA)
+                WORKSPACE_CONFIGURATION_VALIDATOR.validate(self._config)
                 config.validate_broker()
         except ValidationError as ex:
             raise InvalidWorkspaceConfiguration('INVALID_CONFIGURATION', 'Invalid configuration: %s' % unicode(ex))
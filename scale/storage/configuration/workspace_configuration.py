@@ -1,7 +1,6 @@
 """Defines the configuration for a storage Workspace"""
 from __future__ import unicode_literals
 
-from jsonschema import validate
 from jsonschema.exceptions import ValidationError
 
 import storage.brokers.factory as broker_factory
@@ -0,0 +1,122 @@
+"""Defines the command line method for benchmarking file name searches with and without a trigram index"""
+from __future__ import unicode_literals
+from __future__ import print_function
+
+import hashlib
+import random
+import time
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+
+# The synthetic table, shaped like the file name column of scale_file
+TABLE = 'benchmark_file_search'
+# The rows are inserted in batches of this size
+BATCH_SIZE = 1000000
+# The queries made by the files view for file name searches and similarity searches
+SEARCH_SQL = 'SELECT count(*) FROM %s WHERE UPPER(file_name::text) LIKE UPPER(%%s)' % TABLE
+SIMILAR_SQL = ('SELECT id, similarity(UPPER(file_name), %%s) AS rank FROM %s WHERE UPPER(file_name) %%%% %%s '
+               'ORDER BY rank DESC, id LIMIT 100' % TABLE)
+
+
+def _get_file_name(number):
+    """Returns the synthetic file name of the given row, matching the names generated in the database
+
+    :param number: The row number
+    :type number: int
+    :returns: The file name
+    :rtype: string
+    """
+
+    return 'product_%d_%s.tif' % (number % 50, hashlib.md5(('%d' % number).encode('utf-8')).hexdigest())
+
+
+class Command(BaseCommand):
+    """Command that benchmarks searching a large synthetic table of file names by substring and by similarity, without
+    an index and with a GIN trigram index on UPPER(file_name) like the one on scale_file
+    """
+
+    help = 'Benchmarks file name searches on a large synthetic table with and without a trigram index'
+
+    def add_arguments(self, parser):
+        parser.add_argument('-r', '--rows', action='store', type=int, default=10000000,
+                            help='Number of synthetic file rows')
+        parser.add_argument('-q', '--queries', action='store', type=int, default=20,
+                            help='Number of random searches of each kind')
+
+    def handle(self, *args, **options):
+        """See :meth:`django.core.management.base.BaseCommand.handle`.
+
+        This method creates the synthetic table, times the searches before and after indexing and drops the table.
+        """
+
+        num_rows = options['rows']
+        rand = random.Random(0)
+        searches = []
+        similar_searches = []
+        for _ in range(options['queries']):
+            file_name = _get_file_name(rand.randint(1, num_rows))
+            start = rand.randint(10, len(file_name) - 12)
+            searches.append(file_name[start:start + 8])
+            # A name with one character changed, as if mistyped
+            typo = rand.randint(0, len(file_name) - 1)
+            similar_searches.append((file_name[:typo] + 'x' + file_name[typo + 1:]).upper())
+
+        with connection.cursor() as cursor:
+            try:
+                self._create_table(cursor, num_rows)
+                self._time_queries(cursor, 'none', searches, similar_searches)
+                started = time.time()
+                cursor.execute('CREATE INDEX %s_trgm ON %s USING gin (UPPER(file_name) gin_trgm_ops)' % (TABLE, TABLE))
+                build_time = time.time() - started
+                cursor.execute('ANALYZE %s' % TABLE)
+                cursor.execute('SELECT pg_relation_size(%s)', ['%s_trgm' % TABLE])
+                print('Trigram index built in %.1f seconds, %.1f MiB' % (build_time, cursor.fetchone()[0] / 1048576.0))
+                self._time_queries(cursor, 'trgm', searches, similar_searches)
+            finally:
+                cursor.execute('DROP TABLE IF EXISTS %s' % TABLE)
+
+    def _create_table(self, cursor, num_rows):
+        """Creates the synthetic table of file names
+
+        :param cursor: The database cursor
+        :type cursor: :class:`django.db.backends.utils.CursorWrapper`
+        :param num_rows: The number of rows
+        :type num_rows: int
+        """
+
+        cursor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+        cursor.execute('DROP TABLE IF EXISTS %s' % TABLE)
+        cursor.execute('CREATE UNLOGGED TABLE %s (id bigint PRIMARY KEY, file_name varchar(250) NOT NULL)' % TABLE)
+        started = time.time()
+        for batch_first in range(1, num_rows + 1, BATCH_SIZE):
+            batch_last = min(batch_first + BATCH_SIZE - 1, num_rows)
+            cursor.execute('INSERT INTO %s SELECT g, \'product_\' || (g %%%% 50) || \'_\' || md5(g::text) || \'.tif\' '
+                           'FROM generate_series(%%s, %%s) g' % TABLE, [batch_first, batch_last])
+        cursor.execute('ANALYZE %s' % TABLE)
+        print('Created %d rows in %.1f seconds' % (num_rows, time.time() - started))
+
+    def _time_queries(self, cursor, name, searches, similar_searches):
+        """Times the given substring and similarity searches and prints the results
+
+        :param cursor: The database cursor
+        :type cursor: :class:`django.db.backends.utils.CursorWrapper`
+        :param name: The name of the index being used
+        :type name: string
+        :param searches: The substrings to search for
+        :type searches: :func:`list`
+        :param similar_searches: The upper case file names to search for similar names
+        :type similar_searches: :func:`list`
+        """
+
+        for kind, sql, queries in [('substring', SEARCH_SQL, [['%%%s%%' % search] for search in searches]),
+                                   ('similarity', SIMILAR_SQL, [[search, search] for search in similar_searches])]:
+            durations = []
+            for params in queries:
+                started = time.time()
+                cursor.execute(sql, params)
+                cursor.fetchall()
+                durations.append(time.time() - started)
+            durations.sort()
+            print('%-4s %-10s search: median %9.2f ms  max %9.2f ms' %
+                  (name, kind, durations[len(durations) // 2] * 1000.0, durations[-1] * 1000.0))
@@ -10,7 +10,9 @@ from django.utils import timezone
 from job.messages.purge_jobs import create_purge_jobs_messages
 from messaging.messages.message import CommandMessage
 from product.models import FileAncestryLink
+from source.messages.purge_source_file import create_purge_source_file_message
 from storage.models import PurgeResults, ScaleFile
+from storage.purge import claim_purge_continuation, has_purge_started
 
 # This is the maximum number of file models that can fit in one message. This maximum ensures that every message of this
 # type is less than 25 KiB long.
@@ -129,17 +131,31 @@ class DeleteFiles(CommandMessage):
         files_to_delete = ScaleFile.objects.filter(id__in=self._file_ids)
 
         if self.purge:
-            FileAncestryLink.objects.filter(descendant__in=files_to_delete).delete()
-            files_to_delete.delete()
-
-            # Update results
-            PurgeResults.objects.filter(trigger_event=self.trigger_id).update(
-                num_products_deleted = F('num_products_deleted') + len(self._file_ids))
-
-            # Kick off purge_jobs for the given job_id
-            self.new_messages.extend(create_purge_jobs_messages(purge_job_ids=[self.job_id],
-                                                                trigger_id=self.trigger_id,
-                                                                source_file_id=self.source_file_id))
+            with transaction.atomic():
+                # Lock the purge so that only the message that deletes its last product files continues it
+                results = PurgeResults.objects.select_for_update().get(trigger_event=self.trigger_id)
+                FileAncestryLink.objects.filter(descendant__in=files_to_delete).delete()
+                files_to_delete.delete()
+
+                # Update results
+                PurgeResults.objects.filter(id=results.id).update(
+                    num_products_deleted = F('num_products_deleted') + len(self._file_ids))
+
+                chain_token = None
+                is_engine_purge = has_purge_started(self.trigger_id)
+                if is_engine_purge:
+                    chain_token = claim_purge_continuation(results)
+
+            if not is_engine_purge:
+                # Kick off purge_jobs for the given job_id
+                self.new_messages.extend(create_purge_jobs_messages(purge_job_ids=[self.job_id],
+                                                                    trigger_id=self.trigger_id,
+                                                                    source_file_id=self.source_file_id))
+            elif chain_token:
+                # Continue the purge now that its product files are gone
+                self.new_messages.append(create_purge_source_file_message(source_file_id=self.source_file_id,
+                                                                          trigger_id=self.trigger_id,
+                                                                          chain_token=chain_token))
         else:
             files_to_delete.update(is_deleted=True, deleted=when, is_published=False, unpublished=when)
 
@@ -0,0 +1,50 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('storage', '0019_optional_description'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='PurgeCheckpoint',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('step', models.CharField(max_length=50)),
+                ('last_id', models.IntegerField(default=0)),
+                ('num_processed', models.PositiveIntegerField(default=0)),
+                ('completed', models.DateTimeField(blank=True, null=True)),
+                ('last_modified', models.DateTimeField(auto_now=True)),
+                ('purge', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, to='storage.PurgeResults')),
+            ],
+            options={
+                'db_table': 'purge_checkpoint',
+            },
+        ),
+        migrations.CreateModel(
+            name='PurgeLineageRecord',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('model_type', models.CharField(max_length=1)),
+                ('model_id', models.IntegerField()),
+                ('purge', models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, to='storage.PurgeResults')),
+            ],
+            options={
+                'db_table': 'purge_lineage_record',
+            },
+        ),
+        migrations.AlterUniqueTogether(
+            name='purgecheckpoint',
+            unique_together=set([('purge', 'step')]),
+        ),
+        migrations.AlterUniqueTogether(
+            name='purgelineagerecord',
+            unique_together=set([('purge', 'model_type', 'model_id')]),
+        ),
+    ]
@@ -0,0 +1,25 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    # The index is built concurrently so that the scale_file table stays writable, which cannot run in a transaction
+    atomic = False
+
+    dependencies = [
+        ('storage', '0020_purge_checkpoint'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        # Case-insensitive file name searches compare UPPER(file_name), so the index is on that expression
+        migrations.RunSQL(
+            sql='CREATE INDEX CONCURRENTLY IF NOT EXISTS scale_file_file_name_upper_trgm ON scale_file '
+                'USING gin (UPPER(file_name) gin_trgm_ops)',
+            reverse_sql='DROP INDEX IF EXISTS scale_file_file_name_upper_trgm',
+        ),
+    ]
@@ -0,0 +1,37 @@
+# -*- coding: utf-8 -*-
+from __future__ import unicode_literals
+
+from django.db import migrations, models
+from django.utils import timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('storage', '0021_file_name_trigram_index'),
+    ]
+
+    def mark_legacy_purges(apps, schema_editor):
+        # Purges still running under the purge_jobs and purge_recipe messages are marked so that they finish with those
+        # messages instead of being picked up by the purge engine part way through
+        PurgeCheckpoint = apps.get_model('storage', 'PurgeCheckpoint')
+        PurgeResults = apps.get_model('storage', 'PurgeResults')
+
+        when = timezone.now()
+        purges = PurgeResults.objects.filter(purge_completed__isnull=True, purgecheckpoint__isnull=True)
+        checkpoints = [PurgeCheckpoint(purge_id=purge_id, step='legacy', completed=when)
+                       for purge_id in purges.values_list('id', flat=True)]
+        PurgeCheckpoint.objects.bulk_create(checkpoints)
+
+    def unmark_legacy_purges(apps, schema_editor):
+        PurgeCheckpoint = apps.get_model('storage', 'PurgeCheckpoint')
+        PurgeCheckpoint.objects.filter(step='legacy').delete()
+
+    operations = [
+        migrations.AddField(
+            model_name='purgecheckpoint',
+            name='chain_token',
+            field=models.CharField(blank=True, max_length=32, null=True),
+        ),
+        migrations.RunPython(mark_legacy_purges, unmark_legacy_purges),
+    ]
@@ -5,15 +5,21 @@ import hashlib
 import logging
 import os
 import re
+import time
 from collections import namedtuple
+from functools import partial
+from multiprocessing.pool import ThreadPool
 
 import django.contrib.gis.db.models as models
 import django.contrib.gis.geos as geos
 import django.utils.timezone as timezone
 import django.contrib.postgres.fields
-from django.db import transaction
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db import connection, transaction
+from django.db.models.functions import Upper
 
 import storage.geospatial_utils as geospatial_utils
+import storage.settings as storage_settings
 from storage.brokers.factory import get_broker
 from storage.configuration.workspace_configuration import WorkspaceConfiguration
 from storage.configuration.exceptions import InvalidWorkspaceConfiguration
@@ -190,6 +196,67 @@ class PurgeResults(models.Model):
         db_table = 'purge_results'
 
 
+class PurgeCheckpoint(models.Model):
+    """Represents the progress of one step of a purge operation, allowing an interrupted purge to resume where it left
+    off
+
+    :keyword purge: The purge operation this checkpoint belongs to
+    :type purge: :class:`django.db.models.ForeignKey`
+    :keyword step: The name of the purge step
+    :type step: :class:`django.db.models.CharField`
+    :keyword last_id: The highest lineage model ID processed by this step so far
+    :type last_id: :class:`django.db.models.IntegerField`
+    :keyword num_processed: The number of rows inserted, updated, or deleted by this step so far
+    :type num_processed: :class:`django.db.models.PositiveIntegerField`
+    :keyword completed: When this step completed, possibly None
+    :type completed: :class:`django.db.models.DateTimeField`
+    :keyword chain_token: The token of the only message that may continue the purge, kept on the checkpoint of the
+        lineage step. None while the purge waits for its product files to be deleted.
+    :type chain_token: :class:`django.db.models.CharField`
+    :keyword last_modified: When the checkpoint was last modified
+    :type last_modified: :class:`django.db.models.DateTimeField`
+    """
+
+    purge = models.ForeignKey('storage.PurgeResults', on_delete=models.PROTECT)
+    step = models.CharField(max_length=50)
+    last_id = models.IntegerField(default=0)
+    num_processed = models.PositiveIntegerField(default=0)
+    completed = models.DateTimeField(blank=True, null=True)
+    chain_token = models.CharField(blank=True, max_length=32, null=True)
+    last_modified = models.DateTimeField(auto_now=True)
+
+    class Meta(object):
+        """meta information for the db"""
+        db_table = 'purge_checkpoint'
+        unique_together = ('purge', 'step')
+
+
+class PurgeLineageRecord(models.Model):
+    """Represents one model in the lineage of a source file that is being purged. The full lineage is computed when the
+    purge starts so that it can be deleted in ordered chunks.
+
+    :keyword purge: The purge operation this record belongs to
+    :type purge: :class:`django.db.models.ForeignKey`
+    :keyword model_type: The type of the lineage model, one of FILE_TYPE, JOB_TYPE, or RECIPE_TYPE
+    :type model_type: :class:`django.db.models.CharField`
+    :keyword model_id: The ID of the lineage model
+    :type model_id: :class:`django.db.models.IntegerField`
+    """
+
+    FILE_TYPE = 'F'
+    JOB_TYPE = 'J'
+    RECIPE_TYPE = 'R'
+
+    purge = models.ForeignKey('storage.PurgeResults', on_delete=models.PROTECT)
+    model_type = models.CharField(max_length=1)
+    model_id = models.IntegerField()
+
+    class Meta(object):
+        """meta information for the db"""
+        db_table = 'purge_lineage_record'
+        unique_together = ('purge', 'model_type', 'model_id')
+
+
 class ScaleFileManager(models.Manager):
     """Provides additional methods for handling Scale files
     """
@@ -251,11 +318,24 @@ class ScaleFileManager(models.Manager):
                 wp_dict[workspace.id] = (workspace, wp_list)
             wp_list.append(file_download)
 
-        # Download files for each workspace
-        for wp_id in wp_dict:
-            workspace = wp_dict[wp_id][0]
-            wp_file_downloads = wp_dict[wp_id][1]
-            workspace.download_files(wp_file_downloads)
+        # Download files for each workspace, downloading from multiple workspaces concurrently
+        started = time.time()
+        workspace_downloads = list(wp_dict.values())
+        num_workers = min(len(workspace_downloads), storage_settings.DOWNLOAD_WORKSPACE_WORKERS)
+        if num_workers > 1:
+            pool = ThreadPool(num_workers)
+            try:
+                pool.map(partial(self._download_workspace_files, in_thread=True), workspace_downloads)
+            finally:
+                pool.close()
+                pool.join()
+        else:
+            for workspace_download in workspace_downloads:
+                self._download_workspace_files(workspace_download)
+
+        if workspace_downloads:
+            logger.info('Downloaded %d file(s) from %d workspace(s) in %.3fs', len(file_downloads),
+                        len(workspace_downloads), time.time() - started)
 
     def get_details(self, file_id):
         """Returns the file for the given ID with all detail fields included.
@@ -273,6 +353,27 @@ class ScaleFileManager(models.Manager):
 
         return scale_file
 
+    def get_details_for_ids(self, file_ids):
+        """Returns the files for the given IDs with all detail fields included, retrieving the files and their related
+        models in bulk
+
+        :param file_ids: The file IDs
+        :type file_ids: :func:`list`
+        :returns: The files with all detail fields included, stored by ID
+        :rtype: dict
+        """
+
+        if not file_ids:
+            return {}
+
+        files = self.filter(id__in=file_ids)
+        files = files.select_related('workspace', 'job_type', 'job', 'job_exe', 'recipe', 'recipe_type', 'batch')
+        files = files.defer('workspace__json_config', 'job__input', 'job__output', 'job_exe__configuration',
+                            'job_type__configuration', 'recipe__input', 'recipe_type__definition',
+                            'batch__definition')
+        files = files.prefetch_related('countries')
+        return {scale_file.id: scale_file for scale_file in files}
+
     def filter_files_v6(self, started=None, ended=None, time_field=None, file_name=None):
         """Returns a query for Scale files that is filtered on the given fields.
 
@@ -326,7 +427,7 @@ class ScaleFileManager(models.Manager):
                         source_tasks=None, mod_started=None, mod_ended=None, job_type_ids=None, job_type_names=None,
                         job_ids=None, is_published=None, is_superseded=None, file_names=None, file_name_search=None,
                         job_outputs=None, recipe_ids=None, recipe_type_ids=None, recipe_nodes=None, batch_ids=None, 
-                        order=None, countries=None, file_type=None, media_type=None):
+                        order=None, countries=None, file_type=None, media_type=None, file_name_similar=None):
         """Returns a query for product models that filters on the given fields. The returned query includes the related
         workspace, job_type, and job fields, except for the workspace.json_config field. The related countries are set
         to be pre-fetched as part of the query.
@@ -387,6 +488,9 @@ class ScaleFileManager(models.Manager):
         :type file_type: :func:`list`
         :param media_type: Media/Content/Mime type.
         :type media_type: :func:`list`
+        :param file_name_similar: Query files with a file name similar to the given string, ranked by similarity if no
+            order is given.
+        :type file_name_similar: string
         :returns: The product file query
         :rtype: :class:`django.db.models.QuerySet`
         """
@@ -453,7 +557,14 @@ class ScaleFileManager(models.Manager):
         if file_names:
             files = files.filter(file_name__in=file_names)
         if file_name_search:
+            # Case-insensitive containment compares UPPER(file_name), which has a trigram index
             files = files.filter(file_name__icontains=file_name_search)
+        if file_name_similar:
+            # The trigram similarity operator can also use the UPPER(file_name) trigram index
+            files = files.annotate(upper_file_name=Upper('file_name'),
+                                   file_name_similarity=TrigramSimilarity(Upper('file_name'),
+                                                                          file_name_similar.upper()))
+            files = files.filter(upper_file_name__trigram_similar=file_name_similar.upper())
         if job_outputs:
             files = files.filter(job_output__in=job_outputs)
         if recipe_ids:
@@ -469,6 +580,8 @@ class ScaleFileManager(models.Manager):
         if order:
             ordering = alphabetize(order, ScaleFile.ALPHABETIZE_FIELDS)
             files = files.order_by(*ordering)
+        elif file_name_similar:
+            files = files.order_by('-file_name_similarity', 'id')
         else:
             files = files.order_by('last_modified')
 
@@ -574,6 +687,25 @@ class ScaleFileManager(models.Manager):
 
         return file_list
 
+    def _download_workspace_files(self, workspace_download, in_thread=False):
+        """Downloads the given files from a single workspace
+
+        :param workspace_download: The workspace and the list of files to download from it
+        :type workspace_download: tuple
+        :param in_thread: Whether this is called from a worker thread, whose database connection is then closed
+        :type in_thread: bool
+        """
+
+        workspace, file_downloads = workspace_download
+        started = time.time()
+        try:
+            workspace.download_files(file_downloads)
+        finally:
+            if in_thread:
+                connection.close()
+        logger.info('Downloaded %d file(s) from workspace %s in %.3fs', len(file_downloads), workspace.name,
+                    time.time() - started)
+
 
 class ScaleFile(models.Model):
     """Represents a file that is stored within a Scale workspace
@@ -863,6 +995,7 @@ class ScaleFile(models.Model):
     class Meta(object):
         """meta information for the db"""
         db_table = 'scale_file'
+        # A GIN trigram index on UPPER(file_name) is created by migration 0021 since Django cannot declare it here
 
 WorkspaceValidation = namedtuple('WorkspaceValidation', ['is_valid', 'errors', 'warnings'])
 
@@ -0,0 +1,395 @@
+"""Defines the engine that purges the lineage of a source file from Scale in ordered, size-bounded chunks"""
+from __future__ import unicode_literals
+
+import logging
+import uuid
+from collections import namedtuple
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.db.models import F
+from django.utils import timezone
+
+from ingest.models import Ingest
+from job.models import JobStatusCounter
+from storage.models import PurgeCheckpoint, PurgeLineageRecord, PurgeResults, ScaleFile
+
+
+logger = logging.getLogger(__name__)
+
+LEGACY_STEP = 'legacy'
+LINEAGE_STEP = 'lineage'
+DELETE_PRODUCTS_STEP = 'delete_products'
+
+# Computes the full lineage of a source file in one recursive query: every job and recipe that consumed a file in the
+# lineage, every product of those jobs, the recipes containing those jobs or sub-recipes (and everything within them),
+# and any superseded jobs and recipes. Each lineage model is expanded with lookups on the indexed columns of the tables
+# that link it to other models, and only the lookups for the model's own type are run. The resulting models are stored
+# as the lineage records of the purge.
+LINEAGE_SQL = """
+INSERT INTO purge_lineage_record (purge_id, model_type, model_id)
+WITH RECURSIVE lineage (model_type, model_id) AS (
+    SELECT 'F'::text, %(source_file_id)s
+  UNION
+    SELECT edge.model_type, edge.model_id
+    FROM lineage CROSS JOIN LATERAL (
+        SELECT 'J'::text AS model_type, job_id AS model_id FROM job_input_file
+        WHERE lineage.model_type = 'F' AND input_file_id = lineage.model_id
+      UNION ALL
+        SELECT 'R', recipe_id FROM recipe_input_file
+        WHERE lineage.model_type = 'F' AND input_file_id = lineage.model_id
+      UNION ALL
+        SELECT 'F', id FROM scale_file
+        WHERE lineage.model_type = 'J' AND job_id = lineage.model_id
+      UNION ALL
+        SELECT 'J', superseded_job_id FROM job
+        WHERE lineage.model_type = 'J' AND id = lineage.model_id AND superseded_job_id IS NOT NULL
+      UNION ALL
+        SELECT 'R', recipe_id FROM recipe_node
+        WHERE lineage.model_type = 'J' AND job_id = lineage.model_id
+      UNION ALL
+        SELECT 'J', job_id FROM recipe_node
+        WHERE lineage.model_type = 'R' AND recipe_id = lineage.model_id AND job_id IS NOT NULL
+      UNION ALL
+        SELECT 'R', sub_recipe_id FROM recipe_node
+        WHERE lineage.model_type = 'R' AND recipe_id = lineage.model_id AND sub_recipe_id IS NOT NULL
+      UNION ALL
+        SELECT 'R', recipe_id FROM recipe_node
+        WHERE lineage.model_type = 'R' AND sub_recipe_id = lineage.model_id
+      UNION ALL
+        SELECT 'R', superseded_recipe_id FROM recipe
+        WHERE lineage.model_type = 'R' AND id = lineage.model_id AND superseded_recipe_id IS NOT NULL
+    ) edge
+)
+SELECT %(purge_id)s, model_type, model_id FROM lineage
+"""
+
+PurgeStep = namedtuple('PurgeStep', ['name', 'model_type', 'unlink_sql', 'sql', 'results_field'])
+
+# These steps remove every reference to the lineage's product files, so they must run before the products are deleted
+REFERENCE_STEPS = [
+    PurgeStep('file_ancestry_link', PurgeLineageRecord.JOB_TYPE, [],
+              'DELETE FROM file_ancestry_link WHERE job_id = ANY(%(ids)s) OR ancestor_job_id = ANY(%(ids)s)', None),
+    PurgeStep('job_input_file', PurgeLineageRecord.JOB_TYPE, [],
+              'DELETE FROM job_input_file WHERE job_id = ANY(%(ids)s)', None),
+    PurgeStep('recipe_input_file', PurgeLineageRecord.RECIPE_TYPE, [],
+              'DELETE FROM recipe_input_file WHERE recipe_id = ANY(%(ids)s)', None),
+]
+
+# These steps remove the lineage's jobs and recipes once all of the products have been deleted. The job and recipe
+# steps clear the references to each chunk of jobs or recipes in the same transaction that deletes them.
+MODEL_STEPS = [
+    PurgeStep('task_update', PurgeLineageRecord.JOB_TYPE, [],
+              'DELETE FROM task_update WHERE job_exe_id IN (SELECT id FROM job_exe WHERE job_id = ANY(%(ids)s))', None),
+    PurgeStep('job_exe_output', PurgeLineageRecord.JOB_TYPE, [],
+              'DELETE FROM job_exe_output WHERE job_id = ANY(%(ids)s)', None),
+    PurgeStep('job_exe_end', PurgeLineageRecord.JOB_TYPE, [],
+              'DELETE FROM job_exe_end WHERE job_id = ANY(%(ids)s)', None),
+    PurgeStep('job_exe', PurgeLineageRecord.JOB_TYPE, [],
+              'DELETE FROM job_exe WHERE job_id = ANY(%(ids)s)', None),
+    PurgeStep('queue', PurgeLineageRecord.JOB_TYPE, [],
+              'DELETE FROM queue WHERE job_id = ANY(%(ids)s)', None),
+    PurgeStep('recipe_node', PurgeLineageRecord.RECIPE_TYPE, [],
+              'DELETE FROM recipe_node WHERE recipe_id = ANY(%(ids)s)', None),
+    PurgeStep('recipe_condition', PurgeLineageRecord.RECIPE_TYPE, [],
+              'DELETE FROM recipe_condition WHERE recipe_id = ANY(%(ids)s) OR root_recipe_id = ANY(%(ids)s)', None),
+    PurgeStep('job', PurgeLineageRecord.JOB_TYPE,
+              ['UPDATE job SET superseded_job_id = NULL WHERE superseded_job_id = ANY(%(ids)s)',
+               'UPDATE job SET root_superseded_job_id = NULL WHERE root_superseded_job_id = ANY(%(ids)s)'],
+              'DELETE FROM job WHERE id = ANY(%(ids)s)', 'num_jobs_deleted'),
+    PurgeStep('recipe', PurgeLineageRecord.RECIPE_TYPE,
+              ['UPDATE job SET recipe_id = NULL WHERE recipe_id = ANY(%(ids)s)',
+               'UPDATE job SET root_recipe_id = NULL WHERE root_recipe_id = ANY(%(ids)s)',
+               'UPDATE recipe SET superseded_recipe_id = NULL WHERE superseded_recipe_id = ANY(%(ids)s)',
+               'UPDATE recipe SET root_superseded_recipe_id = NULL WHERE root_superseded_recipe_id = ANY(%(ids)s)',
+               'UPDATE recipe SET recipe_id = NULL WHERE recipe_id = ANY(%(ids)s)',
+               'UPDATE recipe SET root_recipe_id = NULL WHERE root_recipe_id = ANY(%(ids)s)'],
+              'DELETE FROM recipe WHERE id = ANY(%(ids)s)', 'num_recipes_deleted'),
+]
+
+
+def claim_purge_continuation(results):
+    """Claims the continuation of the given purge for a message that deleted some of its product files. The purge is
+    only claimed if it is waiting for its product files to be deleted and none of them remain, so exactly one of the
+    messages that delete the product files continues the purge. The caller must hold a lock on the purge results in the
+    transaction that deleted the files.
+
+    :param results: The locked results of the purge operation
+    :type results: :class:`storage.models.PurgeResults`
+    :returns: The chain token for the message that continues the purge, or None if the purge should not be continued
+    :rtype: string
+    """
+
+    if results.force_stop_purge or results.purge_completed:
+        return None
+
+    chain = PurgeCheckpoint.objects.filter(purge_id=results.id, step=LINEAGE_STEP).first()
+    if not chain or chain.chain_token or _has_products(results.id):
+        return None
+
+    chain.chain_token = _new_chain_token()
+    chain.save()
+    return chain.chain_token
+
+
+def has_purge_started(trigger_id):
+    """Indicates whether the purge for the given trigger event has computed its lineage and is being run by the purge
+    engine
+
+    :param trigger_id: The trigger event ID for the purge operation
+    :type trigger_id: int
+    :returns: True if the purge engine is running the purge, False otherwise
+    :rtype: bool
+    """
+
+    return PurgeCheckpoint.objects.filter(purge__trigger_event_id=trigger_id, step=LINEAGE_STEP).exists()
+
+
+def is_legacy_purge(trigger_id):
+    """Indicates whether the purge for the given trigger event was started before the purge engine existed and must
+    finish with the purge_jobs and purge_recipe messages it started with
+
+    :param trigger_id: The trigger event ID for the purge operation
+    :type trigger_id: int
+    :returns: True if the purge is a legacy purge, False otherwise
+    :rtype: bool
+    """
+
+    return PurgeCheckpoint.objects.filter(purge__trigger_event_id=trigger_id, step=LEGACY_STEP).exists()
+
+
+def _has_products(purge_id):
+    """Indicates whether any product files of the lineage's jobs still exist
+
+    :param purge_id: The ID of the purge results
+    :type purge_id: int
+    :returns: True if any product files still exist, False otherwise
+    :rtype: bool
+    """
+
+    job_ids = PurgeLineageRecord.objects.filter(purge_id=purge_id,
+                                                model_type=PurgeLineageRecord.JOB_TYPE).values('model_id')
+    return ScaleFile.objects.filter(job_id__in=job_ids).exists()
+
+
+def _new_chain_token():
+    """Returns a new, unique chain token
+
+    :returns: The chain token
+    :rtype: string
+    """
+
+    return uuid.uuid4().hex
+
+
+class PurgeEngine(object):
+    """Purges the lineage of a source file. The full lineage is computed up front and each table is then purged in
+    order, one chunk of lineage models at a time. Every chunk is committed in its own transaction along with a
+    checkpoint of its progress, so an interrupted purge resumes where it left off. The product files of the lineage are
+    deleted from their workspaces by delete files jobs before the jobs and recipes that produced them are purged.
+
+    A purge is run by a chain of messages. The lineage step's checkpoint holds the token of the one message that may
+    run the purge next, so duplicate or stale messages for the purge do nothing.
+    """
+
+    def __init__(self, trigger_id, source_file_id, chain_token=None):
+        """Constructor
+
+        :param trigger_id: The trigger event ID for the purge operation
+        :type trigger_id: int
+        :param source_file_id: The ID of the source file being purged
+        :type source_file_id: int
+        :param chain_token: The chain token of the message running the purge, None for the message starting the purge
+        :type chain_token: string
+        """
+
+        self._trigger_id = trigger_id
+        self._source_file_id = source_file_id
+        self._chunk_size = settings.PURGE_CHUNK_SIZE
+
+        self.chain_token = chain_token
+        self.new_messages = []
+
+    def run(self, max_chunks):
+        """Runs the purge for up to the given number of chunks. Any messages needed to delete the lineage's product
+        files are added to new_messages.
+
+        :param max_chunks: The maximum number of chunks to process
+        :type max_chunks: int
+        :returns: True if the purge has more chunks that should be processed by another run with the new chain_token,
+            False if the purge is finished, stopped, owned by another message, or waiting for its product files to be
+            deleted
+        :rtype: bool
+        """
+
+        num_chunks = 0
+        steps = [(LINEAGE_STEP, None, self._compute_lineage)]
+        steps.extend((step.name, step.model_type, self._create_step_func(step)) for step in REFERENCE_STEPS)
+        steps.append((DELETE_PRODUCTS_STEP, PurgeLineageRecord.JOB_TYPE, self._delete_products))
+        steps.extend((step.name, step.model_type, self._create_step_func(step)) for step in MODEL_STEPS)
+
+        for step_name, model_type, step_func in steps:
+            is_completed = False
+            while not is_completed:
+                with transaction.atomic():
+                    results = PurgeResults.objects.select_for_update().get(trigger_event_id=self._trigger_id)
+                    if results.force_stop_purge or results.purge_completed:
+                        return False
+                    chain = self._get_chain(results.id)
+                    if not chain:
+                        return False
+                    if self.new_messages:
+                        # Let the delete files messages be sent before a new message continues the purge
+                        self._pass_chain(chain, _new_chain_token())
+                        return True
+                    if step_name == MODEL_STEPS[0].name and _has_products(results.id):
+                        # Wait for the delete files jobs, the one that deletes the last product continues the purge
+                        self._pass_chain(chain, None)
+                        return False
+
+                    if step_name == LINEAGE_STEP:
+                        checkpoint = chain
+                    else:
+                        checkpoint = PurgeCheckpoint.objects.get_or_create(purge_id=results.id, step=step_name)[0]
+                    is_completed = checkpoint.completed is not None
+                    if not is_completed:
+                        ids = self._get_next_ids(checkpoint, model_type) if model_type else None
+                        if ids is None or ids:
+                            # Only chunks that process lineage models count towards the message's limit
+                            if num_chunks >= max_chunks:
+                                self._pass_chain(chain, _new_chain_token())
+                                return True
+                            step_func(checkpoint, ids)
+                            num_chunks += 1
+                        checkpoint.save()
+                        is_completed = checkpoint.completed is not None
+
+        self._complete_purge()
+        return False
+
+    def _complete_purge(self):
+        """Deletes the source file and completes the purge
+        """
+
+        with transaction.atomic():
+            results = PurgeResults.objects.select_for_update().get(trigger_event_id=self._trigger_id)
+            if results.purge_completed:
+                return
+            Ingest.objects.filter(source_file_id=self._source_file_id).delete()
+            ScaleFile.objects.filter(id=self._source_file_id).delete()
+            PurgeLineageRecord.objects.filter(purge_id=results.id).delete()
+            results.purge_completed = timezone.now()
+            results.save()
+        logger.info('Completed purge of source file %d', self._source_file_id)
+
+    def _compute_lineage(self, checkpoint, ids):
+        """Computes and stores the full lineage of the source file
+
+        :param checkpoint: The checkpoint of the lineage step
+        :type checkpoint: :class:`storage.models.PurgeCheckpoint`
+        :param ids: Unused, the lineage step does not process lineage models
+        :type ids: None
+        """
+
+        with connection.cursor() as cursor:
+            cursor.execute(LINEAGE_SQL, {'source_file_id': self._source_file_id, 'purge_id': checkpoint.purge_id})
+            checkpoint.num_processed = cursor.rowcount
+        checkpoint.completed = timezone.now()
+        logger.info('Purge of source file %d found %d models in its lineage', self._source_file_id,
+                    checkpoint.num_processed)
+
+    def _create_step_func(self, step):
+        """Creates the function that processes the next chunk of the given SQL step
+
+        :param step: The purge step
+        :type step: :class:`storage.purge.PurgeStep`
+        :returns: The step function, which takes the step's checkpoint and the IDs of the chunk's lineage models
+        :rtype: function
+        """
+
+        def step_func(checkpoint, ids):
+            if step.name == 'job':
+                JobStatusCounter.objects.update_for_deleted_jobs(ids)
+            with connection.cursor() as cursor:
+                for unlink_sql in step.unlink_sql:
+                    cursor.execute(unlink_sql, {'ids': ids})
+                cursor.execute(step.sql, {'ids': ids})
+                count = cursor.rowcount
+            checkpoint.num_processed += count
+            if step.results_field and count:
+                PurgeResults.objects.filter(id=checkpoint.purge_id).update(
+                    **{step.results_field: F(step.results_field) + count})
+
+        return step_func
+
+    def _delete_products(self, checkpoint, job_ids):
+        """Creates the messages that spawn delete files jobs for the given chunk of lineage jobs with product files
+
+        :param checkpoint: The checkpoint of the delete products step
+        :type checkpoint: :class:`storage.models.PurgeCheckpoint`
+        :param job_ids: The IDs of the lineage jobs in the chunk
+        :type job_ids: :func:`list`
+        """
+
+        from job.messages.spawn_delete_files_job import create_spawn_delete_files_job
+
+        product_job_ids = ScaleFile.objects.filter(job_id__in=job_ids).values_list('job_id', flat=True).distinct()
+        for job_id in product_job_ids:
+            self.new_messages.append(create_spawn_delete_files_job(job_id=job_id, trigger_id=self._trigger_id,
+                                                                   source_file_id=self._source_file_id, purge=True))
+            checkpoint.num_processed += 1
+
+    def _get_next_ids(self, checkpoint, model_type):
+        """Returns the IDs of the next chunk of lineage models of the given type and advances the given checkpoint
+
+        :param checkpoint: The checkpoint of the step
+        :type checkpoint: :class:`storage.models.PurgeCheckpoint`
+        :param model_type: The type of the lineage models
+        :type model_type: string
+        :returns: The list of model IDs
+        :rtype: :func:`list`
+        """
+
+        records = PurgeLineageRecord.objects.filter(purge_id=checkpoint.purge_id, model_type=model_type,
+                                                    model_id__gt=checkpoint.last_id)
+        ids = list(records.order_by('model_id').values_list('model_id', flat=True)[:self._chunk_size])
+        if ids:
+            checkpoint.last_id = ids[-1]
+        if len(ids) < self._chunk_size:
+            checkpoint.completed = timezone.now()
+        return ids
+
+    def _get_chain(self, purge_id):
+        """Returns the checkpoint holding the purge's chain token if this run owns the purge. The purge is claimed for
+        this run if it has not been started yet.
+
+        :param purge_id: The ID of the purge results
+        :type purge_id: int
+        :returns: The lineage step's checkpoint, or None if another message owns the purge
+        :rtype: :class:`storage.models.PurgeCheckpoint`
+        """
+
+        try:
+            chain = PurgeCheckpoint.objects.get(purge_id=purge_id, step=LINEAGE_STEP)
+        except PurgeCheckpoint.DoesNotExist:
+            if self.chain_token:
+                return None
+            self.chain_token = _new_chain_token()
+            return PurgeCheckpoint.objects.create(purge_id=purge_id, step=LINEAGE_STEP, chain_token=self.chain_token)
+
+        if not chain.chain_token or chain.chain_token != self.chain_token:
+            return None
+        return chain
+
+    def _pass_chain(self, chain, chain_token):
+        """Passes the purge on to the message with the given chain token
+
+        :param chain: The checkpoint holding the purge's chain token
+        :type chain: :class:`storage.models.PurgeCheckpoint`
+        :param chain_token: The new chain token, or None if no message should own the purge
+        :type chain_token: string
+        """
+
+        chain.chain_token = chain_token
+        chain.save()
+        self.chain_token = chain_token
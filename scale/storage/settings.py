@@ -11,3 +11,6 @@ S3_RETRY_COUNT = getattr(settings, 'S3_RETRY_COUNT', 3)
 
 # The delay between retry attempts
 S3_RETRY_DELAY = getattr(settings, 'S3_RETRY_DELAY', 60)  # 1 minute
+
+# The maximum number of workspaces that files are downloaded from concurrently
+DOWNLOAD_WORKSPACE_WORKERS = getattr(settings, 'DOWNLOAD_WORKSPACE_WORKERS', 4)
@@ -13,6 +13,7 @@ import storage.test.utils as storage_test_utils
 from storage.brokers.broker import FileDownload, FileMove, FileUpload
 from storage.brokers.exceptions import InvalidBrokerConfiguration
 from storage.brokers.host_broker import HostBroker
+from storage.exceptions import MissingFile
 
 
 class TestHostBrokerDeleteFiles(TestCase):
@@ -62,13 +63,11 @@ class TestHostBrokerDownloadFiles(TestCase):
         self.broker = HostBroker()
         self.broker.load_configuration({'type': HostBroker().broker_type, 'host_path': '/host/path'})
 
-    @patch('storage.brokers.host_broker.os.path.exists')
-    @patch('storage.brokers.host_broker.execute_command_line')
-    def test_successfully(self, mock_execute, mock_exists):
+    @patch('storage.brokers.broker.os.stat')
+    @patch('storage.brokers.broker.os.symlink')
+    def test_successfully(self, mock_symlink, mock_stat):
         """Tests calling HostBroker.download_files() successfully"""
 
-        mock_exists.return_value = True
-
         volume_path = os.path.join('the', 'volume', 'path')
         file_name_1 = 'my_file.txt'
         file_name_2 = 'my_file.json'
@@ -88,9 +87,47 @@ class TestHostBrokerDownloadFiles(TestCase):
         self.broker.download_files(volume_path, [file_1_dl, file_2_dl])
 
         # Check results
-        two_calls = [call(['ln', '-s', full_workspace_path_file_1, local_path_file_1]),
-                     call(['ln', '-s', full_workspace_path_file_2, local_path_file_2])]
-        mock_execute.assert_has_calls(two_calls)
+        mock_stat.assert_has_calls([call(full_workspace_path_file_1), call(full_workspace_path_file_2)])
+        two_calls = [call(full_workspace_path_file_1, local_path_file_1),
+                     call(full_workspace_path_file_2, local_path_file_2)]
+        mock_symlink.assert_has_calls(two_calls)
+
+    def test_links_files(self):
+        """Tests that HostBroker.download_files() creates links to the files in the volume"""
+
+        volume_path = tempfile.mkdtemp()
+        local_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, volume_path)
+        self.addCleanup(shutil.rmtree, local_dir)
+        with open(os.path.join(volume_path, 'my_file.txt'), 'w') as the_file:
+            the_file.write('content')
+
+        file_1 = storage_test_utils.create_file(file_path='my_file.txt')
+        local_path = os.path.join(local_dir, 'my_file.txt')
+
+        self.broker.download_files(volume_path, [FileDownload(file_1, local_path, False)])
+
+        self.assertTrue(os.path.islink(local_path))
+        with open(local_path) as the_file:
+            self.assertEqual(the_file.read(), 'content')
+
+    def test_missing_file(self):
+        """Tests that HostBroker.download_files() checks every file before creating any links"""
+
+        volume_path = tempfile.mkdtemp()
+        local_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, volume_path)
+        self.addCleanup(shutil.rmtree, local_dir)
+        with open(os.path.join(volume_path, 'my_file.txt'), 'w') as the_file:
+            the_file.write('content')
+
+        file_1 = storage_test_utils.create_file(file_path='my_file.txt')
+        file_2 = storage_test_utils.create_file(file_path=os.path.join('missing', 'my_file.json'))
+        file_1_dl = FileDownload(file_1, os.path.join(local_dir, 'my_file.txt'), False)
+        file_2_dl = FileDownload(file_2, os.path.join(local_dir, 'my_file.json'), False)
+
+        self.assertRaises(MissingFile, self.broker.download_files, volume_path, [file_1_dl, file_2_dl])
+        self.assertListEqual(os.listdir(local_dir), [])
 
 
 class TestHostBrokerListFiles(TestCase):
@@ -59,13 +59,11 @@ class TestNfsBrokerDownloadFiles(TestCase):
         self.broker = NfsBroker()
         self.broker.load_configuration({'type': NfsBroker().broker_type, 'nfs_path': 'host:/path'})
 
-    @patch('storage.brokers.nfs_broker.os.path.exists')
-    @patch('storage.brokers.nfs_broker.execute_command_line')
-    def test_successfully(self, mock_execute, mock_exists):
+    @patch('storage.brokers.broker.os.stat')
+    @patch('storage.brokers.broker.os.symlink')
+    def test_successfully(self, mock_symlink, mock_stat):
         """Tests calling NfsBroker.download_files() successfully"""
 
-        mock_exists.return_value = True
-
         volume_path = os.path.join('the', 'volume', 'path')
         file_name_1 = 'my_file.txt'
         file_name_2 = 'my_file.json'
@@ -85,9 +83,10 @@ class TestNfsBrokerDownloadFiles(TestCase):
         self.broker.download_files(volume_path, [file_1_dl, file_2_dl])
 
         # Check results
-        two_calls = [call(['ln', '-s', full_workspace_path_file_1, local_path_file_1]),
-                     call(['ln', '-s', full_workspace_path_file_2, local_path_file_2])]
-        mock_execute.assert_has_calls(two_calls)
+        mock_stat.assert_has_calls([call(full_workspace_path_file_1), call(full_workspace_path_file_2)])
+        two_calls = [call(full_workspace_path_file_1, local_path_file_1),
+                     call(full_workspace_path_file_2, local_path_file_2)]
+        mock_symlink.assert_has_calls(two_calls)
 
 
 class TestNfsBrokerLoadConfiguration(TestCase):
@@ -89,15 +89,14 @@ class TestS3Broker(TestCase):
         self.assertTrue(s3_object_1.download_file.called)
         self.assertTrue(s3_object_2.download_file.called)
 
-    # Patching in storage.brokers.s3_broker as opposed to util.aws / util.command because patch must be applied where
-    # import is made, not on source
-    @patch('os.path.exists')
+    # Patching in storage.brokers.s3_broker as opposed to util.aws because patch must be applied where import is made,
+    # not on source
+    @patch('storage.brokers.broker.os.stat')
     @patch('storage.brokers.s3_broker.S3Client')
-    @patch('storage.brokers.s3_broker.execute_command_line')
-    def test_host_link_files(self, mock_execute, mock_client_class, mock_exists):
+    @patch('storage.brokers.broker.os.symlink')
+    def test_host_link_files(self, mock_symlink, mock_client_class, mock_stat):
         """Tests sym-linking files successfully"""
 
-        mock_exists.return_value = True
         volume_path = os.path.join('the', 'volume', 'path')
         file_name_1 = 'my_file.txt'
         file_name_2 = 'my_file.json'
@@ -117,9 +116,10 @@ class TestS3Broker(TestCase):
         self.broker.download_files(volume_path, [file_1_dl, file_2_dl])
 
         # Check results
-        two_calls = [call(['ln', '-s', full_workspace_path_file_1, local_path_file_1]),
-                     call(['ln', '-s', full_workspace_path_file_2, local_path_file_2])]
-        mock_execute.assert_has_calls(two_calls)
+        two_calls = [call(full_workspace_path_file_1, local_path_file_1),
+                     call(full_workspace_path_file_2, local_path_file_2)]
+        mock_symlink.assert_has_calls(two_calls)
+        self.assertFalse(mock_client_class.called)
 
     def test_load_configuration(self):
         """Tests loading a valid configuration successfully"""
@@ -13,7 +13,7 @@ from mock import MagicMock, patch
 
 import storage.test.utils as storage_test_utils
 from storage.brokers.broker import FileDownload, FileMove, FileUpload
-from storage.exceptions import ArchivedWorkspace, DeletedFile, InvalidDataTypeTag
+from storage.exceptions import ArchivedWorkspace, DeletedFile, InvalidDataTypeTag, MissingFile
 from storage.models import CountryData, PurgeResults, ScaleFile, Workspace
 from storage.brokers.exceptions import InvalidBrokerConfiguration
 from storage.configuration.json.workspace_config_v6 import WorkspaceConfigurationV6
@@ -184,6 +184,28 @@ class TestScaleFileManagerDeleteFiles(TestCase):
         workspace_2.delete_files.assert_called_once_with([file_2])
 
 
+class TestScaleFileManagerGetDetailsForIds(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+    def test_get_details_for_ids(self):
+        """Tests retrieving the details of several files in bulk"""
+
+        workspace = storage_test_utils.create_workspace()
+        file_1 = storage_test_utils.create_file(workspace=workspace)
+        file_2 = storage_test_utils.create_file(workspace=workspace)
+        storage_test_utils.create_file(workspace=workspace)
+
+        files = ScaleFile.objects.get_details_for_ids([file_1.id, file_2.id])
+
+        self.assertSetEqual(set(files.keys()), {file_1.id, file_2.id})
+        with self.assertNumQueries(0):
+            self.assertEqual(files[file_1.id].workspace.name, workspace.name)
+            self.assertListEqual(list(files[file_2.id].countries.all()), [])
+        self.assertDictEqual(ScaleFile.objects.get_details_for_ids([]), {})
+
+
 class TestScaleFileManagerDownloadFiles(TestCase):
 
     def setUp(self):
@@ -221,6 +243,21 @@ class TestScaleFileManagerDownloadFiles(TestCase):
         workspace_2.download_files.assert_called_once_with([FileDownload(file_4, local_path_4, False),
                                                             FileDownload(file_5, local_path_5, False)])
 
+    def test_workspace_error(self):
+        """Tests that an error downloading from one of several concurrent workspaces is raised"""
+
+        workspace_1 = storage_test_utils.create_workspace()
+        file_1 = storage_test_utils.create_file(workspace=workspace_1)
+        workspace_1.download_files = MagicMock()
+        workspace_2 = storage_test_utils.create_workspace()
+        file_2 = storage_test_utils.create_file(workspace=workspace_2)
+        workspace_2.download_files = MagicMock(side_effect=MissingFile(file_2.file_name))
+
+        files = [FileDownload(file_1, '/my/local/path/file.txt', False),
+                 FileDownload(file_2, '/my/local/path/2/file.txt', False)]
+        self.assertRaises(MissingFile, ScaleFile.objects.download_files, files)
+        workspace_1.download_files.assert_called_once_with([files[0]])
+
     def test_inactive_workspace(self):
         """Tests calling ScaleFileManager.download_files() with an inactive workspace"""
 
@@ -227,6 +227,35 @@ class TestFilesViewV6(APITestCase):
         self.assertEqual(result['results'][0]['file_name'], self.file1.file_name)
         self.assertListEqual(['type1', 'type2'], result['results'][0]['data_type_tags'])
 
+    def test_file_name_search(self):
+        """Tests successfully calling the files view filtered by a case-insensitive file name search."""
+
+        url = '/%s/files/?file_name_search=TEST_F' % self.api
+        response = self.client.generic('GET', url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
+
+        result = json.loads(response.content)
+        self.assertEqual(len(result['results']), 1)
+        self.assertEqual(result['results'][0]['id'], self.file2.id)
+
+    def test_file_name_similar(self):
+        """Tests successfully calling the files view filtered by file name similarity."""
+
+        url = '/%s/files/?file_name_similar=my_test_file.text' % self.api
+        response = self.client.generic('GET', url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
+
+        # Both names are similar, and the closer name is ranked first
+        result = json.loads(response.content)
+        self.assertListEqual([file_dict['id'] for file_dict in result['results']], [self.file2.id, self.file1.id])
+
+        url = '/%s/files/?file_name_similar=unrelated' % self.api
+        response = self.client.generic('GET', url)
+        self.assertEqual(response.status_code, status.HTTP_200_OK, response.content)
+
+        result = json.loads(response.content)
+        self.assertEqual(len(result['results']), 0)
+
     def test_job_output(self):
         """Tests successfully calling the files view filtered by job output."""
 
@@ -98,7 +98,7 @@ class FilesView(ListAPIView):
         batch_ids = rest_util.parse_int_list(request, 'batch_id', required=False)
         media_type = rest_util.parse_string_list(request, 'media_type', required=False)
         file_name_search = rest_util.parse_string(request, 'file_name_search', required=False)
-        
+        file_name_similar = rest_util.parse_string(request, 'file_name_similar', required=False)
 
         order = rest_util.parse_string_list(request, 'order', required=False)
 
@@ -113,7 +113,8 @@ class FilesView(ListAPIView):
             file_names=file_names, file_name_search=file_name_search, 
             job_outputs=job_outputs, recipe_ids=recipe_ids,
             recipe_type_ids=recipe_type_ids, recipe_nodes=recipe_nodes, batch_ids=batch_ids,
-            order=order, countries=countries, file_type=file_type, media_type=media_type
+            order=order, countries=countries, file_type=file_type, media_type=media_type,
+            file_name_similar=file_name_similar
         )
 
         page = self.paginate_queryset(files)
@@ -11,6 +11,7 @@ import job.test.utils as job_test_utils
 import recipe.test.utils as recipe_test_utils
 import storage.test.utils as storage_test_utils
 
+from job.models import JobTimeline
 from recipe.models import RecipeType
 
 from rest_framework import status
@@ -111,6 +112,9 @@ class TestRecipeTypeTimelineView(APITestCase):
             job_3.recipe_id = recipe_2.id
             job_3.save()
 
+        # The jobs were created directly with start times, so backfill the timeline counts
+        JobTimeline.objects.rebuild()
+
     def test_successful(self):
 
         started = '2020-01-01T00:00:00Z'
@@ -365,6 +369,9 @@ class TestJobTypeTimelineView(APITestCase):
             job_3.recipe_id = recipe_2.id
             job_3.save()
 
+        # The jobs were created directly with start times, so backfill the timeline counts
+        JobTimeline.objects.rebuild()
+
     def test_successful(self):
         started = '2020-01-01T00:00:00Z'
         ended = '2020-02-01T00:00:00Z'
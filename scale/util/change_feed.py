@@ -0,0 +1,129 @@
+"""Defines the change feed that notifies listeners of queue and job changes using Postgres LISTEN/NOTIFY"""
+from __future__ import unicode_literals
+
+import logging
+import select
+
+import psycopg2
+from django.db import connection
+
+
+# The channel notified when jobs are added to or canceled on the queue
+QUEUE_CHANNEL = 'scale_queue_changed'
+
+# The channel notified with the IDs of jobs that were canceled or re-queued
+JOBS_CHANNEL = 'scale_jobs_changed'
+
+# The maximum number of job IDs in a single notification, keeping payloads well under the Postgres limit of 8000 bytes
+MAX_JOB_IDS_PER_NOTIFICATION = 500
+
+logger = logging.getLogger(__name__)
+
+
+def notify_queue_changed():
+    """Notifies listeners that the queue has changed. The notification is delivered when the current transaction
+    commits, and duplicate notifications within a transaction are only delivered once.
+    """
+
+    with connection.cursor() as cursor:
+        cursor.execute('SELECT pg_notify(%s, %s)', [QUEUE_CHANNEL, ''])
+
+
+def notify_jobs_changed(job_ids):
+    """Notifies listeners that the jobs with the given IDs were canceled or re-queued, so any running executions of
+    these jobs are out of date. The notifications are delivered when the current transaction commits.
+
+    :param job_ids: The job IDs
+    :type job_ids: :func:`list`
+    """
+
+    job_ids = sorted(set(job_ids))
+    if not job_ids:
+        return
+
+    with connection.cursor() as cursor:
+        for i in range(0, len(job_ids), MAX_JOB_IDS_PER_NOTIFICATION):
+            payload = ','.join(str(job_id) for job_id in job_ids[i:i + MAX_JOB_IDS_PER_NOTIFICATION])
+            cursor.execute('SELECT pg_notify(%s, %s)', [JOBS_CHANNEL, payload])
+
+
+def parse_job_ids(payload):
+    """Parses the job IDs from the payload of a jobs channel notification
+
+    :param payload: The notification payload
+    :type payload: string
+    :returns: The job IDs
+    :rtype: :func:`list`
+    """
+
+    return [int(job_id) for job_id in payload.split(',') if job_id]
+
+
+class ChangeFeedListener(object):
+    """Listens for change feed notifications on its own database connection, separate from the connection that Django
+    uses for the calling thread. This class is NOT thread-safe and should only be used within a single thread.
+    """
+
+    def __init__(self, channels):
+        """Constructor
+
+        :param channels: The channels to listen on
+        :type channels: :func:`list`
+        """
+
+        self._channels = channels
+        self._connection = None
+
+    def close(self):
+        """Closes the listener's database connection
+        """
+
+        if self._connection:
+            try:
+                self._connection.close()
+            except Exception:
+                logger.exception('Error closing change feed connection')
+            self._connection = None
+
+    def connect(self):
+        """Opens the listener's database connection and starts listening on its channels
+        """
+
+        self.close()
+        # The connection is opened directly, bypassing any connection pool, since it is held open to listen and is not
+        # returned to a pool when closed
+        db_connection = psycopg2.connect(**connection.get_connection_params())
+        db_connection.autocommit = True
+        with db_connection.cursor() as cursor:
+            for channel in self._channels:
+                cursor.execute('LISTEN %s' % channel)
+        self._connection = db_connection
+
+    def is_connected(self):
+        """Indicates whether the listener is connected and listening
+
+        :returns: True if the listener is connected, False otherwise
+        :rtype: bool
+        """
+
+        return self._connection is not None and not self._connection.closed
+
+    def poll(self, timeout):
+        """Waits for notifications to arrive, up to the given timeout, and returns any received notifications
+
+        :param timeout: The maximum number of seconds to wait
+        :type timeout: float
+        :returns: The list of received notifications as (channel, payload) tuples
+        :rtype: :func:`list`
+        """
+
+        if not self._connection.notifies:
+            readable, _, _ = select.select([self._connection], [], [], timeout)
+            if readable:
+                self._connection.poll()
+        else:
+            self._connection.poll()
+
+        notifications = [(notify.channel, notify.payload) for notify in self._connection.notifies]
+        del self._connection.notifies[:]
+        return notifications
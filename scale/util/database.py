@@ -1,5 +1,7 @@
 """Helper methods for os operations"""
 import time
+from django.core.exceptions import EmptyResultSet
+from django.db import connection, connections
 from django.db.models.functions import Lower
 
 MAX_SLEEP_MS = 500
@@ -48,3 +50,92 @@ def alphabetize(order, fields):
             ordering.append(o)
 
     return ordering
+
+
+def iterate_id_chunks(query, chunk_size):
+    """Iterates over the primary keys of the given query in chunks using keyset pagination on the id field. Only the
+    ids are fetched, so the query may contain related fields and any ordering without materializing the models. Each
+    chunk is retrieved with its own query so that arbitrarily large results can be processed in bounded memory.
+
+    :param query: The query whose model ids should be iterated over
+    :type query: :class:`django.db.models.QuerySet`
+    :param chunk_size: The maximum number of ids in each chunk
+    :type chunk_size: int
+    :returns: A generator of id lists, in ascending id order
+    :rtype: generator
+    """
+
+    id_query = query.select_related(None).prefetch_related(None).order_by('id').values_list('id', flat=True)
+    id_query = id_query.distinct()
+    last_id = None
+    while True:
+        chunk_query = id_query if last_id is None else id_query.filter(id__gt=last_id)
+        ids = list(chunk_query[:chunk_size])
+        if not ids:
+            break
+        yield ids
+        if len(ids) < chunk_size:
+            break
+        last_id = ids[-1]
+
+
+def iterate_ordered_id_chunks(query, chunk_size):
+    """Iterates over the primary keys of the given query in chunks, keeping the query's own ordering. The ids are
+    streamed from a single server-side cursor, so arbitrarily large results can be processed in bounded memory. Any id
+    repeated by a join in the query is removed by the database, keeping the position of its first row.
+
+    :param query: The ordered query whose model ids should be iterated over
+    :type query: :class:`django.db.models.QuerySet`
+    :param chunk_size: The maximum number of ids in each chunk
+    :type chunk_size: int
+    :returns: A generator of id lists, in query order
+    :rtype: generator
+    """
+
+    id_query = query.select_related(None).prefetch_related(None).values_list('id', flat=True)
+    try:
+        sql, params = id_query.query.get_compiler(id_query.db).as_sql()
+    except EmptyResultSet:
+        return
+
+    # An ordered subquery is never flattened into its parent, so its rows are numbered in the query's order
+    qry = 'SELECT id FROM (SELECT DISTINCT ON (id) id, row_position FROM '
+    qry += '(SELECT ordered.id, row_number() OVER () AS row_position FROM (%s) ordered) numbered ' % sql
+    qry += 'ORDER BY id, row_position) first_rows ORDER BY row_position'
+    with connections[id_query.db].chunked_cursor() as cursor:
+        cursor.execute(qry, params)
+        while True:
+            ids = [row[0] for row in cursor.fetchmany(chunk_size)]
+            if not ids:
+                break
+            yield ids
+
+
+def increment_counts(table, columns, conflict_columns, deltas, count_column='count'):
+    """Atomically adds the given deltas to the count column of the rows in the given table, inserting any missing rows.
+    The table must have a unique constraint on the conflict columns. Rows are updated in sorted key order so that
+    concurrent callers cannot deadlock.
+
+    :param table: The name of the database table
+    :type table: string
+    :param columns: The names of the key columns, in the order of the keys in deltas
+    :type columns: :func:`list`
+    :param conflict_columns: The names of the columns that have the unique constraint
+    :type conflict_columns: :func:`list`
+    :param deltas: The amount to add to each count, stored by key tuple
+    :type deltas: dict
+    :param count_column: The name of the count column
+    :type count_column: string
+    """
+
+    rows = [key + (delta,) for key, delta in sorted(deltas.items()) if delta]
+    if not rows:
+        return
+
+    row_placeholder = '(%s)' % ', '.join(['%s'] * (len(columns) + 1))
+    qry = 'INSERT INTO %s (%s, %s) VALUES %s ' % (table, ', '.join(columns), count_column,
+                                                 ', '.join([row_placeholder] * len(rows)))
+    qry += 'ON CONFLICT (%s) DO UPDATE SET %s = %s.%s + EXCLUDED.%s' % (', '.join(conflict_columns), count_column,
+                                                                        table, count_column, count_column)
+    with connection.cursor() as cursor:
+        cursor.execute(qry, [value for row in rows for value in row])
@@ -0,0 +1 @@
+"""Defines a PostGIS database backend that checks connections out of a per-process connection pool"""
@@ -0,0 +1,39 @@
+"""Defines the database wrapper for the pooled PostGIS database backend"""
+from __future__ import unicode_literals
+
+from functools import partial
+
+from django.contrib.gis.db.backends.postgis.base import DatabaseWrapper as PostGISDatabaseWrapper
+
+from util.db_pool.pool import get_pool
+
+
+class DatabaseWrapper(PostGISDatabaseWrapper):
+    """Wraps the PostGIS database backend so that opening a connection checks one out of the process's pool for the
+    database and closing a connection returns it to the pool
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Constructor
+        """
+
+        super(DatabaseWrapper, self).__init__(*args, **kwargs)
+        self._pool = None
+
+    def get_new_connection(self, conn_params):
+        """See :meth:`django.db.backends.postgresql.base.DatabaseWrapper.get_new_connection`
+        """
+
+        self._pool = get_pool(self.alias, conn_params)
+        connection = self._pool.checkout(partial(super(DatabaseWrapper, self).get_new_connection, conn_params))
+        # A connection reused from the pool skipped the parent's setup of the isolation level
+        self.isolation_level = connection.isolation_level
+        return connection
+
+    def _close(self):
+        """See :meth:`django.db.backends.base.base.BaseDatabaseWrapper._close`
+        """
+
+        if self.connection is not None:
+            with self.wrap_database_errors:
+                self._pool.checkin(self.connection)
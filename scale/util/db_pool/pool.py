@@ -0,0 +1,263 @@
+"""Defines the per-process pool of database connections used by the pooled PostGIS database backend"""
+from __future__ import unicode_literals
+
+import logging
+import os
+import threading
+import time
+
+from django.conf import settings
+from django.db import connections
+from psycopg2 import OperationalError
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE
+
+logger = logging.getLogger(__name__)
+
+_pools = {}  # {(Alias, connection parameters): ConnectionPool}
+_pools_lock = threading.Lock()
+_pools_pid = None
+
+
+class PoolTimeout(OperationalError):
+    """Exception indicating that no pooled database connection became available before the checkout timed out. This
+    is a psycopg2 error so that Django raises it as a :class:`django.db.utils.OperationalError`.
+    """
+
+    pass
+
+
+class ConnectionPool(object):
+    """This class represents a pool of connections to a single database that are shared by the threads of a process.
+    At most a maximum number of connections are open at once and a connection that has been idle in the pool for longer
+    than the health check interval is tested before it is checked out again. This class is thread-safe.
+    """
+
+    def __init__(self, name, max_size, timeout, health_check_interval):
+        """Constructor
+
+        :param name: The name of the pool, used for logging
+        :type name: string
+        :param max_size: The maximum number of connections that may be open at once
+        :type max_size: int
+        :param timeout: The number of seconds to wait for a connection before failing the checkout
+        :type timeout: float
+        :param health_check_interval: A connection idle for more than this number of seconds is tested on checkout
+        :type health_check_interval: float
+        """
+
+        self._name = name
+        self._max_size = max_size
+        self._timeout = timeout
+        self._health_check_interval = health_check_interval
+        self._condition = threading.Condition()
+        self._idle = []  # [(Connection, when it was checked in)], most recently checked in last
+        self._size = 0  # The number of connections either checked out or idle, including ones being opened
+
+        # Metrics
+        self._num_checkouts = 0
+        self._num_connects = 0
+        self._num_discarded = 0
+        self._num_timeouts = 0
+        self._num_waits = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    def checkin(self, connection):
+        """Returns the given connection to the pool. Any open transaction is rolled back and a connection that is
+        closed or cannot be rolled back is discarded.
+
+        :param connection: The connection
+        :type connection: :class:`psycopg2.extensions.connection`
+        """
+
+        if not connection.closed and connection.get_transaction_status() != TRANSACTION_STATUS_IDLE:
+            try:
+                connection.rollback()
+            except Exception:
+                logger.exception('Failed to roll back pooled connection, discarding it')
+                self._discard(connection)
+                return
+
+        if connection.closed:
+            self._discard(connection)
+            return
+
+        with self._condition:
+            self._idle.append((connection, time.time()))
+            self._condition.notify()
+
+    def checkout(self, connect):
+        """Checks out an idle connection from the pool, opening a new connection with the given function if none are
+        idle and the pool is not full. If the pool is full, this waits for another thread to return a connection.
+
+        :param connect: The function that opens a new connection
+        :type connect: function
+        :returns: The connection
+        :rtype: :class:`psycopg2.extensions.connection`
+
+        :raises :class:`util.db_pool.pool.PoolTimeout`: If no connection became available before the timeout
+        """
+
+        started = time.time()
+        connection = None
+        with self._condition:
+            while True:
+                if self._idle:
+                    connection, checked_in = self._idle.pop()
+                    break
+                if self._size < self._max_size:
+                    # Reserve the slot for a new connection
+                    self._size += 1
+                    break
+                remaining = self._timeout - (time.time() - started)
+                if remaining <= 0:
+                    self._num_timeouts += 1
+                    raise PoolTimeout('Timed out after %.1f seconds waiting for a connection from the %s pool' %
+                                      (self._timeout, self._name))
+                self._condition.wait(remaining)
+
+            wait = time.time() - started
+            self._num_checkouts += 1
+            if wait > 0.001:
+                self._num_waits += 1
+            self._total_wait += wait
+            self._max_wait = max(self._max_wait, wait)
+
+        if connection is not None:
+            if self._is_healthy(connection, time.time() - checked_in):
+                return connection
+            self._discard(connection, keep_slot=True)
+
+        try:
+            connection = connect()
+        except Exception:
+            with self._condition:
+                self._size -= 1
+                self._condition.notify()
+            raise
+        with self._condition:
+            self._num_connects += 1
+        return connection
+
+    def close(self):
+        """Closes the idle connections in the pool
+        """
+
+        with self._condition:
+            idle = self._idle
+            self._idle = []
+        for connection, _checked_in in idle:
+            self._discard(connection)
+
+    def get_metrics(self):
+        """Returns the current metrics of the pool
+
+        :returns: The JSON dict of metrics
+        :rtype: dict
+        """
+
+        with self._condition:
+            mean_wait = self._total_wait / self._num_checkouts if self._num_checkouts else 0.0
+            return {'name': self._name, 'max_size': self._max_size, 'size': self._size, 'idle': len(self._idle),
+                    'num_checkouts': self._num_checkouts, 'num_connects': self._num_connects,
+                    'num_discarded': self._num_discarded, 'num_timeouts': self._num_timeouts,
+                    'num_waits': self._num_waits, 'mean_wait': mean_wait, 'max_wait': self._max_wait}
+
+    def _discard(self, connection, keep_slot=False):
+        """Closes the given connection and removes it from the pool
+
+        :param connection: The connection
+        :type connection: :class:`psycopg2.extensions.connection`
+        :param keep_slot: Whether the caller keeps the connection's slot in the pool to open a replacement
+        :type keep_slot: bool
+        """
+
+        try:
+            if not connection.closed:
+                connection.close()
+        except Exception:
+            logger.exception('Failed to close discarded connection from the %s pool', self._name)
+
+        with self._condition:
+            self._num_discarded += 1
+            if not keep_slot:
+                self._size -= 1
+                self._condition.notify()
+
+    def _is_healthy(self, connection, idle_time):
+        """Indicates whether the given idle connection can be checked out. A connection that has been idle for longer
+        than the health check interval is tested with a trivial query.
+
+        :param connection: The connection
+        :type connection: :class:`psycopg2.extensions.connection`
+        :param idle_time: The number of seconds the connection has been idle
+        :type idle_time: float
+        :returns: True if the connection is healthy, False otherwise
+        :rtype: bool
+        """
+
+        if connection.closed:
+            return False
+        if idle_time <= self._health_check_interval:
+            return True
+
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute('SELECT 1')
+            if connection.get_transaction_status() != TRANSACTION_STATUS_IDLE:
+                connection.rollback()
+        except Exception:
+            logger.warning('Discarding unhealthy connection from the %s pool', self._name, exc_info=True)
+            return False
+        return True
+
+
+def get_pool(alias, conn_params):
+    """Returns this process's pool for the given database, creating it if needed. Pools inherited from a parent process
+    are dropped, since their connections cannot be shared across a fork.
+
+    :param alias: The alias of the database
+    :type alias: string
+    :param conn_params: The parameters for connecting to the database
+    :type conn_params: dict
+    :returns: The pool
+    :rtype: :class:`util.db_pool.pool.ConnectionPool`
+    """
+
+    global _pools_pid
+
+    key = (alias, repr(sorted(conn_params.items())))
+    with _pools_lock:
+        if _pools_pid != os.getpid():
+            _pools.clear()
+            _pools_pid = os.getpid()
+        if key not in _pools:
+            name = '%s:%s' % (alias, conn_params.get('database', ''))
+            _pools[key] = ConnectionPool(name, settings.DATABASE_POOL_MAX_SIZE, settings.DATABASE_POOL_TIMEOUT,
+                                         settings.DATABASE_POOL_HEALTH_CHECK)
+        return _pools[key]
+
+
+def get_pool_metrics():
+    """Returns the current metrics of all of this process's pools
+
+    :returns: The JSON dicts of metrics for each pool
+    :rtype: :func:`list`
+    """
+
+    with _pools_lock:
+        pools = list(_pools.values())
+    return [pool.get_metrics() for pool in pools]
+
+
+def release_connections():
+    """Returns the current thread's database connections to their pools so that idle threads do not hold connections
+    and each connection is health checked before its next use. This does nothing if pooling is disabled.
+    """
+
+    if not settings.DATABASE_POOL:
+        return
+
+    for connection in connections.all():
+        if not connection.in_atomic_block:
+            connection.close()
@@ -0,0 +1,59 @@
+"""Defines the database router that sends the reads of safe-method REST API requests to a replica database"""
+from __future__ import unicode_literals
+
+import threading
+from contextlib import contextmanager
+
+from django.db import connections, DEFAULT_DB_ALIAS
+
+# The alias of the replica database in the DATABASES setting
+REPLICA_ALIAS = 'replica'
+
+_state = threading.local()
+
+
+@contextmanager
+def read_from_replica():
+    """Returns a context manager within which the current thread's reads are routed to the replica database
+    """
+
+    previous = getattr(_state, 'use_replica', False)
+    _state.use_replica = True
+    try:
+        yield
+    finally:
+        _state.use_replica = previous
+
+
+class ReplicaRouter(object):
+    """Routes reads to the replica database while the current thread is within :func:`read_from_replica` and all other
+    queries to the primary database. Reads within a transaction on the primary stay on the primary so that they see the
+    transaction's writes and can lock rows.
+    """
+
+    def db_for_read(self, model, **hints):
+        """See the Django database router documentation
+        """
+
+        if getattr(_state, 'use_replica', False) and not connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return REPLICA_ALIAS
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        """See the Django database router documentation
+        """
+
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        """See the Django database router documentation
+        """
+
+        # The replica holds the same data as the primary
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        """See the Django database router documentation
+        """
+
+        return db == DEFAULT_DB_ALIAS
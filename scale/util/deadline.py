@@ -0,0 +1,120 @@
+"""Defines a queue of keys ordered by deadline"""
+from __future__ import unicode_literals
+
+import heapq
+
+
+class DeadlineQueue(object):
+    """This class tracks a single deadline for each of a set of keys and efficiently returns the keys whose deadlines
+    have passed. Each key has at most one current deadline; rescheduling or removing a key lazily invalidates its old
+    heap entry. This class is NOT thread-safe and should be protected by its owner's lock.
+    """
+
+    # Rebuild the heap when it has this many times more entries than there are current deadlines
+    COMPACTION_FACTOR = 2
+    # Never bother rebuilding the heap when it has fewer entries than this
+    COMPACTION_MIN_SIZE = 1000
+
+    def __init__(self):
+        """Constructor
+        """
+
+        self._deadlines = {}  # {Key: Deadline}
+        self._heap = []  # [(Deadline, Key)]
+
+    def __contains__(self, key):
+        """Indicates whether the given key currently has a deadline
+
+        :param key: The key
+        :type key: object
+        :returns: True if the key has a deadline, False otherwise
+        :rtype: bool
+        """
+
+        return key in self._deadlines
+
+    def __len__(self):
+        """Returns the number of keys that currently have a deadline
+
+        :returns: The number of keys with a deadline
+        :rtype: int
+        """
+
+        return len(self._deadlines)
+
+    def clear(self):
+        """Removes all keys from the queue
+        """
+
+        self._deadlines = {}
+        self._heap = []
+
+    def get_deadline(self, key):
+        """Returns the current deadline of the given key, possibly None
+
+        :param key: The key
+        :type key: object
+        :returns: The deadline of the key, possibly None
+        :rtype: :class:`datetime.datetime`
+        """
+
+        return self._deadlines.get(key)
+
+    def pop_due(self, when):
+        """Removes and returns all keys whose deadlines are at or before the given time, in deadline order
+
+        :param when: The current time
+        :type when: :class:`datetime.datetime`
+        :returns: The list of keys that are due
+        :rtype: :func:`list`
+        """
+
+        keys = []
+        while self._heap and self._heap[0][0] <= when:
+            deadline, key = heapq.heappop(self._heap)
+            if self._deadlines.get(key) == deadline:
+                del self._deadlines[key]
+                keys.append(key)
+        return keys
+
+    def remove(self, key):
+        """Removes the deadline of the given key, if it has one
+
+        :param key: The key
+        :type key: object
+        """
+
+        if self._deadlines.pop(key, None) is not None:
+            self._compact()
+
+    def schedule(self, key, deadline):
+        """Sets the deadline of the given key, replacing any existing deadline. A deadline of None removes the key.
+
+        :param key: The key
+        :type key: object
+        :param deadline: The deadline, possibly None
+        :type deadline: :class:`datetime.datetime`
+        """
+
+        if deadline is None:
+            self.remove(key)
+            return
+
+        if self._deadlines.get(key) == deadline:
+            return
+        self._deadlines[key] = deadline
+        heapq.heappush(self._heap, (deadline, key))
+        self._compact()
+
+    def _compact(self):
+        """Rebuilds the heap without its invalidated entries if they have grown to dominate it
+        """
+
+        num_entries = len(self._heap)
+        if num_entries < DeadlineQueue.COMPACTION_MIN_SIZE:
+            return
+        if num_entries <= len(self._deadlines) * DeadlineQueue.COMPACTION_FACTOR:
+            return
+
+        self._heap = [(deadline, key) for key, deadline in self._deadlines.items()]
+        heapq.heapify(self._heap)
@@ -2,6 +2,10 @@
 
 import logging
 
+from django.conf import settings
+
+from util.db_router import read_from_replica, REPLICA_ALIAS
+
 
 class ExceptionLoggingMiddleware(object):
     def __init__(self, get_response):
@@ -50,3 +54,33 @@ class MultipleProxyMiddleware(object):
                     request.META[field] = parts[0].strip()
 
         return self.get_response(request)
+
+
+class ReplicaRoutingMiddleware(object):
+    """Routes the database reads of safe-method requests to the replica database, if one is configured.
+
+    A replica lags behind the primary, so a client that just made a write request could read data that does not yet
+    include its write. To prevent this, each write request sets a cookie that pins the client's reads to the primary
+    database until it expires after REPLICA_PIN_SECONDS.
+    """
+    PIN_COOKIE = 'scale_replica_pin'
+    SAFE_METHODS = ('GET', 'HEAD', 'OPTIONS')
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        """Handle the request within the replica routing context if it is a safe-method request from an unpinned
+        client, and pin the client to the primary database if it is a write request."""
+        if REPLICA_ALIAS not in settings.DATABASES:
+            return self.get_response(request)
+
+        if request.method in self.SAFE_METHODS:
+            if self.PIN_COOKIE in request.COOKIES:
+                return self.get_response(request)
+            with read_from_replica():
+                return self.get_response(request)
+
+        response = self.get_response(request)
+        response.set_cookie(self.PIN_COOKIE, '1', max_age=settings.REPLICA_PIN_SECONDS, httponly=True)
+        return response
@@ -0,0 +1,147 @@
+"""Defines the class that validates JSON documents against a JSON schema"""
+from __future__ import unicode_literals
+
+import hashlib
+import json
+import threading
+import time
+
+from jsonschema.validators import validator_for
+
+
+# The maximum number of valid document hashes remembered by each validator before they are forgotten
+MAX_MEMOIZED_DOCUMENTS = 10000
+
+_VALIDATORS = {}  # {Schema name: SchemaValidator}
+_VALIDATORS_LOCK = threading.Lock()
+
+
+def get_validation_stats():
+    """Returns the validation counters of every schema validator
+
+    :returns: The validation counters stored by schema name
+    :rtype: dict
+    """
+
+    with _VALIDATORS_LOCK:
+        validators = list(_VALIDATORS.values())
+    return {validator.name: validator.get_stats() for validator in validators}
+
+
+class SchemaValidator(object):
+    """Validates JSON documents against a JSON schema. The schema itself is only checked once, when the validator is
+    first used, instead of on every validation. Documents that never change, such as the manifest of a job type
+    revision, can be memoized by a hash of their content so that they are only validated once. This class is
+    thread-safe.
+    """
+
+    def __init__(self, name, schema):
+        """Constructor
+
+        :param name: The unique name of the schema, used to report its validation counters
+        :type name: string
+        :param schema: The JSON schema
+        :type schema: dict
+        """
+
+        self.name = name
+        self.schema = schema
+
+        self._validator_class = None
+        self._local = threading.local()  # Validator instances are not thread-safe, so each thread gets its own
+        self._memoized = set()  # Hashes of documents that are known to be valid
+        self._lock = threading.Lock()
+
+        # Counters
+        self._num_validations = 0
+        self._num_memoized = 0
+        self._num_invalid = 0
+        self._total_time = 0.0  # In seconds
+
+        with _VALIDATORS_LOCK:
+            _VALIDATORS[name] = self
+
+    def get_stats(self):
+        """Returns the validation counters for this schema
+
+        :returns: The validation counters
+        :rtype: dict
+        """
+
+        with self._lock:
+            avg_time = self._total_time / self._num_validations if self._num_validations else 0.0
+            return {'validations': self._num_validations, 'memoized': self._num_memoized,
+                    'invalid': self._num_invalid, 'total_time': self._total_time, 'avg_time': avg_time}
+
+    def validate(self, document, memoize=False):
+        """Validates the given JSON document against the schema
+
+        :param document: The JSON document
+        :type document: dict
+        :param memoize: Whether the document is immutable so that its validation can be memoized by its content
+        :type memoize: bool
+
+        :raises :class:`jsonschema.exceptions.ValidationError`: If the document is invalid
+        :raises :class:`jsonschema.exceptions.SchemaError`: If the schema itself is invalid
+        """
+
+        document_hash = self._hash_document(document) if memoize else None
+        if document_hash:
+            with self._lock:
+                if document_hash in self._memoized:
+                    self._num_memoized += 1
+                    return
+
+        validator = self._get_validator()
+        started = time.time()
+        is_valid = False
+        try:
+            validator.validate(document)
+            is_valid = True
+        finally:
+            duration = time.time() - started
+            with self._lock:
+                self._num_validations += 1
+                self._total_time += duration
+                if not is_valid:
+                    self._num_invalid += 1
+                elif document_hash:
+                    if len(self._memoized) >= MAX_MEMOIZED_DOCUMENTS:
+                        self._memoized.clear()
+                    self._memoized.add(document_hash)
+
+    def _get_validator(self):
+        """Returns the validator instance for the current thread, checking the schema on first use
+
+        :returns: The validator instance
+        :rtype: :class:`jsonschema.validators.Validator`
+        """
+
+        validator = getattr(self._local, 'validator', None)
+        if validator:
+            return validator
+
+        with self._lock:
+            if not self._validator_class:
+                validator_class = validator_for(self.schema)
+                validator_class.check_schema(self.schema)
+                self._validator_class = validator_class
+        validator = self._validator_class(self.schema)
+        self._local.validator = validator
+        return validator
+
+    @staticmethod
+    def _hash_document(document):
+        """Returns a hash of the content of the given JSON document, None if the document cannot be serialized
+
+        :param document: The JSON document
+        :type document: dict
+        :returns: The document hash, possibly None
+        :rtype: string
+        """
+
+        try:
+            content = json.dumps(document, sort_keys=True)
+        except (TypeError, ValueError):
+            return None
+        return hashlib.sha1(content.encode('utf-8')).hexdigest()
@@ -0,0 +1,175 @@
+from __future__ import unicode_literals
+
+import threading
+
+import django
+from django.test import TestCase
+from mock import MagicMock, patch
+from psycopg2.extensions import TRANSACTION_STATUS_IDLE, TRANSACTION_STATUS_INTRANS
+
+from util.db_pool.pool import ConnectionPool, get_pool, PoolTimeout, release_connections
+
+
+def create_connection():
+    """Creates a mock psycopg2 connection that is open and idle"""
+
+    connection = MagicMock()
+    connection.closed = 0
+    connection.get_transaction_status.return_value = TRANSACTION_STATUS_IDLE
+    return connection
+
+
+class TestConnectionPool(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+        self.connect = MagicMock(side_effect=create_connection)
+
+    def test_checkout_reuses_connection(self):
+        """Tests that a checked in connection is reused by the next checkout"""
+
+        pool = ConnectionPool('test', 5, 1, 30)
+
+        connection_1 = pool.checkout(self.connect)
+        pool.checkin(connection_1)
+        connection_2 = pool.checkout(self.connect)
+
+        self.assertIs(connection_1, connection_2)
+        self.assertEqual(self.connect.call_count, 1)
+        metrics = pool.get_metrics()
+        self.assertEqual(metrics['num_checkouts'], 2)
+        self.assertEqual(metrics['num_connects'], 1)
+        self.assertEqual(metrics['size'], 1)
+        self.assertEqual(metrics['idle'], 0)
+
+    def test_checkout_timeout(self):
+        """Tests that a checkout times out when the pool is full"""
+
+        pool = ConnectionPool('test', 1, 0.05, 30)
+        pool.checkout(self.connect)
+
+        with self.assertRaises(PoolTimeout):
+            pool.checkout(self.connect)
+
+        self.assertEqual(pool.get_metrics()['num_timeouts'], 1)
+
+    def test_checkout_waits_for_checkin(self):
+        """Tests that a checkout waits for another thread to return a connection when the pool is full"""
+
+        pool = ConnectionPool('test', 1, 5, 30)
+        connection = pool.checkout(self.connect)
+        timer = threading.Timer(0.05, pool.checkin, args=(connection,))
+        timer.start()
+
+        self.assertIs(pool.checkout(self.connect), connection)
+
+        timer.join()
+        metrics = pool.get_metrics()
+        self.assertEqual(metrics['num_waits'], 1)
+        self.assertGreater(metrics['max_wait'], 0.0)
+
+    def test_failed_connect(self):
+        """Tests that a failed connect frees its slot in the pool"""
+
+        pool = ConnectionPool('test', 1, 0.05, 30)
+
+        with self.assertRaises(Exception):
+            pool.checkout(MagicMock(side_effect=Exception))
+
+        pool.checkout(self.connect)
+        self.assertEqual(pool.get_metrics()['size'], 1)
+
+    def test_checkin_rolls_back(self):
+        """Tests that an open transaction is rolled back when its connection is checked in"""
+
+        pool = ConnectionPool('test', 1, 1, 30)
+        connection = pool.checkout(self.connect)
+        connection.get_transaction_status.return_value = TRANSACTION_STATUS_INTRANS
+
+        pool.checkin(connection)
+
+        connection.rollback.assert_called_once_with()
+        self.assertEqual(pool.get_metrics()['idle'], 1)
+
+    def test_checkin_closed(self):
+        """Tests that a closed connection is discarded when it is checked in"""
+
+        pool = ConnectionPool('test', 1, 1, 30)
+        connection_1 = pool.checkout(self.connect)
+        connection_1.closed = 1
+
+        pool.checkin(connection_1)
+        connection_2 = pool.checkout(self.connect)
+
+        self.assertIsNot(connection_1, connection_2)
+        metrics = pool.get_metrics()
+        self.assertEqual(metrics['num_discarded'], 1)
+        self.assertEqual(metrics['size'], 1)
+
+    def test_health_check(self):
+        """Tests that an idle connection that fails its health check is replaced on checkout"""
+
+        pool = ConnectionPool('test', 1, 1, -1)
+        connection_1 = pool.checkout(self.connect)
+        pool.checkin(connection_1)
+        connection_1.cursor.return_value.__enter__.return_value.execute.side_effect = Exception
+
+        connection_2 = pool.checkout(self.connect)
+
+        self.assertIsNot(connection_1, connection_2)
+        connection_1.close.assert_called_once_with()
+        metrics = pool.get_metrics()
+        self.assertEqual(metrics['num_connects'], 2)
+        self.assertEqual(metrics['num_discarded'], 1)
+        self.assertEqual(metrics['size'], 1)
+
+    def test_close(self):
+        """Tests closing the idle connections of a pool"""
+
+        pool = ConnectionPool('test', 2, 1, 30)
+        connection_1 = pool.checkout(self.connect)
+        connection_2 = pool.checkout(self.connect)
+        pool.checkin(connection_1)
+
+        pool.close()
+
+        connection_1.close.assert_called_once_with()
+        self.assertFalse(connection_2.close.called)
+        metrics = pool.get_metrics()
+        self.assertEqual(metrics['size'], 1)
+        self.assertEqual(metrics['idle'], 0)
+
+
+class TestPools(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+    def test_get_pool(self):
+        """Tests that each database has its own pool"""
+
+        params = {'database': 'scale', 'host': 'localhost'}
+        pool = get_pool('test', params)
+
+        self.assertIs(get_pool('test', dict(params)), pool)
+        self.assertIsNot(get_pool('test', {'database': 'other', 'host': 'localhost'}), pool)
+        self.assertIsNot(get_pool('other', params), pool)
+
+    @patch('util.db_pool.pool.connections')
+    @patch('util.db_pool.pool.settings')
+    def test_release_connections(self, mock_settings, mock_connections):
+        """Tests that only connections outside of a transaction are released, and only if pooling is enabled"""
+
+        connection_1 = MagicMock(in_atomic_block=False)
+        connection_2 = MagicMock(in_atomic_block=True)
+        mock_connections.all.return_value = [connection_1, connection_2]
+
+        mock_settings.DATABASE_POOL = False
+        release_connections()
+        self.assertFalse(connection_1.close.called)
+
+        mock_settings.DATABASE_POOL = True
+        release_connections()
+        connection_1.close.assert_called_once_with()
+        self.assertFalse(connection_2.close.called)
@@ -0,0 +1,75 @@
+from __future__ import unicode_literals
+
+import django
+from django.db import connection
+from django.test import override_settings, TransactionTestCase
+from mock import patch
+
+from util.change_feed import ChangeFeedListener, JOBS_CHANNEL, notify_jobs_changed, notify_queue_changed, \
+    parse_job_ids, QUEUE_CHANNEL
+from util.db_pool.base import DatabaseWrapper as PooledDatabaseWrapper
+from util.db_pool.pool import get_pool
+
+
+class TestChangeFeed(TransactionTestCase):
+
+    def setUp(self):
+        django.setup()
+
+        self.listener = ChangeFeedListener([QUEUE_CHANNEL, JOBS_CHANNEL])
+        self.listener.connect()
+        self.addCleanup(self.listener.close)
+
+    def _poll(self, count):
+        notifications = []
+        for _ in range(10):
+            notifications.extend(self.listener.poll(1.0))
+            if len(notifications) >= count:
+                break
+        return notifications
+
+    def test_notify_queue_changed(self):
+        """Tests that the listener receives queue change notifications"""
+
+        self.assertTrue(self.listener.is_connected())
+        notify_queue_changed()
+
+        self.assertListEqual(self._poll(1), [(QUEUE_CHANNEL, '')])
+
+    def test_notify_jobs_changed(self):
+        """Tests that the listener receives the IDs of changed jobs"""
+
+        notify_jobs_changed([3, 1, 2, 1])
+        notify_jobs_changed([])
+
+        notifications = self._poll(1)
+        self.assertEqual(len(notifications), 1)
+        channel, payload = notifications[0]
+        self.assertEqual(channel, JOBS_CHANNEL)
+        self.assertListEqual(parse_job_ids(payload), [1, 2, 3])
+
+    def test_close(self):
+        """Tests closing the listener"""
+
+        self.listener.close()
+        self.assertFalse(self.listener.is_connected())
+
+    @override_settings(DATABASE_POOL_MAX_SIZE=1, DATABASE_POOL_TIMEOUT=0)
+    def test_reconnect_pooled(self):
+        """Tests that reconnecting the listener under the pooled database backend does not use up the pool"""
+
+        pooled_connection = PooledDatabaseWrapper(dict(connection.settings_dict), alias='change_feed_pool_test')
+        with patch('util.change_feed.connection', pooled_connection):
+            listener = ChangeFeedListener([QUEUE_CHANNEL])
+            for _ in range(5):
+                listener.connect()
+                self.assertTrue(listener.is_connected())
+            listener.close()
+
+        # A query through the pooled backend can still check out the pool's only connection
+        with pooled_connection.cursor() as cursor:
+            cursor.execute('SELECT 1')
+        pooled_connection.close()
+        metrics = get_pool('change_feed_pool_test', pooled_connection.get_connection_params()).get_metrics()
+        self.assertEqual(metrics['num_checkouts'], 1)
+        self.assertEqual(metrics['num_timeouts'], 0)
@@ -0,0 +1,113 @@
+from __future__ import unicode_literals
+
+import django
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
+from mock import patch
+
+from job.models import Job
+from util.db_router import read_from_replica, ReplicaRouter
+from util.middleware import ReplicaRoutingMiddleware
+
+
+class TestReplicaRouter(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+        self.router = ReplicaRouter()
+
+    @patch('util.db_router.connections')
+    def test_db_for_read(self, mock_connections):
+        """Tests that reads go to the replica only within the replica routing context"""
+
+        mock_connections.__getitem__.return_value.in_atomic_block = False
+
+        self.assertEqual(self.router.db_for_read(Job), 'default')
+        with read_from_replica():
+            self.assertEqual(self.router.db_for_read(Job), 'replica')
+            with read_from_replica():
+                self.assertEqual(self.router.db_for_read(Job), 'replica')
+            self.assertEqual(self.router.db_for_read(Job), 'replica')
+        self.assertEqual(self.router.db_for_read(Job), 'default')
+
+    @patch('util.db_router.connections')
+    def test_db_for_read_in_transaction(self, mock_connections):
+        """Tests that reads within a transaction on the primary stay on the primary"""
+
+        mock_connections.__getitem__.return_value.in_atomic_block = True
+
+        with read_from_replica():
+            self.assertEqual(self.router.db_for_read(Job), 'default')
+
+    def test_db_for_write(self):
+        """Tests that writes always go to the primary"""
+
+        with read_from_replica():
+            self.assertEqual(self.router.db_for_write(Job), 'default')
+
+    def test_allow_migrate(self):
+        """Tests that only the primary is migrated"""
+
+        self.assertTrue(self.router.allow_migrate('default', 'job'))
+        self.assertFalse(self.router.allow_migrate('replica', 'job'))
+
+
+class TestReplicaRoutingMiddleware(TestCase):
+
+    def setUp(self):
+        django.setup()
+
+        self.factory = RequestFactory()
+        self.router = ReplicaRouter()
+        self.routed_dbs = []
+
+        def get_response(request):
+            self.routed_dbs.append(self.router.db_for_read(Job))
+            return HttpResponse()
+        self.middleware = ReplicaRoutingMiddleware(get_response)
+
+    @patch('util.db_router.connections')
+    @patch('util.middleware.settings')
+    def test_safe_method(self, mock_settings, mock_connections):
+        """Tests that the reads of a safe-method request go to the replica"""
+
+        mock_settings.DATABASES = {'default': {}, 'replica': {}}
+        mock_connections.__getitem__.return_value.in_atomic_block = False
+
+        response = self.middleware(self.factory.get('/v6/jobs/'))
+
+        self.assertListEqual(self.routed_dbs, ['replica'])
+        self.assertNotIn(ReplicaRoutingMiddleware.PIN_COOKIE, response.cookies)
+
+    @patch('util.db_router.connections')
+    @patch('util.middleware.settings')
+    def test_write_pins_client(self, mock_settings, mock_connections):
+        """Tests that a write request pins the client's later reads to the primary"""
+
+        mock_settings.DATABASES = {'default': {}, 'replica': {}}
+        mock_settings.REPLICA_PIN_SECONDS = 15
+        mock_connections.__getitem__.return_value.in_atomic_block = False
+
+        response = self.middleware(self.factory.post('/v6/jobs/cancel/'))
+        self.assertEqual(response.cookies[ReplicaRoutingMiddleware.PIN_COOKIE]['max-age'], 15)
+
+        request = self.factory.get('/v6/jobs/')
+        request.COOKIES[ReplicaRoutingMiddleware.PIN_COOKIE] = '1'
+        self.middleware(request)
+
+        self.assertListEqual(self.routed_dbs, ['default', 'default'])
+
+    @patch('util.db_router.connections')
+    @patch('util.middleware.settings')
+    def test_no_replica(self, mock_settings, mock_connections):
+        """Tests that reads go to the primary when no replica is configured"""
+
+        mock_settings.DATABASES = {'default': {}}
+        mock_connections.__getitem__.return_value.in_atomic_block = False
+
+        response = self.middleware(self.factory.post('/v6/jobs/cancel/'))
+        self.middleware(self.factory.get('/v6/jobs/'))
+
+        self.assertListEqual(self.routed_dbs, ['default', 'default'])
+        self.assertNotIn(ReplicaRoutingMiddleware.PIN_COOKIE, response.cookies)
@@ -0,0 +1,68 @@
+from __future__ import unicode_literals
+
+import datetime
+
+from django.test import SimpleTestCase
+from django.utils.timezone import now
+from mock import patch
+
+from util.deadline import DeadlineQueue
+
+
+class TestDeadlineQueue(SimpleTestCase):
+    """Tests the DeadlineQueue class"""
+
+    def setUp(self):
+        self.when = now()
+
+    def test_pop_due(self):
+        """Tests calling DeadlineQueue.pop_due() returns only keys that are due, in deadline order"""
+
+        queue = DeadlineQueue()
+        queue.schedule('a', self.when + datetime.timedelta(seconds=3))
+        queue.schedule('b', self.when + datetime.timedelta(seconds=1))
+        queue.schedule('c', self.when + datetime.timedelta(seconds=2))
+
+        self.assertListEqual(queue.pop_due(self.when), [])
+        self.assertListEqual(queue.pop_due(self.when + datetime.timedelta(seconds=2)), ['b', 'c'])
+        self.assertEqual(len(queue), 1)
+        self.assertTrue('a' in queue)
+        self.assertListEqual(queue.pop_due(self.when + datetime.timedelta(seconds=5)), ['a'])
+        self.assertEqual(len(queue), 0)
+
+    def test_schedule_replaces_deadline(self):
+        """Tests calling DeadlineQueue.schedule() for a key that already has a deadline"""
+
+        queue = DeadlineQueue()
+        queue.schedule('a', self.when + datetime.timedelta(seconds=1))
+        queue.schedule('a', self.when + datetime.timedelta(seconds=10))
+
+        self.assertListEqual(queue.pop_due(self.when + datetime.timedelta(seconds=5)), [])
+        self.assertEqual(queue.get_deadline('a'), self.when + datetime.timedelta(seconds=10))
+
+        queue.schedule('a', self.when)
+        self.assertListEqual(queue.pop_due(self.when), ['a'])
+
+    def test_remove(self):
+        """Tests calling DeadlineQueue.remove() and scheduling a None deadline"""
+
+        queue = DeadlineQueue()
+        queue.schedule('a', self.when)
+        queue.schedule('b', self.when)
+        queue.remove('a')
+        queue.schedule('b', None)
+        queue.remove('c')  # Should ignore, no error
+
+        self.assertEqual(len(queue), 0)
+        self.assertListEqual(queue.pop_due(self.when), [])
+
+    @patch('util.deadline.DeadlineQueue.COMPACTION_MIN_SIZE', 10)
+    def test_compaction(self):
+        """Tests that invalidated heap entries are discarded once they dominate the heap"""
+
+        queue = DeadlineQueue()
+        for i in range(100):
+            queue.schedule('a', self.when + datetime.timedelta(seconds=i))
+
+        self.assertLessEqual(len(queue._heap), 10)
+        self.assertListEqual(queue.pop_due(self.when + datetime.timedelta(seconds=100)), ['a'])
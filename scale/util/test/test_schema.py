@@ -0,0 +1,60 @@
+from __future__ import unicode_literals
+
+from django.test import SimpleTestCase
+from jsonschema.exceptions import ValidationError
+from mock import patch
+
+from util.schema import get_validation_stats, SchemaValidator
+
+
+TEST_SCHEMA = {
+    'type': 'object',
+    'required': ['name'],
+    'properties': {
+        'name': {'type': 'string'},
+        'count': {'type': 'integer'},
+    },
+}
+
+
+class TestSchemaValidator(SimpleTestCase):
+    """Tests the SchemaValidator class"""
+
+    def test_validate(self):
+        """Tests validating valid and invalid documents"""
+
+        validator = SchemaValidator('test_validate', TEST_SCHEMA)
+        validator.validate({'name': 'abc', 'count': 1})
+        self.assertRaises(ValidationError, validator.validate, {'count': 1})
+        self.assertRaises(ValidationError, validator.validate, {'name': 'abc', 'count': 'one'})
+
+        stats = get_validation_stats()['test_validate']
+        self.assertEqual(stats['validations'], 3)
+        self.assertEqual(stats['invalid'], 2)
+        self.assertEqual(stats['memoized'], 0)
+
+    def test_validate_memoized(self):
+        """Tests that memoized documents are only validated once per unique content"""
+
+        validator = SchemaValidator('test_validate_memoized', TEST_SCHEMA)
+        validator.validate({'name': 'abc', 'count': 1}, memoize=True)
+        validator.validate({'count': 1, 'name': 'abc'}, memoize=True)
+        validator.validate({'name': 'abc', 'count': 2}, memoize=True)
+
+        stats = validator.get_stats()
+        self.assertEqual(stats['validations'], 2)
+        self.assertEqual(stats['memoized'], 1)
+
+        # Invalid documents are never memoized
+        self.assertRaises(ValidationError, validator.validate, {'count': 1}, memoize=True)
+        self.assertRaises(ValidationError, validator.validate, {'count': 1}, memoize=True)
+
+    @patch('util.schema.MAX_MEMOIZED_DOCUMENTS', 2)
+    def test_memoized_limit(self):
+        """Tests that the memoized documents are bounded"""
+
+        validator = SchemaValidator('test_memoized_limit', TEST_SCHEMA)
+        for i in range(5):
+            validator.validate({'name': 'abc', 'count': i}, memoize=True)
+
+        self.assertLessEqual(len(validator._memoized), 2)
@@ -0,0 +1,104 @@
+"""Defines a local stub Vault server for benchmarking and testing the secrets sync"""
+from __future__ import unicode_literals
+
+import json
+import threading
+import time
+from BaseHTTPServer import BaseHTTPRequestHandler, HTTPServer
+from SocketServer import ThreadingMixIn
+
+
+class StubVaultServer(object):
+    """A minimal local Vault HTTP server that stores job type secrets in memory. It supports the health, mounts, list,
+    read and write requests that the secrets handler makes, keeps connections alive and counts the connections and
+    requests it receives.
+    """
+
+    def __init__(self, secrets=None, latency=0.0):
+        """Constructor
+
+        :param secrets: The secrets for each job type name
+        :type secrets: dict
+        :param latency: The number of seconds to wait before answering each request
+        :type latency: float
+        """
+
+        self.secrets = secrets if secrets is not None else {}
+        self.latency = latency
+        self.num_connections = 0
+        self.requests = []  # The (method, path) of each request
+
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+
+            def setup(self):
+                BaseHTTPRequestHandler.setup(self)
+                stub.num_connections += 1
+
+            def handle_request(self):
+                length = int(self.headers.get('Content-Length', 0))
+                body = self.rfile.read(length) if length else ''
+                stub.requests.append((self.command, self.path))
+                if stub.latency:
+                    time.sleep(stub.latency)
+                status_code, content = stub.respond(self.command, self.path, body)
+                content = json.dumps(content) if content is not None else ''
+                self.send_response(status_code)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            do_GET = do_LIST = do_POST = do_PUT = handle_request
+
+            def log_message(self, *args):
+                pass
+
+        class Server(ThreadingMixIn, HTTPServer):
+            daemon_threads = True
+
+        self._server = Server(('127.0.0.1', 0), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever)
+        self._thread.daemon = True
+
+    @property
+    def url(self):
+        return 'http://127.0.0.1:%d' % self._server.server_address[1]
+
+    def respond(self, method, path, body):
+        """Returns the response to the given request
+
+        :param method: The request method
+        :type method: string
+        :param path: The request path
+        :type path: string
+        :param body: The request body
+        :type body: string
+        :returns: The status code and JSON content
+        :rtype: tuple
+        """
+
+        prefix = '/v1/secret/scale/job-type'
+        if path == '/v1/sys/health':
+            return 200, {'initialized': True, 'sealed': False}
+        if path == '/v1/sys/mounts':
+            return 200, {'scale/': {'type': 'generic', 'description': 'Secrets store for all secrets used by Scale'}}
+        if path == prefix and method == 'LIST':
+            return 200, {'data': {'keys': sorted(self.secrets.keys())}}
+        if path.startswith(prefix + '/'):
+            job_name = path[len(prefix) + 1:]
+            if method == 'PUT':
+                self.secrets[job_name] = json.loads(body)
+                return 204, None
+            if job_name in self.secrets:
+                return 200, {'data': self.secrets[job_name]}
+        return 404, {'errors': []}
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
@@ -0,0 +1,50 @@
+"""Defines the command line method for benchmarking the secrets sync"""
+from __future__ import unicode_literals
+from __future__ import print_function
+
+import time
+
+from django.core.management.base import BaseCommand
+from django.test.utils import override_settings
+
+from scheduler.vault.manager import SecretsManager
+from vault.benchmark import StubVaultServer
+
+
+class Command(BaseCommand):
+    """Command that benchmarks syncing job type secrets from a local stub Vault server
+    """
+
+    help = 'Benchmarks syncing job type secrets from a local stub Vault server'
+
+    def add_arguments(self, parser):
+        parser.add_argument('-j', '--num-job-types', action='store', type=int, default=2000,
+                            help='Number of job types with secrets')
+        parser.add_argument('-l', '--latency', action='store', type=float, default=0.005,
+                            help='Seconds the stub server waits before answering each request')
+        parser.add_argument('-w', '--workers', action='store', type=int, default=8,
+                            help='Number of secrets retrieved concurrently')
+
+    def handle(self, *args, **options):
+        """See :meth:`django.core.management.base.BaseCommand.handle`.
+
+        This method syncs the secrets serially and concurrently and prints the duration of each sync.
+        """
+
+        secrets = {'job-type-%d' % i: {'password': 'secret-%d' % i} for i in range(options['num_job_types'])}
+        server = StubVaultServer(secrets, options['latency'])
+        server.start()
+        try:
+            for workers in sorted({1, options['workers']}):
+                with override_settings(SECRETS_URL=server.url, SECRETS_TOKEN='benchmark-token',
+                                       DCOS_SERVICE_ACCOUNT=None, SECRETS_SYNC_WORKERS=workers):
+                    secrets_mgr = SecretsManager()
+                    for sync in ['initial', 'unchanged']:
+                        num_connections = server.num_connections
+                        started = time.time()
+                        changed_jobs = secrets_mgr.sync_with_backend()
+                        duration = time.time() - started
+                        print('%2d worker(s), %-9s sync: %7.2f seconds, %4d changed, %3d new connection(s)' %
+                              (workers, sync, duration, len(changed_jobs), server.num_connections - num_connections))
+        finally:
+            server.stop()
@@ -1,23 +1,36 @@
 """Handles secret getters and setters for Scale"""
 
 import ast
+import datetime
 import jwt
 import json
 import requests
+from requests.adapters import HTTPAdapter
 from requests.packages.urllib3.exceptions import InsecureRequestWarning
 
 from django.conf import settings
+from django.utils.timezone import now, utc
 from vault.exceptions import InvalidSecretsAuthorization, InvalidSecretsConfiguration, InvalidSecretsRequest, \
     InvalidSecretsToken, InvalidSecretsValue
 
 
+# How long an authentication is reused when the secrets backend does not say when it expires
+DEFAULT_AUTH_TTL = datetime.timedelta(minutes=5)
+# How long before its expiration an authentication is no longer reused
+AUTH_EXPIRATION_MARGIN = datetime.timedelta(minutes=1)
+
+
 class SecretsHandler(object):
     """Represents a secrets handler for setting and retrieving secrets
     """
 
-    def __init__(self):
+    def __init__(self, pool_size=None):
         """Creates a secrets handler object.  The backend is initially tested to ensure it exists and Scale can
-        authenticate properly with it.
+        authenticate properly with it. All requests are made over one persistent HTTP session, so a handler can be
+        kept and reused until its authentication expires.
+
+        :param pool_size: The number of connections kept to the backend, if the handler is used by multiple threads
+        :type pool_size: int
         """
 
         self.secrets_error_codes = {
@@ -40,6 +53,13 @@ class SecretsHandler(object):
         if not self.raise_ssl_warnings:
             requests.packages.urllib3.disable_warnings(InsecureRequestWarning)
 
+        self._session = requests.Session()
+        if pool_size:
+            adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+            self._session.mount('http://', adapter)
+            self._session.mount('https://', adapter)
+        self.auth_expires = now() + DEFAULT_AUTH_TTL
+
         if not self.secrets_url:
             raise InvalidSecretsConfiguration('A secrets backend is not properly configured with Scale.')
         elif self.service_account:
@@ -50,6 +70,12 @@ class SecretsHandler(object):
 
         self._check_secrets_backend()
 
+    def close(self):
+        """Closes the handler's HTTP session
+        """
+
+        self._session.close()
+
     def get_job_type_secrets(self, job_name):
         """Retrieves the secrets located at the job_name within the backend
 
@@ -119,6 +145,17 @@ class SecretsHandler(object):
 
         return all_job_types
 
+    def is_auth_expired(self, when):
+        """Indicates whether this handler's authentication with the backend has expired, or is about to
+
+        :param when: The current time
+        :type when: :class:`datetime.datetime`
+        :returns: True if the authentication has expired, False otherwise
+        :rtype: bool
+        """
+
+        return when >= self.auth_expires - AUTH_EXPIRATION_MARGIN
+
     def set_job_type_secrets(self, job_name, secrets):
         """write job-type secrets to the secrets backend
 
@@ -226,6 +263,13 @@ class SecretsHandler(object):
         self.secrets_url += '/secrets/v1'
         access_token = [k + '=' + v for k, v in request_auth.json().items()][0]
 
+        # DC/OS authentication tokens are JWTs that expire, so reuse the token until then
+        try:
+            claims = jwt.decode(access_token.split('=', 1)[1], verify=False)
+            self.auth_expires = datetime.datetime.utcfromtimestamp(claims['exp']).replace(tzinfo=utc)
+        except (jwt.InvalidTokenError, KeyError, TypeError, ValueError):
+            pass
+
         return access_token
 
     def _make_request(self, method, url, headers=None, data=None):
@@ -252,7 +296,7 @@ class SecretsHandler(object):
         if not data:
             data = {}
 
-        r = requests.request(method=method, url=url, headers=headers, data=data, verify=self.raise_ssl_warnings)
+        r = self._session.request(method=method, url=url, headers=headers, data=data, verify=self.raise_ssl_warnings)
 
         if r.status_code in self.secrets_error_codes:
             if r.status_code == 403:
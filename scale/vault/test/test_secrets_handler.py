@@ -80,28 +80,28 @@ UB3V/SWf7Wqp9vDEbUtgzIn9y4l5cIjS/J2IKkYARg==
 
         return MockResponse({}, 404)
 
-    @patch('requests.request', return_value=mocked_validate('dcos'))
+    @patch('requests.Session.request', return_value=mocked_validate('dcos'))
     def test_dcos_authenticate_good_return(self, mock_request):
         with self.settings(SECRETS_TOKEN=self.dcos_token,
                            DCOS_SERVICE_ACCOUNT='some_account_name',
                            SECRETS_URL='HTTP://127.0.0.1:8200'):
             SecretsHandler()
 
-    @patch('requests.request', return_value=mocked_validate('dcos'))
+    @patch('requests.Session.request', return_value=mocked_validate('dcos'))
     def test_dcos_authenticate_bad_token(self, mock_request):
         with self.settings(SECRETS_TOKEN='some_bad_token',
                            DCOS_SERVICE_ACCOUNT='some_account_name',
                            SECRETS_URL='HTTP://127.0.0.1:8200'):
             self.assertRaises(InvalidSecretsToken, SecretsHandler)
 
-    @patch('requests.request', return_value=mocked_validate('vault'))
+    @patch('requests.Session.request', return_value=mocked_validate('vault'))
     def test_vault_authenticate_good_return(self, mock_request):
         with self.settings(SECRETS_TOKEN='some_master_token',
                            DCOS_SERVICE_ACCOUNT=None,
                            SECRETS_URL='HTTP://127.0.0.1:8200'):
             SecretsHandler()
 
-    @patch('requests.request', return_value=mocked_validate())
+    @patch('requests.Session.request', return_value=mocked_validate())
     def test_vault_authenticate_bad_permission(self, mock_request):
         with self.settings(SECRETS_TOKEN='some_master_token',
                            DCOS_SERVICE_ACCOUNT=None,
@@ -167,7 +167,7 @@ class VaultSecretsValueValidation(TestCase):
 
         return r_return
 
-    @patch('requests.request', return_value=mocked_request_setup())
+    @patch('requests.Session.request', return_value=mocked_request_setup())
     def vault_setup(self, mock_request):
         with self.settings(SECRETS_TOKEN='some_master_token',
                            DCOS_SERVICE_ACCOUNT=None,
@@ -175,12 +175,12 @@ class VaultSecretsValueValidation(TestCase):
 
             self.vault_backend = SecretsHandler()
 
-    @patch('requests.request', return_value=mocked_get_secret('secret'))
+    @patch('requests.Session.request', return_value=mocked_get_secret('secret'))
     def test_vault_get_secret(self, mock_request):
         test_secret = self.vault_backend.get_job_type_secrets(self.secret_test_path)
         self.assertEqual(test_secret, {"test_val_name": "vault_backend_secret", "foo": "bar"})
 
-    @patch('requests.request', return_value=mocked_get_secret())
+    @patch('requests.Session.request', return_value=mocked_get_secret())
     def test_vault_get_bad_secret(self, mock_request):
         self.assertRaises(InvalidSecretsAuthorization,
                           self.vault_backend.get_job_type_secrets,
@@ -256,19 +256,19 @@ UB3V/SWf7Wqp9vDEbUtgzIn9y4l5cIjS/J2IKkYARg==
 
         return r_return
 
-    @patch('requests.request', return_value=mocked_get_secret('auth'))
+    @patch('requests.Session.request', return_value=mocked_get_secret('auth'))
     def dcos_setup(self, mock_request):
         with self.settings(SECRETS_TOKEN=self.dcos_token,
                            DCOS_SERVICE_ACCOUNT='some_account_name',
                            SECRETS_URL='HTTP://127.0.0.1:8200'):
             self.dcos_backend = SecretsHandler()
 
-    @patch('requests.request', return_value=mocked_get_secret('secret'))
+    @patch('requests.Session.request', return_value=mocked_get_secret('secret'))
     def test_dcos_get_secret(self, mock_request):
         test_secret = self.dcos_backend.get_job_type_secrets(self.secret_test_path)
         self.assertEqual(test_secret, {'some_name': 'some_secret'})
 
-    @patch('requests.request', return_value=mocked_get_secret())
+    @patch('requests.Session.request', return_value=mocked_get_secret())
     def test_dcos_get_bad_secret(self, mock_request):
         self.assertRaises(InvalidSecretsAuthorization,
                           self.dcos_backend.get_job_type_secrets,